@@ -32,6 +32,29 @@ CREATE TABLE water_tank (
         FOREIGN KEY (building_id) REFERENCES water_tank_building(building_id)
 );
 
+-- 시설 테이블 변경 알림 트리거 (sensor-server 의 FacilityIndex 가 LISTEN facility_changed)
+CREATE OR REPLACE FUNCTION notify_facility_change() RETURNS trigger AS $$
+BEGIN
+    PERFORM pg_notify(
+        'facility_changed',
+        json_build_object(
+            'table', TG_TABLE_NAME,
+            'op', TG_OP,
+            'old', CASE WHEN TG_OP IN ('UPDATE', 'DELETE') THEN row_to_json(OLD) END,
+            'new', CASE WHEN TG_OP IN ('INSERT', 'UPDATE') THEN row_to_json(NEW) END
+        )::text
+    );
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE TRIGGER water_tank_center_notify_row AFTER INSERT OR UPDATE OR DELETE ON water_tank_center FOR EACH ROW EXECUTE FUNCTION notify_facility_change();
+CREATE OR REPLACE TRIGGER water_tank_center_notify_truncate AFTER TRUNCATE ON water_tank_center FOR EACH STATEMENT EXECUTE FUNCTION notify_facility_change();
+CREATE OR REPLACE TRIGGER water_tank_building_notify_row AFTER INSERT OR UPDATE OR DELETE ON water_tank_building FOR EACH ROW EXECUTE FUNCTION notify_facility_change();
+CREATE OR REPLACE TRIGGER water_tank_building_notify_truncate AFTER TRUNCATE ON water_tank_building FOR EACH STATEMENT EXECUTE FUNCTION notify_facility_change();
+CREATE OR REPLACE TRIGGER water_tank_notify_row AFTER INSERT OR UPDATE OR DELETE ON water_tank FOR EACH ROW EXECUTE FUNCTION notify_facility_change();
+CREATE OR REPLACE TRIGGER water_tank_notify_truncate AFTER TRUNCATE ON water_tank FOR EACH STATEMENT EXECUTE FUNCTION notify_facility_change();
+
 -- 수조 센서 기록 테이블
 CREATE TABLE water_tank_sensor_record(
         tank_id INTEGER NOT NULL, 
@@ -39,6 +62,7 @@ CREATE TABLE water_tank_sensor_record(
         ph FLOAT, 
         dissolved_oxygen FLOAT, 
         salinity FLOAT, 
+        oxygen_saturation FLOAT, -- 파생 항목 (수집 시 계산)
         recorded_at TIMESTAMP WITH TIME ZONE NOT NULL, 
 
         PRIMARY KEY (tank_id),
@@ -52,6 +76,7 @@ CREATE TABLE water_tank_sensor_record_history (
         ph FLOAT, 
         dissolved_oxygen FLOAT,
         salinity FLOAT, 
+        oxygen_saturation FLOAT, -- 파생 항목 (수집 시 계산)
         recorded_at TIMESTAMP WITH TIME ZONE NOT NULL, 
 
         FOREIGN KEY (tank_id) REFERENCES water_tank(tank_id)
@@ -59,7 +84,68 @@ CREATE TABLE water_tank_sensor_record_history (
 
 -- 하이퍼테이블로 변환
 SELECT create_hypertable('water_tank_sensor_record_history', 'recorded_at');
-CREATE INDEX ON water_tank_sensor_record_history_tank_id_recorded_at_idx (tank_id, recorded_at DESC);
+
+-- 파생 항목 컬럼이 없던 기존 데이터베이스에 적용 (이미 있으면 무시)
+ALTER TABLE water_tank_sensor_record ADD COLUMN IF NOT EXISTS oxygen_saturation FLOAT;
+ALTER TABLE water_tank_sensor_record_history ADD COLUMN IF NOT EXISTS oxygen_saturation FLOAT;
+
+-- (tank_id, recorded_at) 중복 저장 방지 (spool 재처리 시 ON CONFLICT DO NOTHING 이 이 인덱스에 의존)
+CREATE UNIQUE INDEX IF NOT EXISTS water_tank_sensor_record_history_tank_id_recorded_at_idx ON water_tank_sensor_record_history (tank_id, recorded_at DESC);
+
+-- 경보 규칙 테이블 (scope: tank / building / center, 좁은 범위의 규칙이 우선)
+CREATE TABLE alert_rule (
+        rule_id SERIAL NOT NULL,
+        scope VARCHAR(16) NOT NULL,
+        scope_id INTEGER NOT NULL,
+        metric VARCHAR(32) NOT NULL,
+        lower FLOAT,
+        upper FLOAT,
+        hysteresis FLOAT NOT NULL DEFAULT 0,
+        min_duration FLOAT NOT NULL DEFAULT 0,
+        enabled BOOLEAN NOT NULL DEFAULT TRUE,
+
+        PRIMARY KEY (rule_id)
+);
+
+CREATE TABLE water_tank_anomaly (
+        tank_id INTEGER NOT NULL,
+        metric VARCHAR(32) NOT NULL,
+        evaluated_at TIMESTAMP WITH TIME ZONE NOT NULL,
+        value FLOAT NOT NULL,
+        median FLOAT NOT NULL,
+        mad FLOAT NOT NULL,
+        zscore FLOAT NOT NULL,
+        flatline BOOLEAN NOT NULL,
+        anomalous BOOLEAN NOT NULL,
+
+        PRIMARY KEY (tank_id, metric)
+);
+
+-- 수조 / bucket / 측정 항목별 분위수 sketch (0 이 아닌 bin 과 개수)
+CREATE TABLE water_tank_sketch (
+        tank_id INTEGER NOT NULL,
+        bucket_at TIMESTAMP WITH TIME ZONE NOT NULL,
+        metric VARCHAR(32) NOT NULL,
+        bins INTEGER[] NOT NULL,
+        counts BIGINT[] NOT NULL,
+
+        PRIMARY KEY (tank_id, bucket_at, metric)
+);
+
+CREATE TABLE water_tank_daily_summary (
+        report_date DATE NOT NULL,
+        scope VARCHAR(16) NOT NULL,
+        scope_id INTEGER NOT NULL,
+        metric VARCHAR(32) NOT NULL,
+        count INTEGER NOT NULL,
+        completeness FLOAT NOT NULL,
+        minimum FLOAT,
+        maximum FLOAT,
+        mean FLOAT,
+        out_of_range_seconds FLOAT,
+
+        PRIMARY KEY (report_date, scope, scope_id, metric)
+);
 
 -- 데이터 넣기
 INSERT INTO water_tank_center (center_id, center_name) VALUES (1, '임실');
@@ -147,11 +233,7 @@ INSERT INTO water_tank (tank_id, tank_name, tank_code, center_id, building_id) V
 INSERT INTO water_tank (tank_id, tank_name, tank_code, center_id, building_id) VALUES (63, '제7탱크', '정읍_제4동_제7탱크', 2, 8);
 INSERT INTO water_tank (tank_id, tank_name, tank_code, center_id, building_id) VALUES (64, '제8탱크', '정읍_제4동_제8탱크', 2, 8);
 
-
-
-
-
-
-
-
-
+-- 명시적 id 로 넣은 시드 이후 SERIAL 시퀀스를 맞춤 (이후 provision 시 id 충돌 방지)
+SELECT setval(pg_get_serial_sequence('water_tank_center', 'center_id'), max(center_id)) FROM water_tank_center;
+SELECT setval(pg_get_serial_sequence('water_tank_building', 'building_id'), max(building_id)) FROM water_tank_building;
+SELECT setval(pg_get_serial_sequence('water_tank', 'tank_id'), max(tank_id)) FROM water_tank;
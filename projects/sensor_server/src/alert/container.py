@@ -0,0 +1,34 @@
+from dependency_injector import containers, providers
+
+from src.alert.engine import AlertEngine
+from src.alert.repository import AlertRuleRepository
+from src.alert.settings import AlertSettings
+from src.alert.sink import LoggingAlertSink
+from src.database.container import DatabaseContainer
+from src.facility.container import FacilityContainer
+
+
+class AlertContainer(containers.DeclarativeContainer):
+    """임계값 경보"""
+
+    database: DatabaseContainer = providers.Container(DatabaseContainer)
+    facility: FacilityContainer = providers.Container(FacilityContainer)
+
+    settings = providers.Singleton(AlertSettings)
+
+    rule_repository = providers.Singleton(
+        AlertRuleRepository, session_factory=database.session_factory
+    )
+
+    sinks = providers.List(
+        providers.Singleton(LoggingAlertSink),
+    )
+
+    engine = providers.Singleton(
+        AlertEngine,
+        rule_repository=rule_repository,
+        facility_index=facility.index,
+        sinks=sinks,
+        refresh_interval=settings.provided.ALERT_RULE_REFRESH_INTERVAL,
+        enabled=settings.provided.ALERT_ENABLED,
+    )
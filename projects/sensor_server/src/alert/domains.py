@@ -0,0 +1,58 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Literal, Optional
+
+AlertScope = Literal["tank", "building", "center"]
+AlertState = Literal["fired", "cleared"]
+
+
+@dataclass
+class AlertRule:
+    """측정 항목 임계값 경보 규칙
+
+    scope 단위(수조 / 동 / 센터)로 지정하며, 한 수조에 같은 항목의 규칙이 여러 개 걸리면
+    더 좁은 범위(수조 > 동 > 센터)의 규칙이 적용됩니다.
+    """
+
+    rule_id: int  # primary key
+    scope: AlertScope  # 적용 범위
+    scope_id: int  # 범위의 id (tank_id / building_id / center_id)
+    metric: str  # 측정 항목 (temperature, ph, dissolved_oxygen, salinity)
+    lower: Optional[float]  # 하한 (없으면 검사하지 않음)
+    upper: Optional[float]  # 상한 (없으면 검사하지 않음)
+    hysteresis: float  # 해제 시 범위 안쪽으로 더 들어와야 하는 값
+    min_duration: float  # 경보 발생까지 범위를 벗어난 상태가 유지되어야 하는 시간 (초)
+    enabled: bool = True
+
+    @staticmethod
+    def new(
+        scope: AlertScope,
+        scope_id: int,
+        metric: str,
+        lower: Optional[float] = None,
+        upper: Optional[float] = None,
+        hysteresis: float = 0.0,
+        min_duration: float = 0.0,
+    ) -> "AlertRule":
+        return AlertRule(
+            rule_id=None,  # 생성 시 자동 생성
+            scope=scope,
+            scope_id=scope_id,
+            metric=metric,
+            lower=lower,
+            upper=upper,
+            hysteresis=hysteresis,
+            min_duration=min_duration,
+        )
+
+
+@dataclass
+class AlertEvent:
+    """경보 발생 / 해제"""
+
+    rule_id: int
+    tank_id: int
+    metric: str
+    state: AlertState
+    value: float  # 상태를 바꾼 측정 값
+    recorded_at: datetime  # 상태를 바꾼 측정 값의 측정 시간
@@ -0,0 +1,254 @@
+"""수집 경로에서 평가하는 임계값 경보
+
+규칙(AlertRule)은 측정 항목별로 수조 id 를 인덱스로 하는 numpy 배열(하한, 상한, hysteresis, 최소 지속 시간)로
+컴파일해두고, 측정 값 묶음이 들어오면 행의 수조 id 로 배열을 조회해 한 번에 비교합니다.
+따라서 평가 비용은 규칙 수와 관계 없이 묶음의 행 수에 비례합니다.
+
+- 발생: 범위를 벗어난 상태가 min_duration 이상 유지되면 (측정 시간 기준)
+- 해제: 범위 안쪽으로 hysteresis 만큼 더 들어오면
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Dict, Iterable, List, Optional, Set
+
+import numpy as np
+
+from src import metrics
+from src.alert.domains import AlertEvent, AlertRule
+from src.alert.repository import AlertRuleRepository
+from src.alert.sink import AlertSink
+from src.facility.index import FacilityIndex
+from src.sensor.domains import EPOCH, METRICS, WaterTankSensorRecordColumns
+from src.sensor.listener import occurrence_rounds
+
+logger = logging.getLogger(__name__)
+
+# 좁은 범위의 규칙이 나중에 적용되어 넓은 범위의 규칙을 덮어씀
+SCOPE_PRIORITY = {"center": 0, "building": 1, "tank": 2}
+
+
+@dataclass
+class MetricRuleTable:
+    """한 측정 항목의 수조별 규칙과 경보 상태 (인덱스: tank_id)"""
+
+    rule_id: np.ndarray  # 규칙이 없으면 -1
+    lower: np.ndarray  # 하한이 없으면 NaN
+    upper: np.ndarray  # 상한이 없으면 NaN
+    hysteresis: np.ndarray
+    min_duration: np.ndarray
+    active: np.ndarray  # 경보 발생 중 여부
+    pending_since: np.ndarray  # 범위를 벗어나기 시작한 측정 시간 (epoch 초, 아니면 NaN)
+
+    @staticmethod
+    def empty(size: int) -> "MetricRuleTable":
+        return MetricRuleTable(
+            rule_id=np.full(size, -1, dtype=np.int64),
+            lower=np.full(size, np.nan),
+            upper=np.full(size, np.nan),
+            hysteresis=np.zeros(size),
+            min_duration=np.zeros(size),
+            active=np.zeros(size, dtype=bool),
+            pending_since=np.full(size, np.nan),
+        )
+
+    def __len__(self) -> int:
+        return len(self.rule_id)
+
+    def inherit_state(self, previous: "MetricRuleTable") -> None:
+        """같은 규칙이 적용된 수조의 경보 상태를 이전 테이블에서 이어받음"""
+        size = min(len(self), len(previous))
+        same = self.rule_id[:size] == previous.rule_id[:size]
+        self.active[:size] = previous.active[:size] & same
+        self.pending_since[:size] = np.where(
+            same, previous.pending_since[:size], np.nan
+        )
+
+
+def compile_rules(
+    rules: Iterable[AlertRule], facility_index: FacilityIndex
+) -> Dict[str, MetricRuleTable]:
+    """규칙을 측정 항목별 수조 id 배열로 컴파일"""
+    targets = []
+    for rule in sorted(rules, key=lambda rule: SCOPE_PRIORITY[rule.scope]):
+        if not rule.enabled:
+            continue
+        if rule.metric not in METRICS:
+            logger.warning(f"alert rule {rule.rule_id}: unknown metric {rule.metric}")
+            continue
+        if rule.scope == "tank":
+            tank_ids = [rule.scope_id]
+        elif rule.scope == "building":
+            tank_ids = [t.tank_id for t in facility_index.find_tanks_of_building(rule.scope_id)]
+        else:
+            tank_ids = [t.tank_id for t in facility_index.find_tanks_of_center(rule.scope_id)]
+        if tank_ids:
+            targets.append((rule, np.asarray(tank_ids, dtype=np.int64)))
+
+    size = max((int(tank_ids.max()) + 1 for _, tank_ids in targets), default=0)
+    tables: Dict[str, MetricRuleTable] = {}
+    for rule, tank_ids in targets:
+        table = tables.setdefault(rule.metric, MetricRuleTable.empty(size))
+        table.rule_id[tank_ids] = rule.rule_id
+        table.lower[tank_ids] = np.nan if rule.lower is None else rule.lower
+        table.upper[tank_ids] = np.nan if rule.upper is None else rule.upper
+        table.hysteresis[tank_ids] = rule.hysteresis
+        table.min_duration[tank_ids] = rule.min_duration
+    return tables
+
+
+class AlertEngine:
+    """측정 값 묶음을 규칙과 비교해 경보 발생 / 해제 이벤트를 sink 로 보내는 listener
+
+    SensorRecordService 의 listener 로 등록되며, 이벤트 전달은 별도 task 에서 수행합니다.
+    규칙과 시설 구성은 refresh_interval 마다 다시 컴파일하고, 같은 규칙이 적용된 수조의 경보 상태는 유지합니다.
+    """
+
+    def __init__(
+        self,
+        rule_repository: AlertRuleRepository,
+        facility_index: FacilityIndex,
+        sinks: List[AlertSink],
+        refresh_interval: float = 60.0,
+        enabled: bool = True,
+    ):
+        self.rule_repository = rule_repository
+        self.facility_index = facility_index
+        self.sinks = sinks
+        self.refresh_interval = refresh_interval
+        self.enabled = enabled
+
+        self.tables: Dict[str, MetricRuleTable] = {}
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._send_tasks: Set[asyncio.Task] = set()
+
+    async def start(self) -> None:
+        if not self.enabled:
+            return
+        await self.reload()
+        self._refresh_task = asyncio.create_task(self._refresh())
+
+    async def stop(self) -> None:
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+        # 전달 중인 이벤트는 마저 보냄
+        if self._send_tasks:
+            await asyncio.gather(*self._send_tasks, return_exceptions=True)
+
+    async def reload(self) -> None:
+        """규칙을 다시 읽어 컴파일 (시설 인덱스가 준비되지 않았으면 기존 규칙 유지)"""
+        if not self.facility_index.loaded:
+            logger.warning("alert rules are not reloaded: facility index is not loaded")
+            return
+        rules = await self.rule_repository.find_all()
+        self.apply_rules(rules)
+
+    def apply_rules(self, rules: Iterable[AlertRule]) -> None:
+        tables = compile_rules(rules, self.facility_index)
+        for metric, table in tables.items():
+            if (previous := self.tables.get(metric)) is not None:
+                table.inherit_state(previous)
+        self.tables = tables
+
+    async def _refresh(self) -> None:
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            try:
+                await self.reload()
+            except Exception as e:
+                logger.warning(f"failed to reload alert rules ({e!r})")
+
+    def on_records(self, columns: WaterTankSensorRecordColumns) -> None:
+        if events := self.evaluate(columns):
+            task = asyncio.create_task(self._send(events))
+            self._send_tasks.add(task)
+            task.add_done_callback(self._send_tasks.discard)
+
+    def evaluate(self, columns: WaterTankSensorRecordColumns) -> List[AlertEvent]:
+        """측정 값 묶음을 평가해 경보 상태를 갱신하고 상태가 바뀐 이벤트를 반환"""
+        if not self.tables or len(columns) == 0:
+            return []
+
+        started_at = time.perf_counter()
+        events: List[AlertEvent] = []
+        rounds = occurrence_rounds(columns.tank_id, columns.recorded_at)
+        for metric, table in self.tables.items():
+            values = columns.metric(metric)
+            for rows in rounds:
+                events.extend(
+                    self._evaluate_metric(
+                        metric,
+                        table,
+                        columns.tank_id[rows],
+                        values[rows],
+                        columns.recorded_at[rows],
+                    )
+                )
+        metrics.alert_evaluation_seconds.observe(time.perf_counter() - started_at)
+        return events
+
+    @staticmethod
+    def _evaluate_metric(
+        metric: str,
+        table: MetricRuleTable,
+        tank_id: np.ndarray,
+        value: np.ndarray,
+        recorded_at: np.ndarray,
+    ) -> List[AlertEvent]:
+        # 규칙이 있는 수조의 유효한 측정 값만 평가
+        rows = tank_id < len(table)
+        rows[rows] = table.rule_id[tank_id[rows]] >= 0
+        rows &= ~np.isnan(value)
+        if not rows.any():
+            return []
+        tank_id, value, recorded_at = tank_id[rows], value[rows], recorded_at[rows]
+
+        lower, upper = table.lower[tank_id], table.upper[tank_id]
+        hysteresis = table.hysteresis[tank_id]
+        active = table.active[tank_id]
+        pending_since = table.pending_since[tank_id]
+
+        # NaN 인 경계와의 비교는 False 이므로 경계가 없는 쪽은 검사되지 않음
+        outside = (value < lower) | (value > upper)
+        back_inside = ~((value < lower + hysteresis) | (value > upper - hysteresis))
+
+        pending_since = np.where(
+            outside & ~active,
+            np.where(np.isnan(pending_since), recorded_at, pending_since),
+            np.nan,
+        )
+        fired = ~active & outside & (
+            recorded_at - pending_since >= table.min_duration[tank_id]
+        )
+        cleared = active & back_inside
+
+        table.active[tank_id] = (active | fired) & ~cleared
+        table.pending_since[tank_id] = np.where(fired, np.nan, pending_since)
+
+        events = []
+        for state, changed in (("fired", fired), ("cleared", cleared)):
+            for i in np.flatnonzero(changed).tolist():
+                events.append(
+                    AlertEvent(
+                        rule_id=int(table.rule_id[tank_id[i]]),
+                        tank_id=int(tank_id[i]),
+                        metric=metric,
+                        state=state,
+                        value=float(value[i]),
+                        recorded_at=EPOCH + timedelta(seconds=int(recorded_at[i])),
+                    )
+                )
+            if changed.any():
+                metrics.alert_events.labels(state).inc(int(changed.sum()))
+        return events
+
+    async def _send(self, events: List[AlertEvent]) -> None:
+        for sink in self.sinks:
+            try:
+                await sink.send(events)
+            except Exception:
+                logger.exception(f"alert sink failed ({sink!r})")
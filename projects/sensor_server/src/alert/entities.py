@@ -0,0 +1,67 @@
+from typing import Optional
+
+from sqlalchemy import VARCHAR
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.alert.domains import AlertRule
+from src.database.base import Base
+
+
+class AlertRuleEntity(Base):
+    """경보 규칙 저장"""
+
+    __tablename__ = "alert_rule"
+
+    rule_id: Mapped[int] = mapped_column(primary_key=True)  # 규칙 id
+    scope: Mapped[str] = mapped_column(VARCHAR(16))  # tank / building / center
+    scope_id: Mapped[int] = mapped_column()  # 범위의 id
+    metric: Mapped[str] = mapped_column(VARCHAR(32))  # 측정 항목
+    lower: Mapped[Optional[float]] = mapped_column(nullable=True)  # 하한
+    upper: Mapped[Optional[float]] = mapped_column(nullable=True)  # 상한
+    hysteresis: Mapped[float] = mapped_column(default=0.0)
+    min_duration: Mapped[float] = mapped_column(default=0.0)  # 초
+    enabled: Mapped[bool] = mapped_column(default=True)
+
+    @staticmethod
+    def from_domain(domain: AlertRule):
+        """도메인 객체를 엔티티로 변환합니다."""
+        return AlertRuleEntity(
+            rule_id=domain.rule_id,
+            scope=domain.scope,
+            scope_id=domain.scope_id,
+            metric=domain.metric,
+            lower=domain.lower,
+            upper=domain.upper,
+            hysteresis=domain.hysteresis,
+            min_duration=domain.min_duration,
+            enabled=domain.enabled,
+        )
+
+    def to_domain(self) -> AlertRule:
+        """엔티티 객체를 도메인 객체로 변환합니다."""
+        return AlertRule(
+            rule_id=self.rule_id,
+            scope=self.scope,
+            scope_id=self.scope_id,
+            metric=self.metric,
+            lower=self.lower,
+            upper=self.upper,
+            hysteresis=self.hysteresis,
+            min_duration=self.min_duration,
+            enabled=self.enabled,
+        )
+
+    def update(self, domain: AlertRule):
+        """도메인 객체로 엔티티의 값을 업데이트합니다."""
+        self.scope = domain.scope
+        self.scope_id = domain.scope_id
+        self.metric = domain.metric
+        self.lower = domain.lower
+        self.upper = domain.upper
+        self.hysteresis = domain.hysteresis
+        self.min_duration = domain.min_duration
+        self.enabled = domain.enabled
+
+    def primary_key(self) -> int:
+        """엔티티의 기본 키를 반환합니다."""
+        return self.rule_id
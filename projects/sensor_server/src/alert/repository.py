@@ -0,0 +1,9 @@
+from src.alert.domains import AlertRule
+from src.alert.entities import AlertRuleEntity
+from src.database.repository import BaseRepository
+
+
+class AlertRuleRepository(BaseRepository[int, AlertRule]):
+    """경보 규칙 저장"""
+
+    entity = AlertRuleEntity
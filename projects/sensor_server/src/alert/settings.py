@@ -0,0 +1,8 @@
+from pydantic_settings import BaseSettings
+from pydantic import Field
+
+
+class AlertSettings(BaseSettings):
+    ALERT_ENABLED: bool = Field(default=True)
+    # 규칙 / 시설 변경을 다시 컴파일하는 주기 (초)
+    ALERT_RULE_REFRESH_INTERVAL: float = Field(default=60.0)
@@ -0,0 +1,27 @@
+import logging
+from typing import List, Protocol
+
+from src.alert.domains import AlertEvent
+
+logger = logging.getLogger(__name__)
+
+
+class AlertSink(Protocol):
+    """경보 발생 / 해제 이벤트를 전달받는 곳 (알림 채널 등)
+
+    수집 경로와 분리된 task 에서 호출됩니다.
+    """
+
+    async def send(self, events: List[AlertEvent]) -> None: ...
+
+
+class LoggingAlertSink:
+    """경보 이벤트를 로그로 남기는 sink"""
+
+    async def send(self, events: List[AlertEvent]) -> None:
+        for event in events:
+            logger.warning(
+                f"alert {event.state}: tank={event.tank_id} {event.metric}={event.value} "
+                f"(rule={event.rule_id}, recorded_at={event.recorded_at.isoformat()})",
+                extra={"extra": {"alert": event.state, "rule_id": event.rule_id}},
+            )
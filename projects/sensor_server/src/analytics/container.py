@@ -0,0 +1,19 @@
+from dependency_injector import containers, providers
+
+from src.analytics.executor import AnalyticsExecutor
+from src.analytics.settings import AnalyticsSettings
+
+
+class AnalyticsContainer(containers.DeclarativeContainer):
+    """분석 함수 process pool"""
+
+    settings = providers.Singleton(AnalyticsSettings)
+
+    executor = providers.Singleton(
+        AnalyticsExecutor,
+        max_workers=settings.provided.ANALYTICS_WORKERS,
+        max_concurrency=settings.provided.ANALYTICS_MAX_CONCURRENCY,
+        min_shared_bytes=settings.provided.ANALYTICS_MIN_SHARED_BYTES,
+        max_shared_bytes=settings.provided.ANALYTICS_MAX_SHARED_BYTES,
+        enabled=settings.provided.ANALYTICS_ENABLED,
+    )
@@ -0,0 +1,228 @@
+"""CPU 를 많이 쓰는 분석 함수(격자 정렬, 이상 탐지, 요약, sketch 압축)를 process pool 에서 실행
+
+수집 / API 를 처리하는 event loop 에서 numpy 연산을 직접 돌리면 그동안 다른 요청이 멈추므로,
+분석 함수는 AnalyticsExecutor.run 으로 별도 process 에서 실행합니다.
+
+- 전달: 인자 / 결과의 numpy 배열은 공유 메모리로 복사하고, pickle 은 배열 위치만 전달합니다. (src.analytics.shared)
+  공유 메모리로 복사 / 결과 회수도 thread 에서 하므로 event loop 는 배열 크기만큼 멈추지 않습니다.
+  block 하나가 max_shared_bytes 를 넘으면 /dev/shm 을 채우지 않도록 그 호출은 pickle 로 전달합니다.
+- 동시 실행 제한: 동시에 실행 중인 호출은 max_concurrency 개까지이며, 나머지는 event loop 에서 순서를 기다립니다.
+- 취소 / 시간 제한: 아직 실행 전인 호출은 pool 에서 빼고, 이미 실행 중인 호출은 끝날 때까지 자리를 차지한 채
+  결과만 버립니다. (실행 중인 process 는 강제로 멈추지 않으므로 동시 실행 수는 제한을 넘지 않음)
+
+start 전이거나 비활성화된 경우에는 같은 process 의 thread 에서 실행합니다. (event loop 는 막지 않음)
+함수는 process 에서 import 할 수 있도록 module 최상위 함수여야 합니다.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional, Tuple, TypeVar
+
+from src import metrics
+from src.analytics.shared import close, from_shared, to_shared
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def invoke(
+    func: Callable,
+    name: Optional[str],
+    payload: Any,
+    min_bytes: int,
+    max_bytes: Optional[int] = None,
+) -> Tuple[Optional[str], Any]:
+    """worker process 에서 실행: 공유 메모리의 인자로 함수를 실행하고 결과를 새 block 에 담아 반환"""
+    from multiprocessing.shared_memory import SharedMemory
+
+    block = SharedMemory(name) if name is not None else None
+    try:
+        args, kwargs = from_shared(payload, block, copy=False)
+        result_block, result = to_shared(func(*args, **kwargs), min_bytes, max_bytes)
+        del args, kwargs
+    finally:
+        close(block)
+    if result_block is None:
+        return None, result
+    close(result_block)
+    return result_block.name, result
+
+
+def collect(name: Optional[str], payload: Any) -> Any:
+    """worker 가 반환한 결과 block 을 복사해 가져오고 block 삭제"""
+    from multiprocessing.shared_memory import SharedMemory
+
+    block = SharedMemory(name) if name is not None else None
+    try:
+        return from_shared(payload, block, copy=True)
+    finally:
+        close(block, unlink=True)
+
+
+def discard(name: Optional[str]) -> None:
+    """가져가지 않는 결과 block 삭제 (취소 / 시간 초과)"""
+    from multiprocessing.shared_memory import SharedMemory
+
+    if name is not None:
+        close(SharedMemory(name), unlink=True)
+
+
+class AnalyticsExecutor:
+    """분석 함수를 process pool 에서 실행 (배열은 공유 메모리로 전달)"""
+
+    def __init__(
+        self,
+        max_workers: int = 2,
+        max_concurrency: int = 2,
+        min_shared_bytes: int = 64 * 1024,
+        max_shared_bytes: Optional[int] = 64 * 1024 * 1024,
+        enabled: bool = True,
+    ):
+        self.max_workers = max_workers
+        self.max_concurrency = max_concurrency
+        self.min_shared_bytes = min_shared_bytes
+        self.max_shared_bytes = max_shared_bytes
+        self.enabled = enabled
+
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._slots = asyncio.Semaphore(max_concurrency)
+
+    async def start(self) -> None:
+        """worker process 를 띄우고 numpy import 를 미리 시작 (끝날 때까지 기다리지 않음)
+
+        event loop 의 thread 를 복제하지 않도록 fork 대신 spawn 으로 시작합니다.
+        """
+        if not self.enabled or self._pool is not None:
+            return
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        for _ in range(self.max_workers):
+            self._pool.submit(_warmup)
+        logger.info(f"AnalyticsExecutor started (workers={self.max_workers})")
+
+    async def stop(self) -> None:
+        """실행 중인 호출이 끝날 때까지 기다린 뒤 worker process 종료"""
+        if self._pool is None:
+            return
+        pool, self._pool = self._pool, None
+        await asyncio.to_thread(pool.shutdown, wait=True, cancel_futures=True)
+
+    async def run(
+        self, func: Callable[..., T], *args, timeout: Optional[float] = None, **kwargs
+    ) -> T:
+        """func(*args, **kwargs) 를 worker process 에서 실행한 결과
+
+        Raises:
+            TimeoutError: timeout(초) 안에 끝나지 않은 경우 발생 (자리를 기다린 시간 포함)
+        """
+        function = func.__name__
+        try:
+            async with asyncio.timeout(timeout):
+                result = await self._run(function, func, args, kwargs)
+        except TimeoutError:
+            metrics.analytics_calls.labels(function, "timeout").inc()
+            raise
+        except asyncio.CancelledError:
+            metrics.analytics_calls.labels(function, "cancelled").inc()
+            raise
+        except Exception:
+            metrics.analytics_calls.labels(function, "error").inc()
+            raise
+        metrics.analytics_calls.labels(function, "ok").inc()
+        return result
+
+    async def _run(self, function: str, func: Callable, args: tuple, kwargs: dict):
+        requested_at = time.perf_counter()
+        await self._slots.acquire()
+        started_at = time.perf_counter()
+        metrics.analytics_wait_seconds.labels(function).observe(started_at - requested_at)
+        if self._pool is None:
+            try:
+                return await asyncio.to_thread(func, *args, **kwargs)
+            finally:
+                self._slots.release()
+                metrics.analytics_run_seconds.labels(function).observe(
+                    time.perf_counter() - started_at
+                )
+        result = await self._submit(self._pool, func, args, kwargs)
+        metrics.analytics_run_seconds.labels(function).observe(
+            time.perf_counter() - started_at
+        )
+        return result
+
+    async def _submit(
+        self, pool: ProcessPoolExecutor, func: Callable, args: tuple, kwargs: dict
+    ) -> Any:
+        """pool 에 제출 (자리는 worker 에서 실행이 실제로 끝날 때 반납)"""
+        packing = asyncio.ensure_future(
+            asyncio.to_thread(
+                to_shared, (args, kwargs), self.min_shared_bytes, self.max_shared_bytes
+            )
+        )
+        try:
+            block, payload = await asyncio.shield(packing)
+            future = pool.submit(
+                invoke,
+                func,
+                block.name if block is not None else None,
+                payload,
+                self.min_shared_bytes,
+                self.max_shared_bytes,
+            )
+        except BaseException:
+            packing.add_done_callback(_close_packed)
+            self._slots.release()
+            raise
+
+        done = asyncio.wrap_future(future)
+        done.add_done_callback(lambda _: self._finish(block))
+        try:
+            name, result = await asyncio.shield(done)
+        except asyncio.CancelledError:
+            # 실행 전이면 pool 에서 빼고, 실행 중이면 끝난 뒤 결과 block 만 삭제
+            future.cancel()
+            done.add_done_callback(_discard_result)
+            raise
+        except BrokenProcessPool:
+            logger.error("analytics worker process terminated unexpectedly")
+            await self._restart(pool)
+            raise
+        return await asyncio.to_thread(collect, name, result)
+
+    def _finish(self, block) -> None:
+        close(block, unlink=True)
+        self._slots.release()
+
+    async def _restart(self, broken: ProcessPoolExecutor) -> None:
+        """worker 가 비정상 종료되어 깨진 pool 을 새 pool 로 교체 (동시에 실패한 호출 중 한 번만)"""
+        if self._pool is not broken:
+            return
+        self._pool = None
+        broken.shutdown(wait=False, cancel_futures=True)
+        await self.start()
+
+
+def _close_packed(packing: asyncio.Future) -> None:
+    if packing.cancelled() or packing.exception() is not None:
+        return
+    block, _ = packing.result()
+    close(block, unlink=True)
+
+
+def _discard_result(done: asyncio.Future) -> None:
+    if done.cancelled() or done.exception() is not None:
+        return
+    name, _ = done.result()
+    discard(name)
+
+
+def _warmup() -> None:
+    """worker 에서 numpy 를 미리 import (첫 호출 지연 방지)"""
+    import numpy  # noqa: F401
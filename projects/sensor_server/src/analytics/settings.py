@@ -0,0 +1,16 @@
+from pydantic_settings import BaseSettings
+from pydantic import Field
+
+
+class AnalyticsSettings(BaseSettings):
+    # False 이면 분석 함수를 process pool 대신 thread 에서 실행
+    ANALYTICS_ENABLED: bool = Field(default=True)
+    # 분석 worker process 수 (API worker 당)
+    ANALYTICS_WORKERS: int = Field(default=2)
+    # 동시에 실행하는 분석 호출 수 (나머지는 대기)
+    ANALYTICS_MAX_CONCURRENCY: int = Field(default=2)
+    # 이 크기(byte) 이상인 배열만 공유 메모리로 전달 (작은 배열은 pickle)
+    ANALYTICS_MIN_SHARED_BYTES: int = Field(default=65536)
+    # 호출 하나의 공유 메모리 block 최대 크기 (byte, 넘으면 pickle 로 전달)
+    # 동시에 (인자 + 결과) x ANALYTICS_MAX_CONCURRENCY 개의 block 이 있을 수 있으므로 /dev/shm 크기에 맞춤
+    ANALYTICS_MAX_SHARED_BYTES: int = Field(default=64 * 1024 * 1024)
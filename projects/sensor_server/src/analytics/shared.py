@@ -0,0 +1,116 @@
+"""process 사이에 numpy 배열을 공유 메모리로 전달
+
+인자 / 결과에 들어있는 배열(튜플, 리스트, dict, dataclass 안쪽까지)을 하나의 SharedMemory block 에 모아 복사하고,
+pickle 되는 payload 에는 배열 대신 block 안의 위치(SharedArray)만 남깁니다.
+받는 쪽은 block 을 열어 같은 위치를 numpy view 로 읽으므로, 배열 크기와 관계 없이 pickle 되는 양은 일정합니다.
+
+min_bytes 보다 작은 배열과 object 배열은 그대로 pickle 합니다.
+공유할 배열의 합이 max_bytes 를 넘으면 block 을 만들지 않고 값 전체를 pickle 합니다.
+(공유 메모리는 /dev/shm 크기 제한을 받으며, 넘치면 pod 가 SIGBUS 로 종료될 수 있음)
+"""
+
+from dataclasses import dataclass, fields, is_dataclass, replace
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, List, Optional, Tuple
+
+import numpy as np
+
+# 배열 시작 위치 정렬 (cache line)
+ALIGNMENT = 64
+
+
+@dataclass(frozen=True)
+class SharedArray:
+    """공유 메모리 block 안의 배열 위치"""
+
+    offset: int
+    dtype: str
+    shape: Tuple[int, ...]
+
+
+def to_shared(
+    value: Any, min_bytes: int = 0, max_bytes: Optional[int] = None
+) -> Tuple[Optional[SharedMemory], Any]:
+    """값 안의 배열을 새 공유 메모리 block 으로 복사
+
+    Returns:
+        (block, payload) 공유할 배열이 없거나 block 크기가 max_bytes 를 넘으면 block 은 None (값 그대로)
+    """
+    arrays: List[Tuple[int, np.ndarray]] = []
+    size = 0
+
+    def pack(value: Any) -> Any:
+        nonlocal size
+        if isinstance(value, np.ndarray):
+            if value.nbytes == 0 or value.nbytes < min_bytes or value.dtype.hasobject:
+                return value
+            offset = size
+            size = -(-(offset + value.nbytes) // ALIGNMENT) * ALIGNMENT
+            arrays.append((offset, value))
+            return SharedArray(offset, value.dtype.str, value.shape)
+        if type(value) in (tuple, list):
+            return type(value)(pack(item) for item in value)
+        if type(value) is dict:
+            return {key: pack(item) for key, item in value.items()}
+        if is_dataclass(value) and not isinstance(value, type):
+            return replace(
+                value,
+                **{
+                    field.name: pack(getattr(value, field.name))
+                    for field in fields(value)
+                    if field.init
+                },
+            )
+        return value
+
+    payload = pack(value)
+    if not arrays:
+        return None, payload
+    if max_bytes is not None and size > max_bytes:
+        return None, value
+    block = SharedMemory(create=True, size=size)
+    for offset, array in arrays:
+        np.ndarray(array.shape, array.dtype, buffer=block.buf, offset=offset)[...] = array
+    return block, payload
+
+
+def from_shared(payload: Any, block: Optional[SharedMemory], copy: bool) -> Any:
+    """payload 의 SharedArray 를 block 의 배열로 되돌림
+
+    copy=False 이면 block 을 가리키는 view 이므로, view 를 모두 버린 뒤에 block 을 닫아야 합니다.
+    """
+
+    def unpack(value: Any) -> Any:
+        if isinstance(value, SharedArray):
+            array = np.ndarray(
+                value.shape, np.dtype(value.dtype), buffer=block.buf, offset=value.offset
+            )
+            return array.copy() if copy else array
+        if type(value) in (tuple, list):
+            return type(value)(unpack(item) for item in value)
+        if type(value) is dict:
+            return {key: unpack(item) for key, item in value.items()}
+        if is_dataclass(value) and not isinstance(value, type):
+            return replace(
+                value,
+                **{
+                    field.name: unpack(getattr(value, field.name))
+                    for field in fields(value)
+                    if field.init
+                },
+            )
+        return value
+
+    return unpack(payload)
+
+
+def close(block: Optional[SharedMemory], unlink: bool = False) -> None:
+    """block 닫기 (남아 있는 view 가 있으면 mapping 은 view 가 정리될 때 해제)"""
+    if block is None:
+        return
+    try:
+        block.close()
+    except BufferError:
+        pass
+    if unlink:
+        block.unlink()
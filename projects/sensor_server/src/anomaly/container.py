@@ -0,0 +1,50 @@
+from dependency_injector import containers, providers
+
+from src.analytics.container import AnalyticsContainer
+from src.anomaly.detector import AnomalyDetector
+from src.anomaly.repository import WaterTankAnomalyRepository
+from src.anomaly.settings import AnomalySettings
+from src.database.container import DatabaseContainer
+from src.scheduler.domains import ScheduledJob
+from src.scheduler.schedule import IntervalSchedule
+from src.sensor.container import SensorContainer
+
+
+class AnomalyContainer(containers.DeclarativeContainer):
+    """수조 이상 탐지"""
+
+    database: DatabaseContainer = providers.Container(DatabaseContainer)
+    sensor: SensorContainer = providers.Container(SensorContainer)
+    analytics: AnalyticsContainer = providers.Container(AnalyticsContainer)
+
+    settings = providers.Singleton(AnomalySettings)
+
+    repository = providers.Singleton(
+        WaterTankAnomalyRepository, session_factory=database.session_factory
+    )
+
+    detector = providers.Singleton(
+        AnomalyDetector,
+        history_repository=sensor.history_repository,
+        anomaly_repository=repository,
+        window=settings.provided.ANOMALY_WINDOW,
+        bucket=settings.provided.ANOMALY_BUCKET,
+        zscore_threshold=settings.provided.ANOMALY_ZSCORE_THRESHOLD,
+        min_mad=settings.provided.ANOMALY_MIN_MAD,
+        flatline_window=settings.provided.ANOMALY_FLATLINE_WINDOW,
+        flatline_tolerance=settings.provided.ANOMALY_FLATLINE_TOLERANCE,
+        analytics=analytics.executor,
+    )
+
+    # scheduler 에 등록하는 주기 작업 (leader 에서만 실행)
+    job = providers.Singleton(
+        ScheduledJob,
+        name="anomaly_detection",
+        schedule=providers.Singleton(
+            IntervalSchedule, settings.provided.ANOMALY_INTERVAL
+        ),
+        func=detector.provided.run,
+        timeout=settings.provided.ANOMALY_TIMEOUT,
+        jitter=settings.provided.ANOMALY_JITTER,
+        enabled=settings.provided.ANOMALY_ENABLED,
+    )
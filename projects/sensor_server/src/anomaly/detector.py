@@ -0,0 +1,217 @@
+"""수조 전체에 대한 이상 탐지 (robust z-score, flatline)
+
+고정 임계값(경보 규칙)으로는 잡히지 않는 센서 drift 와 고착(stuck)을 찾기 위해, 주기적으로 모든 수조의 최근 구간
+history 를 bucket 평균으로 조회해 [수조, bucket, 항목] 행렬로 정렬하고 한 번에 계산합니다.
+
+- robust z-score: 구간 중앙값 / MAD 대비 최근 bucket 평균의 편차 (0.6745 * (x - median) / MAD)
+- flatline: 최근 flatline 구간의 모든 bucket 에 값이 있고, 변화 폭(max - min)이 tolerance 이하
+
+측정 값이 없는 bucket 은 NaN 으로 두고 nan* 연산으로 제외합니다. (측정이 끊긴 수조는 flatline 이 아님)
+"""
+
+import logging
+import time
+import warnings
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+
+from src import metrics
+from src.analytics.executor import AnalyticsExecutor
+from src.anomaly.domains import AnomalyDetectionRun, WaterTankAnomaly
+from src.anomaly.repository import WaterTankAnomalyRepository
+from src.sensor.domains import EPOCH, METRICS
+from src.sensor.resample import align_buckets
+
+logger = logging.getLogger(__name__)
+
+# MAD 를 정규분포의 표준편차 단위로 맞추는 계수
+MAD_SCALE = 0.6745
+
+
+@dataclass
+class AnomalyScores:
+    """수조 / 항목별 탐지 결과 ([수조, 항목] 배열)"""
+
+    value: np.ndarray  # 최근 bucket 평균 (값이 있는 마지막 bucket)
+    median: np.ndarray
+    mad: np.ndarray
+    zscore: np.ndarray
+    flatline: np.ndarray
+    anomalous: np.ndarray
+
+
+def score_anomalies(
+    matrix: np.ndarray,
+    zscore_threshold: float,
+    min_mad: float,
+    flatline_buckets: int,
+    flatline_tolerance: float,
+) -> AnomalyScores:
+    """[수조, bucket, 항목] 행렬로 수조 / 항목별 robust z-score 와 flatline 계산"""
+    observed = ~np.isnan(matrix)
+    with warnings.catch_warnings():
+        # 값이 하나도 없는 (수조, 항목) 은 NaN 으로 남김
+        warnings.simplefilter("ignore", RuntimeWarning)
+        median = np.nanmedian(matrix, axis=1)
+        mad = np.nanmedian(np.abs(matrix - median[:, None, :]), axis=1)
+        recent = matrix[:, -flatline_buckets:]
+        spread = np.nanmax(recent, axis=1) - np.nanmin(recent, axis=1)
+
+    last = matrix.shape[1] - 1 - np.argmax(observed[:, ::-1], axis=1)
+    value = np.take_along_axis(matrix, last[:, None, :], axis=1)[:, 0]
+    zscore = MAD_SCALE * (value - median) / np.maximum(mad, min_mad)
+
+    flatline = observed[:, -flatline_buckets:].all(axis=1) & (
+        spread <= flatline_tolerance
+    )
+    anomalous = (np.abs(zscore) >= zscore_threshold) | flatline
+    return AnomalyScores(
+        value=value,
+        median=median,
+        mad=mad,
+        zscore=zscore,
+        flatline=flatline,
+        anomalous=anomalous,
+    )
+
+
+def detect_anomalies(
+    columns,
+    start: int,
+    bucket: int,
+    buckets: int,
+    zscore_threshold: float,
+    min_mad: float,
+    flatline_buckets: int,
+    flatline_tolerance: float,
+) -> Tuple[np.ndarray, AnomalyScores]:
+    """bucket 평균 묶음을 행렬로 정렬해 탐지 (AnalyticsExecutor 에서 실행)
+
+    Returns:
+        (행렬의 행 순서대로 수조 id, 탐지 결과)
+    """
+    tank_ids, matrix = align_buckets(columns, start, bucket, buckets)
+    scores = score_anomalies(
+        matrix,
+        zscore_threshold=zscore_threshold,
+        min_mad=min_mad,
+        flatline_buckets=flatline_buckets,
+        flatline_tolerance=flatline_tolerance,
+    )
+    return tank_ids, scores
+
+
+class AnomalyDetector:
+    """모든 수조의 이상 탐지를 실행하고 결과를 저장
+
+    주기 실행은 scheduler 의 leader_only 작업(AnomalyContainer.job)으로 하므로 replica 가 여러 개여도 한 곳에서만 실행됩니다.
+    history 조회는 SensorContainer 의 history_repository(aggregate_all) 를 사용하므로 TimescaleDB / columnar
+    어느 쪽이든 동작합니다. 마지막 실행 요약(last_run)은 실행한 프로세스의 메모리에 두고, 단계별 소요 시간은 metric 으로도 남깁니다.
+    """
+
+    def __init__(
+        self,
+        history_repository,
+        anomaly_repository: WaterTankAnomalyRepository,
+        window: int = 3600,
+        bucket: int = 60,
+        zscore_threshold: float = 3.5,
+        min_mad: float = 0.01,
+        flatline_window: int = 900,
+        flatline_tolerance: float = 0.0,
+        clock: Callable[[], float] = time.time,
+        analytics: Optional[AnalyticsExecutor] = None,
+    ):
+        self.history_repository = history_repository
+        self.anomaly_repository = anomaly_repository
+        self.bucket = bucket
+        self.buckets = max(window // bucket, 1)
+        self.flatline_buckets = min(max(flatline_window // bucket, 2), self.buckets)
+        self.zscore_threshold = zscore_threshold
+        self.min_mad = min_mad
+        self.flatline_tolerance = flatline_tolerance
+        self.clock = clock
+        self.analytics = analytics or AnalyticsExecutor(enabled=False)
+
+        self.last_run: Optional[AnomalyDetectionRun] = None
+
+    async def find_tank_anomalies(self, tank_id: int) -> List[WaterTankAnomaly]:
+        """수조의 항목별 마지막 탐지 결과"""
+        return await self.anomaly_repository.find_by(tank_id=tank_id)
+
+    async def find_anomalous(self) -> List[WaterTankAnomaly]:
+        """이상으로 판정된 모든 (수조, 항목) 의 마지막 탐지 결과"""
+        return await self.anomaly_repository.find_anomalous()
+
+    async def run(self) -> List[WaterTankAnomaly]:
+        """최근 구간의 모든 수조에 대해 탐지하고 결과를 저장"""
+        now = self.clock()
+        started_at = time.perf_counter()
+
+        # 현재 진행 중인 bucket 까지 포함
+        end = (int(now) // self.bucket + 1) * self.bucket
+        start = end - self.buckets * self.bucket
+        columns = await self.history_repository.aggregate_all(
+            EPOCH + timedelta(seconds=start),
+            EPOCH + timedelta(seconds=end),
+            timedelta(seconds=self.bucket),
+        )
+        loaded_at = time.perf_counter()
+
+        tank_ids, scores = await self.analytics.run(
+            detect_anomalies,
+            columns,
+            start,
+            self.bucket,
+            self.buckets,
+            self.zscore_threshold,
+            self.min_mad,
+            self.flatline_buckets,
+            self.flatline_tolerance,
+        )
+        anomalies = to_anomalies(
+            tank_ids, scores, datetime.fromtimestamp(now, tz=timezone.utc)
+        )
+        detected_at = time.perf_counter()
+
+        await self.anomaly_repository.upsert_many(anomalies)
+        stored_at = time.perf_counter()
+
+        self.last_run = AnomalyDetectionRun(
+            started_at=datetime.fromtimestamp(now, tz=timezone.utc),
+            tanks=len(tank_ids),
+            buckets=self.buckets,
+            anomalies=int(scores.anomalous.sum()),
+            load_seconds=loaded_at - started_at,
+            detect_seconds=detected_at - loaded_at,
+            store_seconds=stored_at - detected_at,
+        )
+        metrics.anomaly_detection_seconds.labels("load").observe(self.last_run.load_seconds)
+        metrics.anomaly_detection_seconds.labels("detect").observe(self.last_run.detect_seconds)
+        metrics.anomaly_detection_seconds.labels("store").observe(self.last_run.store_seconds)
+        metrics.anomaly_detected.set(self.last_run.anomalies)
+        return anomalies
+
+
+def to_anomalies(
+    tank_ids: np.ndarray, scores: AnomalyScores, evaluated_at: datetime
+) -> List[WaterTankAnomaly]:
+    """값이 있는 (수조, 항목) 의 탐지 결과"""
+    rows, columns = np.nonzero(~np.isnan(scores.value))
+    return [
+        WaterTankAnomaly(
+            tank_id=int(tank_ids[i]),
+            metric=METRICS[m],
+            evaluated_at=evaluated_at,
+            value=float(scores.value[i, m]),
+            median=float(scores.median[i, m]),
+            mad=float(scores.mad[i, m]),
+            zscore=float(scores.zscore[i, m]),
+            flatline=bool(scores.flatline[i, m]),
+            anomalous=bool(scores.anomalous[i, m]),
+        )
+        for i, m in zip(rows.tolist(), columns.tolist())
+    ]
@@ -0,0 +1,30 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass
+class WaterTankAnomaly:
+    """수조 측정 항목의 이상 탐지 결과 (수조 / 항목별 마지막 실행 결과만 유지)"""
+
+    tank_id: int  # 수조 id
+    metric: str  # 측정 항목
+    evaluated_at: datetime  # 탐지 실행 시간
+    value: float  # 최근 bucket 평균
+    median: float  # 구간 중앙값
+    mad: float  # 구간 중앙값 절대 편차 (median absolute deviation)
+    zscore: float  # robust z-score = 0.6745 * (value - median) / mad
+    flatline: bool  # 최근 구간 동안 값이 변하지 않음 (센서 고착 의심)
+    anomalous: bool  # |zscore| 가 기준 이상이거나 flatline
+
+
+@dataclass
+class AnomalyDetectionRun:
+    """이상 탐지 실행 1회의 요약과 단계별 소요 시간"""
+
+    started_at: datetime
+    tanks: int  # 탐지한 수조 수
+    buckets: int  # 수조별 bucket 수
+    anomalies: int  # 이상으로 판정된 (수조, 항목) 수
+    load_seconds: float  # history 조회
+    detect_seconds: float  # 행렬 정렬 / 연산
+    store_seconds: float  # 결과 저장
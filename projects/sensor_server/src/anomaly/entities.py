@@ -0,0 +1,66 @@
+from datetime import datetime
+
+from sqlalchemy import VARCHAR, DateTime
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.anomaly.domains import WaterTankAnomaly
+from src.database.base import Base
+
+
+class WaterTankAnomalyEntity(Base):
+    """수조 측정 항목별 마지막 이상 탐지 결과 저장"""
+
+    __tablename__ = "water_tank_anomaly"
+
+    tank_id: Mapped[int] = mapped_column(primary_key=True)
+    metric: Mapped[str] = mapped_column(VARCHAR(32), primary_key=True)
+    evaluated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    value: Mapped[float] = mapped_column()
+    median: Mapped[float] = mapped_column()
+    mad: Mapped[float] = mapped_column()
+    zscore: Mapped[float] = mapped_column()
+    flatline: Mapped[bool] = mapped_column()
+    anomalous: Mapped[bool] = mapped_column()
+
+    @staticmethod
+    def from_domain(domain: WaterTankAnomaly):
+        """도메인 객체를 엔티티로 변환합니다."""
+        return WaterTankAnomalyEntity(
+            tank_id=domain.tank_id,
+            metric=domain.metric,
+            evaluated_at=domain.evaluated_at,
+            value=domain.value,
+            median=domain.median,
+            mad=domain.mad,
+            zscore=domain.zscore,
+            flatline=domain.flatline,
+            anomalous=domain.anomalous,
+        )
+
+    def to_domain(self) -> WaterTankAnomaly:
+        """엔티티 객체를 도메인 객체로 변환합니다."""
+        return WaterTankAnomaly(
+            tank_id=self.tank_id,
+            metric=self.metric,
+            evaluated_at=self.evaluated_at,
+            value=self.value,
+            median=self.median,
+            mad=self.mad,
+            zscore=self.zscore,
+            flatline=self.flatline,
+            anomalous=self.anomalous,
+        )
+
+    def update(self, domain: WaterTankAnomaly):
+        """도메인 객체로 엔티티의 값을 업데이트합니다."""
+        self.evaluated_at = domain.evaluated_at
+        self.value = domain.value
+        self.median = domain.median
+        self.mad = domain.mad
+        self.zscore = domain.zscore
+        self.flatline = domain.flatline
+        self.anomalous = domain.anomalous
+
+    def primary_key(self) -> tuple[int, str]:
+        """엔티티의 기본 키를 반환합니다."""
+        return self.tank_id, self.metric
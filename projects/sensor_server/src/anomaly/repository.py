@@ -0,0 +1,42 @@
+from dataclasses import asdict
+from typing import List
+
+from sqlalchemy.dialects.postgresql import insert
+
+from src.anomaly.domains import WaterTankAnomaly
+from src.anomaly.entities import WaterTankAnomalyEntity
+from src.database.repository import BaseRepository
+
+
+class WaterTankAnomalyRepository(BaseRepository[tuple, WaterTankAnomaly]):
+    """수조 측정 항목별 이상 탐지 결과 저장"""
+
+    entity = WaterTankAnomalyEntity
+
+    async def upsert_many(self, anomalies: List[WaterTankAnomaly]) -> None:
+        """(수조, 항목)별 결과를 한 번의 multi-row upsert 로 저장"""
+        if len(anomalies) == 0:
+            return
+        stmt = insert(self.entity)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[self.entity.tank_id, self.entity.metric],
+            set_={
+                column: stmt.excluded[column]
+                for column in (
+                    "evaluated_at",
+                    "value",
+                    "median",
+                    "mad",
+                    "zscore",
+                    "flatline",
+                    "anomalous",
+                )
+            },
+        )
+        async with self.session_factory() as session:
+            await session.execute(stmt, [asdict(anomaly) for anomaly in anomalies])
+            await session.commit()
+
+    async def find_anomalous(self) -> List[WaterTankAnomaly]:
+        """이상으로 판정된 (수조, 항목) 결과"""
+        return await self.find_by(anomalous=True)
@@ -0,0 +1,22 @@
+from pydantic_settings import BaseSettings
+from pydantic import Field
+
+
+class AnomalySettings(BaseSettings):
+    ANOMALY_ENABLED: bool = Field(default=True)
+    # 탐지 주기 (초)
+    ANOMALY_INTERVAL: float = Field(default=60.0)
+    # 탐지 한 번의 제한 시간 (초) / 실행 시간에 더하는 무작위 지연의 최대값 (초)
+    ANOMALY_TIMEOUT: float = Field(default=50.0)
+    ANOMALY_JITTER: float = Field(default=5.0)
+    # 중앙값 / MAD 를 계산하는 구간 (초)
+    ANOMALY_WINDOW: int = Field(default=3600)
+    # 구간을 나누는 bucket 크기 (초, 수조별 history 를 bucket 평균으로 정렬)
+    ANOMALY_BUCKET: int = Field(default=60)
+    # |robust z-score| 가 이 값 이상이면 이상
+    ANOMALY_ZSCORE_THRESHOLD: float = Field(default=3.5)
+    # MAD 하한 (값이 거의 변하지 않는 항목에서 z-score 가 과도하게 커지는 것을 방지)
+    ANOMALY_MIN_MAD: float = Field(default=0.01)
+    # 최근 구간(초) 동안 bucket 평균의 변화 폭이 tolerance 이하이면 flatline (센서 고착 의심)
+    ANOMALY_FLATLINE_WINDOW: int = Field(default=900)
+    ANOMALY_FLATLINE_TOLERANCE: float = Field(default=0.0)
@@ -1,14 +1,15 @@
 import abc
-from contextlib import AbstractContextManager
-from typing import Generic, List, Optional, Callable
+from typing import Any, Generic, List, Optional, Tuple
 
 from dataclasses import fields
 import sqlalchemy
-from sqlalchemy import exists, func, select, inspect, delete, update
+from sqlalchemy import exists, func, select, inspect, delete, update, insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Executable
 from sqlalchemy.orm import joinedload
 
 from src.database.base import Base, DomainKey, Domain
+from src.database.session_factory import SessionFactory
 from src.exceptions import AlreadyExistsException, NotFoundException
 import logging
 
@@ -34,6 +35,8 @@ class BaseRepository(abc.ABC, Generic[DomainKey, Domain]):
     """기본 저장소 관리
 
     엔티티와 관련된 데이터베이스 CRUD 작업을 수행하는 기본 저장소 클래스입니다.
+    조회 메소드(find_*, get_*, count_by, exist_by)는 `session_factory.reader()` 를 통해
+    read replica 로 보내집니다. primary 에서 조회해야 하는 경우 `session_factory.primary()` 를 사용합니다.
 
     Attrs:
         entity: 관리할 엔티티 클래스
@@ -42,9 +45,7 @@ class BaseRepository(abc.ABC, Generic[DomainKey, Domain]):
 
     entity: Base
 
-    def __init__(
-        self, session_factory: Callable[..., AbstractContextManager[AsyncSession]]
-    ):
+    def __init__(self, session_factory: SessionFactory):
         """BaseRepository 초기화
 
         Args:
@@ -66,6 +67,30 @@ class BaseRepository(abc.ABC, Generic[DomainKey, Domain]):
             await self._create(session, domain)
             await session.commit()
 
+    async def bulk_create(
+        self, domains: List[Domain], session: Optional[AsyncSession] = None
+    ) -> List[Domain]:
+        """여러 엔티티를 multi-row INSERT ... RETURNING 으로 한 번에 저장
+
+        session 이 주어지면 해당 트랜잭션 안에서 실행하고 commit 하지 않습니다.
+
+        Args:
+            domains: 저장할 도메인 객체 리스트
+            session: 함께 사용할 데이터베이스 세션 (선택)
+        Returns:
+            List[Domain]: 자동 생성된 키가 반영된 도메인 객체 리스트 (입력 순서 유지)
+        Raises:
+            AlreadyExistsException: 엔티티가 이미 존재할 경우 발생
+        """
+
+        if session is not None:
+            return await self._bulk_create(session, domains)
+
+        async with self.session_factory() as session:
+            created = await self._bulk_create(session, domains)
+            await session.commit()
+            return created
+
     async def update(self, domain: Domain) -> None:
         """엔티티 정보를 업데이트
 
@@ -159,7 +184,7 @@ class BaseRepository(abc.ABC, Generic[DomainKey, Domain]):
         Raises:
             NotFoundException: 엔티티를 찾지 못할 경우 발생
         """
-        async with self.session_factory() as session:
+        async with self.session_factory.reader() as session:
             try:
                 entity = await self._get_by_id(session, key)
                 if entity is None:
@@ -179,7 +204,7 @@ class BaseRepository(abc.ABC, Generic[DomainKey, Domain]):
             Optional[Domain]: 검색된 도메인 객체 또는 None
         """
 
-        async with self.session_factory() as session:
+        async with self.session_factory.reader() as session:
             if entity := await self._find_by_id(session, key):
                 return entity.to_domain()
 
@@ -190,7 +215,7 @@ class BaseRepository(abc.ABC, Generic[DomainKey, Domain]):
             List[Domain]: 엔티티 도메인 객체 리스트
         """
 
-        async with self.session_factory() as session:
+        async with self.session_factory.reader() as session:
             stmt = self._get_select_based_on_relationship()
             result = await session.execute(stmt)
             entities = self._handle_scalars(result)
@@ -204,14 +229,14 @@ class BaseRepository(abc.ABC, Generic[DomainKey, Domain]):
         Returns:
             bool: 엔티티가 존재하는지 여부
         """
-        async with self.session_factory() as session:
+        async with self.session_factory.reader() as session:
             criteria = create_field_criteria(self.entity, kwargs)
             stmt = select(exists(self.entity)).where(*criteria)
             result = await session.execute(stmt)
             return bool(result.scalar())
 
     async def count_by(self, **kwargs) -> int:
-        async with self.session_factory() as session:
+        async with self.session_factory.reader() as session:
             criteria = create_field_criteria(self.entity, kwargs)
             stmt = select(func.count()).select_from(self.entity).where(*criteria)
             result = await session.execute(stmt)
@@ -238,13 +263,24 @@ class BaseRepository(abc.ABC, Generic[DomainKey, Domain]):
             List[Domain]: 검색된 도메인 객체 리스트
         """
 
-        async with self.session_factory() as session:
-            criteria = create_field_criteria(self.entity, kwargs)
-            stmt = self._get_select_based_on_relationship().filter(*criteria)
+        async with self.session_factory.reader() as session:
+            stmt = self.find_by_statement(**kwargs)
             result = await session.execute(stmt)
             entities = self._handle_scalars(result)
             return [entity.to_domain() for entity in entities]
 
+    def find_by_statement(self, **kwargs) -> Executable:
+        """find_by 가 실행하는 select 문"""
+        criteria = create_field_criteria(self.entity, kwargs)
+        return self._get_select_based_on_relationship().filter(*criteria)
+
+    def warmup_statements(self) -> List[Tuple[Executable, Any]]:
+        """애플리케이션 시작 시 미리 준비해둘 자주 쓰는 statement 와 예시 parameter
+
+        SessionFactory.warmup 에서 rollback 되는 트랜잭션 안에서 실행됩니다.
+        """
+        return []
+
     def _get_select_based_on_relationship(self):
         """엔티티의 관계 여부에 따라 적절한 select 문을 반환
 
@@ -328,6 +364,31 @@ class BaseRepository(abc.ABC, Generic[DomainKey, Domain]):
         new_domain = entity.to_domain()
         reflect_domain(domain, new_domain)
 
+    async def _bulk_create(self, session, domains: List[Domain]) -> List[Domain]:
+        """엔티티 일괄 생성
+
+        Args:
+            session: 데이터베이스 세션
+            domains: 생성할 도메인 객체 리스트
+        Returns:
+            List[Domain]: 생성된 도메인 객체 리스트 (입력 순서 유지)
+        Raises:
+            AlreadyExistsException: 엔티티가 이미 존재할 경우 발생
+        """
+
+        if len(domains) == 0:
+            return []
+
+        rows = [to_row(self.entity.from_domain(domain)) for domain in domains]
+        stmt = insert(self.entity).returning(
+            self.entity, sort_by_parameter_order=True
+        )
+        try:
+            result = await session.execute(stmt, rows)
+        except sqlalchemy.exc.IntegrityError:
+            raise AlreadyExistsException(f"{self.entity} already exists")
+        return [entity.to_domain() for entity in result.scalars().all()]
+
     async def _update(self, session, entity, domain: Domain) -> None:
         """엔티티 업데이트
 
@@ -428,3 +489,26 @@ def get_primary_key(entity: Base, domain: Domain):
     """
 
     return entity.from_domain(domain).primary_key()
+
+
+def to_row(entity: Base) -> dict:
+    """엔티티를 INSERT 용 컬럼 값 dict 로 변환
+
+    값이 없는 기본 키는 제외하여 데이터베이스에서 자동 생성되도록 합니다.
+
+    Args:
+        entity (Base): 변환할 엔티티 객체
+
+    Returns:
+        dict: 컬럼 이름과 값의 쌍
+    """
+
+    mapper = inspect(entity).mapper
+    primary_keys = {column.key for column in mapper.primary_key}
+    row = {}
+    for attr in mapper.column_attrs:
+        value = getattr(entity, attr.key)
+        if value is None and attr.key in primary_keys:
+            continue
+        row[attr.key] = value
+    return row
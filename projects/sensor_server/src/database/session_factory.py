@@ -1,35 +1,94 @@
 import asyncio
-from contextlib import AbstractContextManager, asynccontextmanager
-from typing import Callable
+from contextlib import AbstractContextManager, asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, List, Optional, Tuple
 import logging
+import time
 
+import asyncpg
 import sqlalchemy.exc
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy import Executable, event, text
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, AsyncSession
 from sqlalchemy.ext.asyncio import async_sessionmaker, async_scoped_session
+from src import metrics
 from src.database.base import Base
 from src.exceptions import DatabaseException, NotFoundException, DBIntegrityException
 from src.database.settings import DatabaseSettings
 
 logger = logging.getLogger(__name__)
 
+# replica 에서 primary 대비 재생이 밀린 시간(초). replica 가 아니거나 따라잡은 경우 0
+# WAL receiver 가 primary 에서 받고 있지 않으면(연결 끊김) 받은 만큼은 재생했어도 뒤처진 것이므로 NULL
+# (status 는 pg_read_all_stats 권한이 있어야 보이며, 권한이 없으면 receiver process 존재 여부만 확인)
+REPLICA_LAG_QUERY = text(
+    """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN NOT EXISTS (
+            SELECT 1 FROM pg_stat_wal_receiver
+            WHERE COALESCE(status, 'streaming') = 'streaming'
+        ) THEN NULL
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+    """
+)
+
+# True 인 컨텍스트에서는 조회도 primary 로 보냄 (read-your-writes)
+_use_primary: ContextVar[bool] = ContextVar("use_primary", default=False)
+
 
 class SessionFactory:
-    """비동기 데이터베이스 클래스"""
+    """비동기 데이터베이스 클래스
+
+    쓰기는 primary 로, `reader()` 로 연 세션은 replica(설정된 경우)로 보냅니다.
+    replica 의 lag 이 허용치를 넘거나 접속할 수 없으면 조회도 primary 로 보냅니다.
+    """
 
     def __init__(self, settings: DatabaseSettings):
         logger.info(f"initialize SessionFactory({settings.DB_TYPE})")
+        self._settings = settings
         if settings.DB_TYPE.startswith("postgresql"):
-            url = f"postgresql+asyncpg://{settings.DB_USER}:{settings.DB_PASSWORD}@{settings.DB_HOST}:{settings.DB_PORT}/{settings.DB_NAME}"
-            self._engine = create_async_engine(url, echo=settings.DB_ECHO)
+            self._engine = self._create_engine(settings.DB_HOST, settings.DB_PORT)
+            self._read_engine: Optional[AsyncEngine] = None
+            if settings.DB_READ_HOST:
+                logger.info(f"initialize read replica ({settings.DB_READ_HOST})")
+                self._read_engine = self._create_engine(
+                    settings.DB_READ_HOST, settings.DB_READ_PORT
+                )
         else:
             raise DatabaseException(
                 f"지원하지 않는 database type입니다. {settings.DB_TYPE}"
             )
 
-        self._session_factory = async_scoped_session(
+        self._session_factory = self._create_session_factory(self._engine)
+        self._read_session_factory = (
+            self._create_session_factory(self._read_engine)
+            if self._read_engine is not None
+            else self._session_factory
+        )
+
+        self._replica_checked_at = float("-inf")
+        self._replica_fresh = False
+
+    def _create_engine(self, host: str, port: int) -> AsyncEngine:
+        settings = self._settings
+        url = f"postgresql+asyncpg://{settings.DB_USER}:{settings.DB_PASSWORD}@{host}:{port}/{settings.DB_NAME}"
+        engine = create_async_engine(
+            url, echo=settings.DB_ECHO, **settings.pool_options()
+        )
+        # 요청당 DB 왕복 횟수 집계
+        event.listen(
+            engine.sync_engine, "before_cursor_execute", metrics.record_db_round_trip
+        )
+        return engine
+
+    @staticmethod
+    def _create_session_factory(engine: AsyncEngine):
+        return async_scoped_session(
             async_sessionmaker(
                 autocommit=False,
-                bind=self._engine,
+                bind=engine,
             ),
             scopefunc=asyncio.current_task,
         )
@@ -44,7 +103,48 @@ class SessionFactory:
 
     @asynccontextmanager
     async def __call__(self) -> Callable[..., AbstractContextManager[AsyncSession]]:
-        session: AsyncSession = self._session_factory()
+        async with self._session(self._session_factory) as session:
+            yield session
+
+    @asynccontextmanager
+    async def reader(self) -> Callable[..., AbstractContextManager[AsyncSession]]:
+        """조회용 세션
+
+        replica 가 없거나, `primary()` 컨텍스트 안이거나, replica 의 lag 이 허용치를 넘으면
+        primary 세션을 반환합니다.
+        replica 커넥션은 세션을 넘기기 전에 미리 확보하여, 접속할 수 없으면 replica 를 lag 초과로 표시하고
+        primary 세션을 반환합니다. 조회 도중 replica 커넥션이 끊어진 경우에도 다음 조회부터 primary 로 보냅니다.
+        """
+        session_factory = self._session_factory
+        if not _use_primary.get() and await self._is_replica_fresh():
+            session_factory = await self._connect_replica()
+
+        async with self._session(session_factory) as session:
+            try:
+                yield session
+            except sqlalchemy.exc.DBAPIError as e:
+                if session_factory is self._read_session_factory and e.connection_invalidated:
+                    self._mark_replica_stale(e)
+                raise
+
+    @staticmethod
+    @contextmanager
+    def primary():
+        """컨텍스트 안의 모든 조회를 primary 로 보냅니다. (read-your-writes)
+
+        example:
+            with session_factory.primary():
+                await repository.get_by_id(key)
+        """
+        token = _use_primary.set(True)
+        try:
+            yield
+        finally:
+            _use_primary.reset(token)
+
+    @asynccontextmanager
+    async def _session(self, session_factory) -> AsyncSession:
+        session: AsyncSession = session_factory()
         try:
             yield session
         except sqlalchemy.exc.NoResultFound:
@@ -59,7 +159,115 @@ class SessionFactory:
             raise e
         finally:
             await session.close()
-            await self._session_factory.remove()
+            await session_factory.remove()
+
+    async def _is_replica_fresh(self) -> bool:
+        """replica 로 조회를 보내도 되는지 여부
+
+        lag 확인은 DB_READ_LAG_CHECK_INTERVAL 마다 한 번만 수행하고,
+        확인 중에 들어온 요청은 직전 결과를 사용합니다.
+        """
+        if self._read_engine is None:
+            return False
+
+        now = time.monotonic()
+        if now - self._replica_checked_at >= self._settings.DB_READ_LAG_CHECK_INTERVAL:
+            self._replica_checked_at = now
+            self._replica_fresh = await self._check_replica_lag()
+        return self._replica_fresh
+
+    async def _connect_replica(self):
+        """replica 세션의 커넥션을 미리 확보 (실패하면 primary 세션 factory 반환)"""
+        session: AsyncSession = self._read_session_factory()
+        try:
+            await session.connection()
+        except (OSError, asyncio.TimeoutError, sqlalchemy.exc.SQLAlchemyError) as e:
+            await session.close()
+            await self._read_session_factory.remove()
+            self._mark_replica_stale(e)
+            return self._session_factory
+        return self._read_session_factory
+
+    def _mark_replica_stale(self, error: Exception) -> None:
+        """다음 lag 확인 전까지 조회를 primary 로 보냄"""
+        logger.warning(f"read replica unavailable, fallback to primary ({error!r})")
+        self._replica_fresh = False
+        self._replica_checked_at = time.monotonic()
+
+    async def _check_replica_lag(self) -> bool:
+        try:
+            async with self._read_engine.connect() as conn:
+                lag = (await conn.execute(REPLICA_LAG_QUERY)).scalar()
+        except Exception as e:
+            logger.warning(f"read replica unavailable, fallback to primary ({e})")
+            return False
+
+        if lag is None:
+            logger.warning("read replica is not streaming from primary, fallback to primary")
+            return False
+        lag = float(lag)
+        if lag > self._settings.DB_READ_MAX_LAG_SECONDS:
+            logger.warning(f"read replica lag {lag:.1f}s, fallback to primary")
+            return False
+        return True
+
+    async def warmup(
+        self, connections: Optional[int], statements: List[Tuple[Executable, Any]]
+    ) -> None:
+        """커넥션 풀을 미리 채우고, 각 커넥션에서 자주 쓰는 statement 를 준비해둡니다.
+
+        첫 요청이 TCP 연결, asyncpg 타입 조회, statement prepare 비용을 치르지 않도록 애플리케이션 시작 시 호출합니다.
+        statement 는 rollback 되는 트랜잭션 안에서 실행되므로 데이터는 바뀌지 않습니다.
+        statement 마다 savepoint 를 두어, 예시 parameter 가 제약 조건(FK 등)에 걸려도 트랜잭션이 중단되지 않고
+        다음 statement 를 계속 준비합니다. (prepare 는 실행 전에 끝나므로 무결성 오류는 정상으로 취급)
+        replica 가 있으면 조회 statement 만 replica 커넥션에서도 준비합니다.
+
+        Args:
+            connections: 엔진별로 미리 열 커넥션 수 (None 이면 풀 크기만큼)
+            statements: (statement, 예시 parameter) 리스트
+        """
+        engines = [(self._engine, statements)]
+        if self._read_engine is not None:
+            selects = [(stmt, params) for stmt, params in statements if stmt.is_select]
+            engines.append((self._read_engine, selects))
+
+        async def warm(engine: AsyncEngine, engine_statements) -> None:
+            async with engine.connect() as conn:
+                transaction = await conn.begin()
+                # 실제 요청과 같은 SQL 이 되도록 세션을 통해 실행
+                session = AsyncSession(bind=conn)
+                try:
+                    for stmt, params in engine_statements:
+                        try:
+                            async with session.begin_nested():
+                                await session.execute(stmt, params)
+                        except sqlalchemy.exc.IntegrityError:
+                            pass
+                        except Exception as e:
+                            logger.warning(f"warmup statement failed ({e!r})")
+                finally:
+                    await session.close()
+                    await transaction.rollback()
+
+        for engine, engine_statements in engines:
+            count = engine.pool.size() if connections is None else connections
+            # 동시에 열어야 서로 다른 커넥션이 만들어짐
+            await asyncio.gather(
+                *(warm(engine, engine_statements) for _ in range(min(count, engine.pool.size())))
+            )
 
     async def connect(self):
         return await self._engine.connect()
+
+    async def connect_raw(self) -> asyncpg.Connection:
+        """커넥션 풀과 별개의 asyncpg 커넥션을 생성합니다.
+
+        LISTEN/NOTIFY 처럼 커넥션을 오래 점유하는 작업에 사용합니다.
+        """
+        return await asyncpg.connect(
+            host=self._settings.DB_HOST,
+            port=self._settings.DB_PORT,
+            user=self._settings.DB_USER,
+            password=self._settings.DB_PASSWORD,
+            database=self._settings.DB_NAME,
+        )
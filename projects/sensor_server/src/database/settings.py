@@ -1,6 +1,13 @@
+from typing import Optional
+
 from pydantic_settings import BaseSettings
 from pydantic import Field
 
+# worker 당 커넥션 풀 밖에서 사용하는 커넥션 수 (connect_raw)
+#   - 시설 인덱스 LISTEN (src.facility.index)
+#   - scheduler leader 선출 advisory lock (src.scheduler.leader, 모든 worker 가 lock 을 시도하며 유지)
+RESERVED_CONNECTIONS_PER_WORKER = 2
+
 
 class DatabaseSettings(BaseSettings):
     DB_TYPE: str = Field(default="postgresql")
@@ -10,3 +17,46 @@ class DatabaseSettings(BaseSettings):
     DB_HOST: str = Field()
     DB_PORT: int = Field(default=5432)
     DB_ECHO: bool = Field(default=False)
+
+    # 읽기 전용 replica (DB_READ_HOST 가 없으면 모든 조회는 primary 로)
+    DB_READ_HOST: Optional[str] = Field(default=None)
+    DB_READ_PORT: int = Field(default=5432)
+    DB_READ_MAX_LAG_SECONDS: float = Field(default=5.0)  # 허용 replication lag
+    DB_READ_LAG_CHECK_INTERVAL: float = Field(default=1.0)  # lag 확인 주기 (초)
+
+    # 커넥션 풀 (worker 프로세스 하나 기준)
+    DB_POOL_SIZE: int = Field(default=5)
+    DB_MAX_OVERFLOW: int = Field(default=10)
+    DB_POOL_TIMEOUT: float = Field(default=30.0)  # 커넥션 대기 시간 (초)
+    # 모든 worker 가 사용할 수 있는 커넥션 수 (설정하면 worker 수로 나눠 풀 크기를 정함)
+    DB_CONNECTION_BUDGET: Optional[int] = Field(default=None)
+    WEB_CONCURRENCY: int = Field(default=1)  # worker 프로세스 수 (uvicorn 과 같은 환경 변수)
+    # 시작 시 미리 열어둘 커넥션 수 (없으면 풀 크기만큼)
+    DB_WARMUP_CONNECTIONS: Optional[int] = Field(default=None)
+
+    def pool_options(self) -> dict:
+        """worker 하나의 커넥션 풀 설정
+
+        DB_CONNECTION_BUDGET 이 있으면 worker 당 몫에서 풀 밖에서 여는 커넥션
+        (RESERVED_CONNECTIONS_PER_WORKER: 시설 인덱스 LISTEN, scheduler leader lock)을 뺀 만큼을
+        풀 크기로 하고, budget 을 넘지 않도록 overflow 는 두지 않습니다.
+        """
+        if self.DB_CONNECTION_BUDGET is None:
+            return dict(
+                pool_size=self.DB_POOL_SIZE,
+                max_overflow=self.DB_MAX_OVERFLOW,
+                pool_timeout=self.DB_POOL_TIMEOUT,
+            )
+
+        per_worker = self.DB_CONNECTION_BUDGET // max(self.WEB_CONCURRENCY, 1)
+        pool_size = per_worker - RESERVED_CONNECTIONS_PER_WORKER
+        if pool_size < 1:
+            raise ValueError(
+                f"DB_CONNECTION_BUDGET({self.DB_CONNECTION_BUDGET}) 이 "
+                f"worker {self.WEB_CONCURRENCY}개에 비해 부족합니다."
+            )
+        return dict(
+            pool_size=pool_size,
+            max_overflow=0,
+            pool_timeout=self.DB_POOL_TIMEOUT,
+        )
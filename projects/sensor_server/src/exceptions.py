@@ -15,6 +15,10 @@ class ClientException(SensorAppException):
     """클라이언트 측 오류"""
 
 
+class InvalidRequestException(ClientException):
+    """요청 값이 올바르지 않을 때"""
+
+
 """
 서버 측 오류
 """
@@ -6,6 +6,7 @@ from src.facility.repository import (
 )
 from dependency_injector import containers, providers
 
+from src.facility.index import FacilityIndex
 from src.facility.service import FacilityService
 
 
@@ -24,9 +25,19 @@ class FacilityContainer(containers.DeclarativeContainer):
         WaterTankCenterRepository, session_factory=database.session_factory
     )
 
+    index = providers.Singleton(
+        FacilityIndex,
+        session_factory=database.session_factory,
+        water_tank_repository=water_tank_repository,
+        water_tank_building_repository=water_tank_building_repository,
+        water_tank_center_repository=water_tank_center_repository,
+    )
+
     service = providers.Singleton(
         FacilityService,
         water_tank_repository=water_tank_repository,
         water_tank_building_repository=water_tank_building_repository,
         water_tank_center_repository=water_tank_center_repository,
+        facility_index=index,
+        session_factory=database.session_factory,
     )
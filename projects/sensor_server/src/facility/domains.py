@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import List
 
 
 @dataclass
@@ -56,3 +57,21 @@ class WaterTankCenter:
             center_id=None,  # 생성 시 자동 생성
             center_name=center_name,
         )
+
+
+@dataclass
+class WaterTankHierarchy:
+    """수조와 수조가 속한 동, 센터"""
+
+    tank: WaterTank
+    building: WaterTankBuilding
+    center: WaterTankCenter
+
+
+@dataclass
+class WaterTankCenterProvision:
+    """센터 일괄 생성 결과"""
+
+    center: WaterTankCenter
+    buildings: List[WaterTankBuilding]
+    tanks: List[WaterTank]
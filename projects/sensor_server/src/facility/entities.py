@@ -1,9 +1,11 @@
 import logging
 
 from sqlalchemy import (
+    DDL,
     Column,
     VARCHAR,
     Integer,
+    event,
 )
 from sqlalchemy.orm import mapped_column, Mapped
 from src.facility.domains import (
@@ -15,6 +17,9 @@ from src.database.base import Base
 
 logger = logging.getLogger(__name__)
 
+# 시설 테이블 변경 시 NOTIFY 를 발행할 채널 (FacilityIndex 가 LISTEN)
+FACILITY_CHANGED_CHANNEL = "facility_changed"
+
 
 class WaterTankEntity(Base):
     """수조 정보 저장"""
@@ -129,3 +134,47 @@ class WaterTankCenterEntity(Base):
     def primary_key(self) -> int:
         """엔티티의 기본 키를 반환합니다."""
         return self.center_id
+
+
+# 시설 테이블의 변경 사항을 NOTIFY 로 전파하는 트리거
+#  - payload: {"table": ..., "op": INSERT|UPDATE|DELETE|TRUNCATE, "old": row, "new": row}
+#  - deploy/application/init.sql 에도 동일한 DDL 이 정의되어 있습니다.
+notify_facility_change_function = DDL(
+    f"""
+    CREATE OR REPLACE FUNCTION notify_facility_change() RETURNS trigger AS $$
+    BEGIN
+        PERFORM pg_notify(
+            '{FACILITY_CHANGED_CHANNEL}',
+            json_build_object(
+                'table', TG_TABLE_NAME,
+                'op', TG_OP,
+                'old', CASE WHEN TG_OP IN ('UPDATE', 'DELETE') THEN row_to_json(OLD) END,
+                'new', CASE WHEN TG_OP IN ('INSERT', 'UPDATE') THEN row_to_json(NEW) END
+            )::text
+        );
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """
+)
+
+notify_facility_row_trigger = DDL(
+    "CREATE OR REPLACE TRIGGER %(table)s_notify_row "
+    "AFTER INSERT OR UPDATE OR DELETE ON %(table)s "
+    "FOR EACH ROW EXECUTE FUNCTION notify_facility_change()"
+)
+
+notify_facility_truncate_trigger = DDL(
+    "CREATE OR REPLACE TRIGGER %(table)s_notify_truncate "
+    "AFTER TRUNCATE ON %(table)s "
+    "FOR EACH STATEMENT EXECUTE FUNCTION notify_facility_change()"
+)
+
+for _table in (
+    WaterTankEntity.__table__,
+    WaterTankBuildingEntity.__table__,
+    WaterTankCenterEntity.__table__,
+):
+    event.listen(_table, "after_create", notify_facility_change_function)
+    event.listen(_table, "after_create", notify_facility_row_trigger)
+    event.listen(_table, "after_create", notify_facility_truncate_trigger)
@@ -0,0 +1,283 @@
+import asyncio
+import json
+import logging
+from typing import Dict, List, Optional
+
+import asyncpg
+
+from src.database.session_factory import SessionFactory
+from src.facility.domains import WaterTank, WaterTankBuilding, WaterTankCenter
+from src.facility.entities import (
+    FACILITY_CHANGED_CHANNEL,
+    WaterTankBuildingEntity,
+    WaterTankCenterEntity,
+    WaterTankEntity,
+)
+from src.facility.repository import (
+    WaterTankBuildingRepository,
+    WaterTankCenterRepository,
+    WaterTankRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class FacilityIndex:
+    """시설(센터 → 동 → 수조) 계층 구조 인메모리 인덱스
+
+    애플리케이션 시작 시 시설 테이블 전체를 메모리에 적재하고,
+    시설 테이블 트리거가 발행하는 NOTIFY(`facility_changed`)를 LISTEN 하여 변경 사항을 즉시 반영합니다.
+    따라서 모든 replica 가 polling 없이 최신 상태를 유지하고, 계층 조회는 DB 접근 없이 O(1) 입니다.
+
+    LISTEN 커넥션이 끊긴 동안에는 `loaded` 가 False 가 되며, 호출 측은 DB 조회로 대체해야 합니다.
+    """
+
+    def __init__(
+        self,
+        session_factory: SessionFactory,
+        water_tank_repository: WaterTankRepository,
+        water_tank_building_repository: WaterTankBuildingRepository,
+        water_tank_center_repository: WaterTankCenterRepository,
+        reconnect_interval: float = 1.0,
+    ):
+        self.session_factory = session_factory
+        self.water_tank_repository = water_tank_repository
+        self.water_tank_building_repository = water_tank_building_repository
+        self.water_tank_center_repository = water_tank_center_repository
+        self.reconnect_interval = reconnect_interval
+
+        self.loaded = False
+        self._connection: Optional[asyncpg.Connection] = None
+        self._reconnect_task: Optional[asyncio.Task] = None
+        self._reload_task: Optional[asyncio.Task] = None
+        # 재적재 진행 중 다시 적재가 필요해진 경우 (TRUNCATE / 재연결)
+        self._reload_requested = False
+        self._stopped = True
+        # 적재 중 도착한 변경 사항 (적재 완료 후 다시 반영)
+        self._pending: Optional[List[dict]] = None
+
+        self._tanks: Dict[int, WaterTank] = {}
+        self._tanks_by_code: Dict[str, WaterTank] = {}
+        self._buildings: Dict[int, WaterTankBuilding] = {}
+        self._buildings_by_code: Dict[str, WaterTankBuilding] = {}
+        self._centers: Dict[int, WaterTankCenter] = {}
+        self._tanks_by_building: Dict[int, Dict[int, WaterTank]] = {}
+        self._buildings_by_center: Dict[int, Dict[int, WaterTankBuilding]] = {}
+
+    async def start(self) -> None:
+        """LISTEN 을 시작한 뒤 전체 시설 정보를 적재합니다.
+
+        LISTEN 을 먼저 시작해야 적재 도중 발생한 변경 사항을 놓치지 않습니다.
+        """
+        self._stopped = False
+        await self._listen()
+        await self.load()
+
+    async def stop(self) -> None:
+        """LISTEN 을 중단하고 인덱스를 비활성화합니다."""
+        self._stopped = True
+        self.loaded = False
+        for task in (self._reconnect_task, self._reload_task):
+            if task is not None:
+                task.cancel()
+        self._reconnect_task = None
+        self._reload_task = None
+        self._reload_requested = False
+        if self._connection is not None and not self._connection.is_closed():
+            await self._connection.close()
+        self._connection = None
+
+    async def load(self) -> None:
+        """시설 테이블 전체를 다시 적재합니다."""
+        self._pending = []
+        try:
+            # NOTIFY 는 primary 에서 오므로, replica lag 으로 변경 사항을 놓치지 않도록 primary 에서 조회
+            with self.session_factory.primary():
+                centers, buildings, tanks = await asyncio.gather(
+                    self.water_tank_center_repository.find_all(),
+                    self.water_tank_building_repository.find_all(),
+                    self.water_tank_repository.find_all(),
+                )
+        except Exception:
+            self._pending = None
+            raise
+
+        self._centers = {}
+        self._buildings = {}
+        self._buildings_by_code = {}
+        self._buildings_by_center = {}
+        self._tanks = {}
+        self._tanks_by_code = {}
+        self._tanks_by_building = {}
+
+        for center in centers:
+            self.put_center(center)
+        for building in buildings:
+            self.put_building(building)
+        for tank in tanks:
+            self.put_tank(tank)
+
+        # 조회 시점과 반영 시점 사이의 변경 사항을 다시 적용 (put/remove 는 멱등)
+        pending, self._pending = self._pending, None
+        for change in pending:
+            self._apply_notification(change)
+
+        # 반영 도중 TRUNCATE 를 만났다면 재적재가 끝날 때까지 비활성 상태를 유지
+        self.loaded = not self._reload_requested
+        logger.info(
+            f"FacilityIndex loaded (centers={len(centers)}, "
+            f"buildings={len(buildings)}, tanks={len(tanks)})"
+        )
+
+    def find_tank(self, tank_id: int) -> Optional[WaterTank]:
+        return self._tanks.get(tank_id)
+
+    def find_all_tanks(self) -> List[WaterTank]:
+        return list(self._tanks.values())
+
+    def find_tank_by_code(self, tank_code: str) -> Optional[WaterTank]:
+        return self._tanks_by_code.get(tank_code)
+
+    def find_building(self, building_id: int) -> Optional[WaterTankBuilding]:
+        return self._buildings.get(building_id)
+
+    def find_building_by_code(self, building_code: str) -> Optional[WaterTankBuilding]:
+        return self._buildings_by_code.get(building_code)
+
+    def find_center(self, center_id: int) -> Optional[WaterTankCenter]:
+        return self._centers.get(center_id)
+
+    def find_tanks_of_building(self, building_id: int) -> List[WaterTank]:
+        return list(self._tanks_by_building.get(building_id, {}).values())
+
+    def find_buildings_of_center(self, center_id: int) -> List[WaterTankBuilding]:
+        return list(self._buildings_by_center.get(center_id, {}).values())
+
+    def find_tanks_of_center(self, center_id: int) -> List[WaterTank]:
+        return [
+            tank
+            for building_id in self._buildings_by_center.get(center_id, {})
+            for tank in self._tanks_by_building.get(building_id, {}).values()
+        ]
+
+    def put_tank(self, tank: WaterTank) -> None:
+        self.remove_tank(tank.tank_id)
+        self._tanks[tank.tank_id] = tank
+        self._tanks_by_code[tank.tank_code] = tank
+        self._tanks_by_building.setdefault(tank.building_id, {})[tank.tank_id] = tank
+
+    def put_building(self, building: WaterTankBuilding) -> None:
+        self.remove_building(building.building_id)
+        self._buildings[building.building_id] = building
+        self._buildings_by_code[building.building_code] = building
+        self._buildings_by_center.setdefault(building.center_id, {})[
+            building.building_id
+        ] = building
+
+    def put_center(self, center: WaterTankCenter) -> None:
+        self._centers[center.center_id] = center
+
+    def remove_tank(self, tank_id: int) -> None:
+        if (tank := self._tanks.pop(tank_id, None)) is None:
+            return
+        self._tanks_by_code.pop(tank.tank_code, None)
+        self._tanks_by_building.get(tank.building_id, {}).pop(tank_id, None)
+
+    def remove_building(self, building_id: int) -> None:
+        if (building := self._buildings.pop(building_id, None)) is None:
+            return
+        self._buildings_by_code.pop(building.building_code, None)
+        self._buildings_by_center.get(building.center_id, {}).pop(building_id, None)
+
+    def remove_center(self, center_id: int) -> None:
+        self._centers.pop(center_id, None)
+
+    def apply_change(self, table: str, op: str, old: dict, new: dict) -> None:
+        """트리거가 발행한 변경 사항 하나를 인덱스에 반영합니다.
+
+        Args:
+            table: 변경된 테이블 이름
+            op: INSERT / UPDATE / DELETE
+            old: 변경 전 row (INSERT 의 경우 None)
+            new: 변경 후 row (DELETE 의 경우 None)
+        """
+        if table == WaterTankEntity.__tablename__:
+            put, remove, key = self.put_tank, self.remove_tank, "tank_id"
+            domain = WaterTank
+        elif table == WaterTankBuildingEntity.__tablename__:
+            put, remove, key = self.put_building, self.remove_building, "building_id"
+            domain = WaterTankBuilding
+        elif table == WaterTankCenterEntity.__tablename__:
+            put, remove, key = self.put_center, self.remove_center, "center_id"
+            domain = WaterTankCenter
+        else:
+            logger.warning(f"FacilityIndex: unknown table notification ({table})")
+            return
+
+        if old is not None:
+            remove(old[key])
+        if new is not None:
+            put(domain(**new))
+
+    async def _listen(self) -> None:
+        self._connection = await self.session_factory.connect_raw()
+        self._connection.add_termination_listener(self._on_terminated)
+        await self._connection.add_listener(FACILITY_CHANGED_CHANNEL, self._on_notify)
+
+    def _on_notify(self, connection, pid, channel, payload: str) -> None:
+        change = json.loads(payload)
+        if self._pending is not None:
+            self._pending.append(change)
+        else:
+            self._apply_notification(change)
+
+    def _apply_notification(self, change: dict) -> None:
+        if change["op"] == "TRUNCATE":
+            self._request_reload()
+            return
+        self.apply_change(
+            table=change["table"],
+            op=change["op"],
+            old=change.get("old"),
+            new=change.get("new"),
+        )
+
+    def _on_terminated(self, connection) -> None:
+        """LISTEN 커넥션이 끊기면 변경 사항을 놓칠 수 있으므로 인덱스를 비활성화하고 재연결합니다."""
+        self.loaded = False
+        if self._stopped:
+            return
+        logger.warning("FacilityIndex: LISTEN connection terminated, reconnecting")
+        self._reconnect_task = asyncio.create_task(self._reconnect())
+
+    async def _reconnect(self) -> None:
+        while not self._stopped:
+            try:
+                await self._listen()
+            except Exception as e:
+                logger.warning(f"FacilityIndex: reconnect failed ({e})")
+                await asyncio.sleep(self.reconnect_interval)
+                continue
+            self._request_reload()
+            return
+
+    def _request_reload(self) -> None:
+        """인덱스를 비활성화하고 재적재를 예약합니다.
+
+        재적재는 하나의 task 에서만 수행하므로 적재가 겹치지 않으며,
+        진행 중에 다시 요청되면 현재 적재가 끝난 뒤 한 번 더 적재합니다.
+        """
+        self.loaded = False
+        self._reload_requested = True
+        if self._reload_task is None or self._reload_task.done():
+            self._reload_task = asyncio.create_task(self._reload())
+
+    async def _reload(self) -> None:
+        while not self._stopped and self._reload_requested:
+            self._reload_requested = False
+            try:
+                await self.load()
+            except Exception as e:
+                logger.warning(f"FacilityIndex: reload failed ({e})")
+                self._reload_requested = True
+                await asyncio.sleep(self.reconnect_interval)
@@ -16,6 +16,10 @@ class WaterTankRepository(BaseRepository[int, WaterTank]):
 
     entity = WaterTankEntity
 
+    def warmup_statements(self):
+        # 측정 값 수집 시 수조 코드 조회 (시설 인덱스가 준비되지 않은 경우)
+        return [(self.find_by_statement(tank_code=""), {})]
+
 
 class WaterTankBuildingRepository(BaseRepository[int, WaterTankBuilding]):
     """동 정보 저장"""
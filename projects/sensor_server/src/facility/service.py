@@ -1,32 +1,164 @@
-from src.facility.domains import WaterTank, WaterTankBuilding
+from typing import List, Tuple
+
+from src.database.session_factory import SessionFactory
+from src.exceptions import InvalidRequestException
+from src.facility.domains import (
+    WaterTank,
+    WaterTankBuilding,
+    WaterTankCenter,
+    WaterTankCenterProvision,
+    WaterTankHierarchy,
+)
+from src.facility.index import FacilityIndex
 from src.facility.repository import (
     WaterTankBuildingRepository,
     WaterTankCenterRepository,
     WaterTankRepository,
 )
+from src.singleflight import SingleFlight
 
 
 class FacilityService:
-    """시설 정보 서비스"""
+    """시설 정보 서비스
+
+    FacilityIndex 가 적재된 경우 DB 접근 없이 인덱스에서 조회하고,
+    그렇지 않은 경우(시작 전, LISTEN 재연결 중) 저장소를 조회하며, 동시에 들어온 같은 조회는 하나로 합칩니다.
+    """
 
     def __init__(
         self,
         water_tank_repository: WaterTankRepository,
         water_tank_building_repository: WaterTankBuildingRepository,
         water_tank_center_repository: WaterTankCenterRepository,
+        facility_index: FacilityIndex,
+        session_factory: SessionFactory,
     ):
+        self.session_factory = session_factory
         self.water_tank_repository = water_tank_repository
         self.water_tank_building_repository = water_tank_building_repository
         self.water_tank_center_repository = water_tank_center_repository
+        self.facility_index = facility_index
+        self._lookups = SingleFlight("facility")
 
     async def get_water_tank_by_code(self, tank_code: str) -> WaterTank:
         """코드로 수조 정보 조회"""
-        return await self.water_tank_repository.get_by(tank_code=tank_code)
+        if self.facility_index.loaded:
+            if tank := self.facility_index.find_tank_by_code(tank_code):
+                return tank
+        return await self._lookups.do(
+            ("tank", tank_code),
+            lambda: self.water_tank_repository.get_by(tank_code=tank_code),
+        )
 
     async def get_water_tank_building_by_code(
         self, building_code: str
     ) -> WaterTankBuilding:
         """코드로 동 정보 조회"""
-        return await self.water_tank_building_repository.get_by(
-            building_code=building_code
+        if self.facility_index.loaded:
+            if building := self.facility_index.find_building_by_code(building_code):
+                return building
+        return await self._lookups.do(
+            ("building", building_code),
+            lambda: self.water_tank_building_repository.get_by(
+                building_code=building_code
+            ),
+        )
+
+    async def get_water_tank_hierarchy(self, tank_code: str) -> WaterTankHierarchy:
+        """코드로 수조가 속한 동, 센터 정보까지 함께 조회"""
+        tank = await self.get_water_tank_by_code(tank_code)
+
+        index = self.facility_index
+        building = index.find_building(tank.building_id) if index.loaded else None
+        center = index.find_center(tank.center_id) if index.loaded else None
+        if building is None:
+            building = await self._lookups.do(
+                ("building_id", tank.building_id),
+                lambda: self.water_tank_building_repository.get_by_id(
+                    tank.building_id
+                ),
+            )
+        if center is None:
+            center = await self._lookups.do(
+                ("center_id", tank.center_id),
+                lambda: self.water_tank_center_repository.get_by_id(tank.center_id),
+            )
+        return WaterTankHierarchy(tank=tank, building=building, center=center)
+
+    async def find_water_tanks_by_building_code(
+        self, building_code: str
+    ) -> List[WaterTank]:
+        """동에 속한 수조 목록 조회"""
+        building = await self.get_water_tank_building_by_code(building_code)
+        if self.facility_index.loaded:
+            return self.facility_index.find_tanks_of_building(building.building_id)
+        return await self._lookups.do(
+            ("tanks_of_building", building.building_id),
+            lambda: self.water_tank_repository.find_by(
+                building_id=building.building_id
+            ),
         )
+
+    async def find_water_tanks_by_center_id(self, center_id: int) -> List[WaterTank]:
+        """센터에 속한 수조 목록 조회
+
+        Raises:
+            NotFoundException: 센터가 존재하지 않을 경우 발생
+        """
+        if self.facility_index.loaded and self.facility_index.find_center(center_id):
+            return self.facility_index.find_tanks_of_center(center_id)
+        await self._lookups.do(
+            ("center_id", center_id),
+            lambda: self.water_tank_center_repository.get_by_id(center_id),
+        )
+        return await self._lookups.do(
+            ("tanks_of_center", center_id),
+            lambda: self.water_tank_repository.find_by(center_id=center_id),
+        )
+
+    async def provision_center(
+        self, center_name: str, buildings: List[Tuple[str, List[str]]]
+    ) -> WaterTankCenterProvision:
+        """센터 → 동 → 수조 트리를 하나의 트랜잭션으로 일괄 생성
+
+        계층별로 multi-row INSERT ... RETURNING 을 한 번씩 실행하므로,
+        수조 수와 관계 없이 몇 번의 statement 로 생성됩니다.
+
+        Args:
+            center_name: 생성할 센터 이름
+            buildings: (동 이름, 수조 이름 리스트) 목록
+        Raises:
+            InvalidRequestException: 센터 안에 중복된 동 이름이나 같은 동 안에 중복된 수조 이름이 있을 경우 발생
+            AlreadyExistsException: 동/수조 코드가 이미 존재할 경우 발생
+        """
+        tank_names_by_building = dict(buildings)
+        if len(tank_names_by_building) != len(buildings):
+            raise InvalidRequestException(f"{center_name}에 중복된 동 이름이 있습니다.")
+        for building_name, tank_names in tank_names_by_building.items():
+            if len(set(tank_names)) != len(tank_names):
+                raise InvalidRequestException(
+                    f"{building_name}에 중복된 수조 이름이 있습니다."
+                )
+
+        async with self.session_factory() as session:
+            [center] = await self.water_tank_center_repository.bulk_create(
+                [WaterTankCenter.new(center_name=center_name)], session=session
+            )
+            buildings = await self.water_tank_building_repository.bulk_create(
+                [
+                    WaterTankBuilding.new(building_name=building_name, center=center)
+                    for building_name in tank_names_by_building
+                ],
+                session=session,
+            )
+            tanks = await self.water_tank_repository.bulk_create(
+                [
+                    WaterTank.new(tank_name=tank_name, building=building)
+                    for building in buildings
+                    for tank_name in tank_names_by_building[building.building_name]
+                ],
+                session=session,
+            )
+            await session.commit()
+
+        return WaterTankCenterProvision(center=center, buildings=buildings, tanks=tanks)
@@ -0,0 +1,307 @@
+import logging
+import os
+import time
+from contextvars import ContextVar
+from typing import List, Optional
+
+from prometheus_client import Counter, Gauge, Histogram
+
+logger = logging.getLogger(__name__)
+
+# 로컬 spool
+sensor_spool_records = Gauge(
+    "sensor_spool_records",
+    "Number of sensor records waiting in the local spool",
+    multiprocess_mode="livesum",  # worker 별 spool 합계
+)
+sensor_spooled_records = Counter(
+    "sensor_spooled_records", "Number of sensor records written to the local spool"
+)
+sensor_spool_replayed_records = Counter(
+    "sensor_spool_replayed_records",
+    "Number of spooled sensor records replayed into the database",
+)
+
+# 측정 값 수집 (transport: http / tcp / udp)
+sensor_ingested_records = Counter(
+    "sensor_ingested_records",
+    "Number of sensor records ingested",
+    ["transport"],
+)
+sensor_rejected_records = Counter(
+    "sensor_rejected_records",
+    "Number of sensor records rejected (malformed or unknown tank)",
+    ["transport"],
+)
+sensor_dropped_datagrams = Counter(
+    "sensor_dropped_datagrams",
+    "Number of line protocol UDP datagrams dropped because the queue was full",
+)
+
+# 시설 단위 측정 값 수 (수조 코드 대신 센터/동 id 로 label 수 제한)
+sensor_records = Counter(
+    "sensor_records",
+    "Number of sensor records by center and building",
+    ["center_id", "building_id"],
+)
+
+# 수집 단계별 소요 시간
+INGEST_STAGES = (
+    "decode",
+    "tank_lookup",
+    "derive",
+    "session_acquire",
+    "latest_upsert",
+    "history_insert",
+    "commit",
+)
+sensor_ingest_stage_seconds = Histogram(
+    "sensor_ingest_stage_seconds",
+    "Time spent in each sensor ingest stage",
+    ["stage"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+_ingest_stage_histograms = {
+    stage: sensor_ingest_stage_seconds.labels(stage) for stage in INGEST_STAGES
+}
+
+
+class _StageTimer:
+    __slots__ = ("stage", "histogram", "started_at")
+
+    def __init__(self, stage: str):
+        self.stage = stage
+        self.histogram = _ingest_stage_histograms[stage]
+
+    def __enter__(self):
+        self.started_at = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        elapsed = time.perf_counter() - self.started_at
+        self.histogram.observe(elapsed)
+        if self.stage == "session_acquire" and (
+            pool_wait := _pool_wait.get()
+        ) is not None:
+            pool_wait[0] += elapsed
+
+
+def ingest_stage(stage: str) -> _StageTimer:
+    """수집 단계 소요 시간 측정
+
+    example:
+        with metrics.ingest_stage("commit"):
+            await session.commit()
+    """
+    return _StageTimer(stage)
+
+
+# 요청당 DB 왕복 횟수
+db_round_trips = Counter(
+    "db_round_trips", "Number of statements sent to the database", ["route"]
+)
+db_round_trips_per_request = Histogram(
+    "db_round_trips_per_request",
+    "Number of statements sent to the database per request",
+    ["route"],
+    buckets=(0, 1, 2, 3, 4, 6, 8, 12, 16, 32),
+)
+
+# 현재 요청의 DB 왕복 횟수 (요청 단위로 새 리스트를 설정)
+_db_round_trips: ContextVar[Optional[List[int]]] = ContextVar(
+    "db_round_trips", default=None
+)
+
+
+def start_db_round_trip_count() -> List[int]:
+    """현재 컨텍스트(요청)의 DB 왕복 횟수 집계 시작"""
+    counter = [0]
+    _db_round_trips.set(counter)
+    return counter
+
+
+def record_db_round_trip(*args) -> None:
+    """SQLAlchemy before_cursor_execute 이벤트 리스너"""
+    if (counter := _db_round_trips.get()) is not None:
+        counter[0] += 1
+
+
+# 임계값 경보
+alert_evaluation_seconds = Histogram(
+    "alert_evaluation_seconds",
+    "Time spent evaluating alert rules for an ingested batch",
+    buckets=(0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025),
+)
+alert_events = Counter(
+    "alert_events",
+    "Number of alert state changes",
+    ["state"],  # fired / cleared
+)
+
+# 측정 중단 감지
+tank_liveness_events = Counter(
+    "tank_liveness_events",
+    "Number of tanks that stopped or resumed reporting",
+    ["state"],  # stale / recovered
+)
+stale_tanks = Gauge(
+    "stale_tanks",
+    "Number of tanks that have not reported within the stale timeout",
+    multiprocess_mode="max",
+)
+
+# 이상 탐지
+anomaly_detection_seconds = Histogram(
+    "anomaly_detection_seconds",
+    "Time spent in each anomaly detection stage",
+    ["stage"],  # load / detect / store
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+anomaly_detected = Gauge(
+    "anomaly_detected",
+    "Number of (tank, metric) pairs flagged by the last anomaly detection run",
+    multiprocess_mode="max",
+)
+
+# 분위수 sketch
+sketch_flush_seconds = Histogram(
+    "sketch_flush_seconds",
+    "Time spent merging collected values into stored quantile sketches",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+sketch_flushed_values = Counter(
+    "sketch_flushed_values",
+    "Number of metric values merged into stored quantile sketches",
+)
+
+# 분석 함수 process pool
+analytics_calls = Counter(
+    "analytics_calls",
+    "Number of analytics calls run off the event loop",
+    ["function", "status"],  # ok / error / timeout / cancelled
+)
+analytics_wait_seconds = Histogram(
+    "analytics_wait_seconds",
+    "Time analytics calls waited for a free concurrency slot",
+    ["function"],
+    buckets=(0.0001, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0),
+)
+analytics_run_seconds = Histogram(
+    "analytics_run_seconds",
+    "Time spent running analytics calls including shared memory transfer",
+    ["function"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+
+# 하루 요약 보고서
+report_generation_seconds = Histogram(
+    "report_generation_seconds",
+    "Time spent in each daily report generation stage",
+    ["stage"],  # load / summarize / store
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0),
+)
+
+# 주기 작업 scheduler
+scheduler_leader = Gauge(
+    "scheduler_leader",
+    "Whether this process holds the scheduler leader lock",
+    multiprocess_mode="livesum",
+)
+scheduler_job_runs = Counter(
+    "scheduler_job_runs",
+    "Number of scheduled job runs",
+    ["job", "status"],  # ok / error / timeout / cancelled / skipped
+)
+scheduler_job_duration_seconds = Histogram(
+    "scheduler_job_duration_seconds",
+    "Time spent running each scheduled job",
+    ["job", "status"],
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0),
+)
+scheduler_job_lag_seconds = Histogram(
+    "scheduler_job_lag_seconds",
+    "Delay between the planned and actual start of each scheduled job",
+    ["job"],
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0),
+)
+
+# single-flight (동시에 들어온 같은 조회 합치기)
+singleflight_executed_calls = Counter(
+    "singleflight_executed_calls",
+    "Number of lookups actually executed by single-flight",
+    ["name"],
+)
+singleflight_coalesced_calls = Counter(
+    "singleflight_coalesced_calls",
+    "Number of lookups that joined an identical in-flight call",
+    ["name"],
+)
+
+# 현재 요청이 커넥션 풀에서 커넥션을 기다린 시간 (session_acquire 단계 합계)
+_pool_wait: ContextVar[Optional[List[float]]] = ContextVar("pool_wait", default=None)
+
+
+def start_pool_wait_measure() -> List[float]:
+    """현재 컨텍스트(요청)의 커넥션 대기 시간 집계 시작"""
+    pool_wait = [0.0]
+    _pool_wait.set(pool_wait)
+    return pool_wait
+
+
+# 요청 수용 제어 (admission control)
+admission_concurrency_limit = Gauge(
+    "admission_concurrency_limit",
+    "Current adaptive concurrency limit for admitted API requests",
+    multiprocess_mode="livesum",
+)
+admission_inflight_requests = Gauge(
+    "admission_inflight_requests",
+    "Number of admitted API requests in flight",
+    multiprocess_mode="livesum",
+)
+admission_rejected_requests = Counter(
+    "admission_rejected_requests",
+    "Number of API requests rejected by admission control",
+    ["status"],
+)
+
+
+# 애플리케이션 시작 단계별 소요 시간
+startup_phase_seconds = Gauge(
+    "startup_phase_seconds",
+    "Time spent in each application startup phase",
+    ["phase"],
+    multiprocess_mode="max",
+)
+
+
+class _PhaseTimer:
+    def __init__(self, phase: str):
+        self.phase = phase
+
+    def __enter__(self):
+        self.started_at = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        elapsed = time.perf_counter() - self.started_at
+        startup_phase_seconds.labels(self.phase).set(elapsed)
+        logger.info(f"startup phase {self.phase}: {elapsed * 1000:.0f}ms")
+
+
+def startup_phase(phase: str) -> _PhaseTimer:
+    """시작 단계 소요 시간 기록
+
+    example:
+        with metrics.startup_phase("facility_index"):
+            await facility_index.start()
+    """
+    return _PhaseTimer(phase)
+
+
+def mark_process_dead() -> None:
+    """multiprocess 모드에서 종료하는 worker 의 live gauge 제외"""
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(os.getpid())
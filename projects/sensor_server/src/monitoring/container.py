@@ -0,0 +1,33 @@
+from dependency_injector import containers, providers
+
+from src.facility.container import FacilityContainer
+from src.monitoring.liveness import LivenessTracker
+from src.monitoring.rolling import RollingStatistics
+from src.monitoring.settings import MonitoringSettings
+from src.monitoring.sink import LoggingTankLivenessSink
+
+
+class MonitoringContainer(containers.DeclarativeContainer):
+    """수집 경로에서 갱신하는 수조별 모니터링 상태"""
+
+    facility: FacilityContainer = providers.Container(FacilityContainer)
+
+    settings = providers.Singleton(MonitoringSettings)
+
+    rolling_statistics = providers.Singleton(
+        RollingStatistics,
+        windows=settings.provided.MONITORING_ROLLING_WINDOWS,
+        capacity=settings.provided.MONITORING_ROLLING_CAPACITY,
+    )
+
+    liveness_sinks = providers.List(
+        providers.Singleton(LoggingTankLivenessSink),
+    )
+
+    liveness_tracker = providers.Singleton(
+        LivenessTracker,
+        facility_index=facility.index,
+        sinks=liveness_sinks,
+        timeout=settings.provided.MONITORING_STALE_TIMEOUT,
+        tick=settings.provided.MONITORING_STALE_TICK,
+    )
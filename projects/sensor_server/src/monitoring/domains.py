@@ -0,0 +1,50 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Literal, Optional
+
+
+@dataclass
+class MetricStatistics:
+    """한 측정 항목의 구간 통계"""
+
+    mean: float  # 평균
+    stddev: float  # 표본 표준편차 (측정 값이 하나면 0)
+    minimum: float
+    maximum: float
+    ewma: float  # 지수 이동 평균 (시간 상수 = 구간 길이)
+
+
+@dataclass
+class WaterTankRollingStatistics:
+    """수조의 최근 구간 통계 (구간은 수조의 마지막 측정 시간 기준)"""
+
+    tank_id: int
+    window: int  # 구간 길이 (초)
+    count: int  # 구간 내 측정 횟수
+    recorded_at: datetime  # 마지막 측정 시간
+
+    temperature: MetricStatistics
+    ph: MetricStatistics
+    dissolved_oxygen: MetricStatistics
+    salinity: MetricStatistics
+
+
+LivenessState = Literal["stale", "recovered"]
+
+
+@dataclass
+class TankLivenessEvent:
+    """수조 측정 중단 / 재개"""
+
+    tank_id: int
+    state: LivenessState
+    last_seen_at: datetime  # 마지막으로 측정 값을 받은 시간 (서버 시간)
+
+
+@dataclass
+class StaleWaterTank:
+    """측정 값이 timeout 이상 들어오지 않은 수조"""
+
+    tank_id: int
+    last_seen_at: datetime  # 마지막으로 측정 값을 받은 시간 (서버 시간, 받은 적이 없으면 추적 시작 시간)
+    last_recorded_at: Optional[datetime]  # 마지막 측정 값의 측정 시간 (받은 적이 없으면 None)
@@ -0,0 +1,211 @@
+"""수조별 측정 중단(stale) 감지 (timer wheel)
+
+측정 값이 들어오면 수조의 마지막 수신 시간과 마감 시간(수신 시간 + timeout)만 배열에 갱신하고,
+마감 시간 확인은 tick 단위 slot 으로 나눈 timer wheel 에서 합니다.
+
+- 수조는 wheel 에 많아야 한 번 등록되며, 측정 값이 들어와도 slot 을 옮기지 않습니다.
+- slot 의 시간이 되면 등록된 수조의 (갱신된) 마감 시간을 확인해, 지났으면 stale 로 바꾸고
+  아직이면 마감 시간의 slot 으로 다시 등록합니다.
+
+따라서 수집 경로의 비용은 묶음 크기에 비례하고, wheel 의 비용은 수조당 timeout 마다 한 번 정도로
+수집 빈도와 관계가 없습니다. (DB 에서 수조별 max(recorded_at) 을 주기적으로 조회하지 않음)
+
+상태는 프로세스(worker) 단위입니다. WEB_CONCURRENCY 가 2 이상이면 worker 마다 받은 측정 값만 보므로,
+수조의 측정 값이 항상 같은 worker 로 가도록 하거나 worker 를 하나로 두어야 합니다.
+"""
+
+import asyncio
+import logging
+import math
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable, List, Optional, Set
+
+import numpy as np
+
+from src import metrics
+from src.facility.index import FacilityIndex
+from src.monitoring.domains import StaleWaterTank, TankLivenessEvent
+from src.monitoring.sink import TankLivenessSink
+from src.sensor.domains import EPOCH, WaterTankSensorRecordColumns
+
+logger = logging.getLogger(__name__)
+
+
+class LivenessTracker:
+    """수조별 측정 중단 / 재개를 감지하는 listener (SensorRecordService listener)"""
+
+    def __init__(
+        self,
+        facility_index: FacilityIndex,
+        sinks: List[TankLivenessSink],
+        timeout: float = 300.0,
+        tick: float = 5.0,
+        initial_tanks: int = 128,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.facility_index = facility_index
+        self.sinks = sinks
+        self.timeout = timeout
+        self.tick = tick
+        self.clock = clock
+
+        # 마감 시간은 항상 timeout 이내이므로 slot 을 한 바퀴 넘게 앞서 등록하는 일은 없음
+        self.slots: List[List[int]] = [
+            [] for _ in range(math.ceil(timeout / tick) + 2)
+        ]
+        self.cursor = math.floor(clock() / tick)  # 다음에 확인할 tick 번호
+
+        self.last_seen = np.full(initial_tanks, np.nan)  # 마지막 수신 시간 (epoch 초)
+        self.last_recorded_at = np.full(initial_tanks, -1, dtype=np.int64)
+        self.deadline = np.full(initial_tanks, np.inf)
+        self.scheduled = np.zeros(initial_tanks, dtype=bool)  # wheel 에 등록되어 있는지
+        self.stale = np.zeros(initial_tanks, dtype=bool)
+
+        self._task: Optional[asyncio.Task] = None
+        self._send_tasks: Set[asyncio.Task] = set()
+
+    async def start(self) -> None:
+        """알고 있는 수조를 모두 추적 (재시작 후 측정 값이 한 번도 오지 않는 수조도 stale 로 감지)"""
+        if self.facility_index.loaded:
+            tank_ids = [tank.tank_id for tank in self.facility_index.find_all_tanks()]
+            self.track(np.asarray(tank_ids, dtype=np.int64), self.clock())
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if self._send_tasks:
+            await asyncio.gather(*self._send_tasks, return_exceptions=True)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.tick)
+            try:
+                self._dispatch(self.advance(self.clock()))
+            except Exception:
+                logger.exception("failed to check stale tanks")
+
+    def on_records(self, columns: WaterTankSensorRecordColumns) -> None:
+        if len(columns) == 0:
+            return
+        self._grow(int(columns.tank_id.max()) + 1)
+        np.maximum.at(self.last_recorded_at, columns.tank_id, columns.recorded_at)
+        self._dispatch(self.touch(np.unique(columns.tank_id), self.clock()))
+
+    def track(self, tank_ids: np.ndarray, now: float) -> None:
+        """측정 값을 받은 적이 없는 수조를 지금부터 추적"""
+        if len(tank_ids) == 0:
+            return
+        self._grow(int(tank_ids.max()) + 1)
+        tank_ids = tank_ids[np.isnan(self.last_seen[tank_ids])]
+        self.last_seen[tank_ids] = now
+        self.deadline[tank_ids] = now + self.timeout
+        self._schedule(tank_ids[~self.scheduled[tank_ids]])
+
+    def touch(self, tank_ids: np.ndarray, now: float) -> List[TankLivenessEvent]:
+        """수조들의 측정 값을 받음 (stale 이었던 수조는 recovered 이벤트)"""
+        self.last_seen[tank_ids] = now
+        self.deadline[tank_ids] = now + self.timeout
+
+        recovered = tank_ids[self.stale[tank_ids]]
+        self.stale[recovered] = False
+        # 이미 wheel 에 있는 수조는 slot 을 옮기지 않음 (slot 시간에 갱신된 마감 시간으로 다시 등록됨)
+        self._schedule(tank_ids[~self.scheduled[tank_ids]])
+        return self._events("recovered", recovered)
+
+    def advance(self, now: float) -> List[TankLivenessEvent]:
+        """now 까지 지난 slot 을 확인해 마감 시간이 지난 수조를 stale 로 (stale 이벤트 반환)"""
+        current = math.floor(now / self.tick)
+        # 오래 멈춰 있었으면 모든 slot 을 한 번씩만 확인
+        first = max(self.cursor, current - len(self.slots) + 1)
+        expired = []
+        for tick in range(first, current + 1):
+            slot = self.slots[tick % len(self.slots)]
+            if not slot:
+                continue
+            self.slots[tick % len(self.slots)] = []
+            tank_ids = np.asarray(slot, dtype=np.int64)
+            passed = self.deadline[tank_ids] <= now
+            expired.append(tank_ids[passed])
+            self.scheduled[tank_ids[passed]] = False
+            self._schedule(tank_ids[~passed])
+        self.cursor = current + 1
+
+        if not expired:
+            return []
+        stale = np.concatenate(expired)
+        self.stale[stale] = True
+        return self._events("stale", stale)
+
+    def find_stale(self) -> List[StaleWaterTank]:
+        """현재 stale 인 수조 목록 (시설 인덱스가 준비되어 있으면 삭제된 수조는 제외)"""
+        tank_ids = np.flatnonzero(self.stale).tolist()
+        if self.facility_index.loaded:
+            tank_ids = [t for t in tank_ids if self.facility_index.find_tank(t)]
+        return [
+            StaleWaterTank(
+                tank_id=tank_id,
+                last_seen_at=datetime.fromtimestamp(
+                    self.last_seen[tank_id], tz=timezone.utc
+                ),
+                last_recorded_at=(
+                    EPOCH + timedelta(seconds=int(self.last_recorded_at[tank_id]))
+                    if self.last_recorded_at[tank_id] >= 0
+                    else None
+                ),
+            )
+            for tank_id in tank_ids
+        ]
+
+    def _schedule(self, tank_ids: np.ndarray) -> None:
+        if len(tank_ids) == 0:
+            return
+        self.scheduled[tank_ids] = True
+        # 마감 시간 이후의 첫 tick (이미 지난 tick 이면 다음 확인 때)
+        ticks = np.maximum(np.ceil(self.deadline[tank_ids] / self.tick), self.cursor)
+        for tank_id, tick in zip(tank_ids.tolist(), ticks.astype(np.int64).tolist()):
+            self.slots[tick % len(self.slots)].append(tank_id)
+
+    def _grow(self, size: int) -> None:
+        if size <= len(self.deadline):
+            return
+        size = max(size, len(self.deadline) * 2)
+        extra = size - len(self.deadline)
+        self.last_seen = np.r_[self.last_seen, np.full(extra, np.nan)]
+        self.last_recorded_at = np.r_[
+            self.last_recorded_at, np.full(extra, -1, dtype=np.int64)
+        ]
+        self.deadline = np.r_[self.deadline, np.full(extra, np.inf)]
+        self.scheduled = np.r_[self.scheduled, np.zeros(extra, dtype=bool)]
+        self.stale = np.r_[self.stale, np.zeros(extra, dtype=bool)]
+
+    def _events(self, state: str, tank_ids: np.ndarray) -> List[TankLivenessEvent]:
+        if len(tank_ids) == 0:
+            return []
+        metrics.tank_liveness_events.labels(state).inc(len(tank_ids))
+        metrics.stale_tanks.set(int(self.stale.sum()))
+        return [
+            TankLivenessEvent(
+                tank_id=tank_id,
+                state=state,
+                last_seen_at=datetime.fromtimestamp(
+                    self.last_seen[tank_id], tz=timezone.utc
+                ),
+            )
+            for tank_id in tank_ids.tolist()
+        ]
+
+    def _dispatch(self, events: List[TankLivenessEvent]) -> None:
+        if events and self.sinks:
+            task = asyncio.create_task(self._send(events))
+            self._send_tasks.add(task)
+            task.add_done_callback(self._send_tasks.discard)
+
+    async def _send(self, events: List[TankLivenessEvent]) -> None:
+        for sink in self.sinks:
+            try:
+                await sink.send(events)
+            except Exception:
+                logger.exception(f"liveness sink failed ({sink!r})")
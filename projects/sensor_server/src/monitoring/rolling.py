@@ -0,0 +1,253 @@
+"""수조별 이동 통계 (수집 시 갱신)
+
+수집된 측정 값으로 수조별 최근 구간(예: 5분 / 15분 / 1시간)의 평균, 표준편차, 최소, 최대, 지수 이동 평균을
+갱신해두어 개요 화면이 history 를 조회하지 않도록 합니다.
+
+모든 상태는 tank_id 를 첫 번째 인덱스로 하는 numpy 배열에 두고, 묶음 단위로 한 번에 갱신합니다.
+
+- 측정 값: 수조별 ring buffer (capacity 개). 구간마다 가장 오래된 측정 값의 순번(tail)을 둡니다.
+- 평균 / 분산: Welford. 구간을 벗어난 측정 값은 역으로 제거합니다.
+- 지수 이동 평균: 구간 길이를 시간 상수로 하는 EWMA.
+- 최소 / 최대: 가장 긴 구간에 대한 monotonic deque (측정 값 순번). 짧은 구간의 최소 / 최대는
+  deque 에서 구간 시작 이후의 첫 원소입니다.
+
+구간은 수조의 마지막 측정 시간 기준이며, 마지막 측정 시간보다 이전의 측정 값(늦게 도착한 값)은 반영하지 않습니다.
+"""
+
+from datetime import timedelta
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from src.monitoring.domains import MetricStatistics, WaterTankRollingStatistics
+from src.sensor.domains import EPOCH, METRICS, WaterTankSensorRecordColumns
+from src.sensor.listener import occurrence_rounds
+
+MIN, MAX = 0, 1
+
+
+class RollingStatistics:
+    """수조별 이동 통계 (SensorRecordService listener)"""
+
+    def __init__(
+        self,
+        windows: Sequence[int] = (300, 900, 3600),
+        capacity: int = 512,
+        initial_tanks: int = 128,
+    ):
+        self.windows = np.asarray(sorted(windows), dtype=np.int64)
+        self.capacity = capacity
+        self._allocate(initial_tanks)
+
+    def _allocate(self, tanks: int) -> None:
+        windows, metrics, capacity = len(self.windows), len(METRICS), self.capacity
+        self.ring_at = np.zeros((tanks, capacity), dtype=np.int64)
+        self.ring_value = np.zeros((tanks, capacity, metrics))
+        self.head = np.zeros(tanks, dtype=np.int64)  # 다음 측정 값 순번
+        self.last_at = np.full(tanks, -1, dtype=np.int64)  # 마지막 측정 시간 (epoch 초)
+        self.tail = np.zeros((tanks, windows), dtype=np.int64)
+        self.mean = np.zeros((tanks, windows, metrics))
+        self.m2 = np.zeros((tanks, windows, metrics))
+        self.ewma = np.zeros((tanks, windows, metrics))
+        # [수조, MIN/MAX, 항목, capacity] 측정 값 순번 ring, front / back 은 누적 위치
+        self.deque = np.zeros((tanks, 2, metrics, capacity), dtype=np.int64)
+        self.deque_front = np.zeros((tanks, 2, metrics), dtype=np.int64)
+        self.deque_back = np.zeros((tanks, 2, metrics), dtype=np.int64)
+
+    def _grow(self, tanks: int) -> None:
+        previous = {name: getattr(self, name) for name in STATE_ARRAYS}
+        size = len(self.head)
+        self._allocate(max(tanks, size * 2))
+        for name, array in previous.items():
+            getattr(self, name)[:size] = array
+        self.last_at[size:] = -1
+
+    def __len__(self) -> int:
+        """통계가 있는 수조 수"""
+        return int((self.last_at >= 0).sum())
+
+    def on_records(self, columns: WaterTankSensorRecordColumns) -> None:
+        if len(columns) == 0:
+            return
+        values = np.stack([columns.metric(name) for name in METRICS], axis=1)
+        valid = ~np.isnan(values).any(axis=1)
+        if (max_tank_id := int(columns.tank_id.max())) >= len(self.head):
+            self._grow(max_tank_id + 1)
+
+        for rows in occurrence_rounds(columns.tank_id, columns.recorded_at):
+            rows = rows[valid[rows]]
+            tank_id, recorded_at = columns.tank_id[rows], columns.recorded_at[rows]
+            # 마지막 측정 시간 이후의 값만 반영
+            newer = recorded_at > self.last_at[tank_id]
+            if newer.any():
+                self._push(tank_id[newer], recorded_at[newer], values[rows][newer])
+
+    def _push(self, tank_id: np.ndarray, recorded_at: np.ndarray, value: np.ndarray) -> None:
+        """수조가 겹치지 않는 측정 값들을 반영"""
+        self._expire(tank_id, recorded_at)
+
+        seq = self.head[tank_id]
+        position = seq % self.capacity
+        self.ring_at[tank_id, position] = recorded_at
+        self.ring_value[tank_id, position] = value
+        self.head[tank_id] = seq + 1
+
+        # Welford 추가
+        count = (self.head[tank_id, None] - self.tail[tank_id])[..., None]
+        delta = value[:, None, :] - self.mean[tank_id]
+        mean = self.mean[tank_id] + delta / count
+        self.mean[tank_id] = mean
+        self.m2[tank_id] += delta * (value[:, None, :] - mean)
+
+        # EWMA (첫 측정 값은 그대로)
+        last_at = self.last_at[tank_id]
+        elapsed = np.where(last_at >= 0, recorded_at - last_at, 0)
+        alpha = 1.0 - np.exp(-elapsed[:, None] / self.windows[None, :])
+        alpha[last_at < 0] = 1.0
+        ewma = self.ewma[tank_id]
+        self.ewma[tank_id] = ewma + alpha[..., None] * (value[:, None, :] - ewma)
+        self.last_at[tank_id] = recorded_at
+
+        self._push_deque(tank_id, seq, value)
+
+    def _expire(self, tank_id: np.ndarray, recorded_at: np.ndarray) -> None:
+        """구간을 벗어났거나 ring buffer 에서 덮어쓰일 측정 값을 구간별 통계에서 제거"""
+        cutoff = recorded_at[:, None] - self.windows[None, :]
+        head = self.head[tank_id, None]
+        while True:
+            tail = self.tail[tank_id]
+            position = tail % self.capacity
+            expired = (tail < head) & (
+                (self.ring_at[tank_id[:, None], position] <= cutoff)
+                | (head - tail >= self.capacity)
+            )
+            if not expired.any():
+                break
+            rows, window = np.nonzero(expired)
+            tanks = tank_id[rows]
+            value = self.ring_value[tanks, position[rows, window]]
+            count = (head[rows, 0] - tail[rows, window])[:, None]
+
+            # Welford 제거 (마지막 하나면 초기화)
+            mean = self.mean[tanks, window]
+            remaining = np.maximum(count - 1, 1)
+            new_mean = np.where(count > 1, (mean * count - value) / remaining, 0.0)
+            m2 = self.m2[tanks, window] - (value - mean) * (value - new_mean)
+            self.mean[tanks, window] = new_mean
+            self.m2[tanks, window] = np.where(count > 1, np.maximum(m2, 0.0), 0.0)
+            self.tail[tanks, window] += 1
+
+        # 가장 긴 구간 밖의 순번을 deque 앞에서 제거
+        oldest = self.tail[tank_id, -1][:, None, None]
+        while True:
+            front, back = self.deque_front[tank_id], self.deque_back[tank_id]
+            first = np.take_along_axis(
+                self.deque[tank_id], (front % self.capacity)[..., None], axis=-1
+            )[..., 0]
+            expired = (front < back) & (first < oldest)
+            if not expired.any():
+                break
+            self.deque_front[tank_id] = front + expired
+
+    def _push_deque(self, tank_id: np.ndarray, seq: np.ndarray, value: np.ndarray) -> None:
+        # 새 값보다 크거나 같은(MIN) / 작거나 같은(MAX) 뒤쪽 원소는 다시 최소 / 최대가 될 수 없으므로 제거
+        while True:
+            front, back = self.deque_front[tank_id], self.deque_back[tank_id]
+            last = np.take_along_axis(
+                self.deque[tank_id], ((back - 1) % self.capacity)[..., None], axis=-1
+            )[..., 0]
+            last_value = self.ring_value[
+                tank_id[:, None, None], last % self.capacity, np.arange(len(METRICS))
+            ]
+            dominated = np.stack(
+                [last_value[:, MIN] >= value, last_value[:, MAX] <= value], axis=1
+            )
+            popped = (front < back) & dominated
+            if not popped.any():
+                break
+            self.deque_back[tank_id] = back - popped
+
+        back = self.deque_back[tank_id]
+        self.deque[
+            tank_id[:, None, None],
+            np.arange(2)[None, :, None],
+            np.arange(len(METRICS))[None, None, :],
+            back % self.capacity,
+        ] = seq[:, None, None]
+        self.deque_back[tank_id] = back + 1
+
+    def snapshot(
+        self, window: int, tank_ids: Optional[Sequence[int]] = None
+    ) -> List[WaterTankRollingStatistics]:
+        """구간(초)의 수조별 통계 (tank_ids 가 없으면 측정 값이 있는 모든 수조)"""
+        if window not in self.windows:
+            raise ValueError(f"unknown window: {window}")
+        window_index = int(np.flatnonzero(self.windows == window)[0])
+        if tank_ids is None:
+            tank_id = np.flatnonzero(self.last_at >= 0)
+        else:
+            tank_id = np.asarray(tank_ids, dtype=np.int64)
+            tank_id = tank_id[tank_id < len(self.head)]
+            tank_id = tank_id[self.last_at[tank_id] >= 0]
+
+        count = self.head[tank_id] - self.tail[tank_id, window_index]
+        mean = self.mean[tank_id, window_index]
+        stddev = np.sqrt(
+            self.m2[tank_id, window_index] / np.maximum(count - 1, 1)[:, None]
+        )
+        ewma = self.ewma[tank_id, window_index]
+        minimum, maximum = self._window_extremes(
+            tank_id, self.tail[tank_id, window_index]
+        )
+
+        return [
+            WaterTankRollingStatistics(
+                tank_id=int(tank_id[i]),
+                window=window,
+                count=int(count[i]),
+                recorded_at=EPOCH + timedelta(seconds=int(self.last_at[tank_id[i]])),
+                **{
+                    name: MetricStatistics(
+                        mean=float(mean[i, m]),
+                        stddev=float(stddev[i, m]),
+                        minimum=float(minimum[i, m]),
+                        maximum=float(maximum[i, m]),
+                        ewma=float(ewma[i, m]),
+                    )
+                    for m, name in enumerate(METRICS)
+                },
+            )
+            for i in range(len(tank_id))
+        ]
+
+    def _window_extremes(self, tank_id: np.ndarray, tail: np.ndarray):
+        """deque 에서 구간 시작(tail) 이후의 첫 원소 = 구간의 최소 / 최대"""
+        offset = np.arange(self.capacity)
+        front = self.deque_front[tank_id]
+        length = self.deque_back[tank_id] - front
+        positions = (front[..., None] + offset) % self.capacity
+        seqs = np.take_along_axis(self.deque[tank_id], positions, axis=-1)
+        in_window = (offset < length[..., None]) & (seqs >= tail[:, None, None, None])
+        first = np.take_along_axis(
+            seqs, in_window.argmax(axis=-1)[..., None], axis=-1
+        )[..., 0]
+        extremes = self.ring_value[
+            tank_id[:, None, None], first % self.capacity, np.arange(len(METRICS))
+        ]
+        return extremes[:, MIN], extremes[:, MAX]
+
+
+# 수조 수가 늘어날 때 복사하는 상태 배열
+STATE_ARRAYS = (
+    "ring_at",
+    "ring_value",
+    "head",
+    "last_at",
+    "tail",
+    "mean",
+    "m2",
+    "ewma",
+    "deque",
+    "deque_front",
+    "deque_back",
+)
@@ -0,0 +1,15 @@
+from typing import List
+
+from pydantic_settings import BaseSettings
+from pydantic import Field
+
+
+class MonitoringSettings(BaseSettings):
+    # 수조별 이동 통계 구간 (초, JSON 배열)
+    MONITORING_ROLLING_WINDOWS: List[int] = Field(default=[300, 900, 3600])
+    # 수조별로 보관하는 최근 측정 값 수 (가장 긴 구간의 측정 횟수보다 커야 정확함)
+    MONITORING_ROLLING_CAPACITY: int = Field(default=512)
+    # 이 시간(초) 동안 측정 값이 들어오지 않은 수조는 stale
+    MONITORING_STALE_TIMEOUT: float = Field(default=300.0)
+    # stale 판정 간격 (초, timer wheel 의 slot 크기)
+    MONITORING_STALE_TICK: float = Field(default=5.0)
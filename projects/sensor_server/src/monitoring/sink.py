@@ -0,0 +1,27 @@
+import logging
+from typing import List, Protocol
+
+from src.monitoring.domains import TankLivenessEvent
+
+logger = logging.getLogger(__name__)
+
+
+class TankLivenessSink(Protocol):
+    """수조 측정 중단 / 재개 이벤트를 전달받는 곳 (알림 채널 등)
+
+    수집 경로와 분리된 task 에서 호출됩니다.
+    """
+
+    async def send(self, events: List[TankLivenessEvent]) -> None: ...
+
+
+class LoggingTankLivenessSink:
+    """측정 중단 / 재개 이벤트를 로그로 남기는 sink"""
+
+    async def send(self, events: List[TankLivenessEvent]) -> None:
+        for event in events:
+            logger.warning(
+                f"tank {event.state}: tank={event.tank_id} "
+                f"(last_seen_at={event.last_seen_at.isoformat()})",
+                extra={"extra": {"liveness": event.state, "tank_id": event.tank_id}},
+            )
@@ -0,0 +1,58 @@
+from dependency_injector import containers, providers
+
+from src.alert.container import AlertContainer
+from src.analytics.container import AnalyticsContainer
+from src.database.container import DatabaseContainer
+from src.facility.container import FacilityContainer
+from src.report.generator import DailyReportGenerator
+from src.report.repository import DailySummaryRepository
+from src.report.service import DailyReportService
+from src.report.settings import ReportSettings
+from src.scheduler.domains import ScheduledJob
+from src.scheduler.schedule import CronSchedule
+from src.sensor.container import SensorContainer
+
+
+class ReportContainer(containers.DeclarativeContainer):
+    """수조 / 동 하루 요약 보고서"""
+
+    database: DatabaseContainer = providers.Container(DatabaseContainer)
+    facility: FacilityContainer = providers.Container(FacilityContainer)
+    sensor: SensorContainer = providers.Container(SensorContainer)
+    alert: AlertContainer = providers.Container(AlertContainer)
+    analytics: AnalyticsContainer = providers.Container(AnalyticsContainer)
+
+    settings = providers.Singleton(ReportSettings)
+
+    repository = providers.Singleton(
+        DailySummaryRepository, session_factory=database.session_factory
+    )
+
+    generator = providers.Singleton(
+        DailyReportGenerator,
+        history_repository=sensor.history_repository,
+        report_repository=repository,
+        rule_repository=alert.rule_repository,
+        facility_index=facility.index,
+        timezone=settings.provided.REPORT_TIMEZONE,
+        max_gap=settings.provided.REPORT_MAX_GAP,
+        catchup_days=settings.provided.REPORT_CATCHUP_DAYS,
+        tank_chunk=settings.provided.REPORT_TANK_CHUNK,
+        analytics=analytics.executor,
+    )
+
+    service = providers.Singleton(
+        DailyReportService,
+        repository=repository,
+        facility_service=facility.service,
+    )
+
+    # scheduler 에 등록하는 하루 한 번 작업 (leader 에서만 실행)
+    job = providers.Singleton(
+        ScheduledJob,
+        name="daily_report",
+        schedule=providers.Singleton(CronSchedule, settings.provided.REPORT_CRON),
+        func=generator.provided.run,
+        timeout=settings.provided.REPORT_TIMEOUT,
+        enabled=settings.provided.REPORT_ENABLED,
+    )
@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+from datetime import date
+from typing import Literal, Optional
+
+ReportScope = Literal["tank", "building"]
+
+
+@dataclass
+class DailySummary:
+    """수조 / 동의 측정 항목별 하루 요약 (전날 history 로 한 번 계산해 저장)"""
+
+    report_date: date  # 보고 날짜 (REPORT_TIMEZONE 기준 하루)
+    scope: ReportScope  # 범위
+    scope_id: int  # 범위의 id (tank_id / building_id)
+    metric: str  # 측정 항목
+    count: int  # 측정 값 수
+    completeness: float  # 측정 값으로 덮인 시간 / 하루 시간 (0~1)
+    minimum: Optional[float]  # 측정 값이 없으면 None
+    maximum: Optional[float]
+    mean: Optional[float]
+    out_of_range_seconds: Optional[float]  # 경보 규칙 범위를 벗어난 시간 (규칙이 없으면 None)
@@ -0,0 +1,69 @@
+from datetime import date
+from typing import Optional
+
+from sqlalchemy import VARCHAR, Date
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.database.base import Base
+from src.report.domains import DailySummary
+
+
+class WaterTankDailySummaryEntity(Base):
+    """수조 / 동의 측정 항목별 하루 요약 저장"""
+
+    __tablename__ = "water_tank_daily_summary"
+
+    report_date: Mapped[date] = mapped_column(Date, primary_key=True)
+    scope: Mapped[str] = mapped_column(VARCHAR(16), primary_key=True)
+    scope_id: Mapped[int] = mapped_column(primary_key=True)
+    metric: Mapped[str] = mapped_column(VARCHAR(32), primary_key=True)
+    count: Mapped[int] = mapped_column()
+    completeness: Mapped[float] = mapped_column()
+    minimum: Mapped[Optional[float]] = mapped_column()
+    maximum: Mapped[Optional[float]] = mapped_column()
+    mean: Mapped[Optional[float]] = mapped_column()
+    out_of_range_seconds: Mapped[Optional[float]] = mapped_column()
+
+    @staticmethod
+    def from_domain(domain: DailySummary):
+        """도메인 객체를 엔티티로 변환합니다."""
+        return WaterTankDailySummaryEntity(
+            report_date=domain.report_date,
+            scope=domain.scope,
+            scope_id=domain.scope_id,
+            metric=domain.metric,
+            count=domain.count,
+            completeness=domain.completeness,
+            minimum=domain.minimum,
+            maximum=domain.maximum,
+            mean=domain.mean,
+            out_of_range_seconds=domain.out_of_range_seconds,
+        )
+
+    def to_domain(self) -> DailySummary:
+        """엔티티 객체를 도메인 객체로 변환합니다."""
+        return DailySummary(
+            report_date=self.report_date,
+            scope=self.scope,
+            scope_id=self.scope_id,
+            metric=self.metric,
+            count=self.count,
+            completeness=self.completeness,
+            minimum=self.minimum,
+            maximum=self.maximum,
+            mean=self.mean,
+            out_of_range_seconds=self.out_of_range_seconds,
+        )
+
+    def update(self, domain: DailySummary):
+        """도메인 객체로 엔티티의 값을 업데이트합니다."""
+        self.count = domain.count
+        self.completeness = domain.completeness
+        self.minimum = domain.minimum
+        self.maximum = domain.maximum
+        self.mean = domain.mean
+        self.out_of_range_seconds = domain.out_of_range_seconds
+
+    def primary_key(self) -> tuple[date, str, int, str]:
+        """엔티티의 기본 키를 반환합니다."""
+        return self.report_date, self.scope, self.scope_id, self.metric
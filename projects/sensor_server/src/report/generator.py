@@ -0,0 +1,197 @@
+"""전날 history 로 수조 / 동의 하루 요약을 만들어 저장
+
+화면에서 보고서를 볼 때마다 하루치 raw history 를 집계하지 않도록, scheduler 가 하루에 한 번
+전날 history 로 수조 요약을 계산하고, 이를 합쳐 동 요약을 만든 뒤 함께 저장합니다.
+조회는 (날짜, 범위, 범위 id) 기본 키로 끝납니다.
+
+- history 는 tank_chunk 개 수조씩 나눠 조회 / 요약하므로, 메모리에는 수조 묶음 하나의 하루치만 올라갑니다.
+- 작업이 실행되지 않은 날(배포, leader 교체 등)이 있어도, 최근 catchup_days 일 중 요약이 없는 날짜를
+  다음 실행 때 오래된 날짜부터 만듭니다.
+
+범위를 벗어난 시간은 요약 시점의 경보 규칙(compile_rules)의 하한 / 상한을 기준으로 계산합니다.
+"""
+
+import logging
+import time
+from datetime import date, datetime, timedelta
+from typing import Callable, List, Optional
+from zoneinfo import ZoneInfo
+
+import numpy as np
+
+from src import metrics
+from src.alert.engine import compile_rules
+from src.alert.repository import AlertRuleRepository
+from src.analytics.executor import AnalyticsExecutor
+from src.exceptions import ServerException
+from src.facility.index import FacilityIndex
+from src.report.domains import DailySummary, ReportScope
+from src.report.repository import DailySummaryRepository
+from src.report.summary import (
+    SummaryTable,
+    concat_tables,
+    summarize_groups,
+    summarize_tanks,
+)
+from src.sensor.domains import METRICS
+
+logger = logging.getLogger(__name__)
+
+
+class DailyReportGenerator:
+    """하루 요약 생성 (scheduler 의 daily_report 작업)"""
+
+    def __init__(
+        self,
+        history_repository,
+        report_repository: DailySummaryRepository,
+        rule_repository: AlertRuleRepository,
+        facility_index: FacilityIndex,
+        timezone: str = "Asia/Seoul",
+        max_gap: float = 300.0,
+        catchup_days: int = 7,
+        tank_chunk: int = 200,
+        clock: Callable[[], float] = time.time,
+        analytics: Optional[AnalyticsExecutor] = None,
+    ):
+        self.history_repository = history_repository
+        self.report_repository = report_repository
+        self.rule_repository = rule_repository
+        self.facility_index = facility_index
+        self.timezone = ZoneInfo(timezone)
+        self.max_gap = max_gap
+        self.catchup_days = catchup_days
+        self.tank_chunk = tank_chunk
+        self.clock = clock
+        self.analytics = analytics or AnalyticsExecutor(enabled=False)
+
+    async def run(self) -> List[DailySummary]:
+        """전날 요약과 최근 catchup_days 일 중 빠진 날짜의 요약 생성 (오래된 날짜부터)"""
+        today = datetime.fromtimestamp(self.clock(), tz=self.timezone).date()
+        last = today - timedelta(days=1)
+        first = last - timedelta(days=max(self.catchup_days, 1) - 1)
+        existing = await self.report_repository.find_report_dates(first, last)
+        # 전날은 이미 있어도 늦게 들어온 측정 값을 반영하도록 다시 만듦
+        report_dates = [
+            report_date
+            for report_date in (
+                first + timedelta(days=i) for i in range((last - first).days + 1)
+            )
+            if report_date not in existing or report_date == last
+        ]
+        if len(report_dates) > 1:
+            logger.info(f"daily report catch-up: {[str(d) for d in report_dates]}")
+
+        summaries = []
+        for report_date in report_dates:
+            summaries.extend(await self.generate(report_date))
+        return summaries
+
+    async def generate(self, report_date: date) -> List[DailySummary]:
+        """report_date 하루의 수조 / 동 요약을 계산해 저장 (같은 날짜를 다시 만들면 덮어씀)
+
+        시설 인덱스가 적재되지 않았으면 빈 수조 목록으로 요약하지 않고 ServerException 을 던집니다.
+        (작업은 실패로 기록되고, 요약이 없는 날짜는 다음 실행의 catch-up 에서 다시 만듦)
+        """
+        if not self.facility_index.loaded:
+            raise ServerException("facility index is not loaded")
+        start = datetime.combine(report_date, datetime.min.time(), tzinfo=self.timezone)
+        end = datetime.combine(
+            report_date + timedelta(days=1), datetime.min.time(), tzinfo=self.timezone
+        )
+        tanks = sorted(self.facility_index.find_all_tanks(), key=lambda t: t.tank_id)
+        tank_ids = np.asarray([tank.tank_id for tank in tanks], dtype=np.int64)
+        building_ids = np.asarray([tank.building_id for tank in tanks], dtype=np.int64)
+        lower, upper = await self._ranges(tank_ids)
+
+        # 수조 묶음별로 조회 → 요약 (조회한 측정 값은 다음 묶음 전에 버림, 수조가 없어도 빈 요약 한 번)
+        tables = []
+        rows = 0
+        loading = summarizing = 0.0
+        chunk = max(self.tank_chunk, 1)
+        for begin in range(0, max(len(tank_ids), 1), chunk):
+            selected = slice(begin, begin + chunk)
+            chunk_started_at = time.perf_counter()
+            columns = await self.history_repository.scan_all(
+                start, end, tank_ids[selected].tolist()
+            )
+            loaded_at = time.perf_counter()
+            tables.append(
+                await self.analytics.run(
+                    summarize_tanks,
+                    columns,
+                    tank_ids[selected],
+                    int(start.timestamp()),
+                    int(end.timestamp()),
+                    self.max_gap,
+                    lower[selected],
+                    upper[selected],
+                )
+            )
+            rows += len(columns)
+            del columns
+            loading += loaded_at - chunk_started_at
+            summarizing += time.perf_counter() - loaded_at
+
+        summarized_at = time.perf_counter()
+        tank_table = concat_tables(tables)
+        group_ids, group = np.unique(building_ids, return_inverse=True)
+        building_table = summarize_groups(tank_table, group, group_ids)
+        summaries = to_summaries(report_date, "tank", tank_table) + to_summaries(
+            report_date, "building", building_table
+        )
+        summarizing += time.perf_counter() - summarized_at
+
+        stored_at = time.perf_counter()
+        await self.report_repository.upsert_many(summaries)
+
+        metrics.report_generation_seconds.labels("load").observe(loading)
+        metrics.report_generation_seconds.labels("summarize").observe(summarizing)
+        metrics.report_generation_seconds.labels("store").observe(
+            time.perf_counter() - stored_at
+        )
+        logger.info(
+            f"daily report {report_date}: tanks={len(tank_table)}, "
+            f"buildings={len(building_table)}, rows={rows}"
+        )
+        return summaries
+
+    async def _ranges(self, tank_ids: np.ndarray):
+        """(수조, 항목) 경보 규칙 하한 / 상한 (규칙이 없으면 NaN)"""
+        tables = compile_rules(await self.rule_repository.find_all(), self.facility_index)
+        lower = np.full((len(tank_ids), len(METRICS)), np.nan)
+        upper = np.full((len(tank_ids), len(METRICS)), np.nan)
+        for m, name in enumerate(METRICS):
+            if (table := tables.get(name)) is None:
+                continue
+            covered = tank_ids < len(table)
+            lower[covered, m] = table.lower[tank_ids[covered]]
+            upper[covered, m] = table.upper[tank_ids[covered]]
+        return lower, upper
+
+
+def to_summaries(
+    report_date: date, scope: ReportScope, table: SummaryTable
+) -> List[DailySummary]:
+    """요약 행렬을 (범위, 항목)별 도메인 객체로 (NaN 은 None)"""
+    completeness = table.completeness
+    return [
+        DailySummary(
+            report_date=report_date,
+            scope=scope,
+            scope_id=int(table.scope_id[i]),
+            metric=name,
+            count=int(table.count[i, m]),
+            completeness=float(completeness[i, m]),
+            minimum=to_optional(table.minimum[i, m]),
+            maximum=to_optional(table.maximum[i, m]),
+            mean=to_optional(table.mean[i, m]),
+            out_of_range_seconds=to_optional(table.out_of_range_seconds[i, m]),
+        )
+        for i in range(len(table))
+        for m, name in enumerate(METRICS)
+    ]
+
+
+def to_optional(value: float):
+    return None if np.isnan(value) else float(value)
@@ -0,0 +1,63 @@
+from dataclasses import asdict
+from datetime import date
+from typing import List, Set
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+
+from src.database.repository import BaseRepository
+from src.report.domains import DailySummary, ReportScope
+from src.report.entities import WaterTankDailySummaryEntity
+
+
+class DailySummaryRepository(BaseRepository[tuple, DailySummary]):
+    """수조 / 동의 하루 요약 저장"""
+
+    entity = WaterTankDailySummaryEntity
+
+    async def upsert_many(self, summaries: List[DailySummary]) -> None:
+        """(날짜, 범위, 항목)별 요약을 한 번의 multi-row upsert 로 저장 (같은 날짜를 다시 만들면 덮어씀)"""
+        if len(summaries) == 0:
+            return
+        stmt = insert(self.entity)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[
+                self.entity.report_date,
+                self.entity.scope,
+                self.entity.scope_id,
+                self.entity.metric,
+            ],
+            set_={
+                column: stmt.excluded[column]
+                for column in (
+                    "count",
+                    "completeness",
+                    "minimum",
+                    "maximum",
+                    "mean",
+                    "out_of_range_seconds",
+                )
+            },
+        )
+        async with self.session_factory() as session:
+            await session.execute(stmt, [asdict(summary) for summary in summaries])
+            await session.commit()
+
+    async def find_summaries(
+        self, report_date: date, scope: ReportScope, scope_id: int
+    ) -> List[DailySummary]:
+        """범위의 하루 요약 (기본 키 앞부분으로 조회, 항목 순서는 보장하지 않음)"""
+        return await self.find_by(report_date=report_date, scope=scope, scope_id=scope_id)
+
+    async def find_report_dates(self, first: date, last: date) -> Set[date]:
+        """[first, last] 중 요약이 저장된 날짜 (빠뜨린 날짜를 다시 만들지 정하므로 primary 에서 조회)"""
+        async with self.session_factory() as session:
+            result = await session.execute(
+                select(self.entity.report_date)
+                .where(
+                    self.entity.report_date >= first,
+                    self.entity.report_date <= last,
+                )
+                .distinct()
+            )
+            return set(result.scalars().all())
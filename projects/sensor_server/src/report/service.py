@@ -0,0 +1,53 @@
+from datetime import date
+from typing import List
+
+from src.facility.service import FacilityService
+from src.report.domains import DailySummary
+from src.report.repository import DailySummaryRepository
+from src.sensor.domains import METRICS
+
+
+class DailyReportService:
+    """저장된 하루 요약 조회 (history 집계 없이 기본 키로 조회)"""
+
+    def __init__(
+        self,
+        repository: DailySummaryRepository,
+        facility_service: FacilityService,
+    ):
+        self.repository = repository
+        self.facility_service = facility_service
+
+    async def find_tank_report(
+        self, report_date: date, tank_code: str
+    ) -> List[DailySummary]:
+        """수조의 항목별 하루 요약 (아직 만들어지지 않았으면 빈 리스트)
+
+        Raises:
+            NotFoundException: 수조가 존재하지 않을 경우 발생
+        """
+        tank = await self.facility_service.get_water_tank_by_code(tank_code)
+        return sort_by_metric(
+            await self.repository.find_summaries(report_date, "tank", tank.tank_id)
+        )
+
+    async def find_building_report(
+        self, report_date: date, building_code: str
+    ) -> List[DailySummary]:
+        """동의 항목별 하루 요약 (아직 만들어지지 않았으면 빈 리스트)
+
+        Raises:
+            NotFoundException: 동이 존재하지 않을 경우 발생
+        """
+        building = await self.facility_service.get_water_tank_building_by_code(
+            building_code
+        )
+        return sort_by_metric(
+            await self.repository.find_summaries(
+                report_date, "building", building.building_id
+            )
+        )
+
+
+def sort_by_metric(summaries: List[DailySummary]) -> List[DailySummary]:
+    return sorted(summaries, key=lambda summary: METRICS.index(summary.metric))
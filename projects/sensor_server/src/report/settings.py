@@ -0,0 +1,18 @@
+from pydantic_settings import BaseSettings
+from pydantic import Field
+
+
+class ReportSettings(BaseSettings):
+    REPORT_ENABLED: bool = Field(default=True)
+    # 보고 날짜의 기준 시간대 (하루의 시작 / 끝)
+    REPORT_TIMEZONE: str = Field(default="Asia/Seoul")
+    # 전날 요약을 만드는 시간 (UTC cron, 기본값은 KST 00:10)
+    REPORT_CRON: str = Field(default="10 15 * * *")
+    # 요약 생성 한 번의 제한 시간 (초)
+    REPORT_TIMEOUT: float = Field(default=600.0)
+    # 측정 값 하나가 덮는 최대 시간 (초, 다음 측정 값까지의 간격이 이보다 길면 그 차이는 누락으로 봄)
+    REPORT_MAX_GAP: float = Field(default=300.0)
+    # 요약 작업마다 최근 며칠(전날 포함) 중 요약이 없는 날짜도 만듦 (작업을 건너뛴 날 보충)
+    REPORT_CATCHUP_DAYS: int = Field(default=7)
+    # history 를 한 번에 조회 / 요약할 수조 수 (하루치 전체를 한 번에 올리지 않도록)
+    REPORT_TANK_CHUNK: int = Field(default=200)
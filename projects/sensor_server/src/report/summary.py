@@ -0,0 +1,175 @@
+"""하루 요약 계산 (수조 / 동 x 측정 항목 행렬)
+
+history 를 (수조, 측정 시간) 순으로 한 번 훑으며 수조별 구간(segment)을 reduceat 으로 한 번에 집계합니다.
+
+- 측정 값 하나는 다음 측정 값(수조의 마지막 값은 하루 끝)까지의 시간을 덮으며, 최대 max_gap 까지만 인정합니다.
+- completeness = 항목 값이 있는 측정 값이 덮은 시간 / 하루 시간
+- out_of_range_seconds = 경보 규칙의 하한 / 상한을 벗어난 측정 값이 덮은 시간 (규칙이 없는 수조는 NaN)
+"""
+
+from dataclasses import dataclass, fields
+from typing import List
+
+import numpy as np
+
+from src.sensor.domains import METRICS, WaterTankSensorRecordColumns
+
+
+@dataclass
+class SummaryTable:
+    """범위(수조 / 동)별 x 항목별 하루 요약 (행: scope_id, 열: METRICS)"""
+
+    scope_id: np.ndarray  # (범위,)
+    count: np.ndarray  # (범위, 항목) 측정 값 수
+    minimum: np.ndarray  # (범위, 항목) 측정 값이 없으면 NaN
+    maximum: np.ndarray
+    mean: np.ndarray
+    covered_seconds: np.ndarray  # (범위, 항목) 측정 값이 덮은 시간
+    expected_seconds: np.ndarray  # (범위,) 하루 시간 x 수조 수
+    out_of_range_seconds: np.ndarray  # (범위, 항목) 규칙이 없으면 NaN
+
+    def __len__(self) -> int:
+        return len(self.scope_id)
+
+    @property
+    def completeness(self) -> np.ndarray:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            completeness = self.covered_seconds / self.expected_seconds[:, None]
+        return np.nan_to_num(completeness)
+
+
+def summarize_tanks(
+    columns: WaterTankSensorRecordColumns,
+    tank_ids: np.ndarray,
+    start: int,
+    end: int,
+    max_gap: float,
+    lower: np.ndarray,
+    upper: np.ndarray,
+) -> SummaryTable:
+    """수조별 [start, end) 하루 요약
+
+    Args:
+        columns: 측정 값 묶음 (순서 무관)
+        tank_ids: 요약할 수조 id (오름차순, 측정 값이 없는 수조는 count 0 / completeness 0)
+        start / end: 하루의 시작 / 끝 (epoch 초)
+        max_gap: 측정 값 하나가 덮는 최대 시간 (초)
+        lower / upper: (수조, 항목) 경보 규칙의 하한 / 상한 (없으면 NaN)
+    """
+    tank_ids = np.asarray(tank_ids, dtype=np.int64)
+    size = len(tank_ids)
+    shape = (size, len(METRICS))
+    table = SummaryTable(
+        scope_id=tank_ids,
+        count=np.zeros(shape, dtype=np.int64),
+        minimum=np.full(shape, np.nan),
+        maximum=np.full(shape, np.nan),
+        mean=np.full(shape, np.nan),
+        covered_seconds=np.zeros(shape),
+        expected_seconds=np.full(size, float(end - start)),
+        out_of_range_seconds=np.zeros(shape),
+    )
+    has_range = ~np.isnan(lower) | ~np.isnan(upper)
+    table.out_of_range_seconds[~has_range] = np.nan
+    if size == 0 or len(columns) == 0:
+        return table
+
+    # 요약 대상 수조 / 하루 구간의 행만 (행 위치 → 수조 행 번호)
+    position = np.minimum(np.searchsorted(tank_ids, columns.tank_id), size - 1)
+    keep = (
+        (tank_ids[position] == columns.tank_id)
+        & (columns.recorded_at >= start)
+        & (columns.recorded_at < end)
+    )
+    if not keep.any():
+        return table
+    order = np.lexsort((columns.recorded_at[keep], position[keep]))
+    row = position[keep][order]
+    recorded_at = columns.recorded_at[keep][order]
+    values = np.column_stack([columns.metric(name)[keep][order] for name in METRICS])
+    valid = ~np.isnan(values)
+
+    # 측정 값별로 덮는 시간 (다음 측정 값 또는 하루 끝까지, 최대 max_gap)
+    last = np.append(row[1:] != row[:-1], True)
+    until = np.append(recorded_at[1:], end)
+    until[last] = end
+    duration = np.clip(until - recorded_at, 0, max_gap).astype(np.float64)
+
+    with np.errstate(invalid="ignore"):
+        outside = (values < lower[row]) | (values > upper[row])
+
+    segments = np.flatnonzero(np.append(True, row[1:] != row[:-1]))
+    rows = row[segments]
+    count = np.add.reduceat(valid.astype(np.int64), segments, axis=0)
+    table.count[rows] = count
+    table.minimum[rows] = np.fmin.reduceat(values, segments, axis=0)
+    table.maximum[rows] = np.fmax.reduceat(values, segments, axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        table.mean[rows] = (
+            np.add.reduceat(np.where(valid, values, 0.0), segments, axis=0) / count
+        )
+    table.covered_seconds[rows] = np.add.reduceat(
+        valid * duration[:, None], segments, axis=0
+    )
+    out_of_range = np.add.reduceat(outside * duration[:, None], segments, axis=0)
+    table.out_of_range_seconds[rows] = np.where(has_range[rows], out_of_range, np.nan)
+    return table
+
+
+def summarize_groups(
+    table: SummaryTable, group: np.ndarray, group_ids: np.ndarray
+) -> SummaryTable:
+    """수조 요약을 묶음(동)별로 합침
+
+    - 최소 / 최대: 수조 최소 / 최대의 최소 / 최대
+    - 평균: 측정 값 수로 가중한 평균
+    - completeness: 묶음의 모든 수조 시간 대비 (측정 값이 없는 수조도 0 으로 포함)
+    - out_of_range_seconds: 규칙이 있는 수조의 합 (규칙이 있는 수조가 없으면 NaN)
+
+    Args:
+        table: 수조 요약
+        group: 수조 행별 묶음 행 번호 (group_ids 의 인덱스)
+        group_ids: 묶음 id
+    """
+    shape = (len(group_ids), table.count.shape[1])
+    count = np.zeros(shape, dtype=np.int64)
+    minimum = np.full(shape, np.nan)
+    maximum = np.full(shape, np.nan)
+    total = np.zeros(shape)
+    covered = np.zeros(shape)
+    expected = np.zeros(len(group_ids))
+    out_of_range = np.zeros(shape)
+    ranged = np.zeros(shape, dtype=np.int64)
+
+    np.add.at(count, group, table.count)
+    np.fmin.at(minimum, group, table.minimum)
+    np.fmax.at(maximum, group, table.maximum)
+    np.add.at(total, group, np.nan_to_num(table.mean) * table.count)
+    np.add.at(covered, group, table.covered_seconds)
+    np.add.at(expected, group, table.expected_seconds)
+    np.add.at(out_of_range, group, np.nan_to_num(table.out_of_range_seconds))
+    np.add.at(ranged, group, ~np.isnan(table.out_of_range_seconds))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = total / count
+    return SummaryTable(
+        scope_id=np.asarray(group_ids, dtype=np.int64),
+        count=count,
+        minimum=minimum,
+        maximum=maximum,
+        mean=np.where(count > 0, mean, np.nan),
+        covered_seconds=covered,
+        expected_seconds=expected,
+        out_of_range_seconds=np.where(ranged > 0, out_of_range, np.nan),
+    )
+
+
+def concat_tables(tables: List[SummaryTable]) -> SummaryTable:
+    """범위를 나눠 계산한 요약을 이어 붙임 (행 순서 유지)"""
+    return SummaryTable(
+        **{
+            field.name: np.concatenate([getattr(table, field.name) for table in tables])
+            for field in fields(SummaryTable)
+        }
+    )
+
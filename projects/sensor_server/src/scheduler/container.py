@@ -0,0 +1,32 @@
+from dependency_injector import containers, providers
+
+from src.database.container import DatabaseContainer
+from src.scheduler.leader import AdvisoryLockLeaderElection
+from src.scheduler.scheduler import JobScheduler
+from src.scheduler.settings import SchedulerSettings
+
+
+class SchedulerContainer(containers.DeclarativeContainer):
+    """leader 선출 기반 주기 작업 scheduler"""
+
+    database: DatabaseContainer = providers.Container(DatabaseContainer)
+
+    settings = providers.Singleton(SchedulerSettings)
+
+    # 실행할 작업 (ApplicationContainer 에서 지정)
+    jobs = providers.List()
+
+    leader_election = providers.Singleton(
+        AdvisoryLockLeaderElection,
+        session_factory=database.session_factory,
+        lock_key=settings.provided.SCHEDULER_LOCK_KEY,
+        retry_interval=settings.provided.SCHEDULER_LEADER_RETRY_INTERVAL,
+    )
+
+    scheduler = providers.Singleton(
+        JobScheduler,
+        leader_election=leader_election,
+        jobs=jobs,
+        max_concurrent_jobs=settings.provided.SCHEDULER_MAX_CONCURRENT_JOBS,
+        enabled=settings.provided.SCHEDULER_ENABLED,
+    )
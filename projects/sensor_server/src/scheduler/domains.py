@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Optional
+
+from src.scheduler.schedule import Schedule
+
+
+@dataclass
+class ScheduledJob:
+    """주기적으로 실행할 작업"""
+
+    name: str  # 작업 이름 (metric label)
+    schedule: Schedule
+    func: Callable[[], Awaitable[object]]  # 실행할 coroutine 함수
+    timeout: Optional[float] = None  # 실행 제한 시간 (초, 넘으면 취소)
+    jitter: float = 0.0  # 실행 시간에 더하는 무작위 지연의 최대값 (초)
+    max_concurrency: int = 1  # 동시에 실행할 수 있는 수 (넘으면 이번 실행은 건너뜀)
+    leader_only: bool = True  # leader 인 프로세스에서만 실행 (replica 전체에서 한 번)
+    enabled: bool = True
@@ -0,0 +1,101 @@
+"""PostgreSQL advisory lock 으로 scheduler leader 선출
+
+풀과 별개의 커넥션 하나로 pg_try_advisory_lock(lock_key) 을 시도하고, lock 을 얻은 프로세스가 leader 가 됩니다.
+session 단위 lock 이므로 프로세스가 죽거나 커넥션이 끊기면 DB 가 lock 을 풀고, 다른 프로세스가 다음 시도 때
+leader 가 됩니다. leader 는 retry_interval 마다 커넥션을 확인하며, 끊긴 것을 알게 되면 바로 leader 를 내려놓습니다.
+
+커넥션이 끊긴 뒤 알아차리기까지(최대 retry_interval) 두 프로세스가 동시에 leader 일 수 있으므로,
+작업은 다시 실행되어도 안전하게(upsert 등) 작성해야 합니다.
+"""
+
+import asyncio
+import logging
+from typing import Callable, List, Optional
+
+import asyncpg
+
+from src import metrics
+from src.database.session_factory import SessionFactory
+
+logger = logging.getLogger(__name__)
+
+
+class AdvisoryLockLeaderElection:
+    """advisory lock 기반 leader 선출"""
+
+    def __init__(
+        self,
+        session_factory: SessionFactory,
+        lock_key: int,
+        retry_interval: float = 5.0,
+    ):
+        self.session_factory = session_factory
+        self.lock_key = lock_key
+        self.retry_interval = retry_interval
+
+        self.is_leader = False
+        # leader 여부가 바뀔 때 호출 (인자: leader 여부)
+        self.listeners: List[Callable[[bool], None]] = []
+
+        self._connection: Optional[asyncpg.Connection] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        # 커넥션을 닫으면 lock 도 풀림
+        await self._close()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self._elect()
+            except Exception as e:
+                logger.warning(f"leader election failed ({e!r})")
+                await self._close()
+            await asyncio.sleep(self.retry_interval)
+
+    async def _elect(self) -> None:
+        if self._connection is None or self._connection.is_closed():
+            self._set_leader(False)
+            self._connection = await self.session_factory.connect_raw()
+            self._connection.add_termination_listener(self._on_terminated)
+
+        if self.is_leader:
+            # lock 은 커넥션에 묶여 있으므로 커넥션이 살아 있는지만 확인
+            await self._connection.fetchval("SELECT 1", timeout=self.retry_interval)
+        elif await self._connection.fetchval(
+            "SELECT pg_try_advisory_lock($1)", self.lock_key, timeout=self.retry_interval
+        ):
+            logger.info(f"became scheduler leader (lock {self.lock_key})")
+            self._set_leader(True)
+
+    def _on_terminated(self, connection) -> None:
+        if self.is_leader:
+            logger.warning("scheduler leader connection terminated")
+        self._set_leader(False)
+
+    async def _close(self) -> None:
+        self._set_leader(False)
+        if self._connection is not None:
+            connection, self._connection = self._connection, None
+            try:
+                await connection.close(timeout=self.retry_interval)
+            except Exception:
+                connection.terminate()
+
+    def _set_leader(self, is_leader: bool) -> None:
+        if self.is_leader == is_leader:
+            return
+        self.is_leader = is_leader
+        metrics.scheduler_leader.set(int(is_leader))
+        for listener in self.listeners:
+            try:
+                listener(is_leader)
+            except Exception:
+                logger.exception(f"leader listener failed ({listener!r})")
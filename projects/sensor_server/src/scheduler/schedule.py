@@ -0,0 +1,109 @@
+"""작업 실행 시간 계산 (interval / cron)
+
+모든 시간은 epoch 초(UTC) 이며, 실행 시간은 현재 시간이 아니라 epoch / 달력 기준으로 정렬되므로
+여러 replica 가 같은 시간을 계산합니다.
+"""
+
+import math
+from datetime import datetime, timedelta, timezone
+from typing import List, Protocol, Set
+
+
+class Schedule(Protocol):
+    def next_after(self, timestamp: float) -> float:
+        """timestamp 이후(초과)의 첫 실행 시간"""
+        ...
+
+
+class IntervalSchedule:
+    """interval 초마다 (epoch 기준 정렬)"""
+
+    def __init__(self, interval: float):
+        if interval <= 0:
+            raise ValueError(f"interval must be positive: {interval}")
+        self.interval = interval
+
+    def next_after(self, timestamp: float) -> float:
+        return (math.floor(timestamp / self.interval) + 1) * self.interval
+
+    def __repr__(self) -> str:
+        return f"IntervalSchedule({self.interval})"
+
+
+class CronSchedule:
+    """cron 표현식 (분 시 일 월 요일, UTC)
+
+    각 필드는 `*`, `5`, `1-5`, `*/15`, `0-30/10`, `1,15` 형식을 지원합니다. 요일은 0(또는 7)이 일요일입니다.
+    일과 요일이 모두 `*` 가 아니면 둘 중 하나만 맞아도 실행합니다. (표준 cron 과 같음)
+    """
+
+    # 검색할 최대 일 수 (2월 29일 같은 표현식도 찾을 수 있도록)
+    MAX_DAYS = 366 * 8
+
+    def __init__(self, expression: str):
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"cron expression must have 5 fields: {expression!r}")
+        self.expression = expression
+        self.minutes = parse_field(fields[0], 0, 59)
+        self.hours = sorted(parse_field(fields[1], 0, 23))
+        self.days = parse_field(fields[2], 1, 31)
+        self.months = parse_field(fields[3], 1, 12)
+        self.weekdays = {day % 7 for day in parse_field(fields[4], 0, 7)}
+        self.any_day = fields[2] == "*"
+        self.any_weekday = fields[4] == "*"
+        self._minutes = sorted(self.minutes)
+
+    def next_after(self, timestamp: float) -> float:
+        moment = datetime.fromtimestamp(timestamp, tz=timezone.utc).replace(
+            second=0, microsecond=0
+        ) + timedelta(minutes=1)
+        day = moment.replace(hour=0, minute=0)
+        for _ in range(self.MAX_DAYS):
+            if self._matches_day(day):
+                first = day == moment.replace(hour=0, minute=0)
+                for hour in self.hours:
+                    if first and hour < moment.hour:
+                        continue
+                    for minute in self._minutes:
+                        if first and hour == moment.hour and minute < moment.minute:
+                            continue
+                        return day.replace(hour=hour, minute=minute).timestamp()
+            day += timedelta(days=1)
+        raise ValueError(f"cron expression never matches: {self.expression!r}")
+
+    def _matches_day(self, day: datetime) -> bool:
+        if day.month not in self.months:
+            return False
+        in_days = day.day in self.days
+        # datetime.weekday(): 월요일 0 → cron: 일요일 0
+        in_weekdays = (day.weekday() + 1) % 7 in self.weekdays
+        if self.any_day or self.any_weekday:
+            return in_days and in_weekdays
+        return in_days or in_weekdays
+
+    def __repr__(self) -> str:
+        return f"CronSchedule({self.expression!r})"
+
+
+def parse_field(field: str, minimum: int, maximum: int) -> Set[int]:
+    """cron 필드 하나를 값 집합으로"""
+    values: List[int] = []
+    for part in field.split(","):
+        step = 1
+        if "/" in part:
+            part, step_text = part.split("/", 1)
+            step = int(step_text)
+            if step <= 0:
+                raise ValueError(f"invalid cron step: {field!r}")
+        if part == "*":
+            start, end = minimum, maximum
+        elif "-" in part:
+            start, end = (int(value) for value in part.split("-", 1))
+        else:
+            start = int(part)
+            end = maximum if step > 1 else start
+        if not minimum <= start <= end <= maximum:
+            raise ValueError(f"cron field out of range: {field!r}")
+        values.extend(range(start, end + 1, step))
+    return set(values)
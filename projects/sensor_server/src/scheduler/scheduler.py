@@ -0,0 +1,123 @@
+"""프로세스 안의 주기 작업 scheduler
+
+작업마다 실행 시간(schedule + jitter)까지 기다렸다가 실행 task 를 만듭니다.
+
+- leader_only 작업은 leader 인 프로세스에서만 실행하므로, replica / worker 가 여러 개여도 한 곳에서만 실행됩니다.
+  leader 를 잃으면 실행 중인 leader_only 작업을 취소합니다.
+- 작업별 max_concurrency 를 넘으면 이번 실행은 건너뛰고(skipped), 전체 동시 실행 수는 max_concurrent_jobs 로 제한합니다.
+- 늦어진 실행은 몰아서 실행하지 않고 다음 실행 시간부터 이어갑니다.
+
+작업별 실행 시간(scheduler_job_duration_seconds)과 지연(scheduler_job_lag_seconds, 예정 시간 → 실제 시작)을
+metric 으로 남깁니다.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional, Set
+
+from src import metrics
+from src.scheduler.domains import ScheduledJob
+from src.scheduler.leader import AdvisoryLockLeaderElection
+
+logger = logging.getLogger(__name__)
+
+
+class JobScheduler:
+    """주기 작업 scheduler"""
+
+    def __init__(
+        self,
+        leader_election: AdvisoryLockLeaderElection,
+        jobs: List[ScheduledJob],
+        max_concurrent_jobs: int = 4,
+        enabled: bool = True,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.leader_election = leader_election
+        self.jobs = [job for job in jobs if job.enabled]
+        self.enabled = enabled
+        self.clock = clock
+
+        self._semaphore = asyncio.Semaphore(max_concurrent_jobs)
+        self._loops: List[asyncio.Task] = []
+        self._running: Dict[str, Set[asyncio.Task]] = defaultdict(set)
+        leader_election.listeners.append(self._on_leader_changed)
+
+    async def start(self) -> None:
+        if not self.enabled:
+            return
+        if any(job.leader_only for job in self.jobs):
+            await self.leader_election.start()
+        self._loops = [asyncio.create_task(self._loop(job)) for job in self.jobs]
+        logger.info(f"scheduler started ({[job.name for job in self.jobs]})")
+
+    async def stop(self) -> None:
+        tasks = [*self._loops, *(task for tasks in self._running.values() for task in tasks)]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._loops = []
+        await self.leader_election.stop()
+
+    def running(self, name: str) -> int:
+        """실행 중인 작업 수"""
+        return len(self._running[name])
+
+    async def _loop(self, job: ScheduledJob) -> None:
+        next_at = job.schedule.next_after(self.clock())
+        while True:
+            planned_at = next_at + random.uniform(0, job.jitter)
+            await asyncio.sleep(max(planned_at - self.clock(), 0))
+            # 늦어졌으면 지나간 실행 시간은 건너뜀
+            next_at = job.schedule.next_after(max(self.clock(), next_at))
+            self.trigger(job, planned_at)
+
+    def trigger(self, job: ScheduledJob, planned_at: float) -> Optional[asyncio.Task]:
+        """작업 실행 task 생성 (leader 가 아니거나 동시 실행 수를 넘으면 None)"""
+        if job.leader_only and not self.leader_election.is_leader:
+            return None
+        running = self._running[job.name]
+        if len(running) >= job.max_concurrency:
+            logger.warning(f"skip job {job.name} ({len(running)} running)")
+            metrics.scheduler_job_runs.labels(job.name, "skipped").inc()
+            return None
+        task = asyncio.create_task(self._execute(job, planned_at))
+        running.add(task)
+        task.add_done_callback(running.discard)
+        return task
+
+    async def _execute(self, job: ScheduledJob, planned_at: float) -> None:
+        async with self._semaphore:
+            metrics.scheduler_job_lag_seconds.labels(job.name).observe(
+                max(self.clock() - planned_at, 0)
+            )
+            started_at = time.perf_counter()
+            status = "ok"
+            try:
+                await asyncio.wait_for(job.func(), timeout=job.timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"job {job.name} timed out ({job.timeout}s)")
+                status = "timeout"
+            except asyncio.CancelledError:
+                status = "cancelled"
+                raise
+            except Exception:
+                logger.exception(f"job {job.name} failed")
+                status = "error"
+            finally:
+                metrics.scheduler_job_duration_seconds.labels(job.name, status).observe(
+                    time.perf_counter() - started_at
+                )
+                metrics.scheduler_job_runs.labels(job.name, status).inc()
+
+    def _on_leader_changed(self, is_leader: bool) -> None:
+        if is_leader:
+            return
+        # 다른 프로세스가 leader 가 될 수 있으므로 실행 중인 leader_only 작업 취소
+        for job in self.jobs:
+            if job.leader_only:
+                for task in self._running[job.name]:
+                    task.cancel()
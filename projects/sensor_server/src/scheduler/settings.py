@@ -0,0 +1,12 @@
+from pydantic_settings import BaseSettings
+from pydantic import Field
+
+
+class SchedulerSettings(BaseSettings):
+    SCHEDULER_ENABLED: bool = Field(default=True)
+    # leader 선출에 사용하는 advisory lock key (같은 DB 를 쓰는 replica 끼리 같아야 함)
+    SCHEDULER_LOCK_KEY: int = Field(default=4802)
+    # leader 가 아닐 때 lock 재시도 / leader 일 때 커넥션 확인 주기 (초)
+    SCHEDULER_LEADER_RETRY_INTERVAL: float = Field(default=5.0)
+    # 프로세스 안에서 동시에 실행할 수 있는 작업 수
+    SCHEDULER_MAX_CONCURRENT_JOBS: int = Field(default=4)
@@ -0,0 +1,125 @@
+"""파생 항목 backfill
+
+    python -m src.sensor.backfill --start 2025-01-01 --end 2025-02-01 --chunk-hours 24 --concurrency 4
+
+파생 항목(src.sensor.derived)을 추가하거나 계산식을 바꾼 뒤, 저장된 history 의 값을 다시 계산합니다.
+
+- history 는 [start, end) 구간을 chunk 로 나눠 chunk 마다 하나의 트랜잭션으로 조회 → 계산 → 기본 키 UPDATE 하며,
+  동시에 concurrency 개의 chunk 를 처리합니다. chunk 는 서로 겹치지 않으므로 실패한 chunk 만 다시 실행하면 됩니다.
+- 최신 값 테이블은 수조당 한 행이므로 한 번에 다시 계산합니다.
+- columnar history 는 파생 항목을 읽을 때 계산하므로 backfill 할 것이 없습니다.
+
+수집 중에 실행해도 됩니다. (새로 들어오는 측정 값은 수집 경로에서 계산된 값으로 저장됨)
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Tuple
+
+from src.sensor.container import SensorContainer
+from src.sensor.derived import fill_derived_metrics
+from src.sensor.repository import (
+    WaterTankSensorRecordHistoryRepository,
+    WaterTankSensorRecordRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def split_range(
+    start: datetime, end: datetime, chunk: timedelta
+) -> List[Tuple[datetime, datetime]]:
+    """[start, end) 를 chunk 길이의 구간들로 나눔 (마지막 구간은 end 까지)"""
+    ranges = []
+    while start < end:
+        ranges.append((start, min(start + chunk, end)))
+        start += chunk
+    return ranges
+
+
+async def backfill_history(
+    history_repository: WaterTankSensorRecordHistoryRepository,
+    start: datetime,
+    end: datetime,
+    chunk: timedelta,
+    concurrency: int = 4,
+) -> Tuple[int, List[Tuple[datetime, datetime]]]:
+    """history 의 파생 항목을 chunk 단위로 동시에 다시 계산
+
+    Returns:
+        (갱신한 행 수, 실패한 chunk 목록)
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(chunk_start: datetime, chunk_end: datetime) -> int:
+        async with semaphore:
+            rows = await history_repository.recompute_derived(chunk_start, chunk_end)
+            logger.info(f"backfill [{chunk_start}, {chunk_end}): {rows} rows")
+            return rows
+
+    ranges = split_range(start, end, chunk)
+    results = await asyncio.gather(
+        *(run(chunk_start, chunk_end) for chunk_start, chunk_end in ranges),
+        return_exceptions=True,
+    )
+
+    failed = []
+    for (chunk_start, chunk_end), result in zip(ranges, results):
+        if isinstance(result, BaseException):
+            logger.error(f"backfill [{chunk_start}, {chunk_end}) failed ({result!r})")
+            failed.append((chunk_start, chunk_end))
+    rows = sum(result for result in results if not isinstance(result, BaseException))
+    return rows, failed
+
+
+async def backfill_latest(repository: WaterTankSensorRecordRepository) -> int:
+    """최신 값 테이블의 파생 항목을 다시 계산 (갱신한 행 수)"""
+    records = await repository.find_all()
+    fill_derived_metrics(records)
+    await repository.upsert_many(records)
+    return len(records)
+
+
+def parse_datetime(value: str) -> datetime:
+    """ISO 8601 시간 (timezone 이 없으면 UTC)"""
+    parsed = datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+async def run(args: argparse.Namespace) -> int:
+    container = SensorContainer()
+    latest = await backfill_latest(container.repository())
+    logger.info(f"backfill latest: {latest} rows")
+
+    if container.settings().SENSOR_HISTORY_BACKEND != "timescale":
+        logger.info("history backend computes derived metrics on read, skip history")
+        return 0
+
+    rows, failed = await backfill_history(
+        container.history_repository(),
+        args.start,
+        args.end,
+        timedelta(hours=args.chunk_hours),
+        args.concurrency,
+    )
+    logger.info(f"backfill history: {rows} rows, {len(failed)} failed chunks")
+    return 1 if failed else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="파생 항목 backfill")
+    parser.add_argument("--start", type=parse_datetime, required=True)
+    parser.add_argument("--end", type=parse_datetime, required=True)
+    parser.add_argument("--chunk-hours", type=float, default=24.0)
+    parser.add_argument("--concurrency", type=int, default=4)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,547 @@
+import asyncio
+import logging
+import mmap
+import os
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src import metrics
+from src.sensor.domains import (
+    EPOCH,
+    METRICS,
+    WaterTankSensorRecord,
+    WaterTankSensorRecordBucket,
+    WaterTankSensorRecordColumns,
+    WaterTankSensorRecordContent,
+)
+from src.sensor.derived import compute_derived_metrics, to_nullable
+
+logger = logging.getLogger(__name__)
+
+# 컬럼 이름 → 저장 타입 (recorded_at 은 epoch 마이크로초)
+COLUMNS = {
+    "recorded_at": np.dtype("<i8"),
+    "temperature": np.dtype("<f8"),
+    "ph": np.dtype("<f8"),
+    "dissolved_oxygen": np.dtype("<f8"),
+    "salinity": np.dtype("<f8"),
+}
+
+# sparse index 간격 (행 수)
+GRANULE_ROWS = 1024
+
+
+class ColumnarSegment:
+    """수조 하나의 append-only segment
+
+    컬럼마다 하나의 파일(`{seq}.{column}`)에 고정 폭 값을 이어 붙이며, 한 segment 안의 행은 시간 순으로 정렬되어 있습니다.
+    조회는 파일을 memory-map 하여 복사 없이 읽고, GRANULE_ROWS 행마다의 시간을 모은 sparse index 와
+    segment 의 최소/최대 시간으로 읽을 범위를 좁힙니다.
+    """
+
+    def __init__(self, prefix: Path):
+        self.prefix = prefix
+        self._files = None
+        self._maps: Dict[str, Tuple[mmap.mmap, np.ndarray]] = {}
+        self._mapped_rows = 0
+
+        self._recover()
+        self.row_count = self._committed_rows()
+        self._reset()
+
+    @property
+    def sequence(self) -> int:
+        return int(self.prefix.name)
+
+    def overlaps(self, start: int, end: int) -> bool:
+        """[start, end) 구간과 겹치는지 여부"""
+        return (
+            self.row_count > 0
+            and self.min_recorded_at < end
+            and self.max_recorded_at >= start
+        )
+
+    def append(self, columns: Dict[str, np.ndarray]) -> None:
+        """시간 순으로 정렬된 행을 append (모두 max_recorded_at 이후여야 함)"""
+        if self._files is None:
+            self._files = {
+                name: open(self._path(name), "ab") for name in COLUMNS
+            }
+        for name, dtype in COLUMNS.items():
+            self._files[name].write(columns[name].astype(dtype, copy=False).tobytes())
+            self._files[name].flush()
+
+        recorded_at = columns["recorded_at"]
+        first_granule = -(-self.row_count // GRANULE_ROWS) * GRANULE_ROWS
+        self.sparse_index = np.concatenate(
+            [self.sparse_index, recorded_at[first_granule - self.row_count :: GRANULE_ROWS]]
+        )
+        if self.row_count == 0:
+            self.min_recorded_at = int(recorded_at[0])
+        self.max_recorded_at = int(recorded_at[-1])
+        self.row_count += len(recorded_at)
+
+    def merge(self, columns: Dict[str, np.ndarray]) -> None:
+        """시간 순으로 정렬된 행을 기존 행과 합쳐 segment 를 다시 씀 (늦게 도착한 값)
+
+        합친 컬럼을 임시 파일에 모두 쓴 뒤 merge 표시 파일을 만들고 교체합니다.
+        교체 도중 중단되면 다음에 열 때 표시 파일이 있으면 교체를 마저 하고, 없으면 임시 파일을 버립니다.
+        """
+        recorded_at = np.concatenate([self.column("recorded_at"), columns["recorded_at"]])
+        order = np.argsort(recorded_at, kind="stable")
+        merged = {
+            name: np.concatenate(
+                [self.column(name), columns[name].astype(dtype, copy=False)]
+            )[order]
+            for name, dtype in COLUMNS.items()
+        }
+        self.close()
+
+        for name in COLUMNS:
+            with open(self._temporary_path(name), "wb") as file:
+                file.write(merged[name].tobytes())
+                file.flush()
+                os.fsync(file.fileno())
+        self._path("merge").touch()
+        for name in COLUMNS:
+            self._temporary_path(name).replace(self._path(name))
+        self._path("merge").unlink()
+
+        self.row_count = len(order)
+        self._reset()
+
+    def column(self, name: str) -> np.ndarray:
+        """컬럼의 memory-map view"""
+        if self.row_count == 0:
+            return np.empty(0, dtype=COLUMNS[name])
+        if self._mapped_rows != self.row_count:
+            self._maps = {}
+            self._mapped_rows = self.row_count
+        if name not in self._maps:
+            with open(self._path(name), "rb") as file:
+                mapped = mmap.mmap(
+                    file.fileno(),
+                    self.row_count * COLUMNS[name].itemsize,
+                    access=mmap.ACCESS_READ,
+                )
+            self._maps[name] = (
+                mapped,
+                np.frombuffer(mapped, dtype=COLUMNS[name], count=self.row_count),
+            )
+        return self._maps[name][1]
+
+    def lower_bound(self, recorded_at: int) -> int:
+        """recorded_at 이상인 첫 행의 위치 (sparse index 로 granule 하나만 탐색)"""
+        granule = max(
+            int(np.searchsorted(self.sparse_index, recorded_at, side="right")) - 1, 0
+        )
+        begin = granule * GRANULE_ROWS
+        end = min(begin + GRANULE_ROWS, self.row_count)
+        values = self.column("recorded_at")[begin:end]
+        return begin + int(np.searchsorted(values, recorded_at, side="left"))
+
+    def slice(self, start: int, end: int) -> Dict[str, np.ndarray]:
+        """[start, end) 구간의 컬럼 값"""
+        lo, hi = self.lower_bound(start), self.lower_bound(end)
+        return {name: self.column(name)[lo:hi] for name in COLUMNS}
+
+    def close(self) -> None:
+        if self._files is not None:
+            for file in self._files.values():
+                file.close()
+            self._files = None
+        self._maps = {}
+
+    def _path(self, column: str) -> Path:
+        return self.prefix.with_suffix(f".{column}")
+
+    def _temporary_path(self, column: str) -> Path:
+        return self.prefix.with_suffix(f".{column}.tmp")
+
+    def _recover(self) -> None:
+        """중단된 merge 정리 (표시 파일이 있으면 교체를 마저 하고, 없으면 임시 파일 삭제)"""
+        marker = self._path("merge")
+        for name in COLUMNS:
+            temporary = self._temporary_path(name)
+            if not temporary.exists():
+                continue
+            if marker.exists():
+                temporary.replace(self._path(name))
+            else:
+                temporary.unlink()
+        marker.unlink(missing_ok=True)
+
+    def _committed_rows(self) -> int:
+        """모든 컬럼 파일에 끝까지 기록된 행 수 (append 도중 중단되어 더 긴 파일은 잘라냄)"""
+        sizes = {
+            name: self._path(name).stat().st_size // dtype.itemsize
+            if self._path(name).exists()
+            else 0
+            for name, dtype in COLUMNS.items()
+        }
+        row_count = min(sizes.values())
+        for name, size in sizes.items():
+            if size > row_count:
+                logger.warning(
+                    f"truncate {self._path(name)}: {size} rows -> {row_count} rows"
+                )
+                os.truncate(self._path(name), row_count * COLUMNS[name].itemsize)
+        return row_count
+
+    def _reset(self) -> None:
+        """row_count 기준으로 sparse index 와 최소 / 최대 시간을 다시 계산"""
+        self._maps = {}
+        recorded_at = self.column("recorded_at")
+        self.sparse_index = recorded_at[::GRANULE_ROWS].copy()
+        self.min_recorded_at = int(recorded_at[0]) if self.row_count > 0 else None
+        self.max_recorded_at = int(recorded_at[-1]) if self.row_count > 0 else None
+
+
+class ColumnarSensorRecordHistoryRepository:
+    """로컬 디스크 기반 수조 센서 측정 history 저장소 (edge 배포용)
+
+    WaterTankSensorRecordHistoryRepository 와 같은 인터페이스(insert_many, find_range, aggregate, ...)를 제공하여,
+    TimescaleDB 를 운영할 수 없는 소규모 사이트에서 SensorContainer 설정만으로 교체해 사용할 수 있습니다.
+
+    디렉토리 구조: `{directory}/{tank_id}/{seq}.{column}`
+      - 수조별로 append-only 컬럼 segment 를 유지하며, segment_rows 를 넘으면 새 segment 를 시작합니다.
+      - 이전 측정 값이 뒤늦게 들어오면(spool 재처리 등) merge_rows 행 이하는 시간 구간이 맞는 기존 segment 에
+        합쳐 다시 쓰고, 그보다 많으면 새 segment 에 기록합니다. (작은 늦은 값마다 파일이 늘어나지 않도록)
+      - 이미 저장된 (tank_id, recorded_at) 은 시간 구간이 겹치는 모든 segment 에서 찾아 무시합니다.
+      - 쓰기 도중 중단되어 컬럼 파일 길이가 다르면, 다시 열 때 가장 짧은 파일 기준으로 잘라냅니다.
+
+    파일 I/O 는 별도 스레드에서 수행하며, 쓰기와 조회는 lock 으로 직렬화됩니다.
+    """
+
+    def __init__(self, directory: str, segment_rows: int = 65536, merge_rows: int = 4096):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.segment_rows = segment_rows
+        self.merge_rows = merge_rows
+        self._lock = asyncio.Lock()
+
+        self._segments: Dict[int, List[ColumnarSegment]] = {}
+        for tank_directory in self.directory.iterdir():
+            if not tank_directory.name.isdigit():
+                continue
+            prefixes = {
+                tank_directory / path.name.split(".")[0] for path in tank_directory.iterdir()
+            }
+            self._segments[int(tank_directory.name)] = sorted(
+                (ColumnarSegment(prefix) for prefix in prefixes),
+                key=lambda segment: segment.sequence,
+            )
+        logger.info(
+            f"initialize ColumnarSensorRecordHistoryRepository({directory}, "
+            f"tanks={len(self._segments)})"
+        )
+
+    async def create(self, domain: WaterTankSensorRecord) -> None:
+        await self.insert_many([domain])
+
+    async def insert_many(
+        self, records: List[WaterTankSensorRecord]
+    ) -> List[WaterTankSensorRecord]:
+        """측정 history 일괄 저장 후 실제로 저장된 측정 값 반환 (이미 저장된 (tank_id, recorded_at) 은 무시)"""
+        if len(records) == 0:
+            return []
+        async with self._lock:
+            with metrics.ingest_stage("history_insert"):
+                return await asyncio.to_thread(self._insert_many, records)
+
+    async def find_all(self) -> List[WaterTankSensorRecord]:
+        async with self._lock:
+            return await asyncio.to_thread(
+                lambda: [
+                    record
+                    for tank_id in list(self._segments)
+                    for record in self._scan_records(tank_id, None, None)
+                ]
+            )
+
+    async def find_by_tank(self, tank_id: int) -> List[WaterTankSensorRecord]:
+        async with self._lock:
+            return await asyncio.to_thread(self._scan_records, tank_id, None, None)
+
+    async def find_range(
+        self, tank_id: int, start: datetime, end: datetime
+    ) -> List[WaterTankSensorRecord]:
+        """수조의 [start, end) 구간 측정 history 를 시간 순으로 조회"""
+        async with self._lock:
+            return await asyncio.to_thread(
+                self._scan_records, tank_id, to_micros(start), to_micros(end)
+            )
+
+    async def aggregate(
+        self, tank_id: int, start: datetime, end: datetime, bucket: timedelta
+    ) -> List[WaterTankSensorRecordBucket]:
+        """수조의 [start, end) 구간 측정 history 를 bucket 단위 평균으로 조회
+
+        bucket 경계는 epoch 기준으로 정렬됩니다.
+        """
+        async with self._lock:
+            return await asyncio.to_thread(
+                self._aggregate, tank_id, to_micros(start), to_micros(end), bucket
+            )
+
+    async def aggregate_all(
+        self,
+        start: datetime,
+        end: datetime,
+        bucket: timedelta,
+        tank_ids: Optional[List[int]] = None,
+    ) -> WaterTankSensorRecordColumns:
+        """모든 수조(tank_ids 가 있으면 해당 수조들)의 [start, end) 구간 측정 history 를 bucket 단위 평균으로 조회
+
+        행마다 (수조, bucket) 하나이며 recorded_at 은 bucket 시작 시간(epoch 초)입니다.
+        """
+        async with self._lock:
+            return await asyncio.to_thread(
+                self._aggregate_all, to_micros(start), to_micros(end), bucket, tank_ids
+            )
+
+    async def scan_all(
+        self, start: datetime, end: datetime, tank_ids: Optional[List[int]] = None
+    ) -> WaterTankSensorRecordColumns:
+        """모든 수조(tank_ids 가 있으면 해당 수조들)의 [start, end) 구간 측정 history 를 (수조, 측정 시간) 순으로 조회"""
+        async with self._lock:
+            return await asyncio.to_thread(
+                self._scan_all, to_micros(start), to_micros(end), tank_ids
+            )
+
+    def warmup_statements(self) -> list:
+        return []
+
+    def close(self) -> None:
+        for segments in self._segments.values():
+            for segment in segments:
+                segment.close()
+
+    def _insert_many(
+        self, records: List[WaterTankSensorRecord]
+    ) -> List[WaterTankSensorRecord]:
+        inserted = []
+        by_tank: Dict[int, List[WaterTankSensorRecord]] = {}
+        for record in records:
+            by_tank.setdefault(record.tank_id, []).append(record)
+
+        for tank_id, tank_records in by_tank.items():
+            columns = {
+                "recorded_at": np.array(
+                    [to_micros(r.content.recorded_at) for r in tank_records], dtype="<i8"
+                ),
+                **{
+                    name: np.array(
+                        [getattr(r.content, name) for r in tank_records], dtype="<f8"
+                    )
+                    for name in METRICS
+                },
+            }
+            positions = self._append(tank_id, columns)
+            inserted.extend(tank_records[i] for i in positions.tolist())
+        return inserted
+
+    def _append(self, tank_id: int, columns: Dict[str, np.ndarray]) -> np.ndarray:
+        """컬럼 값을 수조의 segment 에 추가하고, 실제로 저장된 행의 (입력 기준) 위치 반환"""
+        # 시간 순 정렬 + batch 내 중복 제거
+        recorded_at, index = np.unique(columns["recorded_at"], return_index=True)
+        columns = {name: values[index] for name, values in columns.items()}
+
+        segments = self._segments.setdefault(tank_id, [])
+        last = max(
+            (segment.max_recorded_at for segment in segments if segment.row_count > 0),
+            default=None,
+        )
+
+        if last is not None and recorded_at[0] <= last:
+            # 이미 저장된 값 제외 (시간 구간이 겹치는 모든 segment)
+            stored = np.zeros(len(recorded_at), dtype=bool)
+            for segment in segments:
+                if segment.overlaps(int(recorded_at[0]), int(recorded_at[-1]) + 1):
+                    values = segment.column("recorded_at")
+                    position = np.searchsorted(values, recorded_at).clip(
+                        max=len(values) - 1
+                    )
+                    stored |= values[position] == recorded_at
+            late = ~stored & (recorded_at <= last)
+            if late.any():
+                self._append_late(
+                    tank_id, {name: values[late] for name, values in columns.items()}
+                )
+            fresh = recorded_at > last
+            columns = {name: values[fresh] for name, values in columns.items()}
+            if not fresh.any():
+                return index[late]
+            index = index[late | fresh]
+
+        active = segments[-1] if len(segments) > 0 else None
+        if active is None or active.row_count >= self.segment_rows:
+            active = self._new_segment(tank_id)
+        active.append(columns)
+        return index
+
+    def _append_late(self, tank_id: int, columns: Dict[str, np.ndarray]) -> None:
+        """늦게 도착한 값: merge_rows 행 이하면 시간 구간이 맞는 기존 segment 에 합치고, 많으면 새 segment 로"""
+        if len(columns["recorded_at"]) > self.merge_rows:
+            self._new_segment(tank_id).append(columns)
+            return
+
+        # 첫 값 이전에 시작하는 segment 중 가장 늦게 시작하는 것 (없으면 가장 먼저 시작하는 것)
+        first = int(columns["recorded_at"][0])
+        segments = [s for s in self._segments[tank_id] if s.row_count > 0]
+        preceding = [s for s in segments if s.min_recorded_at <= first]
+        target = (
+            max(preceding, key=lambda s: s.min_recorded_at)
+            if preceding
+            else min(segments, key=lambda s: s.min_recorded_at)
+        )
+        target.merge(columns)
+
+    def _new_segment(self, tank_id: int) -> ColumnarSegment:
+        segments = self._segments.setdefault(tank_id, [])
+        sequence = segments[-1].sequence + 1 if len(segments) > 0 else 0
+        tank_directory = self.directory / str(tank_id)
+        tank_directory.mkdir(exist_ok=True)
+        segment = ColumnarSegment(tank_directory / f"{sequence:08d}")
+        segments.append(segment)
+        return segment
+
+    def _scan(
+        self, tank_id: int, start: Optional[int], end: Optional[int]
+    ) -> Dict[str, np.ndarray]:
+        """[start, end) 구간의 컬럼 값을 시간 순으로 모음"""
+        start = np.iinfo(np.int64).min if start is None else start
+        end = np.iinfo(np.int64).max if end is None else end
+        slices = [
+            segment.slice(start, end)
+            for segment in self._segments.get(tank_id, [])
+            if segment.overlaps(start, end)
+        ]
+        if len(slices) == 0:
+            return {name: np.empty(0, dtype=dtype) for name, dtype in COLUMNS.items()}
+
+        columns = {
+            name: np.concatenate([columns[name] for columns in slices])
+            for name in COLUMNS
+        }
+        if len(slices) > 1:
+            order = np.argsort(columns["recorded_at"], kind="stable")
+            columns = {name: values[order] for name, values in columns.items()}
+        return columns
+
+    def _scan_records(
+        self, tank_id: int, start: Optional[int], end: Optional[int]
+    ) -> List[WaterTankSensorRecord]:
+        columns = self._scan(tank_id, start, end)
+        # 파생 항목은 segment 에 저장하지 않고 읽을 때 계산 (기존 segment 형식 유지)
+        derived = compute_derived_metrics(columns)
+        return [
+            WaterTankSensorRecord(
+                tank_id=tank_id,
+                content=WaterTankSensorRecordContent(
+                    temperature=temperature,
+                    ph=ph,
+                    dissolved_oxygen=dissolved_oxygen,
+                    salinity=salinity,
+                    recorded_at=from_micros(recorded_at),
+                    oxygen_saturation=oxygen_saturation,
+                ),
+            )
+            for recorded_at, temperature, ph, dissolved_oxygen, salinity, oxygen_saturation in zip(
+                *(columns[name].tolist() for name in COLUMNS),
+                to_nullable(derived["oxygen_saturation"]),
+            )
+        ]
+
+    def _bucket_means(
+        self, tank_id: int, start: int, end: int, bucket: timedelta
+    ) -> Tuple[np.ndarray, np.ndarray, Dict[str, np.ndarray]]:
+        """수조의 [start, end) 구간 bucket 시작 시간(마이크로초), 측정 횟수, 항목별 평균"""
+        columns = self._scan(tank_id, start, end)
+        width = bucket // timedelta(microseconds=1)
+        buckets, inverse, counts = np.unique(
+            columns["recorded_at"] // width * width,
+            return_inverse=True,
+            return_counts=True,
+        )
+        means = {
+            name: np.bincount(inverse, weights=columns[name], minlength=len(buckets))
+            / counts
+            for name in METRICS
+        }
+        return buckets, counts, means
+
+    def _aggregate(
+        self, tank_id: int, start: int, end: int, bucket: timedelta
+    ) -> List[WaterTankSensorRecordBucket]:
+        buckets, counts, means = self._bucket_means(tank_id, start, end, bucket)
+        return [
+            WaterTankSensorRecordBucket(
+                tank_id=tank_id,
+                bucket_at=from_micros(bucket_at),
+                count=count,
+                temperature=temperature,
+                ph=ph,
+                dissolved_oxygen=dissolved_oxygen,
+                salinity=salinity,
+            )
+            for bucket_at, count, temperature, ph, dissolved_oxygen, salinity in zip(
+                buckets.tolist(),
+                counts.tolist(),
+                *(means[name].tolist() for name in METRICS),
+            )
+        ]
+
+    def _aggregate_all(
+        self,
+        start: int,
+        end: int,
+        bucket: timedelta,
+        tank_ids: Optional[List[int]],
+    ) -> WaterTankSensorRecordColumns:
+        # 수조별로 파일이 나뉘어 있으므로 수조 단위로 집계해서 합침
+        rows = [np.empty(0, dtype=np.int64)]
+        bucket_at = [np.empty(0, dtype=np.int64)]
+        values = {name: [np.empty(0)] for name in METRICS}
+        for tank_id in sorted(self._segments if tank_ids is None else set(tank_ids)):
+            buckets, _, means = self._bucket_means(tank_id, start, end, bucket)
+            rows.append(np.full(len(buckets), tank_id, dtype=np.int64))
+            bucket_at.append(buckets // 1_000_000)
+            for name in METRICS:
+                values[name].append(means[name])
+        return WaterTankSensorRecordColumns(
+            tank_id=np.concatenate(rows),
+            recorded_at=np.concatenate(bucket_at),
+            **{name: np.concatenate(values[name]) for name in METRICS},
+        )
+
+    def _scan_all(
+        self, start: int, end: int, tank_ids: Optional[List[int]]
+    ) -> WaterTankSensorRecordColumns:
+        rows = [np.empty(0, dtype=np.int64)]
+        recorded_at = [np.empty(0, dtype=np.int64)]
+        values = {name: [np.empty(0)] for name in METRICS}
+        for tank_id in sorted(self._segments if tank_ids is None else set(tank_ids)):
+            columns = self._scan(tank_id, start, end)
+            rows.append(np.full(len(columns["recorded_at"]), tank_id, dtype=np.int64))
+            recorded_at.append(columns["recorded_at"] // 1_000_000)
+            for name in METRICS:
+                values[name].append(columns[name])
+        return WaterTankSensorRecordColumns(
+            tank_id=np.concatenate(rows),
+            recorded_at=np.concatenate(recorded_at),
+            **{name: np.concatenate(values[name]) for name in METRICS},
+        )
+
+
+def to_micros(value: datetime) -> int:
+    """datetime → epoch 마이크로초"""
+    return (value - EPOCH) // timedelta(microseconds=1)
+
+
+def from_micros(value: int) -> datetime:
+    """epoch 마이크로초 → datetime (UTC)"""
+    return EPOCH + timedelta(microseconds=value)
@@ -1,12 +1,17 @@
+from src.analytics.container import AnalyticsContainer
 from src.database.container import DatabaseContainer
 from dependency_injector import containers, providers
 
 from src.facility.container import FacilityContainer
+from src.sensor.columnar import ColumnarSensorRecordHistoryRepository
+from src.sensor.line_protocol import SensorLineProtocolListener
 from src.sensor.repository import (
     WaterTankSensorRecordHistoryRepository,
     WaterTankSensorRecordRepository,
 )
 from src.sensor.service import SensorRecordService
+from src.sensor.settings import SensorSettings
+from src.sensor.spool import SensorRecordSpoolReplayer, create_spool
 
 
 class SensorContainer(containers.DeclarativeContainer):
@@ -14,19 +19,61 @@ class SensorContainer(containers.DeclarativeContainer):
 
     database: DatabaseContainer = providers.Container(DatabaseContainer)
     facility: FacilityContainer = providers.Container(FacilityContainer)
+    analytics: AnalyticsContainer = providers.Container(AnalyticsContainer)
+
+    settings = providers.Singleton(SensorSettings)
 
     repository = providers.Singleton(
         WaterTankSensorRecordRepository,
         session_factory=database.session_factory,
     )
-    history_repository = providers.Singleton(
-        WaterTankSensorRecordHistoryRepository,
-        session_factory=database.session_factory,
+    history_repository = providers.Selector(
+        settings.provided.SENSOR_HISTORY_BACKEND,
+        timescale=providers.Singleton(
+            WaterTankSensorRecordHistoryRepository,
+            session_factory=database.session_factory,
+        ),
+        columnar=providers.Singleton(
+            ColumnarSensorRecordHistoryRepository,
+            directory=settings.provided.SENSOR_COLUMNAR_DIR,
+            segment_rows=settings.provided.SENSOR_COLUMNAR_SEGMENT_ROWS,
+            merge_rows=settings.provided.SENSOR_COLUMNAR_MERGE_ROWS,
+        ),
     )
 
+    spool = providers.Singleton(create_spool, settings=settings)
+
+    # 수집된 측정 값 묶음을 전달받는 listener (ApplicationContainer 에서 지정)
+    listeners = providers.List()
+    # history 에 새로 저장된 측정 값만 전달받는 listener (재시도 / 중복 값 제외)
+    history_listeners = providers.List()
+
     service = providers.Singleton(
         SensorRecordService,
         repository=repository,
         history_repository=history_repository,
         facility_service=facility.service,
+        spool=spool,
+        spool_latency_budget=settings.provided.SENSOR_SPOOL_LATENCY_BUDGET,
+        listeners=listeners,
+        history_listeners=history_listeners,
+        grid_max_cells=settings.provided.SENSOR_GRID_MAX_CELLS,
+        analytics=analytics.executor,
+    )
+
+    spool_replayer = providers.Singleton(
+        SensorRecordSpoolReplayer,
+        spool=spool,
+        writer=service.provided.write_records,
+        interval=settings.provided.SENSOR_SPOOL_REPLAY_INTERVAL,
+        batch_size=settings.provided.SENSOR_SPOOL_REPLAY_BATCH_SIZE,
+    )
+
+    line_protocol_listener = providers.Singleton(
+        SensorLineProtocolListener,
+        service=service,
+        host=settings.provided.SENSOR_LINE_PROTOCOL_HOST,
+        tcp_port=settings.provided.SENSOR_LINE_PROTOCOL_TCP_PORT,
+        udp_port=settings.provided.SENSOR_LINE_PROTOCOL_UDP_PORT,
+        udp_queue_size=settings.provided.SENSOR_LINE_PROTOCOL_UDP_QUEUE_SIZE,
     )
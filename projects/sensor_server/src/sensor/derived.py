@@ -0,0 +1,102 @@
+"""파생 측정 항목 (수집 시 계산)
+
+측정 항목으로 계산되는 값(예: 산소 포화도)을 조회할 때마다 SQL 로 계산하지 않도록, 수집 경로에서 묶음 단위로
+한 번에(numpy 배열 연산) 계산해 최신 값 / history 행에 함께 저장합니다.
+
+파생 항목을 추가하려면 DERIVED_METRICS 에 등록하고, 같은 이름의 컬럼을 엔티티(최신 값 / history)와
+init.sql 에 추가한 뒤 기존 history 는 backfill(python -m src.sensor.backfill)로 채웁니다.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+from src.sensor.domains import METRICS, WaterTankSensorRecord
+
+
+def oxygen_saturation(
+    temperature: np.ndarray, salinity: np.ndarray, dissolved_oxygen: np.ndarray
+) -> np.ndarray:
+    """산소 포화도 (%)
+
+    1 기압에서의 용존산소 포화 농도(Benson & Krause, APHA 4500-O 의 염분 보정식)에 대한 측정 값의 비율입니다.
+    온도는 °C, 염분은 ‰(psu), 용존산소는 mg/L 기준입니다.
+    """
+    kelvin = temperature + 273.15
+    log_solubility = (
+        -139.34411
+        + 1.575701e5 / kelvin
+        - 6.642308e7 / kelvin**2
+        + 1.243800e10 / kelvin**3
+        - 8.621949e11 / kelvin**4
+        - salinity * (1.7674e-2 - 10.754 / kelvin + 2140.7 / kelvin**2)
+    )
+    return 100.0 * dissolved_oxygen / np.exp(log_solubility)
+
+
+@dataclass(frozen=True)
+class DerivedMetric:
+    """측정 항목으로 계산되는 파생 항목"""
+
+    name: str  # 저장 컬럼 이름
+    inputs: Tuple[str, ...]  # formula 에 순서대로 넘길 측정 항목 (METRICS)
+    formula: Callable[..., np.ndarray]  # 측정 항목 배열 → 파생 항목 배열
+
+
+DERIVED_METRICS = (
+    DerivedMetric(
+        name="oxygen_saturation",
+        inputs=("temperature", "salinity", "dissolved_oxygen"),
+        formula=oxygen_saturation,
+    ),
+)
+
+# 파생 항목 이름 (WaterTankSensorRecordContent 의 필드 이름)
+DERIVED_METRIC_NAMES = tuple(metric.name for metric in DERIVED_METRICS)
+
+# 파생 항목 계산에 필요한 측정 항목
+DERIVED_METRIC_INPUTS = tuple(
+    name
+    for name in METRICS
+    if any(name in metric.inputs for metric in DERIVED_METRICS)
+)
+
+
+def compute_derived_metrics(values: Mapping[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """측정 항목 배열로 등록된 파생 항목을 모두 계산 (입력이 NaN 인 행은 NaN)"""
+    with np.errstate(all="ignore"):
+        return {
+            metric.name: metric.formula(
+                *(np.asarray(values[name], dtype=np.float64) for name in metric.inputs)
+            )
+            for metric in DERIVED_METRICS
+        }
+
+
+def fill_derived_metrics(records: List[WaterTankSensorRecord]) -> None:
+    """측정 값들의 파생 항목을 한 번에 계산해 채움 (계산할 수 없는 값은 None)"""
+    if len(records) == 0:
+        return
+    derived = compute_derived_metrics(
+        {
+            name: np.fromiter(
+                (getattr(record.content, name) for record in records),
+                dtype=np.float64,
+                count=len(records),
+            )
+            for name in DERIVED_METRIC_INPUTS
+        }
+    )
+    for name, values in derived.items():
+        for record, value in zip(records, to_nullable(values)):
+            setattr(record.content, name, value)
+
+
+def to_nullable(values: np.ndarray) -> List[Optional[float]]:
+    """저장용 값 리스트 (NaN / inf 는 None)"""
+    return [
+        value if math.isfinite(value) else None
+        for value in values.tolist()
+    ]
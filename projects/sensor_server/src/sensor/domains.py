@@ -1,5 +1,13 @@
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+
+import numpy as np
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# 측정 항목 (WaterTankSensorRecordContent 의 필드 이름)
+METRICS = ("temperature", "ph", "dissolved_oxygen", "salinity")
 
 
 @dataclass
@@ -12,6 +20,9 @@ class WaterTankSensorRecordContent:
     salinity: float  # 염분
     recorded_at: datetime
 
+    # 파생 항목 (src.sensor.derived, 저장 시 계산)
+    oxygen_saturation: Optional[float] = None  # 산소 포화도 (%)
+
 
 @dataclass
 class WaterTankSensorRecord:
@@ -27,3 +38,163 @@ class WaterTankSensorRecord:
             tank_id=tank_id,
             content=content,
         )
+
+
+@dataclass
+class WaterTankSensorRecordBucket:
+    """시간 구간별 측정 값 평균"""
+
+    tank_id: int  # 수조 id
+    bucket_at: datetime  # 구간 시작 시간
+    count: int  # 구간 내 측정 횟수
+
+    temperature: float  # 온도 평균
+    ph: float  # 산성도 평균
+    dissolved_oxygen: float  # 용존산소 평균
+    salinity: float  # 염분 평균
+
+
+@dataclass
+class WaterTankSensorRecordBatch:
+    """여러 수조의 측정 값 묶음 (컬럼 단위 numpy 배열)
+
+    각 행의 수조는 tank_codes 의 인덱스(code_index)로 표현합니다.
+    """
+
+    tank_codes: List[str]  # 수조 코드 사전
+    code_index: np.ndarray  # 행별 tank_codes 인덱스
+    recorded_at: np.ndarray  # 행별 측정 시간 (epoch 초, 소수점 이하 포함 가능)
+    temperature: np.ndarray
+    ph: np.ndarray
+    dissolved_oxygen: np.ndarray
+    salinity: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.code_index)
+
+    def to_records(self, tank_ids: List[int]) -> List[WaterTankSensorRecord]:
+        """tank_codes 와 같은 순서의 수조 id 로 측정 값 리스트 생성"""
+        tank_id_by_row = np.asarray(tank_ids, dtype=np.int64)[self.code_index]
+        return [
+            WaterTankSensorRecord(
+                tank_id=tank_id,
+                content=WaterTankSensorRecordContent(
+                    temperature=temperature,
+                    ph=ph,
+                    dissolved_oxygen=dissolved_oxygen,
+                    salinity=salinity,
+                    recorded_at=EPOCH + timedelta(seconds=recorded_at),
+                ),
+            )
+            for tank_id, recorded_at, temperature, ph, dissolved_oxygen, salinity in zip(
+                tank_id_by_row.tolist(),
+                self.recorded_at.tolist(),
+                self.temperature.tolist(),
+                self.ph.tolist(),
+                self.dissolved_oxygen.tolist(),
+                self.salinity.tolist(),
+            )
+        ]
+
+    def select_codes(self, keep: np.ndarray) -> "WaterTankSensorRecordBatch":
+        """keep(tank_codes 와 같은 순서의 bool 배열)이 True 인 수조 코드의 행만 남긴 묶음"""
+        keep = np.asarray(keep, dtype=bool)
+        rows = keep[self.code_index]
+        code_index = np.cumsum(keep) - 1
+        return WaterTankSensorRecordBatch(
+            tank_codes=[code for code, kept in zip(self.tank_codes, keep.tolist()) if kept],
+            code_index=code_index[self.code_index[rows]],
+            recorded_at=self.recorded_at[rows],
+            temperature=self.temperature[rows],
+            ph=self.ph[rows],
+            dissolved_oxygen=self.dissolved_oxygen[rows],
+            salinity=self.salinity[rows],
+        )
+
+    def to_columns(self, tank_ids: List[int]) -> "WaterTankSensorRecordColumns":
+        """tank_codes 와 같은 순서의 수조 id 로 행별 수조 id 컬럼을 만든 묶음"""
+        return WaterTankSensorRecordColumns(
+            tank_id=np.asarray(tank_ids, dtype=np.int64)[self.code_index],
+            recorded_at=self.recorded_at.astype(np.int64, copy=False),
+            temperature=self.temperature,
+            ph=self.ph,
+            dissolved_oxygen=self.dissolved_oxygen,
+            salinity=self.salinity,
+        )
+
+
+@dataclass
+class WaterTankSensorRecordColumns:
+    """저장된 측정 값 묶음 (컬럼 단위 numpy 배열, 행별 수조 id)
+
+    수집 경로의 listener(경보, 통계 등)에 전달되며, listener 는 배열을 수정하면 안 됩니다.
+    """
+
+    tank_id: np.ndarray  # 행별 수조 id
+    recorded_at: np.ndarray  # 행별 측정 시간 (epoch 초)
+    temperature: np.ndarray
+    ph: np.ndarray
+    dissolved_oxygen: np.ndarray
+    salinity: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.tank_id)
+
+    def metric(self, name: str) -> np.ndarray:
+        """측정 항목 이름(METRICS)으로 컬럼 조회"""
+        return getattr(self, name)
+
+    @staticmethod
+    def concat(
+        parts: List["WaterTankSensorRecordColumns"],
+    ) -> "WaterTankSensorRecordColumns":
+        """여러 묶음을 순서대로 이어 붙임"""
+        return WaterTankSensorRecordColumns(
+            tank_id=np.concatenate([part.tank_id for part in parts]),
+            recorded_at=np.concatenate([part.recorded_at for part in parts]),
+            **{
+                name: np.concatenate([part.metric(name) for part in parts])
+                for name in METRICS
+            },
+        )
+
+    @staticmethod
+    def from_records(
+        records: List[WaterTankSensorRecord],
+    ) -> "WaterTankSensorRecordColumns":
+        return WaterTankSensorRecordColumns(
+            tank_id=np.array([record.tank_id for record in records], dtype=np.int64),
+            recorded_at=np.array(
+                [int(record.content.recorded_at.timestamp()) for record in records],
+                dtype=np.int64,
+            ),
+            **{
+                name: np.array(
+                    [getattr(record.content, name) for record in records],
+                    dtype=np.float64,
+                )
+                for name in METRICS
+            },
+        )
+
+
+@dataclass
+class WaterTankSensorRecordGrid:
+    """여러 수조의 고정 간격 측정 값 격자
+
+    values[i, j, k] 는 tank_codes[i] 수조의 start + j * interval bucket 에서 METRICS[k] 항목의 평균이며,
+    값이 없거나 채울 수 없는 칸은 NaN 입니다.
+    """
+
+    tank_codes: List[str]
+    start: datetime  # 첫 bucket 시작 시간
+    interval: timedelta  # bucket 간격
+    values: np.ndarray  # [수조, bucket, 항목]
+    filled: np.ndarray  # [수조, bucket, 항목] 측정 값이 아니라 채운 칸인지
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """bucket 시작 시간 (epoch 초)"""
+        start = int((self.start - EPOCH).total_seconds())
+        step = int(self.interval.total_seconds())
+        return start + np.arange(self.values.shape[1], dtype=np.int64) * step
@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Optional
 import logging
 
 from sqlalchemy.orm import mapped_column, Mapped
@@ -21,6 +22,7 @@ class WaterTankSensorRecordEntity(Base):
     ph: Mapped[float] = mapped_column()
     dissolved_oxygen: Mapped[float] = mapped_column()
     salinity: Mapped[float] = mapped_column()
+    oxygen_saturation: Mapped[Optional[float]] = mapped_column()
     recorded_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
 
     @staticmethod
@@ -32,6 +34,7 @@ class WaterTankSensorRecordEntity(Base):
             ph=domain.content.ph,
             dissolved_oxygen=domain.content.dissolved_oxygen,
             salinity=domain.content.salinity,
+            oxygen_saturation=domain.content.oxygen_saturation,
             recorded_at=domain.content.recorded_at,
         )
 
@@ -45,6 +48,7 @@ class WaterTankSensorRecordEntity(Base):
                 dissolved_oxygen=self.dissolved_oxygen,
                 salinity=self.salinity,
                 recorded_at=self.recorded_at,
+                oxygen_saturation=self.oxygen_saturation,
             ),
         )
 
@@ -54,6 +58,7 @@ class WaterTankSensorRecordEntity(Base):
         self.ph = domain.content.ph
         self.dissolved_oxygen = domain.content.dissolved_oxygen
         self.salinity = domain.content.salinity
+        self.oxygen_saturation = domain.content.oxygen_saturation
 
     def primary_key(self) -> int:
         """엔티티의 기본 키를 반환합니다."""
@@ -70,6 +75,7 @@ class WaterTankSensorRecordHistoryEntity(Base):
     ph: Mapped[float] = mapped_column()
     dissolved_oxygen: Mapped[float] = mapped_column()
     salinity: Mapped[float] = mapped_column()
+    oxygen_saturation: Mapped[Optional[float]] = mapped_column()
     recorded_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), primary_key=True
     )
@@ -83,6 +89,7 @@ class WaterTankSensorRecordHistoryEntity(Base):
             ph=domain.content.ph,
             dissolved_oxygen=domain.content.dissolved_oxygen,
             salinity=domain.content.salinity,
+            oxygen_saturation=domain.content.oxygen_saturation,
             recorded_at=domain.content.recorded_at,
         )
 
@@ -96,6 +103,7 @@ class WaterTankSensorRecordHistoryEntity(Base):
                 dissolved_oxygen=self.dissolved_oxygen,
                 salinity=self.salinity,
                 recorded_at=self.recorded_at,
+                oxygen_saturation=self.oxygen_saturation,
             ),
         )
 
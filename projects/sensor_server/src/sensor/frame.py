@@ -0,0 +1,114 @@
+"""수조 센서 측정 값 binary frame (Content-Type: application/x-sensor-frame)
+
+셀룰러 게이트웨이용 압축 포맷입니다. 모든 정수/실수는 little-endian 입니다.
+
+    header (12 bytes)
+        magic       4s   b"SNSR"
+        version     u8   1
+        flags       u8   0 (예약)
+        code_count  u16  수조 코드 사전 크기
+        row_count   u32  측정 값 행 수
+    tank code dictionary (code_count 개)
+        length      u8   코드 길이 (bytes)
+        code        utf-8
+    rows (row_count 개, 행당 22 bytes)
+        code_index        u16  사전 내 수조 코드 위치
+        recorded_at       u32  측정 시간 (epoch 초)
+        temperature       f32
+        ph                f32
+        dissolved_oxygen  f32
+        salinity          f32
+
+JSON 대비 측정 값 하나가 약 150 bytes → 22 bytes 입니다.
+"""
+
+import struct
+from typing import List
+
+import numpy as np
+
+from src.sensor.domains import WaterTankSensorRecordBatch
+
+MEDIA_TYPE = "application/x-sensor-frame"
+
+MAGIC = b"SNSR"
+VERSION = 1
+HEADER = struct.Struct("<4sBBHI")
+ROW = np.dtype(
+    [
+        ("code_index", "<u2"),
+        ("recorded_at", "<u4"),
+        ("temperature", "<f4"),
+        ("ph", "<f4"),
+        ("dissolved_oxygen", "<f4"),
+        ("salinity", "<f4"),
+    ]
+)
+
+
+class FrameDecodeError(ValueError):
+    """잘못된 binary frame"""
+
+
+def decode_frame(data: bytes) -> WaterTankSensorRecordBatch:
+    """binary frame 을 측정 값 묶음으로 변환 (행 단위 파싱 없이 numpy view 로 읽음)"""
+    if len(data) < HEADER.size:
+        raise FrameDecodeError("frame is shorter than header")
+    magic, version, _, code_count, row_count = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise FrameDecodeError("invalid magic")
+    if version != VERSION:
+        raise FrameDecodeError(f"unsupported version {version}")
+
+    tank_codes: List[str] = []
+    offset = HEADER.size
+    for _ in range(code_count):
+        if offset >= len(data):
+            raise FrameDecodeError("truncated tank code dictionary")
+        length = data[offset]
+        code = data[offset + 1 : offset + 1 + length]
+        if len(code) != length:
+            raise FrameDecodeError("truncated tank code dictionary")
+        try:
+            tank_codes.append(code.decode("utf-8"))
+        except UnicodeDecodeError:
+            raise FrameDecodeError("tank code is not utf-8")
+        offset += 1 + length
+
+    if len(data) - offset != row_count * ROW.itemsize:
+        raise FrameDecodeError(
+            f"expected {row_count} rows ({row_count * ROW.itemsize} bytes), "
+            f"got {len(data) - offset} bytes"
+        )
+    rows = np.frombuffer(data, dtype=ROW, count=row_count, offset=offset)
+
+    if row_count > 0 and int(rows["code_index"].max()) >= code_count:
+        raise FrameDecodeError("tank code index out of range")
+    metrics = [rows[name] for name in ("temperature", "ph", "dissolved_oxygen", "salinity")]
+    if not all(np.isfinite(values).all() for values in metrics):
+        raise FrameDecodeError("metrics must be finite")
+
+    return WaterTankSensorRecordBatch(
+        tank_codes=tank_codes,
+        code_index=rows["code_index"],
+        recorded_at=rows["recorded_at"].astype(np.int64),
+        temperature=rows["temperature"],
+        ph=rows["ph"],
+        dissolved_oxygen=rows["dissolved_oxygen"],
+        salinity=rows["salinity"],
+    )
+
+
+def encode_frame(batch: WaterTankSensorRecordBatch) -> bytes:
+    """측정 값 묶음을 binary frame 으로 변환 (게이트웨이 구현 참고 및 테스트용)"""
+    codes = [code.encode("utf-8") for code in batch.tank_codes]
+    rows = np.empty(len(batch), dtype=ROW)
+    for name in ROW.names:
+        rows[name] = getattr(batch, name)
+    return b"".join(
+        [
+            HEADER.pack(MAGIC, VERSION, 0, len(codes), len(batch)),
+            *(bytes([len(code)]) + code for code in codes),
+            rows.tobytes(),
+        ]
+    )
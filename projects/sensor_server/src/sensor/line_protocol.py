@@ -0,0 +1,232 @@
+"""수조 센서 측정 값 line protocol
+
+PLC 등 HTTP 를 쓰기 어려운 장비를 위한 한 줄 한 측정 값 텍스트 포맷입니다.
+
+    <tank_code> temperature=<f>,ph=<f>,do=<f>,salinity=<f> <epoch 초>\\n
+
+    예) tank_0001 temperature=20.5,ph=7.1,do=9.8,salinity=30.2 1735689600
+
+필드 순서는 자유이며, 네 필드 모두 필요합니다.
+"""
+
+import asyncio
+import logging
+import math
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src import metrics
+from src.exceptions import ClientException
+from src.sensor.domains import WaterTankSensorRecordBatch
+from src.sensor.service import SensorRecordService
+
+logger = logging.getLogger(__name__)
+
+FIELDS = {
+    b"temperature": 0,
+    b"ph": 1,
+    b"do": 2,
+    b"salinity": 3,
+}
+
+
+def parse_lines(lines: List[bytes]) -> Tuple[WaterTankSensorRecordBatch, int]:
+    """여러 줄을 한 번에 측정 값 묶음으로 변환
+
+    Returns:
+        (측정 값 묶음, 형식이 잘못되어 버린 줄 수)
+    """
+    code_index_by_code: Dict[str, int] = {}
+    code_index, recorded_at, values = [], [], []
+    invalid = 0
+    for line in lines:
+        line = line.strip()
+        if len(line) == 0:
+            continue
+        try:
+            # 줄 전체를 검증한 뒤에만 추가 (중간에 실패한 줄이 다른 줄과 섞이지 않도록)
+            tank_code, fields, timestamp = line.split(b" ")
+            code = tank_code.decode("utf-8")
+            row = [None] * len(FIELDS)
+            for field in fields.split(b","):
+                key, value = field.split(b"=")
+                row[FIELDS[key]] = float(value)
+            if None in row:
+                raise ValueError(f"missing field: {line!r}")
+            if not all(math.isfinite(value) for value in row):
+                raise ValueError(f"metrics must be finite: {line!r}")
+            timestamp = int(timestamp)
+        except (ValueError, KeyError):
+            invalid += 1
+            continue
+        recorded_at.append(timestamp)
+        values.append(row)
+        code_index.append(code_index_by_code.setdefault(code, len(code_index_by_code)))
+
+    values = np.array(values, dtype=np.float64).reshape(-1, len(FIELDS))
+    batch = WaterTankSensorRecordBatch(
+        tank_codes=list(code_index_by_code),
+        code_index=np.array(code_index, dtype=np.int64),
+        recorded_at=np.array(recorded_at, dtype=np.int64),
+        temperature=values[:, 0],
+        ph=values[:, 1],
+        dissolved_oxygen=values[:, 2],
+        salinity=values[:, 3],
+    )
+    return batch, invalid
+
+
+class SensorLineProtocolListener:
+    """line protocol 측정 값 수신 (TCP / UDP)
+
+    - TCP: 소켓에서 한 번 읽은 데이터의 완성된 줄을 묶어서 저장하고, 저장이 끝난 뒤에 다음 데이터를 읽습니다.
+      따라서 저장이 느려지면 커널 수신 버퍼가 차서 TCP 흐름 제어로 장비 측 전송이 늦춰집니다. (연결별 backpressure)
+    - UDP: 흐름 제어가 없으므로 datagram 을 크기가 제한된 queue 에 넣고, queue 가 가득 차면 버립니다.
+
+    HTTP 와 같은 SensorRecordService.record_tank_sensor_batch 로 저장합니다.
+    worker 프로세스가 여러 개인 경우 SO_REUSEPORT 로 같은 포트를 열어 커널이 연결/datagram 을 분산합니다.
+    """
+
+    def __init__(
+        self,
+        service: SensorRecordService,
+        host: str = "0.0.0.0",
+        tcp_port: Optional[int] = None,
+        udp_port: Optional[int] = None,
+        udp_queue_size: int = 1000,
+        max_line_bytes: int = 4096,
+        read_bytes: int = 64 * 1024,
+        retry_attempts: int = 3,
+        retry_delay: float = 0.5,
+    ):
+        self.service = service
+        self.host = host
+        self.tcp_port = tcp_port
+        self.udp_port = udp_port
+        self.udp_queue_size = udp_queue_size
+        self.max_line_bytes = max_line_bytes
+        self.read_bytes = read_bytes
+        self.retry_attempts = retry_attempts
+        self.retry_delay = retry_delay
+
+        self._tcp_server: Optional[asyncio.Server] = None
+        self._udp_transport: Optional[asyncio.DatagramTransport] = None
+        self._udp_queue: Optional[asyncio.Queue] = None
+        self._udp_task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        if self.tcp_port is not None:
+            self._tcp_server = await asyncio.start_server(
+                self._handle_connection, self.host, self.tcp_port, reuse_port=True
+            )
+            logger.info(f"line protocol: listening tcp {self.host}:{self.tcp_port}")
+        if self.udp_port is not None:
+            self._udp_queue = asyncio.Queue(maxsize=self.udp_queue_size)
+            self._udp_transport, _ = await asyncio.get_running_loop().create_datagram_endpoint(
+                lambda: _DatagramProtocol(self._udp_queue),
+                local_addr=(self.host, self.udp_port),
+                reuse_port=True,
+            )
+            self._udp_task = asyncio.create_task(self._drain_datagrams())
+            logger.info(f"line protocol: listening udp {self.host}:{self.udp_port}")
+
+    async def stop(self) -> None:
+        if self._tcp_server is not None:
+            self._tcp_server.close()
+            await self._tcp_server.wait_closed()
+            self._tcp_server = None
+        if self._udp_transport is not None:
+            self._udp_transport.close()
+            self._udp_transport = None
+        if self._udp_task is not None:
+            self._udp_task.cancel()
+            self._udp_task = None
+
+    @property
+    def tcp_address(self) -> Optional[Tuple[str, int]]:
+        """실제 listen 중인 TCP 주소 (port=0 으로 시작한 경우 확인용)"""
+        if self._tcp_server is None:
+            return None
+        return self._tcp_server.sockets[0].getsockname()[:2]
+
+    @property
+    def udp_address(self) -> Optional[Tuple[str, int]]:
+        if self._udp_transport is None:
+            return None
+        return self._udp_transport.get_extra_info("sockname")[:2]
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        peer = writer.get_extra_info("peername")
+        remainder = b""
+        try:
+            while data := await reader.read(self.read_bytes):
+                lines = (remainder + data).split(b"\n")
+                remainder = lines.pop()
+                if len(remainder) > self.max_line_bytes:
+                    logger.warning(f"line protocol: line too long from {peer}, closing")
+                    break
+                await self.ingest(lines, transport="tcp")
+            if remainder:
+                await self.ingest([remainder], transport="tcp")
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except Exception as e:
+            logger.warning(f"line protocol: save failed, closing {peer} ({e!r})")
+        finally:
+            writer.close()
+
+    async def _drain_datagrams(self) -> None:
+        while True:
+            datagram = await self._udp_queue.get()
+            try:
+                await self.ingest(datagram.split(b"\n"), transport="udp")
+            except Exception as e:
+                logger.warning(f"line protocol: udp ingest failed ({e!r})")
+
+    async def ingest(self, lines: List[bytes], transport: str) -> int:
+        """줄 묶음을 저장하고 저장된 측정 값 수를 반환
+
+        응답 채널이 없으므로 버리는 측정 값은 기록만 합니다.
+        - 형식이 잘못된 줄과 등록되지 않은 수조 코드의 줄은 해당 줄만 버립니다.
+        - ClientException(잘못된 요청)은 다시 보내도 실패하므로 묶음을 버립니다.
+        - 그 외 오류(ServerException - DB 장애 등)는 retry_delay 부터 두 배씩 늘려가며 retry_attempts 번까지
+          다시 시도하고, 모두 실패하면 예외를 전달합니다. (TCP 는 연결을 끊어 장비가 다시 보내도록 함)
+        """
+        batch, invalid = parse_lines(lines)
+        batch, unknown = await self.service.drop_unknown_tanks(batch)
+        if invalid + unknown > 0:
+            metrics.sensor_rejected_records.labels(transport).inc(invalid + unknown)
+        if len(batch) == 0:
+            return 0
+
+        for attempt in range(1, self.retry_attempts + 1):
+            try:
+                await self.service.record_tank_sensor_batch(batch)
+                break
+            except ClientException as e:
+                logger.warning(f"line protocol: reject {len(batch)} records ({e.message})")
+                metrics.sensor_rejected_records.labels(transport).inc(len(batch))
+                return 0
+            except Exception as e:
+                if attempt == self.retry_attempts:
+                    raise
+                logger.warning(
+                    f"line protocol: save {len(batch)} records failed, retry ({e!r})"
+                )
+                await asyncio.sleep(self.retry_delay * 2 ** (attempt - 1))
+        metrics.sensor_ingested_records.labels(transport).inc(len(batch))
+        return len(batch)
+
+
+class _DatagramProtocol(asyncio.DatagramProtocol):
+    def __init__(self, queue: asyncio.Queue):
+        self.queue = queue
+
+    def datagram_received(self, data: bytes, addr) -> None:
+        try:
+            self.queue.put_nowait(data)
+        except asyncio.QueueFull:
+            metrics.sensor_dropped_datagrams.inc()
@@ -0,0 +1,31 @@
+from typing import List, Protocol
+
+import numpy as np
+
+from src.sensor.domains import WaterTankSensorRecordColumns
+
+
+class SensorRecordListener(Protocol):
+    """수집된 측정 값 묶음을 전달받는 listener (SensorRecordService 에 등록)
+
+    측정 값이 저장(또는 spool)된 직후 이벤트 루프에서 동기로 호출되므로, numpy 연산 정도로 가벼워야 합니다.
+    I/O 가 필요하면 별도 task 로 넘겨야 합니다. 예외는 기록만 하고 수집은 계속됩니다.
+    """
+
+    def on_records(self, columns: WaterTankSensorRecordColumns) -> None: ...
+
+
+def occurrence_rounds(tank_id: np.ndarray, recorded_at: np.ndarray) -> List[np.ndarray]:
+    """행을 수조별 측정 시간 순서로 나눈 round 목록 (round 안에서는 수조가 겹치지 않음)
+
+    수조별 상태(경보, 통계 등)는 측정 시간 순서대로 갱신되어야 하므로, 한 묶음에 같은 수조의 측정 값이 여러 개 있으면
+    k 번째 측정 값끼리 묶어서 차례로 평가합니다. 대부분의 묶음은 수조당 하나이므로 round 는 하나입니다.
+    """
+    order = np.lexsort((recorded_at, tank_id))
+    sorted_tank_id = tank_id[order]
+    starts = np.flatnonzero(np.r_[True, sorted_tank_id[1:] != sorted_tank_id[:-1]])
+    if len(starts) == len(order):
+        return [order]
+    lengths = np.diff(np.r_[starts, len(order)])
+    occurrence = np.arange(len(order)) - np.repeat(starts, lengths)
+    return [order[occurrence == k] for k in range(int(lengths.max()))]
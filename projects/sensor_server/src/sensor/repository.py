@@ -1,16 +1,85 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+from sqlalchemy import BigInteger, Select, cast, func, literal, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src import metrics
 from src.database.repository import BaseRepository
-from src.sensor.domains import WaterTankSensorRecord
+from src.sensor.derived import (
+    DERIVED_METRIC_INPUTS,
+    compute_derived_metrics,
+    to_nullable,
+)
+from src.sensor.domains import (
+    EPOCH,
+    METRICS,
+    WaterTankSensorRecord,
+    WaterTankSensorRecordBucket,
+    WaterTankSensorRecordColumns,
+    WaterTankSensorRecordContent,
+)
 from src.sensor.entities import (
     WaterTankSensorRecordEntity,
     WaterTankSensorRecordHistoryEntity,
 )
 
 
+# 대량 조회(scan_all, aggregate_all)에서 한 번에 받아 변환하는 행 수
+SCAN_CHUNK_ROWS = 5_000
+
+
 class WaterTankSensorRecordRepository(BaseRepository[int, WaterTankSensorRecord]):
     """수조 센서 측정 값 저장"""
 
     entity = WaterTankSensorRecordEntity
 
+    async def upsert_many(self, records: List[WaterTankSensorRecord]) -> None:
+        """수조별 최신 측정 값 일괄 저장
+
+        이미 저장된 값보다 측정 시간이 이전인 값은 반영하지 않으므로,
+        spool 재처리처럼 순서가 뒤섞여 들어와도 최신 값이 유지됩니다.
+        """
+        latest = {}
+        for record in records:
+            saved = latest.get(record.tank_id)
+            if saved is None or saved.content.recorded_at <= record.content.recorded_at:
+                latest[record.tank_id] = record
+        if len(latest) == 0:
+            return
+
+        async with self.session_factory() as session:
+            with metrics.ingest_stage("session_acquire"):
+                await session.connection()
+            with metrics.ingest_stage("latest_upsert"):
+                await session.execute(
+                    self.upsert_statement(),
+                    [to_row(record) for record in latest.values()],
+                )
+            with metrics.ingest_stage("commit"):
+                await session.commit()
+
+    def upsert_statement(self):
+        stmt = insert(self.entity)
+        return stmt.on_conflict_do_update(
+            index_elements=[self.entity.tank_id],
+            set_={
+                "temperature": stmt.excluded.temperature,
+                "ph": stmt.excluded.ph,
+                "dissolved_oxygen": stmt.excluded.dissolved_oxygen,
+                "salinity": stmt.excluded.salinity,
+                "oxygen_saturation": stmt.excluded.oxygen_saturation,
+                "recorded_at": stmt.excluded.recorded_at,
+            },
+            where=self.entity.recorded_at <= stmt.excluded.recorded_at,
+        )
+
+    def warmup_statements(self):
+        return [(self.upsert_statement(), [to_row(WARMUP_RECORD)])]
+
 
 class WaterTankSensorRecordHistoryRepository(
     BaseRepository[int, WaterTankSensorRecord]
@@ -18,3 +87,249 @@ class WaterTankSensorRecordHistoryRepository(
     """수조 센서 측정 history 저장"""
 
     entity = WaterTankSensorRecordHistoryEntity
+
+    async def insert_many(
+        self, records: List[WaterTankSensorRecord]
+    ) -> List[WaterTankSensorRecord]:
+        """측정 history 일괄 저장 후 실제로 저장된 측정 값 반환
+
+        (tank_id, recorded_at) 이 이미 존재하는 값은 무시하므로, 같은 값을 다시 저장해도 안전합니다.
+        무시된 값은 반환하지 않으므로, 재시도 / spool 재처리로 다시 들어온 값을 구분할 수 있습니다.
+        """
+        if len(records) == 0:
+            return []
+
+        async with self.session_factory() as session:
+            with metrics.ingest_stage("session_acquire"):
+                await session.connection()
+            with metrics.ingest_stage("history_insert"):
+                result = await session.execute(
+                    self.insert_statement().returning(
+                        self.entity.tank_id, self.entity.recorded_at
+                    ),
+                    [to_row(record) for record in records],
+                )
+                inserted = set(result.tuples().all())
+            with metrics.ingest_stage("commit"):
+                await session.commit()
+        return select_inserted(records, inserted)
+
+    def insert_statement(self):
+        return insert(self.entity).on_conflict_do_nothing(
+            index_elements=[self.entity.tank_id, self.entity.recorded_at]
+        )
+
+    def warmup_statements(self):
+        return [(self.insert_statement(), [to_row(WARMUP_RECORD)])]
+
+    async def find_range(
+        self, tank_id: int, start: datetime, end: datetime
+    ) -> List[WaterTankSensorRecord]:
+        """수조의 [start, end) 구간 측정 history 를 시간 순으로 조회"""
+        async with self.session_factory.reader() as session:
+            stmt = (
+                select(self.entity)
+                .where(
+                    self.entity.tank_id == tank_id,
+                    self.entity.recorded_at >= start,
+                    self.entity.recorded_at < end,
+                )
+                .order_by(self.entity.recorded_at)
+            )
+            result = await session.execute(stmt)
+            return [entity.to_domain() for entity in result.scalars().all()]
+
+    async def aggregate(
+        self, tank_id: int, start: datetime, end: datetime, bucket: timedelta
+    ) -> List[WaterTankSensorRecordBucket]:
+        """수조의 [start, end) 구간 측정 history 를 bucket 단위 평균으로 조회
+
+        bucket 경계는 epoch 기준으로 정렬됩니다.
+        """
+        bucket_at = func.date_bin(
+            bucket, self.entity.recorded_at, literal(EPOCH)
+        ).label("bucket_at")
+        async with self.session_factory.reader() as session:
+            stmt = (
+                select(
+                    bucket_at,
+                    func.count().label("count"),
+                    func.avg(self.entity.temperature).label("temperature"),
+                    func.avg(self.entity.ph).label("ph"),
+                    func.avg(self.entity.dissolved_oxygen).label("dissolved_oxygen"),
+                    func.avg(self.entity.salinity).label("salinity"),
+                )
+                .where(
+                    self.entity.tank_id == tank_id,
+                    self.entity.recorded_at >= start,
+                    self.entity.recorded_at < end,
+                )
+                .group_by(bucket_at)
+                .order_by(bucket_at)
+            )
+            result = await session.execute(stmt)
+            return [
+                WaterTankSensorRecordBucket(tank_id=tank_id, **row._asdict())
+                for row in result
+            ]
+
+    async def aggregate_all(
+        self,
+        start: datetime,
+        end: datetime,
+        bucket: timedelta,
+        tank_ids: Optional[List[int]] = None,
+    ) -> WaterTankSensorRecordColumns:
+        """모든 수조(tank_ids 가 있으면 해당 수조들)의 [start, end) 구간 측정 history 를 bucket 단위 평균으로 조회
+
+        행마다 (수조, bucket) 하나이며 recorded_at 은 bucket 시작 시간(epoch 초)입니다.
+        """
+        bucket_at = cast(
+            func.extract(
+                "epoch", func.date_bin(bucket, self.entity.recorded_at, literal(EPOCH))
+            ),
+            BigInteger,
+        ).label("bucket_at")
+        async with self.session_factory.reader() as session:
+            stmt = (
+                select(
+                    self.entity.tank_id,
+                    bucket_at,
+                    *(func.avg(getattr(self.entity, name)) for name in METRICS),
+                )
+                .where(
+                    self.entity.recorded_at >= start,
+                    self.entity.recorded_at < end,
+                )
+                .group_by(self.entity.tank_id, bucket_at)
+            )
+            if tank_ids is not None:
+                stmt = stmt.where(self.entity.tank_id.in_(tank_ids))
+            return await fetch_columns(session, stmt)
+
+    async def scan_all(
+        self, start: datetime, end: datetime, tank_ids: Optional[List[int]] = None
+    ) -> WaterTankSensorRecordColumns:
+        """모든 수조(tank_ids 가 있으면 해당 수조들)의 [start, end) 구간 측정 history 를 (수조, 측정 시간) 순으로 조회"""
+        recorded_at = cast(func.extract("epoch", self.entity.recorded_at), BigInteger)
+        async with self.session_factory.reader() as session:
+            stmt = (
+                select(
+                    self.entity.tank_id,
+                    recorded_at,
+                    *(getattr(self.entity, name) for name in METRICS),
+                )
+                .where(
+                    self.entity.recorded_at >= start,
+                    self.entity.recorded_at < end,
+                )
+                .order_by(self.entity.tank_id, self.entity.recorded_at)
+            )
+            if tank_ids is not None:
+                stmt = stmt.where(self.entity.tank_id.in_(tank_ids))
+            return await fetch_columns(session, stmt)
+
+    async def recompute_derived(self, start: datetime, end: datetime) -> int:
+        """[start, end) 구간 history 의 파생 항목을 다시 계산해 저장 (backfill 용)
+
+        Returns:
+            갱신한 행 수
+        """
+        async with self.session_factory() as session:
+            result = await session.execute(
+                select(
+                    self.entity.tank_id,
+                    self.entity.recorded_at,
+                    *(getattr(self.entity, name) for name in DERIVED_METRIC_INPUTS),
+                ).where(
+                    self.entity.recorded_at >= start,
+                    self.entity.recorded_at < end,
+                )
+            )
+            rows = result.all()
+            if len(rows) == 0:
+                return 0
+
+            values = np.array([row[2:] for row in rows], dtype=np.float64)
+            derived = compute_derived_metrics(
+                {name: values[:, i] for i, name in enumerate(DERIVED_METRIC_INPUTS)}
+            )
+            derived = {name: to_nullable(column) for name, column in derived.items()}
+            # 기본 키(tank_id, recorded_at) 기준 bulk UPDATE
+            await session.execute(
+                update(self.entity),
+                [
+                    {
+                        "tank_id": row.tank_id,
+                        "recorded_at": row.recorded_at,
+                        **{name: column[i] for name, column in derived.items()},
+                    }
+                    for i, row in enumerate(rows)
+                ],
+            )
+            await session.commit()
+        return len(rows)
+
+
+# warmup 용 측정 값 (없는 수조라 FK 에 걸리지만 statement 는 실행 전에 prepare 되므로 warmup 에는 충분. rollback 되므로 저장되지 않음)
+WARMUP_RECORD = WaterTankSensorRecord(
+    tank_id=-1,
+    content=WaterTankSensorRecordContent(
+        temperature=0, ph=0, dissolved_oxygen=0, salinity=0, recorded_at=EPOCH
+    ),
+)
+
+
+async def fetch_columns(
+    session: AsyncSession, stmt: Select, chunk_rows: int = SCAN_CHUNK_ROWS
+) -> WaterTankSensorRecordColumns:
+    """(tank_id, recorded_at, *METRICS) 행 조회 결과를 컬럼 묶음으로
+
+    server-side cursor 로 chunk_rows 행씩 받아 thread 에서 numpy 로 변환하므로,
+    event loop 는 결과 전체 크기가 아니라 chunk 하나를 받는 동안만 사용됩니다.
+    """
+    result = await session.stream(stmt.execution_options(yield_per=chunk_rows))
+    parts = []
+    async for rows in result.partitions():
+        parts.append(await asyncio.to_thread(to_columns, rows))
+    if len(parts) == 0:
+        return to_columns([])
+    if len(parts) == 1:
+        return parts[0]
+    return await asyncio.to_thread(WaterTankSensorRecordColumns.concat, parts)
+
+
+def to_columns(rows: Sequence[Sequence]) -> WaterTankSensorRecordColumns:
+    """(tank_id, recorded_at, *METRICS) 행 목록을 컬럼 묶음으로 (NULL 은 NaN)"""
+    values = np.array(rows, dtype=np.float64).reshape(-1, 2 + len(METRICS))
+    return WaterTankSensorRecordColumns(
+        tank_id=values[:, 0].astype(np.int64),
+        recorded_at=values[:, 1].astype(np.int64),
+        **{name: values[:, 2 + m] for m, name in enumerate(METRICS)},
+    )
+
+
+def select_inserted(
+    records: List[WaterTankSensorRecord], inserted: Set[Tuple[int, datetime]]
+) -> List[WaterTankSensorRecord]:
+    """저장된 (tank_id, recorded_at) 의 측정 값만 순서대로 (묶음 안의 중복은 처음 값만)"""
+    selected = []
+    for record in records:
+        key = (record.tank_id, record.content.recorded_at)
+        if key in inserted:
+            inserted.discard(key)
+            selected.append(record)
+    return selected
+
+
+def to_row(record: WaterTankSensorRecord) -> dict:
+    """측정 값을 INSERT 용 컬럼 값 dict 로 변환"""
+    return {
+        "tank_id": record.tank_id,
+        "temperature": record.content.temperature,
+        "ph": record.content.ph,
+        "dissolved_oxygen": record.content.dissolved_oxygen,
+        "salinity": record.content.salinity,
+        "oxygen_saturation": record.content.oxygen_saturation,
+        "recorded_at": record.content.recorded_at,
+    }
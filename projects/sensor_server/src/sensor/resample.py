@@ -0,0 +1,97 @@
+"""측정 history 를 고정 간격 격자로 정렬 / 빈 칸 채우기
+
+bucket 평균 묶음(history_repository.aggregate_all)을 [수조, bucket, 항목] 행렬로 정렬하고,
+측정 값이 없는 bucket 을 LOCF(직전 값 유지) 또는 선형 보간으로 채웁니다.
+모든 수조 / 항목을 numpy 배열 연산으로 한 번에 처리합니다.
+"""
+
+from typing import Literal, Tuple
+
+import numpy as np
+
+from src.sensor.domains import METRICS, WaterTankSensorRecordColumns
+
+FillMethod = Literal["none", "locf", "linear"]
+
+
+def align_buckets(
+    columns: WaterTankSensorRecordColumns, start: int, bucket: int, buckets: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """bucket 평균 묶음을 [수조, bucket, 항목] 행렬로 정렬 (값이 없는 칸은 NaN)
+
+    Returns:
+        (행렬의 행 순서대로 수조 id, 행렬)
+    """
+    tank_ids, row = np.unique(columns.tank_id, return_inverse=True)
+    column = (columns.recorded_at - start) // bucket
+    valid = (column >= 0) & (column < buckets)
+    matrix = np.full((len(tank_ids), buckets, len(METRICS)), np.nan)
+    values = np.stack([columns.metric(name) for name in METRICS], axis=1)
+    matrix[row[valid], column[valid]] = values[valid]
+    return tank_ids, matrix
+
+
+def fill_gaps(matrix: np.ndarray, method: FillMethod, max_gap: int) -> np.ndarray:
+    """[수조, bucket, 항목] 행렬의 빈 칸(NaN)을 채운 새 행렬
+
+    - locf: 직전 값으로 채움 (직전 값으로부터 max_gap bucket 까지)
+    - linear: 앞뒤 값으로 선형 보간 (연속으로 빈 bucket 이 max_gap 개 이하인 구간만)
+
+    채울 수 없는 칸(처음 값 이전, 허용 길이를 넘는 빈 구간 등)은 NaN 으로 남습니다.
+    """
+    if method == "none" or matrix.shape[1] == 0:
+        return matrix.copy()
+
+    buckets = matrix.shape[1]
+    position = np.arange(buckets)[None, :, None]
+    observed = ~np.isnan(matrix)
+
+    # 칸마다 직전 / 직후 값이 있는 bucket 위치 (없으면 -1 / buckets)
+    previous = np.maximum.accumulate(np.where(observed, position, -1), axis=1)
+    following = np.minimum.accumulate(
+        np.where(observed, position, buckets)[:, ::-1], axis=1
+    )[:, ::-1]
+    previous_value = np.take_along_axis(matrix, previous.clip(min=0), axis=1)
+    following_value = np.take_along_axis(matrix, following.clip(max=buckets - 1), axis=1)
+
+    missing = ~observed & (previous >= 0)
+    if method == "locf":
+        fill = missing & (position - previous <= max_gap)
+        filled = np.where(fill, previous_value, matrix)
+    else:
+        fill = missing & (following < buckets) & (following - previous - 1 <= max_gap)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            ratio = (position - previous) / (following - previous)
+        filled = np.where(
+            fill, previous_value + (following_value - previous_value) * ratio, matrix
+        )
+    return filled
+
+
+def resample_grid(
+    columns: WaterTankSensorRecordColumns,
+    tank_ids: np.ndarray,
+    start: int,
+    bucket: int,
+    buckets: int,
+    margin: int,
+    method: FillMethod,
+    max_gap: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """요청한 수조 순서의 격자와 채운 칸 여부 (AnalyticsExecutor 에서 실행)
+
+    columns 는 앞뒤로 margin bucket 만큼 더 조회한 bucket 평균 묶음이며, 결과에서는 margin 을 잘라냅니다.
+
+    Returns:
+        ([수조, bucket, 항목] 값, 측정 값이 아니라 채운 칸인지)
+    """
+    found_ids, matrix = align_buckets(columns, start, bucket, buckets + 2 * margin)
+
+    # 요청한 수조 순서로 (측정 값이 없는 수조는 NaN 행)
+    aligned = np.full((len(tank_ids), *matrix.shape[1:]), np.nan)
+    found = np.isin(tank_ids, found_ids)
+    aligned[found] = matrix[np.searchsorted(found_ids, tank_ids[found])]
+
+    values = fill_gaps(aligned, method, max_gap)[:, margin : margin + buckets]
+    observed = ~np.isnan(aligned[:, margin : margin + buckets])
+    return values, ~observed & ~np.isnan(values)
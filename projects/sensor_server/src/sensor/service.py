@@ -1,37 +1,255 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from src import metrics
+from src.analytics.executor import AnalyticsExecutor
+from src.exceptions import (
+    InvalidRequestException,
+    NotFoundException,
+    SensorAppException,
+)
 from src.facility.service import FacilityService
 from src.sensor.domains import (
+    EPOCH,
+    WaterTankSensorRecordBatch,
+    WaterTankSensorRecordBucket,
+    WaterTankSensorRecordColumns,
     WaterTankSensorRecordContent,
+    WaterTankSensorRecordGrid,
     WaterTankSensorRecord,
 )
+from src.sensor.derived import fill_derived_metrics
+from src.sensor.listener import SensorRecordListener
+from src.sensor.resample import FillMethod, resample_grid
 from src.sensor.repository import (
     WaterTankSensorRecordHistoryRepository,
     WaterTankSensorRecordRepository,
 )
+from src.sensor.spool import SensorRecordSpool
+from src.singleflight import SingleFlight
+
+logger = logging.getLogger(__name__)
 
 
 class SensorRecordService:
-    """센서 측정 정보"""
+    """센서 측정 정보
+
+    저장된 측정 값 묶음은 등록된 listener(경보 등)에 차례로 전달됩니다.
+    history_listeners(분위수 sketch 등)에는 history 에 실제로 새로 저장된 측정 값만 전달되므로,
+    재시도 / spool 재처리로 같은 값이 다시 들어와도 한 번만 반영됩니다.
+    """
 
     def __init__(
         self,
         repository: WaterTankSensorRecordRepository,
         history_repository: WaterTankSensorRecordHistoryRepository,
         facility_service: FacilityService,
+        spool: Optional[SensorRecordSpool] = None,
+        spool_latency_budget: float = 1.0,
+        listeners: Optional[List[SensorRecordListener]] = None,
+        history_listeners: Optional[List[SensorRecordListener]] = None,
+        grid_max_cells: int = 500_000,
+        analytics: Optional[AnalyticsExecutor] = None,
     ):
         self.repository = repository
         self.history_repository = history_repository
         self.facility_service = facility_service
+        self.spool = spool
+        self.spool_latency_budget = spool_latency_budget
+        self.listeners = list(listeners or [])
+        self.history_listeners = list(history_listeners or [])
+        self.grid_max_cells = grid_max_cells
+        self.analytics = analytics or AnalyticsExecutor(enabled=False)
+        self._reads = SingleFlight("sensor_history")
 
     async def record_tank_sensor(
         self, tank_code: str, content: WaterTankSensorRecordContent
     ) -> WaterTankSensorRecord:
-        tank = await self.facility_service.get_water_tank_by_code(tank_code)
+        with metrics.ingest_stage("tank_lookup"):
+            tank = await self.facility_service.get_water_tank_by_code(tank_code)
 
         record = WaterTankSensorRecord.from_content(
             tank_id=tank.tank_id,
             content=content,
         )
 
-        await self.repository.save(record)
-        await self.history_repository.create(record)
+        await self.save_records([record])
+        metrics.sensor_records.labels(tank.center_id, tank.building_id).inc()
+        if self.listeners:
+            self.notify_listeners(WaterTankSensorRecordColumns.from_records([record]))
         return record
+
+    async def record_tank_sensor_batch(
+        self, batch: WaterTankSensorRecordBatch
+    ) -> List[WaterTankSensorRecord]:
+        """여러 수조의 측정 값 묶음 기록 (수조 코드는 묶음의 코드 사전 단위로 한 번씩만 조회)"""
+        if len(batch) == 0:
+            return []
+
+        with metrics.ingest_stage("tank_lookup"):
+            tanks = [
+                await self.facility_service.get_water_tank_by_code(tank_code)
+                for tank_code in batch.tank_codes
+            ]
+        tank_ids = [tank.tank_id for tank in tanks]
+        records = batch.to_records(tank_ids)
+
+        await self.save_records(records)
+
+        counts = np.bincount(batch.code_index, minlength=len(tanks))
+        for tank, count in zip(tanks, counts.tolist()):
+            if count > 0:
+                metrics.sensor_records.labels(tank.center_id, tank.building_id).inc(count)
+        if self.listeners:
+            self.notify_listeners(batch.to_columns(tank_ids))
+        return records
+
+    async def drop_unknown_tanks(
+        self, batch: WaterTankSensorRecordBatch
+    ) -> Tuple[WaterTankSensorRecordBatch, int]:
+        """등록되지 않은 수조 코드의 측정 값을 뺀 묶음과 뺀 측정 값 수
+
+        응답으로 오류를 알릴 수 없는 수집 경로(line protocol)에서, 알 수 없는 코드 때문에
+        같은 묶음의 다른 수조 측정 값까지 버리지 않도록 저장 전에 호출합니다.
+        """
+        known = []
+        for tank_code in batch.tank_codes:
+            try:
+                await self.facility_service.get_water_tank_by_code(tank_code)
+            except NotFoundException:
+                logger.warning(f"unknown tank code {tank_code!r}")
+                known.append(False)
+            else:
+                known.append(True)
+        if all(known):
+            return batch, 0
+        selected = batch.select_codes(np.array(known))
+        return selected, len(batch) - len(selected)
+
+    def notify_listeners(
+        self,
+        columns: WaterTankSensorRecordColumns,
+        listeners: Optional[List[SensorRecordListener]] = None,
+    ) -> None:
+        """저장된 측정 값 묶음을 listener 에 전달 (listener 의 예외는 기록만 하고 무시)"""
+        for listener in self.listeners if listeners is None else listeners:
+            try:
+                listener.on_records(columns)
+            except Exception:
+                logger.exception(f"sensor record listener failed ({listener!r})")
+
+    async def save_records(self, records: List[WaterTankSensorRecord]) -> None:
+        """측정 값 저장
+
+        spool 이 설정된 경우, DB 저장이 실패하거나 spool_latency_budget 을 넘기면
+        로컬 spool 에 기록하고 반환합니다. spool 의 측정 값은 DB 가 복구되면 재처리됩니다.
+        """
+        if self.spool is None:
+            await self.write_records(records)
+            return
+
+        try:
+            await asyncio.wait_for(
+                self.write_records(records), timeout=self.spool_latency_budget
+            )
+        except SensorAppException:
+            # 무결성 오류 등은 다시 시도해도 실패하므로 spool 하지 않음
+            raise
+        except Exception as e:
+            logger.warning(f"spool {len(records)} records ({e!r})")
+            await self.spool.append(records)
+
+    async def write_records(self, records: List[WaterTankSensorRecord]) -> None:
+        """측정 값을 최신 값 테이블과 history 테이블에 저장 (중복 저장에 안전)
+
+        저장 전에 파생 항목(src.sensor.derived)을 묶음 단위로 계산해 채우므로, spool 에서 재처리되는
+        측정 값에도 같은 값이 저장됩니다. history 에 새로 저장된 측정 값은 history_listeners 에 전달합니다.
+        """
+        with metrics.ingest_stage("derive"):
+            fill_derived_metrics(records)
+        await self.repository.upsert_many(records)
+        inserted = await self.history_repository.insert_many(records)
+        if self.history_listeners and inserted:
+            self.notify_listeners(
+                WaterTankSensorRecordColumns.from_records(inserted),
+                self.history_listeners,
+            )
+
+    async def find_tank_history(
+        self, tank_code: str, start: datetime, end: datetime
+    ) -> List[WaterTankSensorRecord]:
+        """수조의 [start, end) 구간 측정 history 조회 (동시에 들어온 같은 조회는 한 번만 실행)"""
+        tank = await self.facility_service.get_water_tank_by_code(tank_code)
+        return await self._reads.do(
+            ("range", tank.tank_id, start, end),
+            lambda: self.history_repository.find_range(tank.tank_id, start, end),
+        )
+
+    async def aggregate_tank_history(
+        self, tank_code: str, start: datetime, end: datetime, bucket: timedelta
+    ) -> List[WaterTankSensorRecordBucket]:
+        """수조의 [start, end) 구간 bucket 평균 조회 (동시에 들어온 같은 조회는 한 번만 실행)"""
+        tank = await self.facility_service.get_water_tank_by_code(tank_code)
+        return await self._reads.do(
+            ("aggregate", tank.tank_id, start, end, bucket),
+            lambda: self.history_repository.aggregate(tank.tank_id, start, end, bucket),
+        )
+
+    async def resample_tank_history(
+        self,
+        tank_codes: List[str],
+        start: datetime,
+        end: datetime,
+        interval: timedelta,
+        fill: FillMethod = "none",
+        max_gap: int = 0,
+    ) -> WaterTankSensorRecordGrid:
+        """여러 수조의 [start, end) 구간을 interval 간격 격자로 조회
+
+        bucket 평균은 저장소에서 계산하고(수조 x bucket 행만 가져옴), 격자 정렬 / 빈 칸 채우기는 analytics process 에서 numpy 로 한 번에 합니다.
+        경계의 빈 칸도 채울 수 있도록 앞뒤로 max_gap bucket 만큼 더 조회합니다.
+        start 는 interval 단위로 내림 정렬됩니다.
+        """
+        step = int(interval.total_seconds())
+        if step <= 0 or end <= start:
+            raise InvalidRequestException("조회 구간 또는 간격이 올바르지 않습니다.")
+        first = int((start - EPOCH).total_seconds()) // step
+        buckets = -(-int((end - EPOCH).total_seconds()) // step) - first
+        if len(tank_codes) * buckets > self.grid_max_cells:
+            raise InvalidRequestException(
+                f"조회 범위가 너무 큽니다. (수조 수 x bucket 수 <= {self.grid_max_cells})"
+            )
+
+        tanks = [
+            await self.facility_service.get_water_tank_by_code(tank_code)
+            for tank_code in tank_codes
+        ]
+        margin = max_gap if fill != "none" else 0
+        columns = await self.history_repository.aggregate_all(
+            EPOCH + timedelta(seconds=(first - margin) * step),
+            EPOCH + timedelta(seconds=(first + buckets + margin) * step),
+            interval,
+            tank_ids=[tank.tank_id for tank in tanks],
+        )
+        values, filled = await self.analytics.run(
+            resample_grid,
+            columns,
+            np.asarray([tank.tank_id for tank in tanks], dtype=np.int64),
+            (first - margin) * step,
+            step,
+            buckets,
+            margin,
+            fill,
+            max_gap,
+        )
+        return WaterTankSensorRecordGrid(
+            tank_codes=list(tank_codes),
+            start=EPOCH + timedelta(seconds=first * step),
+            interval=interval,
+            values=values,
+            filled=filled,
+        )
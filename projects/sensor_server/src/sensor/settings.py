@@ -0,0 +1,29 @@
+from typing import Literal, Optional
+
+from pydantic_settings import BaseSettings
+from pydantic import Field
+
+
+class SensorSettings(BaseSettings):
+    # 로컬 spool (SENSOR_SPOOL_DIR 가 없으면 spool 을 사용하지 않음)
+    SENSOR_SPOOL_DIR: Optional[str] = Field(default=None)
+    SENSOR_SPOOL_LATENCY_BUDGET: float = Field(default=1.0)  # DB 저장 허용 시간 (초)
+    SENSOR_SPOOL_SEGMENT_BYTES: int = Field(default=16 * 1024 * 1024)
+    SENSOR_SPOOL_FSYNC_INTERVAL: float = Field(default=0.005)  # fsync 묶음 주기 (초)
+    SENSOR_SPOOL_REPLAY_INTERVAL: float = Field(default=1.0)  # 재처리 주기 (초)
+    SENSOR_SPOOL_REPLAY_BATCH_SIZE: int = Field(default=1000)
+
+    # 측정 history 저장소 (timescale: TimescaleDB, columnar: 로컬 컬럼 파일 - edge 배포용)
+    SENSOR_HISTORY_BACKEND: Literal["timescale", "columnar"] = Field(default="timescale")
+    SENSOR_COLUMNAR_DIR: str = Field(default="./data/columnar")
+    SENSOR_COLUMNAR_SEGMENT_ROWS: int = Field(default=65536)  # segment 당 최대 행 수
+    SENSOR_COLUMNAR_MERGE_ROWS: int = Field(default=4096)  # 기존 segment 에 합치는 늦은 값 최대 행 수
+
+    # 격자 조회 한 번에 허용하는 최대 칸 수 (수조 수 x bucket 수)
+    SENSOR_GRID_MAX_CELLS: int = Field(default=500_000)
+
+    # line protocol 수신 (포트가 없으면 해당 transport 를 열지 않음)
+    SENSOR_LINE_PROTOCOL_HOST: str = Field(default="0.0.0.0")
+    SENSOR_LINE_PROTOCOL_TCP_PORT: Optional[int] = Field(default=None)
+    SENSOR_LINE_PROTOCOL_UDP_PORT: Optional[int] = Field(default=None)
+    SENSOR_LINE_PROTOCOL_UDP_QUEUE_SIZE: int = Field(default=1000)  # 처리 대기 datagram 수
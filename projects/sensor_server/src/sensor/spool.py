@@ -0,0 +1,392 @@
+import asyncio
+import fcntl
+import itertools
+import logging
+import os
+import struct
+import zlib
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Awaitable, Callable, List, Optional
+
+from src import metrics
+from src.exceptions import SensorAppException
+from src.sensor.domains import WaterTankSensorRecord, WaterTankSensorRecordContent
+from src.sensor.settings import SensorSettings
+
+logger = logging.getLogger(__name__)
+
+# frame = header(payload 길이, payload crc32) + payload
+FRAME_HEADER = struct.Struct("<II")
+# payload = tank_id, recorded_at(epoch 초), temperature, ph, dissolved_oxygen, salinity
+RECORD = struct.Struct("<qddddd")
+FRAME_SIZE = FRAME_HEADER.size + RECORD.size
+
+SEGMENT_SUFFIX = ".spool"
+REJECTED_SUFFIX = ".rejected"
+
+
+def encode_frame(record: WaterTankSensorRecord) -> bytes:
+    """측정 값 하나를 CRC 가 포함된 frame 으로 변환"""
+    content = record.content
+    payload = RECORD.pack(
+        record.tank_id,
+        content.recorded_at.timestamp(),
+        content.temperature,
+        content.ph,
+        content.dissolved_oxygen,
+        content.salinity,
+    )
+    return FRAME_HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+
+
+def decode_frames(data: bytes) -> List[WaterTankSensorRecord]:
+    """segment 내용을 측정 값 리스트로 변환
+
+    마지막 frame 이 잘렸거나(쓰는 도중 종료) CRC 가 맞지 않으면 그 이후는 버립니다.
+    """
+    records = []
+    offset = 0
+    while offset + FRAME_HEADER.size <= len(data):
+        length, crc = FRAME_HEADER.unpack_from(data, offset)
+        payload = data[offset + FRAME_HEADER.size : offset + FRAME_HEADER.size + length]
+        if length != RECORD.size or len(payload) != length or zlib.crc32(payload) != crc:
+            logger.error(f"spool: corrupted frame at offset {offset}, skip the rest")
+            break
+
+        tank_id, recorded_at, temperature, ph, dissolved_oxygen, salinity = (
+            RECORD.unpack(payload)
+        )
+        records.append(
+            WaterTankSensorRecord(
+                tank_id=tank_id,
+                content=WaterTankSensorRecordContent(
+                    temperature=temperature,
+                    ph=ph,
+                    dissolved_oxygen=dissolved_oxygen,
+                    salinity=salinity,
+                    recorded_at=datetime.fromtimestamp(recorded_at, tz=timezone.utc),
+                ),
+            )
+        )
+        offset += FRAME_HEADER.size + length
+    return records
+
+
+class SensorRecordSpool:
+    """DB 에 저장하지 못한 측정 값을 보관하는 로컬 write-ahead spool
+
+    측정 값은 활성 segment 파일에 CRC frame 으로 append 되며,
+    fsync 는 `fsync_interval` 동안 모인 append 를 묶어서 한 번만 수행합니다. (group commit)
+    append 는 자신의 데이터가 fsync 된 이후에 반환되므로, 반환된 측정 값은 프로세스가 종료되어도 유실되지 않습니다.
+
+    활성 segment 가 `segment_bytes` 를 넘거나 재처리를 위해 `seal()` 되면 닫힌 segment 가 되고,
+    SensorRecordSpoolReplayer 가 오래된 segment 부터 DB 에 반영한 뒤 삭제합니다.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        segment_bytes: int = 16 * 1024 * 1024,
+        fsync_interval: float = 0.005,
+        lock_file=None,
+    ):
+        self.directory = Path(directory)
+        # 다른 worker 프로세스가 같은 디렉토리를 쓰지 않도록 잡고 있는 lock (claim_spool_directory)
+        self._lock_file = lock_file
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.segment_bytes = segment_bytes
+        self.fsync_interval = fsync_interval
+
+        self._active_file = None
+        self._active_path: Optional[Path] = None
+        self._dirty_files = []  # 마지막 fsync 이후 기록된 파일
+        self._sync_future: Optional[asyncio.Future] = None
+        self._sync_task: Optional[asyncio.Task] = None
+        self._sync_lock: Optional[asyncio.Lock] = None
+
+        # 이전 실행에서 남은 segment 는 모두 닫힌 segment 로 취급하여 재처리
+        self._sealed: List[Path] = sorted(self.directory.glob(f"*{SEGMENT_SUFFIX}"))
+        self._next_sequence = (
+            int(self._sealed[-1].stem) + 1 if len(self._sealed) > 0 else 0
+        )
+        self._depth = sum(path.stat().st_size // FRAME_SIZE for path in self._sealed)
+        metrics.sensor_spool_records.set(self._depth)
+        if self._depth > 0:
+            logger.info(f"spool: recovered {self._depth} records from {directory}")
+
+    @property
+    def depth(self) -> int:
+        """재처리를 기다리는 측정 값 수"""
+        return self._depth
+
+    async def append(self, records: List[WaterTankSensorRecord]) -> None:
+        """측정 값을 spool 에 기록하고, fsync 가 완료될 때까지 대기"""
+        if len(records) == 0:
+            return
+
+        if self._active_file is not None and self._active_file.tell() >= self.segment_bytes:
+            self.seal()
+        file = self._open_active()
+        file.write(b"".join(encode_frame(record) for record in records))
+        if file not in self._dirty_files:
+            self._dirty_files.append(file)
+
+        self._depth += len(records)
+        metrics.sensor_spool_records.set(self._depth)
+        metrics.sensor_spooled_records.inc(len(records))
+
+        if self._sync_future is None:
+            self._sync_future = asyncio.get_running_loop().create_future()
+            self._sync_task = asyncio.create_task(self._sync(self._sync_future))
+        await asyncio.shield(self._sync_future)
+
+    def seal(self) -> None:
+        """활성 segment 를 닫힌 segment 로 전환합니다. 다음 append 는 새 segment 에 기록됩니다."""
+        if self._active_file is None:
+            return
+        file, path = self._active_file, self._active_path
+        self._active_file, self._active_path = None, None
+        if file.tell() == 0:
+            file.close()
+            path.unlink()
+            return
+        # 재처리 시 읽을 수 있도록 버퍼를 비움 (fsync 는 진행 중인 group commit 이 담당)
+        file.flush()
+        if file not in self._dirty_files:
+            file.close()
+        self._sealed.append(path)
+
+    def sealed_segments(self) -> List[Path]:
+        """재처리할 segment 목록 (오래된 순)"""
+        return list(self._sealed)
+
+    async def read_segment(self, path: Path) -> List[WaterTankSensorRecord]:
+        data = await asyncio.to_thread(path.read_bytes)
+        return decode_frames(data)
+
+    def remove_segment(self, path: Path) -> None:
+        """재처리가 끝난 segment 삭제"""
+        self._forget(path)
+        path.unlink(missing_ok=True)
+
+    def reject_records(self, path: Path, records: List[WaterTankSensorRecord]) -> None:
+        """segment 에서 재처리할 수 없는 측정 값만 확인용 파일(`{seq}.rejected`)로 옮김"""
+        with open(path.with_suffix(REJECTED_SUFFIX), "ab") as file:
+            file.write(b"".join(encode_frame(record) for record in records))
+            file.flush()
+            os.fsync(file.fileno())
+
+    async def close(self) -> None:
+        """남은 데이터를 fsync 하고 활성 segment 를 닫습니다."""
+        while self._sync_future is not None:
+            await asyncio.shield(self._sync_future)
+        self.seal()
+
+    def _forget(self, path: Path) -> None:
+        self._sealed.remove(path)
+        self._depth -= path.stat().st_size // FRAME_SIZE
+        metrics.sensor_spool_records.set(self._depth)
+
+    def _open_active(self):
+        if self._active_file is None:
+            self._active_path = self.directory / f"{self._next_sequence:012d}{SEGMENT_SUFFIX}"
+            self._active_file = open(self._active_path, "ab")
+            self._next_sequence += 1
+        return self._active_file
+
+    async def _sync(self, future: asyncio.Future) -> None:
+        """fsync_interval 동안 모인 append 를 한 번의 fsync 로 디스크에 반영"""
+        await asyncio.sleep(self.fsync_interval)
+        if self._sync_lock is None:
+            self._sync_lock = asyncio.Lock()
+
+        async with self._sync_lock:
+            # 이 시점 이후의 append 는 다음 fsync 에 포함됨
+            self._sync_future = None
+            files, self._dirty_files = self._dirty_files, []
+            try:
+                for file in files:
+                    file.flush()
+                await asyncio.to_thread(fsync_all, [file.fileno() for file in files])
+            except Exception as e:
+                future.set_exception(e)
+            else:
+                future.set_result(None)
+            finally:
+                for file in files:
+                    if file is not self._active_file and file not in self._dirty_files:
+                        file.close()
+
+
+def fsync_all(file_descriptors: List[int]) -> None:
+    for file_descriptor in file_descriptors:
+        os.fsync(file_descriptor)
+
+
+class SensorRecordSpoolReplayer:
+    """spool 에 쌓인 측정 값을 DB 가 복구되면 일괄로 반영하는 백그라운드 작업"""
+
+    def __init__(
+        self,
+        spool: Optional[SensorRecordSpool],
+        writer: Callable[[List[WaterTankSensorRecord]], Awaitable[None]],
+        interval: float = 1.0,
+        batch_size: int = 1000,
+    ):
+        self.spool = spool
+        self.writer = writer
+        self.interval = interval
+        self.batch_size = batch_size
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        if self.spool is None:
+            return
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if self.spool is not None:
+            await self.spool.close()
+
+    async def replay(self) -> int:
+        """닫힌 segment 를 오래된 순으로 DB 에 반영
+
+        저장에 실패하면 해당 segment 는 남겨두고 다음 주기에 다시 시도합니다.
+        저장 로직은 중복 저장에 안전하므로, 일부만 반영된 segment 를 다시 처리해도 됩니다.
+        저장할 수 없는 측정 값(SensorAppException - 삭제된 수조 등)이 섞인 묶음은 반씩 나눠 다시 저장하여,
+        해당 측정 값만 `.rejected` 파일로 옮기고 나머지는 반영합니다.
+
+        Returns:
+            int: 반영된 측정 값 수
+        """
+        if self.spool.depth == 0:
+            return 0
+
+        self.spool.seal()
+        replayed = 0
+        for path in self.spool.sealed_segments():
+            records = await self.spool.read_segment(path)
+            rejected = []
+            for i in range(0, len(records), self.batch_size):
+                batch = records[i : i + self.batch_size]
+                failed = await self._write(batch)
+                replayed += len(batch) - len(failed)
+                rejected.extend(failed)
+            if len(rejected) > 0:
+                logger.error(f"spool: reject {len(rejected)} records in {path.name}")
+                self.spool.reject_records(path, rejected)
+            self.spool.remove_segment(path)
+
+        logger.info(f"spool: replayed {replayed} records")
+        return replayed
+
+    async def _write(
+        self, records: List[WaterTankSensorRecord]
+    ) -> List[WaterTankSensorRecord]:
+        """측정 값 묶음을 저장하고, 저장할 수 없는 측정 값을 반환
+
+        SensorAppException 으로 실패한 묶음은 반으로 나눠 다시 저장합니다. (DB 장애 등 다른 예외는 그대로 전달)
+        """
+        try:
+            await self.writer(records)
+        except SensorAppException as e:
+            if len(records) == 1:
+                logger.warning(
+                    f"spool: reject record (tank_id={records[0].tank_id}, {e.message})"
+                )
+                return records
+            middle = len(records) // 2
+            return await self._write(records[:middle]) + await self._write(
+                records[middle:]
+            )
+        metrics.sensor_spool_replayed_records.inc(len(records))
+        return []
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.replay()
+            except Exception as e:
+                logger.warning(f"spool: replay failed, retry later ({e!r})")
+
+
+def claim_spool_directory(base_directory: str):
+    """worker 프로세스 전용 spool 디렉토리 확보
+
+    lock 을 잡지 못한 slot 중 가장 작은 번호를 사용합니다. (slot 0 은 base_directory 자체)
+    프로세스가 종료되면 lock 이 풀리므로, 재시작한 worker 가 같은 slot 의 남은 segment 를 재처리합니다.
+    worker 수가 줄어 다시 사용되지 않는 slot 의 segment 는 `adopt_orphaned_segments` 로 가져옵니다.
+
+    Returns:
+        (spool 디렉토리, lock 파일 - 프로세스가 살아있는 동안 열어두어야 함)
+    """
+    base = Path(base_directory)
+    base.mkdir(parents=True, exist_ok=True)
+    for slot in itertools.count():
+        lock_file = open(base / f".worker-{slot}.lock", "w")
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            lock_file.close()
+            continue
+        adopt_orphaned_segments(base, slot)
+        return str(slot_directory(base, slot)), lock_file
+
+
+def slot_directory(base: Path, slot: int) -> Path:
+    return base if slot == 0 else base / f"worker-{slot}"
+
+
+def adopt_orphaned_segments(base: Path, slot: int) -> int:
+    """소유한 worker 가 없는 다른 slot 의 segment 를 `slot` 디렉토리로 옮김
+
+    lock 을 잡을 수 있는 slot 은 살아있는 worker 가 없는 slot 이므로, 그 안의 segment 를
+    이어지는 번호로 rename 하여 이 worker 의 spool 이 재처리하게 합니다.
+    (SensorRecordSpool 생성 전에 호출해야 함, 같은 파일 시스템 안의 rename 이므로 도중에 종료되어도 유실되지 않음)
+
+    Returns:
+        int: 옮긴 segment 수
+    """
+    directory = slot_directory(base, slot)
+    directory.mkdir(parents=True, exist_ok=True)
+    segments = sorted(directory.glob(f"*{SEGMENT_SUFFIX}"))
+    sequence = int(segments[-1].stem) + 1 if len(segments) > 0 else 0
+
+    slots = {0} | {
+        int(path.name.removeprefix("worker-"))
+        for path in base.glob("worker-*")
+        if path.is_dir() and path.name.removeprefix("worker-").isdigit()
+    }
+    adopted = 0
+    for other in sorted(slots - {slot}):
+        with open(base / f".worker-{other}.lock", "w") as lock_file:
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                continue
+            for path in sorted(slot_directory(base, other).glob(f"*{SEGMENT_SUFFIX}")):
+                path.rename(directory / f"{sequence:012d}{SEGMENT_SUFFIX}")
+                sequence += 1
+                adopted += 1
+
+    if adopted > 0:
+        logger.info(f"spool: adopted {adopted} orphaned segments into {directory}")
+    return adopted
+
+
+def create_spool(settings: SensorSettings) -> Optional[SensorRecordSpool]:
+    """설정에 spool 디렉토리가 있는 경우에만 spool 생성"""
+    if settings.SENSOR_SPOOL_DIR is None:
+        return None
+    directory, lock_file = claim_spool_directory(settings.SENSOR_SPOOL_DIR)
+    return SensorRecordSpool(
+        directory=directory,
+        segment_bytes=settings.SENSOR_SPOOL_SEGMENT_BYTES,
+        fsync_interval=settings.SENSOR_SPOOL_FSYNC_INTERVAL,
+        lock_file=lock_file,
+    )
@@ -0,0 +1,57 @@
+"""동시에 들어온 같은 조회를 하나로 합치는 single-flight
+
+캐시(시설 인덱스)가 비어 있을 때 게이트웨이가 여러 수조의 측정 값을 한꺼번에 보내거나,
+여러 대시보드가 같은 집계를 동시에 요청하면 같은 쿼리가 동시에 여러 번 실행됩니다.
+같은 key 로 실행 중인 호출이 있으면 새로 실행하지 않고 그 결과를 함께 기다립니다.
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable, TypeVar
+
+from src import metrics
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """key 별로 실행 중인 호출을 공유
+
+    - 실행은 별도 task 로 하고 호출자는 asyncio.shield 로 기다리므로, 한 호출자가 취소되어도
+      다른 호출자가 기다리는 실행은 취소되지 않습니다.
+    - 실행이 끝나면 (성공 / 실패 모두) key 를 지우므로 결과를 캐시하지 않습니다.
+    - 실행 task 는 처음 호출한 요청의 context 를 복사해서 실행됩니다. (DB 왕복 횟수 등은 첫 요청에 집계)
+
+    example:
+        tank = await self._lookups.do(
+            ("tank", tank_code),
+            lambda: self.water_tank_repository.get_by(tank_code=tank_code),
+        )
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+        self._coalesced = metrics.singleflight_coalesced_calls.labels(name)
+        self._executed = metrics.singleflight_executed_calls.labels(name)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+            self._executed.inc()
+        else:
+            self._coalesced.inc()
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            # 모든 호출자가 취소된 경우 예외가 처리되지 않았다는 경고가 남지 않도록 조회
+            task.exception()
+
+    def __len__(self) -> int:
+        """실행 중인 key 수"""
+        return len(self._calls)
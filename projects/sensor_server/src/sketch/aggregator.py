@@ -0,0 +1,144 @@
+"""수집 경로의 분위수 sketch 갱신
+
+측정 값이 들어오면 항목별 값을 DDSketch bin 으로 바꿔 (수조, 항목, bin) 을 하나의 정수(flat index)로 만들어
+bucket(기본 1시간)별 목록에 모아두고, flush 주기마다 bin 별 개수로 합친 sketch 를 저장된 sketch 에 더합니다.
+
+- 수집 경로의 비용은 묶음 크기에 비례하는 numpy 연산뿐이고, DB 쓰기는 flush 주기마다 bucket 당 한 번입니다.
+- sketch 는 개수의 합으로 합쳐지므로 worker 가 여러 개여도 각자 flush 한 결과가 같은 행에 더해집니다.
+- 아직 flush 되지 않은 값(최대 flush 주기)은 분위수 조회에 반영되지 않습니다.
+- history 에 새로 저장된 측정 값만 전달받으므로 (SensorRecordService history_listeners), 재시도 / spool 재처리 /
+  중복 전송된 값은 다시 세지 않습니다. (분위수 오차는 src.sketch.ddsketch 의 오차 한계만 따름)
+"""
+
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from datetime import timedelta
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src import metrics
+from src.analytics.executor import AnalyticsExecutor
+from src.sensor.domains import EPOCH, METRICS, WaterTankSensorRecordColumns
+from src.sketch.ddsketch import DDSketchMapping
+from src.sketch.domains import WaterTankSketch
+from src.sketch.repository import WaterTankSketchRepository
+
+logger = logging.getLogger(__name__)
+
+
+class SketchAggregator:
+    """수조 / 항목별 분위수 sketch 를 갱신하는 listener (SensorRecordService history_listeners)"""
+
+    def __init__(
+        self,
+        repository: WaterTankSketchRepository,
+        mapping: DDSketchMapping,
+        bucket: int = 3600,
+        flush_interval: float = 60.0,
+        enabled: bool = True,
+        analytics: Optional[AnalyticsExecutor] = None,
+    ):
+        self.repository = repository
+        self.mapping = mapping
+        self.bucket = bucket
+        self.flush_interval = flush_interval
+        self.enabled = enabled
+        self.analytics = analytics or AnalyticsExecutor(enabled=False)
+
+        # bucket 시작 시간(epoch 초) → (flat index, 개수) 배열 목록
+        self.pending: Dict[int, List[Tuple[np.ndarray, np.ndarray]]] = defaultdict(list)
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        if self.enabled:
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        """flush 를 멈추고 남은 값을 저장"""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await self.flush()
+
+    async def _loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    def on_records(self, columns: WaterTankSensorRecordColumns) -> None:
+        if not self.enabled or len(columns) == 0:
+            return
+        values = np.stack([columns.metric(name) for name in METRICS], axis=1)
+        bins = self.mapping.to_bins(values)
+        flat = (
+            columns.tank_id[:, None] * len(METRICS) + np.arange(len(METRICS))
+        ) * self.mapping.bins + bins
+        bucket_at = columns.recorded_at // self.bucket * self.bucket
+
+        valid = bins >= 0  # NaN 제외
+        for start in np.unique(bucket_at).tolist():
+            indexes = flat[(bucket_at == start)[:, None] & valid]
+            if len(indexes):
+                self.pending[start].append(
+                    (indexes, np.ones(len(indexes), dtype=np.int64))
+                )
+
+    async def flush(self) -> None:
+        """모아둔 값을 bucket 별로 저장된 sketch 에 합침 (실패한 bucket 은 다음 flush 때 다시 시도)"""
+        async with self._lock:
+            pending, self.pending = self.pending, defaultdict(list)
+            for start, parts in sorted(pending.items()):
+                started_at = time.perf_counter()
+                try:
+                    # 합친 뒤 실패하면 합친 결과를 다시 시도
+                    parts = [await self.analytics.run(compact_counts, parts)]
+                    flat, counts = parts[0]
+                    await self.repository.merge_many(
+                        EPOCH + timedelta(seconds=start),
+                        self._to_sketches(start, flat, counts),
+                    )
+                except Exception as e:
+                    logger.warning(f"failed to flush sketches ({e!r})")
+                    self.pending[start].extend(parts)
+                    continue
+                metrics.sketch_flush_seconds.observe(time.perf_counter() - started_at)
+                metrics.sketch_flushed_values.inc(int(counts.sum()))
+
+    def _to_sketches(
+        self, start: int, flat: np.ndarray, counts: np.ndarray
+    ) -> List[WaterTankSketch]:
+        """정렬된 flat index 를 (수조, 항목)별 sparse sketch 로"""
+        series, bins = np.divmod(flat, self.mapping.bins)
+        boundaries = np.flatnonzero(np.r_[True, series[1:] != series[:-1], True])
+        tank_ids, metric_indexes = np.divmod(series[boundaries[:-1]], len(METRICS))
+        bucket_at = EPOCH + timedelta(seconds=start)
+        return [
+            WaterTankSketch(
+                tank_id=int(tank_ids[i]),
+                bucket_at=bucket_at,
+                metric=METRICS[metric_indexes[i]],
+                bins=bins[begin:end].tolist(),
+                counts=counts[begin:end].tolist(),
+            )
+            for i, (begin, end) in enumerate(
+                zip(boundaries[:-1].tolist(), boundaries[1:].tolist())
+            )
+        ]
+
+
+def compact_counts(
+    parts: List[Tuple[np.ndarray, np.ndarray]],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """같은 flat index 의 개수를 합침 (flat index 오름차순, AnalyticsExecutor 에서 실행)"""
+    flat, inverse = np.unique(
+        np.concatenate([indexes for indexes, _ in parts]), return_inverse=True
+    )
+    counts = np.bincount(
+        inverse, weights=np.concatenate([counts for _, counts in parts])
+    ).astype(np.int64)
+    return flat, counts
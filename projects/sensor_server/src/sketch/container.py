@@ -0,0 +1,49 @@
+from dependency_injector import containers, providers
+
+from src.analytics.container import AnalyticsContainer
+from src.database.container import DatabaseContainer
+from src.facility.container import FacilityContainer
+from src.sketch.aggregator import SketchAggregator
+from src.sketch.ddsketch import DDSketchMapping
+from src.sketch.repository import WaterTankSketchRepository
+from src.sketch.service import SketchService
+from src.sketch.settings import SketchSettings
+
+
+class SketchContainer(containers.DeclarativeContainer):
+    """측정 항목 분위수 sketch"""
+
+    database: DatabaseContainer = providers.Container(DatabaseContainer)
+    facility: FacilityContainer = providers.Container(FacilityContainer)
+    analytics: AnalyticsContainer = providers.Container(AnalyticsContainer)
+
+    settings = providers.Singleton(SketchSettings)
+
+    mapping = providers.Singleton(
+        DDSketchMapping,
+        relative_accuracy=settings.provided.SKETCH_RELATIVE_ACCURACY,
+        min_value=settings.provided.SKETCH_MIN_VALUE,
+        max_value=settings.provided.SKETCH_MAX_VALUE,
+    )
+
+    repository = providers.Singleton(
+        WaterTankSketchRepository, session_factory=database.session_factory
+    )
+
+    aggregator = providers.Singleton(
+        SketchAggregator,
+        repository=repository,
+        mapping=mapping,
+        bucket=settings.provided.SKETCH_BUCKET,
+        flush_interval=settings.provided.SKETCH_FLUSH_INTERVAL,
+        enabled=settings.provided.SKETCH_ENABLED,
+        analytics=analytics.executor,
+    )
+
+    service = providers.Singleton(
+        SketchService,
+        repository=repository,
+        facility_service=facility.service,
+        mapping=mapping,
+        bucket=settings.provided.SKETCH_BUCKET,
+    )
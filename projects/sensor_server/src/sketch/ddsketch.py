@@ -0,0 +1,79 @@
+"""DDSketch (relative-error quantile sketch)
+
+값을 로그 간격 bin 의 개수로만 저장하므로 sketch 끼리는 bin 별 개수를 더하는 것으로 합칠 수 있고(mergeable),
+합친 결과는 원본 값을 모두 모아 만든 sketch 와 같습니다.
+
+오차 한계:
+  - |x| 가 [min_value, max_value] 안이면 분위수 추정 값의 상대 오차는 relative_accuracy(α) 이하입니다.
+    (추정 값 v 와 실제 분위수 x 에 대해 |v - x| <= α * |x|)
+  - |x| < min_value 인 값은 0 으로 모으므로 절대 오차가 min_value 미만입니다.
+  - |x| > max_value 인 값은 마지막 bin 으로 모으므로 max_value 근처의 값으로 추정됩니다.
+
+bin 배치 (bins = 2 * keys + 1):
+  [0, keys)        양수 (key 오름차순)
+  [keys, 2 * keys) 음수 (|x| 의 key 오름차순)
+  2 * keys         0 (|x| < min_value)
+"""
+
+import math
+from typing import Sequence
+
+import numpy as np
+
+
+class DDSketchMapping:
+    """값 ↔ bin 변환과 bin 개수로부터의 분위수 계산 (모든 수조 / 항목이 같은 mapping 을 공유)"""
+
+    def __init__(
+        self,
+        relative_accuracy: float = 0.01,
+        min_value: float = 0.01,
+        max_value: float = 10000.0,
+    ):
+        self.relative_accuracy = relative_accuracy
+        self.min_value = min_value
+        self.max_value = max_value
+
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.min_key = math.ceil(math.log(min_value) / self.log_gamma)
+        self.max_key = math.ceil(math.log(max_value) / self.log_gamma)
+        self.keys = self.max_key - self.min_key + 1
+        self.bins = 2 * self.keys + 1
+        self.zero_bin = 2 * self.keys
+
+        # bin 의 대표 값 (bin 구간 (γ^(k-1), γ^k] 에서 상대 오차가 가장 작은 값)
+        magnitude = 2 * self.gamma ** np.arange(self.min_key, self.max_key + 1) / (
+            self.gamma + 1
+        )
+        self.bin_values = np.concatenate([magnitude, -magnitude, [0.0]])
+        # 값 순서 (작은 값부터): 음수 (|x| 큰 것부터) → 0 → 양수
+        self.order = np.concatenate(
+            [
+                np.arange(2 * self.keys - 1, self.keys - 1, -1),
+                [self.zero_bin],
+                np.arange(self.keys),
+            ]
+        )
+
+    def to_bins(self, values: np.ndarray) -> np.ndarray:
+        """값별 bin (NaN 은 -1)"""
+        magnitude = np.abs(values)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            key = np.ceil(np.log(np.maximum(magnitude, self.min_value)) / self.log_gamma)
+        offset = np.clip(np.nan_to_num(key), self.min_key, self.max_key).astype(
+            np.int64
+        ) - self.min_key
+        bins = np.where(values > 0, offset, self.keys + offset)
+        bins = np.where(magnitude < self.min_value, self.zero_bin, bins)
+        return np.where(np.isnan(values), -1, bins)
+
+    def quantiles(self, counts: np.ndarray, quantiles: Sequence[float]) -> np.ndarray:
+        """bin 별 개수(길이 bins)로 분위수 추정 (값이 없으면 NaN)"""
+        ordered = counts[self.order]
+        total = ordered.sum()
+        if total == 0:
+            return np.full(len(quantiles), np.nan)
+        rank = np.asarray(quantiles, dtype=np.float64) * (total - 1)
+        position = np.searchsorted(np.cumsum(ordered), rank, side="right")
+        return self.bin_values[self.order][position]
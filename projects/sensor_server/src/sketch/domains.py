@@ -0,0 +1,30 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Literal
+
+SketchScope = Literal["tank", "building", "center"]
+
+
+@dataclass
+class WaterTankSketch:
+    """수조 / bucket / 측정 항목별 DDSketch (0 이 아닌 bin 만 저장)"""
+
+    tank_id: int
+    bucket_at: datetime  # bucket 시작 시간
+    metric: str  # 측정 항목
+    bins: List[int]  # bin 번호 (src.sketch.ddsketch 참고)
+    counts: List[int]  # bin 별 개수
+
+
+@dataclass
+class PercentileResult:
+    """범위(수조 / 동 / 센터)의 측정 항목 분위수"""
+
+    scope: SketchScope
+    scope_id: int
+    metric: str
+    start: datetime  # 조회에 사용한 첫 bucket 시작 시간
+    end: datetime  # 조회에 사용한 마지막 bucket 끝 시간
+    count: int  # 측정 값 수
+    relative_accuracy: float  # 분위수 추정 값의 상대 오차 한계
+    percentiles: Dict[float, float]  # 분위수(0~1) → 추정 값 (측정 값이 없으면 NaN)
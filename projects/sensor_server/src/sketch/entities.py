@@ -0,0 +1,53 @@
+from datetime import datetime
+from typing import List
+
+from sqlalchemy import VARCHAR, BigInteger, DateTime, Integer
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.database.base import Base
+from src.sketch.domains import WaterTankSketch
+
+
+class WaterTankSketchEntity(Base):
+    """수조 / bucket / 측정 항목별 DDSketch 저장"""
+
+    __tablename__ = "water_tank_sketch"
+
+    tank_id: Mapped[int] = mapped_column(primary_key=True)
+    bucket_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), primary_key=True
+    )
+    metric: Mapped[str] = mapped_column(VARCHAR(32), primary_key=True)
+    bins: Mapped[List[int]] = mapped_column(ARRAY(Integer))
+    counts: Mapped[List[int]] = mapped_column(ARRAY(BigInteger))
+
+    @staticmethod
+    def from_domain(domain: WaterTankSketch):
+        """도메인 객체를 엔티티로 변환합니다."""
+        return WaterTankSketchEntity(
+            tank_id=domain.tank_id,
+            bucket_at=domain.bucket_at,
+            metric=domain.metric,
+            bins=domain.bins,
+            counts=domain.counts,
+        )
+
+    def to_domain(self) -> WaterTankSketch:
+        """엔티티 객체를 도메인 객체로 변환합니다."""
+        return WaterTankSketch(
+            tank_id=self.tank_id,
+            bucket_at=self.bucket_at,
+            metric=self.metric,
+            bins=self.bins,
+            counts=self.counts,
+        )
+
+    def update(self, domain: WaterTankSketch):
+        """도메인 객체로 엔티티의 값을 업데이트합니다."""
+        self.bins = domain.bins
+        self.counts = domain.counts
+
+    def primary_key(self) -> tuple[int, datetime, str]:
+        """엔티티의 기본 키를 반환합니다."""
+        return self.tank_id, self.bucket_at, self.metric
@@ -0,0 +1,103 @@
+from dataclasses import asdict
+from datetime import datetime
+from typing import List
+
+import numpy as np
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
+
+from src.database.repository import BaseRepository
+from src.sketch.domains import WaterTankSketch
+from src.sketch.entities import WaterTankSketchEntity
+
+# pg_advisory_xact_lock(class, key) 의 class (다른 advisory lock 과 겹치지 않도록)
+SKETCH_LOCK_CLASS = 4601
+
+
+def merge_sketch(bins: List[int], counts: List[int], other: WaterTankSketch):
+    """두 sparse sketch 를 bin 별 개수 합으로 합침"""
+    merged_bins, inverse = np.unique(
+        np.concatenate([bins, other.bins]).astype(np.int64), return_inverse=True
+    )
+    merged_counts = np.zeros(len(merged_bins), dtype=np.int64)
+    np.add.at(merged_counts, inverse, np.concatenate([counts, other.counts]))
+    return merged_bins.tolist(), merged_counts.tolist()
+
+
+class WaterTankSketchRepository(BaseRepository[tuple, WaterTankSketch]):
+    """수조 / bucket / 측정 항목별 DDSketch 저장"""
+
+    entity = WaterTankSketchEntity
+
+    async def merge_many(
+        self, bucket_at: datetime, sketches: List[WaterTankSketch]
+    ) -> None:
+        """같은 bucket 의 sketch 들을 저장된 sketch 에 합쳐 저장
+
+        여러 worker 가 같은 bucket 을 동시에 합치지 않도록 bucket 단위 advisory lock 을 잡은 뒤,
+        저장된 sketch 를 읽어 합치고 한 번의 multi-row upsert 로 저장합니다.
+        """
+        if len(sketches) == 0:
+            return
+        async with self.session_factory() as session:
+            await session.execute(
+                select(
+                    func.pg_advisory_xact_lock(
+                        SKETCH_LOCK_CLASS, int(bucket_at.timestamp()) % 2**31
+                    )
+                )
+            )
+            keys = [(sketch.tank_id, sketch.metric) for sketch in sketches]
+            result = await session.execute(
+                select(
+                    self.entity.tank_id,
+                    self.entity.metric,
+                    self.entity.bins,
+                    self.entity.counts,
+                ).where(
+                    self.entity.bucket_at == bucket_at,
+                    tuple_(self.entity.tank_id, self.entity.metric).in_(keys),
+                )
+            )
+            stored = {(row.tank_id, row.metric): row for row in result}
+
+            rows = []
+            for sketch in sketches:
+                if row := stored.get((sketch.tank_id, sketch.metric)):
+                    bins, counts = merge_sketch(row.bins, row.counts, sketch)
+                    sketch = WaterTankSketch(
+                        tank_id=sketch.tank_id,
+                        bucket_at=sketch.bucket_at,
+                        metric=sketch.metric,
+                        bins=bins,
+                        counts=counts,
+                    )
+                rows.append(asdict(sketch))
+
+            stmt = insert(self.entity)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[
+                    self.entity.tank_id,
+                    self.entity.bucket_at,
+                    self.entity.metric,
+                ],
+                set_={"bins": stmt.excluded.bins, "counts": stmt.excluded.counts},
+            )
+            await session.execute(stmt, rows)
+            await session.commit()
+
+    async def find_range(
+        self, tank_ids: List[int], metric: str, start: datetime, end: datetime
+    ) -> List[WaterTankSketch]:
+        """수조들의 [start, end) 구간 bucket sketch 조회"""
+        if len(tank_ids) == 0:
+            return []
+        async with self.session_factory.reader() as session:
+            stmt = select(self.entity).where(
+                self.entity.tank_id.in_(tank_ids),
+                self.entity.metric == metric,
+                self.entity.bucket_at >= start,
+                self.entity.bucket_at < end,
+            )
+            result = await session.execute(stmt)
+            return [entity.to_domain() for entity in result.scalars().all()]
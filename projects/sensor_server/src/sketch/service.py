@@ -0,0 +1,115 @@
+from datetime import datetime, timedelta
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from src.exceptions import InvalidRequestException
+from src.facility.service import FacilityService
+from src.sensor.domains import EPOCH, METRICS
+from src.sketch.ddsketch import DDSketchMapping
+from src.sketch.domains import PercentileResult, WaterTankSketch
+from src.sketch.repository import WaterTankSketchRepository
+
+
+def merge_counts(mapping: DDSketchMapping, sketches: List[WaterTankSketch]) -> np.ndarray:
+    """sparse sketch 들을 하나의 bin 별 개수 배열(길이 mapping.bins)로 합침"""
+    counts = np.zeros(mapping.bins, dtype=np.int64)
+    if sketches:
+        np.add.at(
+            counts,
+            np.concatenate([sketch.bins for sketch in sketches]).astype(np.int64),
+            np.concatenate([sketch.counts for sketch in sketches]).astype(np.int64),
+        )
+    return counts
+
+
+class SketchService:
+    """저장된 sketch 를 합쳐 수조 / 동 / 센터 단위 분위수를 계산
+
+    raw history 를 읽지 않고 구간의 bucket sketch 만 합치므로, 조회 비용은 측정 값 수가 아니라
+    (수조 수 x bucket 수) 에 비례합니다.
+    """
+
+    def __init__(
+        self,
+        repository: WaterTankSketchRepository,
+        facility_service: FacilityService,
+        mapping: DDSketchMapping,
+        bucket: int = 3600,
+    ):
+        self.repository = repository
+        self.facility_service = facility_service
+        self.mapping = mapping
+        self.bucket = bucket
+
+    async def percentiles(
+        self,
+        metric: str,
+        start: datetime,
+        end: datetime,
+        quantiles: Sequence[float],
+        tank_code: Optional[str] = None,
+        building_code: Optional[str] = None,
+        center_id: Optional[int] = None,
+    ) -> PercentileResult:
+        """범위의 [start, end) 구간 측정 항목 분위수
+
+        구간은 sketch bucket 경계로 넓혀집니다. (start 는 내림, end 는 올림)
+
+        Args:
+            metric: 측정 항목
+            quantiles: 분위수 목록 (0~1)
+            tank_code / building_code / center_id: 범위 (하나만 지정)
+        Raises:
+            InvalidRequestException: 항목, 분위수, 구간, 범위가 올바르지 않을 경우 발생
+            NotFoundException: 범위의 수조 / 동 / 센터가 존재하지 않을 경우 발생
+        """
+        if metric not in METRICS:
+            raise InvalidRequestException(f"알 수 없는 측정 항목입니다: {metric}")
+        if not quantiles or any(not 0 <= q <= 1 for q in quantiles):
+            raise InvalidRequestException("분위수는 0 이상 1 이하여야 합니다.")
+        if start >= end:
+            raise InvalidRequestException("start 는 end 보다 이전이어야 합니다.")
+        scopes = [s for s in (tank_code, building_code, center_id) if s is not None]
+        if len(scopes) != 1:
+            raise InvalidRequestException(
+                "tank_code, building_code, center_id 중 하나만 지정해야 합니다."
+            )
+
+        if tank_code is not None:
+            tank = await self.facility_service.get_water_tank_by_code(tank_code)
+            scope, scope_id, tanks = "tank", tank.tank_id, [tank]
+        elif building_code is not None:
+            building = await self.facility_service.get_water_tank_building_by_code(
+                building_code
+            )
+            tanks = await self.facility_service.find_water_tanks_by_building_code(
+                building_code
+            )
+            scope, scope_id = "building", building.building_id
+        else:
+            tanks = await self.facility_service.find_water_tanks_by_center_id(center_id)
+            scope, scope_id = "center", center_id
+
+        first = int((start - EPOCH).total_seconds()) // self.bucket * self.bucket
+        last = -(-int((end - EPOCH).total_seconds()) // self.bucket) * self.bucket
+        start = EPOCH + timedelta(seconds=first)
+        end = EPOCH + timedelta(seconds=last)
+        sketches = await self.repository.find_range(
+            [tank.tank_id for tank in tanks], metric, start, end
+        )
+
+        counts = merge_counts(self.mapping, sketches)
+        values = self.mapping.quantiles(counts, quantiles)
+        return PercentileResult(
+            scope=scope,
+            scope_id=scope_id,
+            metric=metric,
+            start=start,
+            end=end,
+            count=int(counts.sum()),
+            relative_accuracy=self.mapping.relative_accuracy,
+            percentiles={
+                float(q): float(value) for q, value in zip(quantiles, values.tolist())
+            },
+        )
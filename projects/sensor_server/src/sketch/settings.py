@@ -0,0 +1,15 @@
+from pydantic_settings import BaseSettings
+from pydantic import Field
+
+
+class SketchSettings(BaseSettings):
+    SKETCH_ENABLED: bool = Field(default=True)
+    # 분위수 추정 값의 상대 오차 한계 (0.01 = 1%)
+    SKETCH_RELATIVE_ACCURACY: float = Field(default=0.01)
+    # |값| 이 이 범위 밖이면 오차 한계가 보장되지 않음 (min 미만은 0, max 초과는 max 로 모음)
+    SKETCH_MIN_VALUE: float = Field(default=0.01)
+    SKETCH_MAX_VALUE: float = Field(default=10000.0)
+    # sketch 를 나누는 시간 bucket (초)
+    SKETCH_BUCKET: int = Field(default=3600)
+    # 수집된 값을 DB 의 sketch 에 합치는 주기 (초)
+    SKETCH_FLUSH_INTERVAL: float = Field(default=60.0)
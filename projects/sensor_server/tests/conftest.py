@@ -5,6 +5,7 @@ from src.sensor.container import SensorContainer
 from src.facility.container import FacilityContainer
 from testcontainers.postgres import PostgresContainer
 
+import gc
 import logging
 from pathlib import Path
 
@@ -68,6 +69,20 @@ def pytest_collection_modifyitems(items):
         async_test.add_marker(session_scope_marker, append=False)
 
 
+@pytest.fixture
+def given_frozen_startup_heap():
+    """webapp.app lifespan 과 같이 시작 시점까지의 객체를 full GC 대상에서 제외
+
+    앱은 시작을 마친 뒤 `gc.collect()` → `gc.freeze()` 를 호출하므로, 운영 중 full GC 는 시작 이후 만든 객체만 훑습니다.
+    테스트 프로세스는 앞선 테스트가 남긴 객체로 힙이 앱보다 훨씬 크므로, event loop 가 멈추는 시간을 재는 테스트는
+    이 fixture 로 앱과 같은 GC 조건을 만든 뒤 측정합니다. (종료 시 unfreeze 하여 다음 테스트에 영향을 주지 않음)
+    """
+    gc.collect()
+    gc.freeze()
+    yield
+    gc.unfreeze()
+
+
 @pytest.fixture(scope="session")
 def given_postgres_container():
     """테스트용 timescale 도커 컨테이너 Instance 생성
@@ -0,0 +1,160 @@
+import logging
+import time
+
+import pytest
+from testcontainers.postgres import PostgresContainer
+
+from src.database.session_factory import SessionFactory
+from src.database.settings import DatabaseSettings
+from src.facility.domains import WaterTankCenter
+from src.facility.repository import WaterTankCenterRepository
+from src.sensor.repository import (
+    WaterTankSensorRecordHistoryRepository,
+    WaterTankSensorRecordRepository,
+)
+
+
+@pytest.fixture(scope="module")
+def given_replica_container():
+    """테스트용 read replica 컨테이너
+
+    실제 복제는 하지 않고, 조회가 어느 쪽으로 가는지 확인하기 위한 별도의 데이터베이스로 사용합니다.
+    """
+    with PostgresContainer(
+        image="timescale/timescaledb-ha:pg16",
+        username="postgres",
+        password="password",
+        dbname="postgres",
+        port=5432,
+    ) as replica_container:
+        yield replica_container
+
+
+def create_settings(
+    primary: PostgresContainer, replica: PostgresContainer, **kwargs
+) -> DatabaseSettings:
+    return DatabaseSettings(
+        DB_TYPE="postgresql",
+        DB_NAME=primary.dbname,
+        DB_USER=primary.username,
+        DB_PASSWORD=primary.password,
+        DB_HOST=primary.get_container_host_ip(),
+        DB_PORT=primary.get_exposed_port(5432),
+        DB_READ_HOST=replica.get_container_host_ip(),
+        DB_READ_PORT=replica.get_exposed_port(5432),
+        DB_READ_LAG_CHECK_INTERVAL=0,
+        **kwargs,
+    )
+
+
+@pytest.fixture
+async def given_replica_center(given_replica_container: PostgresContainer):
+    """replica 에만 존재하는 센터"""
+    replica_settings = DatabaseSettings(
+        DB_TYPE="postgresql",
+        DB_NAME=given_replica_container.dbname,
+        DB_USER=given_replica_container.username,
+        DB_PASSWORD=given_replica_container.password,
+        DB_HOST=given_replica_container.get_container_host_ip(),
+        DB_PORT=given_replica_container.get_exposed_port(5432),
+    )
+    replica_session_factory = SessionFactory(replica_settings)
+    await replica_session_factory.create_database()
+
+    center = WaterTankCenter.new(center_name="replica_center")
+    await WaterTankCenterRepository(replica_session_factory).create(center)
+    yield center
+    await replica_session_factory.drop_database()
+
+
+async def test_read_routes_to_replica(
+    given_postgres_container: PostgresContainer,
+    given_replica_container: PostgresContainer,
+    given_replica_center: WaterTankCenter,
+    initialize_database,
+):
+    """조회는 replica 로, primary() 컨텍스트 안에서는 primary 로"""
+    session_factory = SessionFactory(
+        create_settings(given_postgres_container, given_replica_container)
+    )
+    repository = WaterTankCenterRepository(session_factory)
+
+    assert await repository.find_all() == [given_replica_center]
+    assert await repository.count_by(center_name="replica_center") == 1
+
+    with session_factory.primary():
+        assert await repository.find_all() == []
+
+
+async def test_read_falls_back_to_primary_when_replica_lags(
+    given_postgres_container: PostgresContainer,
+    given_replica_container: PostgresContainer,
+    given_replica_center: WaterTankCenter,
+    initialize_database,
+):
+    """replica 의 lag 이 허용치를 넘으면 조회도 primary 로"""
+    session_factory = SessionFactory(
+        create_settings(
+            given_postgres_container,
+            given_replica_container,
+            DB_READ_MAX_LAG_SECONDS=-1,
+        )
+    )
+    repository = WaterTankCenterRepository(session_factory)
+
+    assert await repository.find_all() == []
+
+
+async def test_warmup_fills_pool_without_writing(
+    given_postgres_container: PostgresContainer,
+    initialize_database,
+    caplog,
+):
+    """warmup 은 커넥션만 열어두고 데이터는 바꾸지 않음 (FK 에 걸리는 예시 값도 경고 없이 준비)"""
+    session_factory = SessionFactory(
+        DatabaseSettings(
+            DB_TYPE="postgresql",
+            DB_NAME=given_postgres_container.dbname,
+            DB_USER=given_postgres_container.username,
+            DB_PASSWORD=given_postgres_container.password,
+            DB_HOST=given_postgres_container.get_container_host_ip(),
+            DB_PORT=given_postgres_container.get_exposed_port(5432),
+        )
+    )
+    repository = WaterTankSensorRecordRepository(session_factory)
+    history_repository = WaterTankSensorRecordHistoryRepository(session_factory)
+
+    with caplog.at_level(logging.WARNING, logger="src.database.session_factory"):
+        await session_factory.warmup(
+            connections=2,
+            statements=[
+                *repository.warmup_statements(),
+                *history_repository.warmup_statements(),
+            ],
+        )
+
+    assert caplog.records == []
+    assert session_factory._engine.pool.checkedin() == 2
+    assert await repository.find_all() == []
+    assert await history_repository.find_all() == []
+
+
+async def test_reader_falls_back_to_primary_when_replica_is_unreachable():
+    """접속할 수 없는 replica 는 lag 초과로 표시하고 primary 로 조회 (포트 1 은 열려 있지 않음)"""
+    session_factory = SessionFactory(
+        DatabaseSettings(
+            DB_NAME="sensor",
+            DB_USER="sensor",
+            DB_PASSWORD="sensor",
+            DB_HOST="127.0.0.1",
+            DB_READ_HOST="127.0.0.1",
+            DB_READ_PORT=1,
+            DB_READ_LAG_CHECK_INTERVAL=60.0,
+        )
+    )
+    # 직전 lag 확인에서는 replica 가 정상이었음
+    session_factory._replica_checked_at = time.monotonic()
+    session_factory._replica_fresh = True
+
+    assert await session_factory._connect_replica() is session_factory._session_factory
+    assert not await session_factory._is_replica_fresh()
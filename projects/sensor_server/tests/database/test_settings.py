@@ -0,0 +1,26 @@
+import pytest
+
+from src.database.settings import DatabaseSettings
+
+
+def create_settings(**kwargs) -> DatabaseSettings:
+    return DatabaseSettings(
+        DB_NAME="sensor", DB_USER="sensor", DB_PASSWORD="sensor", DB_HOST="localhost", **kwargs
+    )
+
+
+def test_pool_options_without_budget():
+    assert create_settings(DB_POOL_SIZE=7).pool_options()["pool_size"] == 7
+
+
+def test_pool_options_divides_budget_by_workers():
+    """worker 당 몫에서 풀 밖의 커넥션(LISTEN, leader lock)을 뺀 만큼이 풀 크기"""
+    options = create_settings(DB_CONNECTION_BUDGET=20, WEB_CONCURRENCY=4).pool_options()
+
+    assert options["pool_size"] == 3
+    assert options["max_overflow"] == 0
+
+
+def test_pool_options_rejects_too_small_budget():
+    with pytest.raises(ValueError):
+        create_settings(DB_CONNECTION_BUDGET=8, WEB_CONCURRENCY=4).pool_options()
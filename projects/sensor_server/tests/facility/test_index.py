@@ -0,0 +1,138 @@
+import asyncio
+
+import pytest
+
+from src.facility.container import FacilityContainer
+from src.facility.domains import WaterTank, WaterTankBuilding, WaterTankCenter
+from src.facility.index import FacilityIndex
+from src.facility.repository import (
+    WaterTankBuildingRepository,
+    WaterTankCenterRepository,
+    WaterTankRepository,
+)
+from src.facility.service import FacilityService
+
+
+@pytest.fixture
+def given_water_tank_center_repository(
+    given_facility_container: FacilityContainer,
+    initialize_database,
+):
+    return given_facility_container.water_tank_center_repository()
+
+
+@pytest.fixture
+def given_water_tank_building_repository(
+    given_facility_container: FacilityContainer,
+):
+    return given_facility_container.water_tank_building_repository()
+
+
+@pytest.fixture
+def given_water_tank_repository(
+    given_facility_container: FacilityContainer,
+):
+    return given_facility_container.water_tank_repository()
+
+
+@pytest.fixture
+async def given_center(
+    given_water_tank_center_repository: WaterTankCenterRepository,
+):
+    """테스트용 수조 센터 생성"""
+    center = WaterTankCenter.new(center_name="test_center")
+    await given_water_tank_center_repository.save(center)
+    return center
+
+
+@pytest.fixture
+async def given_building(
+    given_water_tank_building_repository: WaterTankBuildingRepository,
+    given_center: WaterTankCenter,
+):
+    """테스트용 수조 건물 생성"""
+    building = WaterTankBuilding.new(building_name="test_building", center=given_center)
+    await given_water_tank_building_repository.save(building)
+    return building
+
+
+@pytest.fixture
+async def given_tank(
+    given_water_tank_repository: WaterTankRepository,
+    given_building: WaterTankBuilding,
+):
+    """테스트용 수조 생성"""
+    tank = WaterTank.new(tank_name="test_tank", building=given_building)
+    await given_water_tank_repository.save(tank)
+    return tank
+
+
+@pytest.fixture
+async def given_index(given_facility_container: FacilityContainer, given_tank):
+    """LISTEN 중인 시설 인덱스"""
+    index = given_facility_container.index()
+    await index.start()
+    yield index
+    await index.stop()
+
+
+async def wait_until(condition, timeout: float = 3.0):
+    """NOTIFY 가 반영될 때까지 대기"""
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline
+        await asyncio.sleep(0.01)
+
+
+async def test_index_resolves_hierarchy_without_db(
+    given_index: FacilityIndex,
+    given_tank: WaterTank,
+    given_building: WaterTankBuilding,
+    given_center: WaterTankCenter,
+):
+    """적재된 인덱스로 수조 → 동 → 센터 계층 조회"""
+    assert given_index.find_tank_by_code(given_tank.tank_code) == given_tank
+    assert given_index.find_building(given_tank.building_id) == given_building
+    assert given_index.find_center(given_tank.center_id) == given_center
+    assert given_index.find_tanks_of_building(given_building.building_id) == [
+        given_tank
+    ]
+    assert given_index.find_tanks_of_center(given_center.center_id) == [given_tank]
+
+
+async def test_index_applies_notifications(
+    given_index: FacilityIndex,
+    given_water_tank_repository: WaterTankRepository,
+    given_building: WaterTankBuilding,
+    given_tank: WaterTank,
+):
+    """시설 테이블 변경이 NOTIFY 로 인덱스에 반영"""
+    new_tank = WaterTank.new(tank_name="new_tank", building=given_building)
+    await given_water_tank_repository.save(new_tank)
+    await wait_until(lambda: given_index.find_tank_by_code(new_tank.tank_code))
+
+    await given_water_tank_repository.update_field(
+        given_tank.tank_id, tank_code="renamed_code"
+    )
+    await wait_until(lambda: given_index.find_tank_by_code("renamed_code"))
+    assert given_index.find_tank_by_code(given_tank.tank_code) is None
+
+    await given_water_tank_repository.delete(new_tank.tank_id)
+    await wait_until(lambda: given_index.find_tank(new_tank.tank_id) is None)
+
+
+async def test_service_uses_index_hierarchy(
+    given_index: FacilityIndex,
+    given_facility_container: FacilityContainer,
+    given_tank: WaterTank,
+    given_building: WaterTankBuilding,
+    given_center: WaterTankCenter,
+):
+    """서비스의 계층 조회"""
+    service: FacilityService = given_facility_container.service()
+
+    hierarchy = await service.get_water_tank_hierarchy(given_tank.tank_code)
+
+    assert hierarchy.tank == given_tank
+    assert hierarchy.building == given_building
+    assert hierarchy.center == given_center
@@ -1,5 +1,6 @@
 import pytest
 
+from src.exceptions import InvalidRequestException
 from src.facility.container import FacilityContainer
 from src.facility.domains import WaterTank, WaterTankBuilding, WaterTankCenter
 from src.facility.repository import (
@@ -85,3 +86,44 @@ async def test_tank_get_by_code(
     assert tank.tank_id == given_tank.tank_id
     assert tank.tank_name == given_tank.tank_name
     assert tank.building_id == given_tank.building_id
+
+
+async def test_provision_center(
+    given_service: FacilityService,
+    given_water_tank_center_repository: WaterTankCenterRepository,
+    given_water_tank_building_repository: WaterTankBuildingRepository,
+    given_water_tank_repository: WaterTankRepository,
+):
+    """센터 → 동 → 수조 일괄 생성"""
+    provision = await given_service.provision_center(
+        center_name="bulk_center",
+        buildings=[
+            (f"building_{b}", [f"tank_{t}" for t in range(100)]) for b in range(3)
+        ],
+    )
+
+    assert provision.center.center_id is not None
+    assert [building.building_name for building in provision.buildings] == [
+        f"building_{b}" for b in range(3)
+    ]
+    assert len(provision.tanks) == 300
+    assert await given_water_tank_repository.count_by() == 300
+
+    tank = await given_service.get_water_tank_by_code(provision.tanks[-1].tank_code)
+    assert tank.tank_name == "tank_99"
+    assert tank.building_id == provision.buildings[-1].building_id
+    assert tank.center_id == provision.center.center_id
+
+
+async def test_provision_center_with_duplicated_building(
+    given_service: FacilityService,
+    given_water_tank_center_repository: WaterTankCenterRepository,
+):
+    """중복된 동 이름은 생성 전에 거부"""
+    with pytest.raises(InvalidRequestException):
+        await given_service.provision_center(
+            center_name="bulk_center",
+            buildings=[("building", ["tank_1"]), ("building", ["tank_2"])],
+        )
+
+    assert await given_water_tank_center_repository.count_by() == 0
@@ -0,0 +1,130 @@
+"""수집 API 요청당 tracing 비용 측정
+
+설정(TRACE_*)별로 프로세스를 새로 띄워 (TracerProvider 는 프로세스당 한 번만 설정 가능)
+POST /api/records/water-tank-sensor 를 in-process(ASGI)로 반복 호출하고 요청당 평균 시간을 비교합니다.
+DB 를 사용하지 않도록 SensorRecordService 를 대신하는 가짜 서비스가 DB 조회 대신 span 만 만듭니다.
+span 은 아무 것도 하지 않는 exporter 로 내보냅니다.
+
+example:
+    python tests/load_test/benchmark_tracing.py --requests 5000
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+PROJECT_DIR = Path(__file__).parents[2]
+
+CONFIGS = {
+    "off": {"TRACE_EXPORTER": "none"},
+    "ratio=1.0": {"TRACE_SAMPLE_RATIO": "1.0", "TRACE_SAMPLE_ERRORS": "false"},
+    "ratio=0.1": {"TRACE_SAMPLE_RATIO": "0.1", "TRACE_SAMPLE_ERRORS": "false"},
+    "ratio=0.1+errors": {"TRACE_SAMPLE_RATIO": "0.1", "TRACE_SAMPLE_ERRORS": "true"},
+    "ratio=0.0": {"TRACE_SAMPLE_RATIO": "0.0", "TRACE_SAMPLE_ERRORS": "false"},
+}
+
+
+async def measure(requests: int) -> float:
+    """요청당 평균 처리 시간 (초)"""
+    from dependency_injector import providers
+    from httpx import ASGITransport, AsyncClient
+    from opentelemetry import trace
+    from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult
+
+    from webapp.app import create_app
+    from webapp.container import ApplicationContainer
+    from webapp.settings import TracingSettings
+    from webapp.tracing import create_tracer_provider
+
+    class NullExporter(SpanExporter):
+        def export(self, spans):
+            return SpanExportResult.SUCCESS
+
+    settings = TracingSettings()
+    exporter = None if settings.TRACE_EXPORTER == "none" else NullExporter()
+    trace.set_tracer_provider(create_tracer_provider(settings, exporter=exporter))
+    tracer = trace.get_tracer(__name__)
+
+    class FakeSensorRecordService:
+        async def record_tank_sensor(self, tank_code, content):
+            # 수조 조회 / 최신 값 upsert / 이력 insert 에 해당하는 DB span
+            for name in ("SELECT water_tank", "INSERT latest", "INSERT history"):
+                with tracer.start_as_current_span(name):
+                    pass
+
+    container = ApplicationContainer()
+    container.sensor.service.override(providers.Object(FakeSensorRecordService()))
+    app = create_app(container)
+    body = {
+        "tank_code": "tank_0001",
+        "temperature": 20.5,
+        "ph": 7.1,
+        "dissolved_oxygen": 9.8,
+        "salinity": 30.2,
+        "recorded_at": 1735689600,
+    }
+
+    async with AsyncClient(
+        transport=ASGITransport(app), base_url="http://test"
+    ) as client:
+        for _ in range(min(requests // 10, 500)):  # warmup
+            await client.post("/api/records/water-tank-sensor", json=body)
+        started_at = time.perf_counter()
+        for _ in range(requests):
+            await client.post("/api/records/water-tank-sensor", json=body)
+        elapsed = time.perf_counter() - started_at
+
+    trace.get_tracer_provider().shutdown()
+    return elapsed / requests
+
+
+def run(name: str, args) -> float:
+    env = {
+        # 컨테이너 생성에 필요한 값 (DB 에는 접속하지 않음)
+        "DB_NAME": "sensor",
+        "DB_USER": "sensor",
+        "DB_PASSWORD": "sensor",
+        "DB_HOST": "localhost",
+        **os.environ,
+        "TRACE_EXPORTER": "console",  # none 이 아니면 NullExporter 로 대체
+        **CONFIGS[name],
+        "PYTHONPATH": str(PROJECT_DIR),
+    }
+    result = subprocess.run(
+        [sys.executable, __file__, "--child", "--requests", str(args.requests)],
+        cwd=PROJECT_DIR,
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return json.loads(result.stdout.splitlines()[-1])["seconds"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps({"seconds": asyncio.run(measure(args.requests))}))
+        return
+
+    results = {name: run(name, args) for name in CONFIGS}
+
+    baseline = results["off"]
+    print(f"{'config':>18} {'us/req':>8} {'overhead(us)':>13}")
+    for name, seconds in results.items():
+        print(
+            f"{name:>18} {seconds * 1e6:>8.1f} {(seconds - baseline) * 1e6:>13.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""worker 수에 따른 처리량 측정
+
+worker 수를 1 부터 --max-workers 까지 늘려가며 서버(python -m webapp.server)를 띄우고,
+locustfile.py 로 같은 부하를 준 뒤 초당 처리량과 지연 시간을 표로 출력합니다.
+DB 접속 정보(DB_*)는 환경 변수로 전달합니다.
+
+example:
+    python tests/load_test/benchmark_workers.py --max-workers 4 --users 200 --duration 60
+"""
+
+import argparse
+import csv
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from pathlib import Path
+
+PROJECT_DIR = Path(__file__).parents[2]
+LOCUSTFILE = Path(__file__).parent / "locustfile.py"
+
+
+def wait_until_healthy(url: str, timeout: float = 60.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f"{url}/health", timeout=1):
+                return
+        except OSError:
+            time.sleep(0.5)
+    raise TimeoutError(f"server is not healthy: {url}")
+
+
+def run(workers: int, args) -> dict:
+    env = {**os.environ, "WEB_CONCURRENCY": str(workers), "WEB_PORT": str(args.port)}
+    url = f"http://127.0.0.1:{args.port}"
+    server = subprocess.Popen(
+        [sys.executable, "-m", "webapp.server"], cwd=PROJECT_DIR, env=env
+    )
+    try:
+        wait_until_healthy(url)
+        with tempfile.TemporaryDirectory() as directory:
+            prefix = os.path.join(directory, "result")
+            subprocess.run(
+                [
+                    "locust",
+                    "-f", str(LOCUSTFILE),
+                    "--headless",
+                    "--host", url,
+                    "--users", str(args.users),
+                    "--spawn-rate", str(args.users),
+                    "--run-time", f"{args.duration}s",
+                    "--csv", prefix,
+                    "--only-summary",
+                ],
+                check=True,
+                cwd=PROJECT_DIR,
+            )
+            with open(f"{prefix}_stats.csv") as file:
+                aggregated = next(
+                    row for row in csv.DictReader(file) if row["Name"] == "Aggregated"
+                )
+    finally:
+        server.terminate()
+        server.wait()
+
+    return {
+        "workers": workers,
+        "rps": float(aggregated["Requests/s"]),
+        "p50": float(aggregated["50%"]),
+        "p99": float(aggregated["99%"]),
+        "failures": int(aggregated["Failure Count"]),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count())
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--duration", type=int, default=30, help="worker 수별 측정 시간 (초)")
+    parser.add_argument("--port", type=int, default=8080)
+    args = parser.parse_args()
+
+    results = [run(workers, args) for workers in range(1, args.max_workers + 1)]
+
+    baseline = results[0]["rps"] or 1
+    print(f"{'workers':>7} {'req/s':>10} {'scale':>6} {'p50(ms)':>8} {'p99(ms)':>8} {'fail':>6}")
+    for result in results:
+        print(
+            f"{result['workers']:>7} {result['rps']:>10.1f} "
+            f"{result['rps'] / baseline:>6.2f} {result['p50']:>8.0f} "
+            f"{result['p99']:>8.0f} {result['failures']:>6}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+import numpy as np
+import pytest
+
+from src.alert.domains import AlertRule
+from src.alert.engine import AlertEngine
+from src.facility.domains import WaterTank, WaterTankBuilding, WaterTankCenter
+from src.facility.index import FacilityIndex
+from src.sensor.domains import WaterTankSensorRecordColumns
+
+
+@pytest.fixture
+def given_facility_index() -> FacilityIndex:
+    """센터 1 → 동 1, 2 → 동마다 수조 2개"""
+    index = FacilityIndex(None, None, None, None)
+    index.put_center(WaterTankCenter(center_id=1, center_name="center"))
+    for building_id in (1, 2):
+        index.put_building(
+            WaterTankBuilding(
+                building_id=building_id,
+                building_name=f"b{building_id}",
+                building_code=f"1_b{building_id}",
+                center_id=1,
+            )
+        )
+    for tank_id in (1, 2, 3, 4):
+        building_id = 1 if tank_id <= 2 else 2
+        index.put_tank(
+            WaterTank(
+                tank_id=tank_id,
+                tank_name=f"t{tank_id}",
+                tank_code=f"1_b{building_id}_t{tank_id}",
+                center_id=1,
+                building_id=building_id,
+            )
+        )
+    index.loaded = True
+    return index
+
+
+def create_rule(rule_id: int, **kwargs) -> AlertRule:
+    rule = AlertRule.new(**kwargs)
+    rule.rule_id = rule_id
+    return rule
+
+
+def columns(tank_id, recorded_at, ph) -> WaterTankSensorRecordColumns:
+    n = len(tank_id)
+    return WaterTankSensorRecordColumns(
+        tank_id=np.asarray(tank_id, dtype=np.int64),
+        recorded_at=np.asarray(recorded_at, dtype=np.int64),
+        temperature=np.full(n, 20.0),
+        ph=np.asarray(ph, dtype=np.float64),
+        dissolved_oxygen=np.full(n, 8.0),
+        salinity=np.full(n, 30.0),
+    )
+
+
+def test_narrower_scope_overrides_wider_scope(given_facility_index):
+    engine = AlertEngine(None, given_facility_index, sinks=[])
+    engine.apply_rules(
+        [
+            create_rule(1, scope="center", scope_id=1, metric="ph", lower=6.5),
+            create_rule(2, scope="building", scope_id=2, metric="ph", lower=7.0),
+            create_rule(3, scope="tank", scope_id=4, metric="ph", lower=5.0),
+        ]
+    )
+
+    events = engine.evaluate(columns([1, 2, 3, 4], [0] * 4, [6.8] * 4))
+
+    # 수조 1, 2: 센터 규칙(6.5) 안, 수조 3: 동 규칙(7.0) 밖, 수조 4: 수조 규칙(5.0) 안
+    assert [(e.rule_id, e.tank_id, e.state) for e in events] == [(2, 3, "fired")]
+
+
+def test_min_duration_and_hysteresis(given_facility_index):
+    engine = AlertEngine(None, given_facility_index, sinks=[])
+    engine.apply_rules(
+        [
+            create_rule(
+                1,
+                scope="tank",
+                scope_id=1,
+                metric="ph",
+                upper=8.0,
+                hysteresis=0.5,
+                min_duration=60,
+            )
+        ]
+    )
+
+    def evaluate(recorded_at, ph):
+        return [e.state for e in engine.evaluate(columns([1], [recorded_at], [ph]))]
+
+    assert evaluate(0, 8.5) == []  # 범위 밖 시작
+    assert evaluate(30, 7.9) == []  # 60초 전에 돌아옴
+    assert evaluate(40, 8.5) == []
+    assert evaluate(100, 8.6) == ["fired"]  # 60초 유지
+    assert evaluate(110, 8.6) == []
+    assert evaluate(120, 7.8) == []  # hysteresis (7.5 이하) 전
+    assert evaluate(130, 7.4) == ["cleared"]
+
+
+def test_batch_with_several_readings_per_tank_is_evaluated_in_order(
+    given_facility_index,
+):
+    engine = AlertEngine(None, given_facility_index, sinks=[])
+    engine.apply_rules([create_rule(1, scope="center", scope_id=1, metric="ph", lower=6.0)])
+
+    # 순서가 섞인 묶음: 수조 1 은 5.0 (발생) → 7.0 (해제), 수조 2 는 한 번 발생
+    events = engine.evaluate(columns([1, 2, 1], [20, 10, 10], [7.0, 5.5, 5.0]))
+
+    assert [(e.tank_id, e.state) for e in events] == [
+        (1, "fired"),
+        (2, "fired"),
+        (1, "cleared"),
+    ]
+
+
+def test_reload_keeps_state_of_unchanged_rules(given_facility_index):
+    engine = AlertEngine(None, given_facility_index, sinks=[])
+    rule = create_rule(1, scope="tank", scope_id=1, metric="ph", lower=6.0)
+    engine.apply_rules([rule])
+    assert len(engine.evaluate(columns([1], [0], [5.0]))) == 1
+
+    engine.apply_rules([rule])
+
+    # 이미 발생 중이므로 다시 발생하지 않음
+    assert engine.evaluate(columns([1], [10], [5.0])) == []
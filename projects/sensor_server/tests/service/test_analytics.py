@@ -0,0 +1,225 @@
+import asyncio
+import os
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+
+import numpy as np
+import pytest
+
+from src.analytics.executor import AnalyticsExecutor
+from src.analytics.shared import SharedArray, close, from_shared, to_shared
+from src.facility.domains import WaterTank
+from src.report.generator import DailyReportGenerator
+from src.report.summary import summarize_groups, summarize_tanks
+from src.sensor.domains import METRICS, WaterTankSensorRecordColumns
+from src.sensor.repository import WaterTankSensorRecordHistoryRepository
+
+# event loop 가 한 번에 멈춰도 되는 시간 (초)
+LOOP_BLOCKING_BUDGET = 0.1
+DAY = 86400
+
+
+class LoopBlockingMonitor:
+    """짧은 sleep 이 늦게 깨어난 시간으로 event loop 가 한 번에 멈춘 최대 시간을 측정"""
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.max_blocked = 0.0
+
+    async def __aenter__(self) -> "LoopBlockingMonitor":
+        self._task = asyncio.create_task(self._beat())
+        await asyncio.sleep(0)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+
+    async def _beat(self) -> None:
+        while True:
+            started_at = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            blocked = time.perf_counter() - started_at - self.interval
+            self.max_blocked = max(self.max_blocked, blocked)
+
+
+@pytest.fixture
+async def executor():
+    executor = AnalyticsExecutor(max_workers=2, max_concurrency=2, min_shared_bytes=0)
+    await executor.start()
+    yield executor
+    await executor.stop()
+
+
+def day_columns(rows: int, tanks: int) -> WaterTankSensorRecordColumns:
+    rng = np.random.default_rng(0)
+    return WaterTankSensorRecordColumns(
+        tank_id=rng.integers(1, tanks + 1, rows),
+        recorded_at=rng.integers(0, DAY, rows),
+        **{name: rng.normal(20.0, 5.0, rows) for name in METRICS},
+    )
+
+
+def test_shared_round_trip_keeps_structure():
+    @dataclass
+    class Result:
+        values: np.ndarray
+        labels: np.ndarray
+        name: str
+
+    value = (
+        Result(np.arange(12.0).reshape(3, 4), np.array(["a", "b"], dtype=object), "r"),
+        {"ids": np.arange(5, dtype=np.int64), "small": np.ones(2)},
+        [np.empty(0)],
+    )
+
+    block, payload = to_shared(value, min_bytes=32)
+    try:
+        # 큰 배열만 공유 메모리로, 작은 배열 / object 배열 / 빈 배열은 그대로 pickle
+        assert isinstance(payload[0].values, SharedArray)
+        assert isinstance(payload[1]["ids"], SharedArray)
+        assert isinstance(payload[0].labels, np.ndarray)
+        assert isinstance(payload[1]["small"], np.ndarray)
+
+        restored = from_shared(payload, block, copy=True)
+    finally:
+        close(block, unlink=True)
+
+    np.testing.assert_array_equal(restored[0].values, value[0].values)
+    np.testing.assert_array_equal(restored[1]["ids"], value[1]["ids"])
+    assert restored[0].name == "r" and restored[2][0].shape == (0,)
+    assert to_shared((1, "a"), min_bytes=0) == (None, (1, "a"))
+    # block 이 max_bytes 를 넘으면 공유 메모리 없이 값 그대로 (pickle 로 전달)
+    block, payload = to_shared(value, min_bytes=32, max_bytes=64)
+    assert block is None and payload is value
+
+
+async def test_runs_in_worker_process_with_same_result(executor):
+    columns = day_columns(50_000, 20)
+    tank_ids = np.arange(1, 21)
+    ranges = np.full((20, len(METRICS)), np.nan)
+    args = (columns, tank_ids, 0, DAY, 300.0, ranges, ranges + 25.0)
+    group_ids, group = np.unique(tank_ids % 3, return_inverse=True)
+
+    tanks = await executor.run(summarize_tanks, *args)
+    expected_tanks = summarize_tanks(*args)
+    buildings = summarize_groups(tanks, group, group_ids)
+    expected_buildings = summarize_groups(expected_tanks, group, group_ids)
+
+    assert await executor.run(os.getpid) != os.getpid()
+    np.testing.assert_array_equal(tanks.count, expected_tanks.count)
+    np.testing.assert_allclose(tanks.mean, expected_tanks.mean)
+    np.testing.assert_allclose(
+        buildings.out_of_range_seconds, expected_buildings.out_of_range_seconds
+    )
+
+
+async def test_concurrency_limit_timeout_and_cancellation():
+    executor = AnalyticsExecutor(max_workers=1, max_concurrency=1)
+    await executor.start()
+    try:
+        await executor.run(os.getpid)  # worker 시작 대기
+
+        # 실행 중에 취소해도 worker 가 끝날 때까지 자리를 차지하므로 다음 호출은 기다림
+        running = asyncio.create_task(executor.run(time.sleep, 0.5))
+        await asyncio.sleep(0.1)
+        running.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await running
+        started_at = time.perf_counter()
+        await executor.run(os.getpid)
+        assert time.perf_counter() - started_at >= 0.3
+
+        # 자리를 기다리는 시간도 timeout 에 포함
+        sleeping = asyncio.create_task(executor.run(time.sleep, 0.3))
+        await asyncio.sleep(0.05)
+        with pytest.raises(TimeoutError):
+            await executor.run(os.getpid, timeout=0.1)
+        await sleeping
+        assert executor._slots._value == 1
+    finally:
+        await executor.stop()
+
+
+async def test_analytics_stays_within_loop_blocking_budget(
+    executor, given_frozen_startup_heap
+):
+    rows, tanks = 1_000_000, 500
+    columns = day_columns(rows, tanks)
+
+    # DB 결과처럼 행(tuple) 단위로 chunk 를 돌려주는 session (행 생성 비용은 driver 와 같이 event loop 에서)
+    rows = np.column_stack(
+        [columns.tank_id, columns.recorded_at, *(columns.metric(name) for name in METRICS)]
+    )
+
+    class Result:
+        def __init__(self, chunk_rows: int):
+            self.chunk_rows = chunk_rows
+
+        async def partitions(self):
+            for begin in range(0, len(rows), self.chunk_rows):
+                yield [tuple(row) for row in rows[begin : begin + self.chunk_rows].tolist()]
+                await asyncio.sleep(0)
+
+    class Session:
+        async def stream(self, stmt):
+            return Result(stmt.get_execution_options()["yield_per"])
+
+    class SessionFactory:
+        @asynccontextmanager
+        async def reader(self):
+            yield Session()
+
+    class Reports:
+        def __init__(self):
+            self.saved = []
+
+        async def upsert_many(self, summaries):
+            self.saved.extend(summaries)
+
+        async def find_report_dates(self, first, last):
+            return set()
+
+    class Rules:
+        async def find_all(self):
+            return []
+
+    class Index:
+        loaded = True
+
+        def find_all_tanks(self):
+            return [
+                WaterTank(tank_id, f"{tank_id}", f"{tank_id}", 1, tank_id % 10)
+                for tank_id in range(1, tanks + 1)
+            ]
+
+    reports = Reports()
+    generator = DailyReportGenerator(
+        WaterTankSensorRecordHistoryRepository(SessionFactory()),
+        reports,
+        Rules(),
+        Index(),
+        timezone="UTC",
+        catchup_days=1,
+        tank_chunk=tanks,  # session 은 수조 조건 없이 모든 행을 돌려주므로 한 번에 조회
+        clock=lambda: DAY * 1.5,
+        analytics=executor,
+    )
+    await executor.run(os.getpid)  # worker 시작 대기
+
+    async with LoopBlockingMonitor() as offloaded:
+        await generator.run()
+    assert len(reports.saved) == (tanks + 10) * len(METRICS)
+    assert offloaded.max_blocked < LOOP_BLOCKING_BUDGET
+
+    # 같은 계산을 event loop 에서 직접 실행하면 budget 검사에 걸림
+    ranges = np.full((tanks, len(METRICS)), np.nan)
+    tank_ids = np.arange(1, tanks + 1)
+    group_ids, group = np.unique(tank_ids % 10, return_inverse=True)
+    async with LoopBlockingMonitor() as inline:
+        await asyncio.sleep(0.01)
+        table = summarize_tanks(columns, tank_ids, 0, DAY, 300.0, ranges, ranges)
+        summarize_groups(table, group, group_ids)
+        await asyncio.sleep(0.01)
+    assert inline.max_blocked >= LOOP_BLOCKING_BUDGET
@@ -0,0 +1,72 @@
+import numpy as np
+
+from src.anomaly.detector import AnomalyDetector, score_anomalies
+from src.sensor.domains import METRICS, WaterTankSensorRecordColumns
+
+BUCKET = 60
+
+
+def bucket_columns(matrix: np.ndarray, tank_ids, start: int) -> WaterTankSensorRecordColumns:
+    """[수조, bucket, 항목] 행렬의 값이 있는 칸을 bucket 평균 묶음으로"""
+    rows, buckets = np.nonzero(~np.isnan(matrix).all(axis=2))
+    return WaterTankSensorRecordColumns(
+        tank_id=np.asarray(tank_ids, dtype=np.int64)[rows],
+        recorded_at=start + buckets * BUCKET,
+        **{name: matrix[rows, buckets, m] for m, name in enumerate(METRICS)},
+    )
+
+
+def test_detects_spike_drift_and_stuck_sensor_at_once():
+    rng = np.random.default_rng(1)
+    matrix = rng.normal(7.0, 0.05, size=(4, 60, len(METRICS)))
+    ph = METRICS.index("ph")
+    matrix[1, -1, ph] = 9.0  # 수조 1: 최근 값 급변
+    matrix[2, -15:] = 7.123  # 수조 2: 최근 15분 동안 값 고착
+    matrix[3, 10:50] = np.nan  # 수조 3: 측정 누락 (이상 아님)
+
+    scores = score_anomalies(
+        matrix,
+        zscore_threshold=3.5,
+        min_mad=0.01,
+        flatline_buckets=15,
+        flatline_tolerance=0.0,
+    )
+
+    assert scores.anomalous[:, ph].tolist() == [False, True, True, False]
+    assert scores.zscore[1, ph] > 10
+    assert scores.flatline[2].all() and not scores.flatline[[0, 1, 3]].any()
+    assert scores.value[1, ph] == 9.0
+
+
+async def test_run_stores_results_and_timings():
+    now = 1_700_000_000
+    start = (now // BUCKET + 1) * BUCKET - 60 * BUCKET
+    matrix = np.full((2, 60, len(METRICS)), 20.0)
+    matrix[:, :, 0] += np.arange(60) % 3 * 0.1
+    matrix[1, -1, 0] = 30.0
+
+    class History:
+        async def aggregate_all(self, start_at, end_at, bucket):
+            return bucket_columns(matrix, [1, 2], start)
+
+    class Repository:
+        async def upsert_many(self, anomalies):
+            self.saved = anomalies
+
+    repository = Repository()
+    detector = AnomalyDetector(
+        History(), repository, window=3600, bucket=BUCKET, clock=lambda: now
+    )
+
+    await detector.run()
+
+    anomalous = {(a.tank_id, a.metric) for a in repository.saved if a.anomalous}
+    assert len(repository.saved) == 2 * len(METRICS)
+    # 온도 외 항목은 계속 같은 값이므로 flatline
+    assert ("temperature", False) in {
+        (a.metric, a.flatline) for a in repository.saved if a.tank_id == 1
+    }
+    assert (2, "temperature") in anomalous and (1, "temperature") not in anomalous
+    assert detector.last_run.tanks == 2
+    assert detector.last_run.anomalies == len(anomalous)
+    assert detector.last_run.detect_seconds >= 0
@@ -0,0 +1,150 @@
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import List
+
+import numpy as np
+
+from src.sensor.columnar import GRANULE_ROWS, ColumnarSensorRecordHistoryRepository
+from src.sensor.derived import fill_derived_metrics
+from src.sensor.domains import WaterTankSensorRecord, WaterTankSensorRecordContent
+
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def create_records(
+    count: int, tank_id: int = 1, offset: int = 0
+) -> List[WaterTankSensorRecord]:
+    """1초 간격 측정 값 (파생 항목은 저장 시와 같이 계산)"""
+    records = [
+        WaterTankSensorRecord(
+            tank_id=tank_id,
+            content=WaterTankSensorRecordContent(
+                temperature=float(i),
+                ph=7.0,
+                dissolved_oxygen=10.0,
+                salinity=30.0,
+                recorded_at=START + timedelta(seconds=i),
+            ),
+        )
+        for i in range(offset, offset + count)
+    ]
+    fill_derived_metrics(records)
+    return records
+
+
+async def test_columnar_find_range(tmp_path: Path):
+    """segment 와 granule 경계를 넘는 구간 조회"""
+    repository = ColumnarSensorRecordHistoryRepository(
+        str(tmp_path), segment_rows=GRANULE_ROWS * 2
+    )
+    records = create_records(GRANULE_ROWS * 5)
+    for i in range(0, len(records), 1000):
+        await repository.insert_many(records[i : i + 1000])
+    await repository.insert_many(create_records(10, tank_id=2))
+
+    result = await repository.find_range(
+        1, START + timedelta(seconds=1500), START + timedelta(seconds=4500)
+    )
+
+    assert result == records[1500:4500]
+    assert await repository.find_by_tank(2) == create_records(10, tank_id=2)
+
+
+async def test_columnar_ignores_duplicates_and_keeps_late_records(tmp_path: Path):
+    """이미 저장된 시각은 무시하고, 늦게 도착한 값도 시간 순으로 조회"""
+    repository = ColumnarSensorRecordHistoryRepository(str(tmp_path))
+    await repository.insert_many(create_records(10, offset=10))
+    inserted = await repository.insert_many(create_records(15, offset=0))
+
+    assert await repository.find_by_tank(1) == create_records(20)
+    # 새로 저장된 값만 반환
+    assert inserted == create_records(10)
+    assert await repository.insert_many(create_records(5, offset=18)) == create_records(
+        3, offset=20
+    )
+
+
+async def test_columnar_merges_late_records_into_existing_segment(tmp_path: Path):
+    """늦게 도착한 값은 기존 segment 에 합치고, 이후 중복은 모든 segment 에서 걸러냄"""
+    repository = ColumnarSensorRecordHistoryRepository(str(tmp_path))
+    await repository.insert_many(create_records(100, offset=100))
+    await repository.insert_many(create_records(1, offset=50))
+    await repository.insert_many(create_records(1, offset=150))
+    await repository.insert_many(create_records(2, offset=50))
+
+    assert await repository.find_by_tank(1) == create_records(
+        1, offset=50
+    ) + create_records(1, offset=51) + create_records(100, offset=100)
+    assert len(repository._segments[1]) == 1
+
+
+async def test_columnar_truncates_partially_written_rows(tmp_path: Path):
+    """컬럼 파일 일부에만 기록된 행은 다시 열 때 잘라냄"""
+    repository = ColumnarSensorRecordHistoryRepository(str(tmp_path))
+    await repository.insert_many(create_records(10))
+    repository.close()
+    with open(tmp_path / "1" / "00000000.recorded_at", "ab") as file:
+        file.write(np.int64(0).tobytes())
+
+    recovered = ColumnarSensorRecordHistoryRepository(str(tmp_path))
+    await recovered.insert_many(create_records(2, offset=10))
+
+    assert await recovered.find_by_tank(1) == create_records(12)
+
+
+async def test_columnar_recovers_after_restart(tmp_path: Path):
+    repository = ColumnarSensorRecordHistoryRepository(str(tmp_path), segment_rows=7)
+    await repository.insert_many(create_records(20))
+    repository.close()
+
+    recovered = ColumnarSensorRecordHistoryRepository(str(tmp_path), segment_rows=7)
+    await recovered.insert_many(create_records(5, offset=18))
+
+    assert await recovered.find_all() == create_records(23)
+
+
+async def test_columnar_aggregate(tmp_path: Path):
+    repository = ColumnarSensorRecordHistoryRepository(str(tmp_path))
+    await repository.insert_many(create_records(120))
+
+    buckets = await repository.aggregate(
+        1, START + timedelta(seconds=30), START + timedelta(minutes=2), timedelta(minutes=1)
+    )
+
+    assert [bucket.bucket_at for bucket in buckets] == [
+        START,
+        START + timedelta(minutes=1),
+    ]
+    assert [bucket.count for bucket in buckets] == [30, 60]
+    assert [bucket.temperature for bucket in buckets] == [44.5, 89.5]
+    assert buckets[0].ph == 7.0
+
+
+async def test_columnar_aggregate_all(tmp_path: Path):
+    repository = ColumnarSensorRecordHistoryRepository(str(tmp_path))
+    await repository.insert_many(create_records(120))
+    await repository.insert_many(create_records(30, tank_id=2, offset=60))
+
+    columns = await repository.aggregate_all(
+        START, START + timedelta(minutes=2), timedelta(minutes=1)
+    )
+
+    start = int(START.timestamp())
+    assert columns.tank_id.tolist() == [1, 1, 2]
+    assert columns.recorded_at.tolist() == [start, start + 60, start + 60]
+    assert columns.temperature.tolist() == [29.5, 89.5, 74.5]
+
+
+async def test_columnar_scan_all(tmp_path: Path):
+    repository = ColumnarSensorRecordHistoryRepository(str(tmp_path))
+    await repository.insert_many(create_records(30, tank_id=2, offset=60))
+    await repository.insert_many(create_records(120))
+
+    columns = await repository.scan_all(
+        START + timedelta(seconds=80), START + timedelta(seconds=100)
+    )
+
+    start = int(START.timestamp())
+    assert columns.tank_id.tolist() == [1] * 20 + [2] * 10
+    assert columns.recorded_at.tolist()[:2] == [start + 80, start + 81]
+    assert columns.temperature.tolist()[-1] == 89.0
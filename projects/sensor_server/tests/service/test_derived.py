@@ -0,0 +1,81 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+from src.sensor.backfill import backfill_history, split_range
+from src.sensor.derived import compute_derived_metrics, fill_derived_metrics
+from src.sensor.domains import WaterTankSensorRecord, WaterTankSensorRecordContent
+
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def test_oxygen_saturation_matches_solubility_table():
+    # 1 기압 포화 농도 (APHA): 20°C 담수 9.09 mg/L, 25°C 담수 8.26 mg/L, 25°C 해수(35‰) 6.77 mg/L
+    derived = compute_derived_metrics(
+        {
+            "temperature": np.array([20.0, 25.0, 25.0, 25.0, np.nan]),
+            "salinity": np.array([0.0, 0.0, 35.0, 35.0, 30.0]),
+            "dissolved_oxygen": np.array([9.09, 8.26, 6.77, 3.385, 8.0]),
+        }
+    )
+
+    saturation = derived["oxygen_saturation"]
+    np.testing.assert_allclose(saturation[:4], [100.0, 100.0, 100.0, 50.0], atol=0.1)
+    assert np.isnan(saturation[4])
+
+
+def test_fill_derived_metrics_sets_values_and_none():
+    records = [
+        WaterTankSensorRecord(
+            tank_id=1,
+            content=WaterTankSensorRecordContent(
+                temperature=temperature,
+                ph=7.0,
+                dissolved_oxygen=9.09,
+                salinity=0.0,
+                recorded_at=START,
+            ),
+        )
+        for temperature in (20.0, float("nan"))
+    ]
+
+    fill_derived_metrics(records)
+
+    assert abs(records[0].content.oxygen_saturation - 100.0) < 0.1
+    assert records[1].content.oxygen_saturation is None
+
+
+def test_split_range():
+    ranges = split_range(START, START + timedelta(hours=50), timedelta(hours=24))
+
+    assert ranges == [
+        (START, START + timedelta(hours=24)),
+        (START + timedelta(hours=24), START + timedelta(hours=48)),
+        (START + timedelta(hours=48), START + timedelta(hours=50)),
+    ]
+
+
+async def test_backfill_history_runs_chunks_concurrently_and_reports_failures():
+    class Repository:
+        def __init__(self):
+            self.running = 0
+            self.max_running = 0
+
+        async def recompute_derived(self, start, end):
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+            await asyncio.sleep(0.01)
+            self.running -= 1
+            if start == START + timedelta(days=2):
+                raise ConnectionError("connection lost")
+            return 10
+
+    repository = Repository()
+    rows, failed = await backfill_history(
+        repository, START, START + timedelta(days=6), timedelta(days=1), concurrency=2
+    )
+
+    assert rows == 50
+    assert failed == [(START + timedelta(days=2), START + timedelta(days=3))]
+    assert repository.max_running == 2
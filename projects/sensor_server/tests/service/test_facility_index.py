@@ -0,0 +1,112 @@
+import asyncio
+import json
+from contextlib import nullcontext
+
+from src.facility.domains import WaterTank
+from src.facility.index import FacilityIndex
+
+
+class SessionFactory:
+    def primary(self):
+        return nullcontext()
+
+
+class Repository:
+    """`failures` 번 실패한 뒤 `rows` 를 돌려주는 조회"""
+
+    def __init__(self, rows=(), failures: int = 0):
+        self.rows = list(rows)
+        self.failures = failures
+        self.calls = 0
+
+    async def find_all(self):
+        self.calls += 1
+        await asyncio.sleep(0)
+        if self.failures > 0:
+            self.failures -= 1
+            raise ConnectionError("database unavailable")
+        return list(self.rows)
+
+
+def tank(tank_id: int) -> WaterTank:
+    return WaterTank(
+        tank_id=tank_id,
+        tank_name=f"tank_{tank_id}",
+        tank_code=f"tank_{tank_id:04d}",
+        center_id=1,
+        building_id=1,
+    )
+
+
+def index_of(tank_repository: Repository) -> FacilityIndex:
+    index = FacilityIndex(
+        SessionFactory(), tank_repository, Repository(), Repository(), reconnect_interval=0
+    )
+    index._stopped = False
+    return index
+
+
+def truncate(index: FacilityIndex) -> None:
+    payload = json.dumps({"table": "water_tank", "op": "TRUNCATE"})
+    index._on_notify(None, 0, "facility_changed", payload)
+
+
+async def wait_until(condition, timeout: float = 1.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline
+        await asyncio.sleep(0)
+
+
+async def test_truncate_reload_retries_until_loaded():
+    """TRUNCATE 후 재적재가 실패해도 재시도하여 다시 활성화"""
+    tanks = Repository([tank(1)])
+    index = index_of(tanks)
+    await index.load()
+
+    tanks.rows = [tank(2)]
+    tanks.failures = 2
+    truncate(index)
+    assert not index.loaded
+
+    await wait_until(lambda: index.loaded)
+    assert tanks.calls == 4
+    assert index.find_tank(1) is None
+    assert index.find_tank(2) == tank(2)
+    await index.stop()
+
+
+async def test_truncate_during_reload_loads_again():
+    """재적재 도중 다시 TRUNCATE 되면 같은 task 가 한 번 더 적재"""
+    tanks = Repository([tank(1)])
+    index = index_of(tanks)
+    await index.load()
+
+    truncate(index)
+    reload_task = index._reload_task
+    await asyncio.sleep(0)
+    tanks.rows = [tank(3)]
+    truncate(index)
+
+    assert index._reload_task is reload_task
+    assert index._reconnect_task is None
+    await wait_until(lambda: index.loaded)
+    assert index.find_tank(3) == tank(3)
+    await index.stop()
+
+
+async def test_stop_cancels_pending_reload():
+    """중단 시 재시도 중인 재적재 task 도 취소"""
+    tanks = Repository([tank(1)], failures=1_000)
+    index = FacilityIndex(SessionFactory(), tanks, Repository(), Repository(), 60)
+    index._stopped = False
+
+    truncate(index)
+    reload_task = index._reload_task
+    await asyncio.sleep(0)
+    await index.stop()
+    await asyncio.wait([reload_task], timeout=1)
+
+    assert reload_task.cancelled()
+    assert index._reload_task is None
+    assert not index.loaded
@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+from src.sensor.domains import WaterTankSensorRecordBatch
+from src.sensor.frame import FrameDecodeError, decode_frame, encode_frame
+
+
+def create_batch() -> WaterTankSensorRecordBatch:
+    return WaterTankSensorRecordBatch(
+        tank_codes=["tank_a", "수조_b"],
+        code_index=np.array([0, 1, 0]),
+        recorded_at=np.array([1735689600, 1735689600, 1735689601]),
+        temperature=np.array([20.5, 21.0, 20.75]),
+        ph=np.array([7.0, 7.5, 7.25]),
+        dissolved_oxygen=np.array([10.0, 9.5, 10.0]),
+        salinity=np.array([30.0, 31.0, 30.5]),
+    )
+
+
+def test_frame_round_trip():
+    data = encode_frame(create_batch())
+
+    batch = decode_frame(data)
+
+    assert len(data) == 12 + (1 + 6) + (1 + 8) + 3 * 22
+    assert batch.to_records([1, 2]) == create_batch().to_records([1, 2])
+
+
+@pytest.mark.parametrize(
+    "corrupt",
+    [
+        lambda data: data[:-1],  # 잘린 행
+        lambda data: b"XXXX" + data[4:],  # magic
+        lambda data: data[:4] + b"\x09" + data[5:],  # version
+        lambda data: data[:-22] + b"\x05\x00" + data[-20:],  # 코드 인덱스 범위
+        lambda data: data[:-4] + np.float32(np.nan).tobytes(),  # NaN
+    ],
+)
+def test_frame_rejects_invalid_data(corrupt):
+    with pytest.raises(FrameDecodeError):
+        decode_frame(corrupt(encode_frame(create_batch())))
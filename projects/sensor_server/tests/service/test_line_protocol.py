@@ -0,0 +1,184 @@
+import asyncio
+from typing import List
+
+import pytest
+
+from src.exceptions import DatabaseException, InvalidRequestException, NotFoundException
+from src.facility.domains import WaterTank
+from src.sensor.domains import WaterTankSensorRecord, WaterTankSensorRecordBatch
+from src.sensor.line_protocol import SensorLineProtocolListener, parse_lines
+from src.sensor.service import SensorRecordService
+
+
+class RecordingService:
+    """저장 대신 받은 측정 값 묶음을 모아두는 서비스"""
+
+    def __init__(self):
+        self.batches: List[WaterTankSensorRecordBatch] = []
+
+    async def drop_unknown_tanks(self, batch: WaterTankSensorRecordBatch):
+        return batch, 0
+
+    async def record_tank_sensor_batch(self, batch: WaterTankSensorRecordBatch):
+        self.batches.append(batch)
+
+
+class FailingService(RecordingService):
+    """앞의 몇 번은 주어진 예외로 실패하는 서비스"""
+
+    def __init__(self, error: Exception, failures: int):
+        super().__init__()
+        self.error = error
+        self.failures = failures
+        self.calls = 0
+
+    async def record_tank_sensor_batch(self, batch: WaterTankSensorRecordBatch):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise self.error
+        await super().record_tank_sensor_batch(batch)
+
+
+class FakeFacilityService:
+    async def get_water_tank_by_code(self, tank_code: str) -> WaterTank:
+        if tank_code != "tank_a":
+            raise NotFoundException(f"{tank_code} 찾을 수 없습니다.")
+        return WaterTank(1, "tank_a", "tank_a", 1, 1)
+
+
+class FakeRepository:
+    def __init__(self):
+        self.records: List[WaterTankSensorRecord] = []
+
+    async def upsert_many(self, records):
+        pass
+
+    async def insert_many(self, records):
+        self.records.extend(records)
+        return records
+
+
+def test_parse_lines():
+    batch, invalid = parse_lines(
+        [
+            b"tank_a temperature=20.5,ph=7.1,do=9.8,salinity=30.2 1735689600",
+            b"tank_b salinity=31,do=9,ph=7,temperature=21 1735689601\r",
+            b"tank_a temperature=20.6,ph=7.1,do=9.8 1735689602",  # 필드 누락
+            b"garbage",
+            b"",
+        ]
+    )
+
+    assert invalid == 2
+    assert batch.tank_codes == ["tank_a", "tank_b"]
+    assert batch.code_index.tolist() == [0, 1]
+    assert batch.recorded_at.tolist() == [1735689600, 1735689601]
+    assert batch.temperature.tolist() == [20.5, 21.0]
+    assert batch.dissolved_oxygen.tolist() == [9.8, 9.0]
+
+
+def test_parse_lines_keeps_rows_aligned_when_tank_code_is_not_utf8():
+    """수조 코드를 decode 할 수 없는 줄은 값도 함께 버림 (다음 줄과 섞이지 않음)"""
+    batch, invalid = parse_lines(
+        [
+            b"tank_1 temperature=1,ph=7,do=9,salinity=30 100",
+            b"\xff\xfe temperature=2,ph=7,do=9,salinity=30 200",
+            b"tank_2 temperature=3,ph=7,do=9,salinity=30 300",
+        ]
+    )
+
+    assert invalid == 1
+    assert batch.tank_codes == ["tank_1", "tank_2"]
+    assert batch.code_index.tolist() == [0, 1]
+    assert batch.recorded_at.tolist() == [100, 300]
+    assert batch.temperature.tolist() == [1.0, 3.0]
+
+
+def test_parse_lines_rejects_non_finite_values():
+    """binary frame 과 같이 nan / inf 값은 형식 오류"""
+    batch, invalid = parse_lines(
+        [
+            b"tank_a temperature=nan,ph=7,do=9,salinity=30 100",
+            b"tank_a temperature=20,ph=inf,do=9,salinity=30 200",
+            b"tank_a temperature=20,ph=7,do=9,salinity=30 300",
+        ]
+    )
+
+    assert invalid == 2
+    assert batch.recorded_at.tolist() == [300]
+
+
+async def wait_until(condition, timeout: float = 3.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline
+        await asyncio.sleep(0.01)
+
+
+async def test_listener_receives_tcp_and_udp():
+    service = RecordingService()
+    listener = SensorLineProtocolListener(
+        service, host="127.0.0.1", tcp_port=0, udp_port=0
+    )
+    await listener.start()
+    try:
+        _, writer = await asyncio.open_connection(*listener.tcp_address)
+        # 줄이 여러 번의 read 로 나뉘어 도착해도 완성된 줄만 처리
+        writer.write(b"tank_a temperature=20,ph=7,do=9,salinity=30 1735689600\ntank_a temp")
+        await writer.drain()
+        writer.write(b"erature=21,ph=7,do=9,salinity=30 1735689601\n")
+        await writer.drain()
+        writer.close()
+
+        transport, _ = await asyncio.get_running_loop().create_datagram_endpoint(
+            asyncio.DatagramProtocol, remote_addr=listener.udp_address
+        )
+        transport.sendto(b"tank_b temperature=22,ph=7,do=9,salinity=30 1735689602\n")
+        transport.close()
+
+        await wait_until(lambda: sum(len(batch) for batch in service.batches) == 3)
+    finally:
+        await listener.stop()
+
+    assert sorted(
+        recorded_at
+        for batch in service.batches
+        for recorded_at in batch.recorded_at.tolist()
+    ) == [1735689600, 1735689601, 1735689602]
+
+
+LINES = [
+    b"tank_a temperature=20,ph=7,do=9,salinity=30 1735689600",
+    b"tank_x temperature=20,ph=7,do=9,salinity=30 1735689600",
+    b"tank_a temperature=21,ph=7,do=9,salinity=30 1735689601",
+]
+
+
+async def test_ingest_drops_only_lines_of_unknown_tanks():
+    history = FakeRepository()
+    service = SensorRecordService(
+        repository=FakeRepository(),
+        history_repository=history,
+        facility_service=FakeFacilityService(),
+    )
+    listener = SensorLineProtocolListener(service)
+
+    assert await listener.ingest(LINES, transport="tcp") == 2
+    assert [record.content.temperature for record in history.records] == [20.0, 21.0]
+
+
+async def test_ingest_retries_server_errors_and_rejects_client_errors():
+    service = FailingService(DatabaseException("db down"), failures=2)
+    listener = SensorLineProtocolListener(service, retry_attempts=3, retry_delay=0.01)
+    assert await listener.ingest(LINES, transport="tcp") == 3
+    assert service.calls == 3
+
+    service = FailingService(DatabaseException("db down"), failures=3)
+    listener = SensorLineProtocolListener(service, retry_attempts=3, retry_delay=0.01)
+    with pytest.raises(DatabaseException):
+        await listener.ingest(LINES, transport="tcp")
+
+    service = FailingService(InvalidRequestException("invalid"), failures=1)
+    listener = SensorLineProtocolListener(service, retry_attempts=3, retry_delay=0.01)
+    assert await listener.ingest(LINES, transport="tcp") == 0
+    assert service.calls == 1
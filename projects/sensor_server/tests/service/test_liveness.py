@@ -0,0 +1,94 @@
+import numpy as np
+
+from src.facility.domains import WaterTank
+from src.facility.index import FacilityIndex
+from src.monitoring.liveness import LivenessTracker
+from src.sensor.domains import WaterTankSensorRecordColumns
+
+
+class Clock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def columns(tank_id, recorded_at=0) -> WaterTankSensorRecordColumns:
+    n = len(tank_id)
+    return WaterTankSensorRecordColumns(
+        tank_id=np.asarray(tank_id, dtype=np.int64),
+        recorded_at=np.full(n, recorded_at, dtype=np.int64),
+        temperature=np.full(n, 20.0),
+        ph=np.full(n, 7.0),
+        dissolved_oxygen=np.full(n, 8.0),
+        salinity=np.full(n, 30.0),
+    )
+
+
+def states(events):
+    return [(event.tank_id, event.state) for event in events]
+
+
+def test_stale_and_recovered_events():
+    clock = Clock()
+    tracker = LivenessTracker(FacilityIndex(None, None, None, None), [], 60, 5, clock=clock)
+    tracker.on_records(columns([1, 2, 300]))
+
+    # 수조 1, 300 은 계속 보고, 수조 2 는 중단 (마감 시간 1060)
+    for _ in range(5):
+        clock.now += 10
+        tracker.on_records(columns([1, 300]))
+        assert tracker.advance(clock.now) == []
+    clock.now += 10
+    assert states(tracker.advance(clock.now)) == [(2, "stale")]
+    assert [tank.tank_id for tank in tracker.find_stale()] == [2]
+
+    # stale 이벤트는 한 번만, 다시 보고하면 recovered
+    assert tracker.advance(clock.now + 30) == []
+    assert states(tracker.touch(np.array([2]), clock.now + 30)) == [(2, "recovered")]
+    assert tracker.find_stale() == []
+
+
+def test_wheel_work_does_not_grow_with_ingest_frequency():
+    clock = Clock()
+    tracker = LivenessTracker(FacilityIndex(None, None, None, None), [], 60, 5, clock=clock)
+    tank_ids = np.arange(1000)
+
+    # 1초마다 모든 수조가 보고해도 wheel 에는 수조당 한 번만 등록
+    for _ in range(120):
+        clock.now += 1
+        tracker.on_records(columns(tank_ids))
+        tracker.advance(clock.now)
+        assert sum(len(slot) for slot in tracker.slots) == len(tank_ids)
+
+    # 보고가 멈추면 timeout 이후 한 번에 stale
+    clock.now += 61
+    assert len(tracker.advance(clock.now)) == len(tank_ids)
+    assert sum(len(slot) for slot in tracker.slots) == 0
+
+
+async def test_start_tracks_known_tanks_that_never_report():
+    clock = Clock()
+    index = FacilityIndex(None, None, None, None)
+    for tank_id in (1, 2):
+        index.put_tank(
+            WaterTank(
+                tank_id=tank_id,
+                tank_name=f"t{tank_id}",
+                tank_code=f"t{tank_id}",
+                center_id=1,
+                building_id=1,
+            )
+        )
+    index.loaded = True
+    tracker = LivenessTracker(index, [], 60, 5, clock=clock)
+    await tracker.start()
+    await tracker.stop()
+
+    clock.now += 30
+    tracker.on_records(columns([1], recorded_at=1020))
+    clock.now += 40
+
+    assert states(tracker.advance(clock.now)) == [(2, "stale")]
+    assert [(t.tank_id, t.last_recorded_at) for t in tracker.find_stale()] == [(2, None)]
@@ -0,0 +1,33 @@
+import asyncio
+
+from prometheus_client import REGISTRY
+
+from src import metrics
+
+
+def get_stage_count(stage: str) -> float:
+    return REGISTRY.get_sample_value(
+        "sensor_ingest_stage_seconds_count", {"stage": stage}
+    ) or 0
+
+
+def test_ingest_stage_observes_duration():
+    before = get_stage_count("commit")
+
+    with metrics.ingest_stage("commit"):
+        pass
+
+    assert get_stage_count("commit") == before + 1
+
+
+async def test_db_round_trips_are_counted_per_context():
+    """요청(태스크)마다 별도로 집계"""
+
+    async def request(statements: int) -> int:
+        counter = metrics.start_db_round_trip_count()
+        for _ in range(statements):
+            await asyncio.sleep(0)
+            metrics.record_db_round_trip()
+        return counter[0]
+
+    assert await asyncio.gather(request(1), request(3)) == [1, 3]
@@ -0,0 +1,266 @@
+from dataclasses import fields
+from datetime import date, datetime
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pytest
+
+from src.alert.domains import AlertRule
+from src.exceptions import ServerException
+from src.facility.domains import WaterTank
+from src.report.generator import DailyReportGenerator
+from src.report.summary import summarize_groups, summarize_tanks
+from src.sensor.domains import METRICS, WaterTankSensorRecordColumns
+
+DAY = 3600
+TEMPERATURE = METRICS.index("temperature")
+PH = METRICS.index("ph")
+
+
+def columns(tank_id, recorded_at, temperature, offset=0) -> WaterTankSensorRecordColumns:
+    n = len(tank_id)
+    return WaterTankSensorRecordColumns(
+        tank_id=np.asarray(tank_id, dtype=np.int64),
+        recorded_at=offset + np.asarray(recorded_at, dtype=np.int64),
+        temperature=np.asarray(temperature, dtype=np.float64),
+        ph=np.full(n, 7.0),
+        dissolved_oxygen=np.full(n, np.nan),
+        salinity=np.full(n, 30.0),
+    )
+
+
+def sample_columns(offset=0) -> WaterTankSensorRecordColumns:
+    # 순서가 뒤섞여 있고, 하루 밖 / 모르는 수조의 행을 포함
+    return columns(
+        tank_id=[2, 1, 1, 9, 2, 1, 1],
+        recorded_at=[1800, 600, 0, 100, 0, 300, -1],
+        temperature=[np.nan, 20.0, 10.0, 99.0, 15.0, 30.0, 99.0],
+        offset=offset,
+    )
+
+
+def select_tanks(
+    columns: WaterTankSensorRecordColumns, tank_ids
+) -> WaterTankSensorRecordColumns:
+    selected = np.isin(columns.tank_id, tank_ids)
+    return WaterTankSensorRecordColumns(
+        **{field.name: getattr(columns, field.name)[selected] for field in fields(columns)}
+    )
+
+
+def temperature_ranges(size: int, upper: float):
+    """수조 1 (첫 번째 행) 에만 온도 상한 규칙"""
+    lower = np.full((size, len(METRICS)), np.nan)
+    uppers = np.full((size, len(METRICS)), np.nan)
+    uppers[0, TEMPERATURE] = upper
+    return lower, uppers
+
+
+def test_summarize_tanks_counts_coverage_and_time_out_of_range():
+    table = summarize_tanks(
+        sample_columns(), [1, 2, 3], 0, DAY, 600, *temperature_ranges(3, 25.0)
+    )
+
+    assert table.count[:, TEMPERATURE].tolist() == [3, 1, 0]
+    assert table.count[:, PH].tolist() == [3, 2, 0]
+    assert table.minimum[0, TEMPERATURE] == 10.0
+    assert table.maximum[0, TEMPERATURE] == 30.0
+    assert table.mean[0, TEMPERATURE] == 20.0
+    assert np.isnan(table.mean[2]).all()
+    # 수조 1: 300 + 300 + 600(하루 끝까지 3000 초지만 max_gap 으로 제한)
+    # 수조 2: 온도는 0 초 값만 (600), pH 는 두 값 (600 + 600)
+    assert np.allclose(table.completeness[:, TEMPERATURE], [1200 / DAY, 600 / DAY, 0])
+    assert np.allclose(table.completeness[:, PH], [1200 / DAY, 1200 / DAY, 0])
+    # 30.0 (300 초 동안) 만 상한 초과, 규칙이 없는 (수조, 항목) 은 NaN
+    assert table.out_of_range_seconds[0, TEMPERATURE] == 300
+    assert np.isnan(table.out_of_range_seconds[1:, TEMPERATURE]).all()
+    assert np.isnan(table.out_of_range_seconds[0, PH])
+
+
+def test_summarize_groups_weights_mean_and_counts_missing_tanks():
+    tanks = summarize_tanks(
+        sample_columns(), [1, 2, 3], 0, DAY, 600, *temperature_ranges(3, 25.0)
+    )
+
+    buildings = summarize_groups(tanks, np.array([0, 0, 1]), np.array([10, 20]))
+
+    assert buildings.scope_id.tolist() == [10, 20]
+    assert buildings.count[:, TEMPERATURE].tolist() == [4, 0]
+    assert buildings.mean[0, TEMPERATURE] == (10.0 + 30.0 + 20.0 + 15.0) / 4
+    assert buildings.minimum[0, TEMPERATURE] == 10.0
+    assert buildings.maximum[0, TEMPERATURE] == 30.0
+    assert np.isnan(buildings.mean[1]).all()
+    # 동의 수조 2개 x 하루 대비
+    assert np.isclose(buildings.completeness[0, TEMPERATURE], 1800 / (2 * DAY))
+    assert buildings.completeness[1].tolist() == [0.0] * len(METRICS)
+    assert buildings.out_of_range_seconds[0, TEMPERATURE] == 300
+    assert np.isnan(buildings.out_of_range_seconds[1, TEMPERATURE])
+
+
+async def test_generate_yesterday_stores_tank_and_building_summaries():
+    seoul = ZoneInfo("Asia/Seoul")
+    day_start = int(datetime(2024, 1, 1, tzinfo=seoul).timestamp())
+    now = datetime(2024, 1, 2, 0, 30, tzinfo=seoul).timestamp()
+    tanks = [
+        WaterTank(tank_id=1, tank_name="1", tank_code="A_1", center_id=1, building_id=10),
+        WaterTank(tank_id=2, tank_name="2", tank_code="A_2", center_id=1, building_id=10),
+        WaterTank(tank_id=3, tank_name="3", tank_code="B_3", center_id=1, building_id=20),
+    ]
+
+    class History:
+        def __init__(self):
+            self.requested = []
+
+        async def scan_all(self, start, end, tank_ids):
+            self.requested.append((start, end, tank_ids))
+            return select_tanks(sample_columns(offset=day_start), tank_ids)
+
+    class Reports:
+        async def upsert_many(self, summaries):
+            self.saved = summaries
+
+        async def find_report_dates(self, first, last):
+            return set()
+
+    class Rules:
+        async def find_all(self):
+            return [
+                AlertRule(
+                    rule_id=1,
+                    scope="tank",
+                    scope_id=1,
+                    metric="temperature",
+                    lower=None,
+                    upper=25.0,
+                    hysteresis=0.0,
+                    min_duration=0.0,
+                )
+            ]
+
+    class Index:
+        loaded = True
+
+        def find_all_tanks(self):
+            return tanks
+
+    history, reports = History(), Reports()
+    generator = DailyReportGenerator(
+        history,
+        reports,
+        Rules(),
+        Index(),
+        max_gap=600,
+        catchup_days=1,
+        tank_chunk=2,
+        clock=lambda: now,
+    )
+
+    await generator.run()
+
+    # 수조 2개씩 나눠 조회
+    start, end, _ = history.requested[0]
+    assert [tank_ids for _, _, tank_ids in history.requested] == [[1, 2], [3]]
+    assert start == datetime(2024, 1, 1, tzinfo=seoul)
+    assert end == datetime(2024, 1, 2, tzinfo=seoul)
+    assert len(reports.saved) == (3 + 2) * len(METRICS)
+    saved = {(s.scope, s.scope_id, s.metric): s for s in reports.saved}
+    tank = saved[("tank", 1, "temperature")]
+    assert tank.report_date == date(2024, 1, 1)
+    assert (tank.count, tank.minimum, tank.maximum, tank.mean) == (3, 10.0, 30.0, 20.0)
+    assert tank.out_of_range_seconds == 300
+    assert np.isclose(tank.completeness, 1200 / 86400)
+    assert saved[("tank", 3, "ph")].mean is None
+    assert saved[("building", 10, "temperature")].count == 4
+    assert saved[("building", 20, "temperature")].out_of_range_seconds is None
+
+
+async def test_run_catches_up_missing_report_dates():
+    """최근 catchup_days 일 중 요약이 없는 날짜와 전날을 오래된 날짜부터 생성"""
+    seoul = ZoneInfo("Asia/Seoul")
+    now = datetime(2024, 1, 10, 0, 30, tzinfo=seoul).timestamp()
+    tanks = [
+        WaterTank(tank_id=1, tank_name="1", tank_code="A_1", center_id=1, building_id=10)
+    ]
+
+    class History:
+        async def scan_all(self, start, end, tank_ids):
+            return columns([], [], [])
+
+    class Reports:
+        def __init__(self):
+            self.saved_dates = []
+
+        async def upsert_many(self, summaries):
+            self.saved_dates.append(summaries[0].report_date)
+
+        async def find_report_dates(self, first, last):
+            self.checked = (first, last)
+            return {date(2024, 1, d) for d in (3, 4, 6, 8, 9)}
+
+    class Rules:
+        async def find_all(self):
+            return []
+
+    class Index:
+        loaded = True
+
+        def find_all_tanks(self):
+            return tanks
+
+    reports = Reports()
+    generator = DailyReportGenerator(
+        History(), reports, Rules(), Index(), catchup_days=7, clock=lambda: now
+    )
+
+    summaries = await generator.run()
+
+    assert reports.checked == (date(2024, 1, 3), date(2024, 1, 9))
+    assert reports.saved_dates == [date(2024, 1, 5), date(2024, 1, 7), date(2024, 1, 9)]
+    assert len(summaries) == 3 * (1 + 1) * len(METRICS)
+
+
+async def test_run_fails_until_facility_index_is_loaded():
+    """시설 인덱스가 적재되지 않았으면 빈 요약을 저장하지 않고 실패, 적재 후 catch-up 으로 생성"""
+    seoul = ZoneInfo("Asia/Seoul")
+    now = datetime(2024, 1, 10, 0, 30, tzinfo=seoul).timestamp()
+
+    class History:
+        async def scan_all(self, start, end, tank_ids):
+            return columns([], [], [])
+
+    class Reports:
+        def __init__(self):
+            self.saved_dates = []
+
+        async def upsert_many(self, summaries):
+            self.saved_dates.append(summaries[0].report_date)
+
+        async def find_report_dates(self, first, last):
+            return set(self.saved_dates)
+
+    class Rules:
+        async def find_all(self):
+            return []
+
+    class Index:
+        loaded = False
+
+        def find_all_tanks(self):
+            return [
+                WaterTank(
+                    tank_id=1, tank_name="1", tank_code="A_1", center_id=1, building_id=10
+                )
+            ]
+
+    reports, index = Reports(), Index()
+    generator = DailyReportGenerator(
+        History(), reports, Rules(), index, catchup_days=2, clock=lambda: now
+    )
+
+    with pytest.raises(ServerException):
+        await generator.run()
+    assert reports.saved_dates == []
+
+    index.loaded = True
+    await generator.run()
+    assert reports.saved_dates == [date(2024, 1, 8), date(2024, 1, 9)]
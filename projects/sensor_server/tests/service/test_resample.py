@@ -0,0 +1,113 @@
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import numpy as np
+
+from src.facility.domains import WaterTank
+from src.facility.index import FacilityIndex
+from src.facility.service import FacilityService
+from src.sensor.columnar import ColumnarSensorRecordHistoryRepository
+from src.sensor.domains import (
+    METRICS,
+    WaterTankSensorRecord,
+    WaterTankSensorRecordColumns,
+    WaterTankSensorRecordContent,
+)
+from src.sensor.resample import align_buckets, fill_gaps
+from src.sensor.service import SensorRecordService
+
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+NAN = np.nan
+
+
+def test_align_buckets_places_buckets_by_tank_and_time():
+    columns = WaterTankSensorRecordColumns(
+        tank_id=np.array([7, 7, 3]),
+        recorded_at=np.array([600, 840, 720]),
+        **{name: np.array([1.0, 1.0, 2.0]) for name in METRICS},
+    )
+
+    tank_ids, matrix = align_buckets(columns, start=600, bucket=60, buckets=5)
+
+    assert tank_ids.tolist() == [3, 7]
+    np.testing.assert_array_equal(
+        matrix[:, :, 0], [[NAN, NAN, 2.0, NAN, NAN], [1.0, NAN, NAN, NAN, 1.0]]
+    )
+
+
+def test_fill_gaps_respects_max_gap():
+    series = np.array([[NAN, 1.0, NAN, 3.0, NAN, NAN, NAN, 7.0, NAN]])[..., None]
+
+    def fill(method, max_gap):
+        return fill_gaps(series, method, max_gap)[0, :, 0].tolist()
+
+    np.testing.assert_array_equal(
+        fill("locf", 2), [NAN, 1.0, 1.0, 3.0, 3.0, 3.0, NAN, 7.0, 7.0]
+    )
+    np.testing.assert_array_equal(
+        fill("linear", 1), [NAN, 1.0, 2.0, 3.0, NAN, NAN, NAN, 7.0, NAN]
+    )
+    np.testing.assert_array_equal(
+        fill("linear", 3), [NAN, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, NAN]
+    )
+    np.testing.assert_array_equal(fill("none", 3), series[0, :, 0])
+
+
+async def test_resample_returns_one_matrix_for_several_tanks(tmp_path: Path):
+    index = FacilityIndex(None, None, None, None)
+    for tank_id in (1, 2, 3):
+        index.put_tank(
+            WaterTank(
+                tank_id=tank_id,
+                tank_name=f"t{tank_id}",
+                tank_code=f"t{tank_id}",
+                center_id=1,
+                building_id=1,
+            )
+        )
+    index.loaded = True
+    history = ColumnarSensorRecordHistoryRepository(str(tmp_path))
+    service = SensorRecordService(
+        None, history, FacilityService(None, None, None, index, None)
+    )
+
+    # 수조 1: 0~9분 매분 (4~6분 누락), 수조 2: 2분 전 마지막 값, 수조 3: 측정 없음
+    minutes = [(1, m, float(m)) for m in range(10) if m not in (4, 5, 6)]
+    minutes.append((2, -2, 50.0))
+    await history.insert_many(
+        [
+            WaterTankSensorRecord(
+                tank_id=tank_id,
+                content=WaterTankSensorRecordContent(
+                    temperature=value,
+                    ph=7.0,
+                    dissolved_oxygen=8.0,
+                    salinity=30.0,
+                    recorded_at=START + timedelta(minutes=minute, seconds=10),
+                ),
+            )
+            for tank_id, minute, value in minutes
+        ]
+    )
+
+    grid = await service.resample_tank_history(
+        ["t2", "t1", "t3"],
+        START,
+        START + timedelta(minutes=8),
+        timedelta(minutes=1),
+        fill="linear",
+        max_gap=3,
+    )
+
+    assert grid.values.shape == (3, 8, len(METRICS))
+    assert grid.timestamps[0] == int(START.timestamp())
+    np.testing.assert_array_equal(grid.values[1, :, 0], np.arange(8.0))
+    assert grid.filled[1, :, 0].tolist() == [False] * 4 + [True] * 3 + [False]
+    # 수조 2 는 구간 앞의 값만 있어 선형 보간 불가, 수조 3 은 값 없음
+    assert np.isnan(grid.values[[0, 2]]).all()
+
+    locf = await service.resample_tank_history(
+        ["t2"], START, START + timedelta(minutes=3), timedelta(minutes=1), "locf", 3
+    )
+    # 구간 앞(-2분)의 값으로 max_gap(3분) 까지 채움
+    np.testing.assert_array_equal(locf.values[0, :, 0], [50.0, 50.0, NAN])
@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+from src.monitoring.rolling import RollingStatistics
+from src.sensor.domains import METRICS, WaterTankSensorRecordColumns
+
+
+def columns(tank_id, recorded_at, values) -> WaterTankSensorRecordColumns:
+    values = np.asarray(values, dtype=np.float64).reshape(len(tank_id), len(METRICS))
+    return WaterTankSensorRecordColumns(
+        tank_id=np.asarray(tank_id, dtype=np.int64),
+        recorded_at=np.asarray(recorded_at, dtype=np.int64),
+        **{name: values[:, m] for m, name in enumerate(METRICS)},
+    )
+
+
+def test_matches_numpy_over_each_window():
+    rng = np.random.default_rng(0)
+    statistics = RollingStatistics(windows=[60, 300], capacity=64, initial_tanks=2)
+
+    # 수조 5개, 수조마다 10초 간격 120회 (수조 수 증가 / 구간 만료 / ring 덮어쓰기 포함)
+    tank_id = np.repeat(np.arange(5), 120)
+    recorded_at = np.tile(np.arange(120) * 10, 5)
+    values = rng.normal(20.0, 3.0, size=(len(tank_id), len(METRICS)))
+    order = rng.permutation(len(tank_id))
+    for chunk in np.array_split(order, 7):
+        statistics.on_records(columns(tank_id[chunk], recorded_at[chunk], values[chunk]))
+
+    for window in (60, 300):
+        snapshot = statistics.snapshot(window)
+        assert [s.tank_id for s in snapshot] == [0, 1, 2, 3, 4]
+        for s in snapshot:
+            # 묶음 순서가 섞였으므로 마지막 측정 시간 이후의 값만 반영됨 → 기대값도 같은 규칙으로 계산
+            rows = np.flatnonzero(tank_id == s.tank_id)
+            accepted, last_at = [], -1
+            for chunk in np.array_split(order, 7):
+                chunk_rows = np.sort(chunk[np.isin(chunk, rows)])
+                for row in chunk_rows[np.argsort(recorded_at[chunk_rows], kind="stable")]:
+                    if recorded_at[row] > last_at:
+                        accepted.append(row)
+                        last_at = recorded_at[row]
+            accepted = np.asarray(accepted)
+            expected = values[accepted[recorded_at[accepted] > last_at - window]]
+
+            assert s.count == len(expected)
+            for m, name in enumerate(METRICS):
+                metric = getattr(s, name)
+                assert metric.mean == pytest.approx(expected[:, m].mean())
+                assert metric.stddev == pytest.approx(expected[:, m].std(ddof=1))
+                assert metric.minimum == expected[:, m].min()
+                assert metric.maximum == expected[:, m].max()
+
+
+def test_ewma_and_late_or_invalid_readings():
+    statistics = RollingStatistics(windows=[100], capacity=8)
+
+    statistics.on_records(columns([3], [0], [10.0] * 4))
+    statistics.on_records(columns([3], [100], [20.0] * 4))
+    statistics.on_records(columns([3], [50], [99.0] * 4))
+    statistics.on_records(columns([3], [200], [[np.nan, 1.0, 1.0, 1.0]]))
+
+    (s,) = statistics.snapshot(100, [3, 7])
+    # 50초(늦게 도착)와 NaN 이 있는 측정 값은 무시, 구간 (0, 100] 에는 100초 측정 값만 남음
+    assert s.count == 1
+    assert s.ph.mean == 20.0 and s.ph.stddev == 0.0
+    assert s.ph.minimum == s.ph.maximum == 20.0
+    # 시간 상수 100초, 100초 경과 → 10 + (1 - e^-1) * 10
+    assert s.ph.ewma == pytest.approx(10.0 + (1 - np.exp(-1)) * 10.0)
+    assert len(statistics) == 1
+
+    with pytest.raises(ValueError):
+        statistics.snapshot(60)
@@ -0,0 +1,168 @@
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+from src.scheduler.domains import ScheduledJob
+from src.scheduler.leader import AdvisoryLockLeaderElection
+from src.scheduler.schedule import CronSchedule, IntervalSchedule
+from src.scheduler.scheduler import JobScheduler
+
+
+class LeaderElection:
+    def __init__(self, is_leader: bool = True):
+        self.is_leader = is_leader
+        self.listeners = []
+
+    async def start(self):
+        pass
+
+    async def stop(self):
+        pass
+
+    def set_leader(self, is_leader: bool):
+        self.is_leader = is_leader
+        for listener in self.listeners:
+            listener(is_leader)
+
+
+def timestamp(*args) -> float:
+    return datetime(*args, tzinfo=timezone.utc).timestamp()
+
+
+def test_interval_schedule_is_aligned_to_epoch():
+    schedule = IntervalSchedule(60)
+
+    assert schedule.next_after(119.5) == 120
+    assert schedule.next_after(120) == 180
+
+
+@pytest.mark.parametrize(
+    "expression, after, expected",
+    [
+        ("*/15 * * * *", (2025, 1, 1, 10, 7), (2025, 1, 1, 10, 15)),
+        ("0 3 * * *", (2025, 1, 1, 3, 0), (2025, 1, 2, 3, 0)),
+        ("30 9 * * 1-5", (2025, 1, 3, 10, 0), (2025, 1, 6, 9, 30)),  # 금 → 월
+        ("0 0 1 */3 *", (2025, 2, 10, 0, 0), (2025, 4, 1, 0, 0)),
+        ("0 12 29 2 *", (2025, 3, 1, 0, 0), (2028, 2, 29, 12, 0)),
+        # 일과 요일이 모두 지정되면 둘 중 하나만 맞아도 실행
+        ("0 0 15 * 0", (2025, 1, 6, 0, 0), (2025, 1, 12, 0, 0)),
+    ],
+)
+def test_cron_schedule(expression, after, expected):
+    assert CronSchedule(expression).next_after(timestamp(*after)) == timestamp(*expected)
+
+
+def test_cron_schedule_rejects_invalid_expression():
+    for expression in ("* * * *", "60 * * * *", "*/0 * * * *"):
+        with pytest.raises(ValueError):
+            CronSchedule(expression)
+
+
+async def test_leader_only_jobs_run_on_leader():
+    runs = []
+
+    async def job(name):
+        runs.append(name)
+
+    leader = LeaderElection(is_leader=False)
+    scheduler = JobScheduler(
+        leader,
+        [
+            ScheduledJob("leader", IntervalSchedule(0.02), lambda: job("leader")),
+            ScheduledJob(
+                "every", IntervalSchedule(0.02), lambda: job("every"), leader_only=False
+            ),
+        ],
+    )
+    await scheduler.start()
+    await asyncio.sleep(0.1)
+    assert "leader" not in runs and "every" in runs
+
+    leader.set_leader(True)
+    await asyncio.sleep(0.1)
+    await scheduler.stop()
+    assert "leader" in runs
+
+
+async def test_job_timeout_concurrency_and_leadership_loss():
+    started = asyncio.Event()
+    cancelled = []
+
+    async def slow():
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    leader = LeaderElection()
+    job = ScheduledJob("slow", IntervalSchedule(3600), slow, max_concurrency=1)
+    scheduler = JobScheduler(leader, [job])
+
+    task = scheduler.trigger(job, 0)
+    await started.wait()
+    # 실행 중이면 건너뜀
+    assert scheduler.trigger(job, 0) is None
+    assert scheduler.running("slow") == 1
+
+    # leader 를 잃으면 실행 중인 작업 취소
+    leader.set_leader(False)
+    await asyncio.gather(task, return_exceptions=True)
+    assert cancelled == [True]
+    assert scheduler.running("slow") == 0
+
+    # 제한 시간을 넘으면 취소하고 다음 실행은 가능
+    leader.set_leader(True)
+    timed = ScheduledJob("timed", IntervalSchedule(3600), slow, timeout=0.01)
+    await scheduler.trigger(timed, 0)
+    assert cancelled == [True, True]
+    assert scheduler.running("timed") == 0
+
+
+async def test_advisory_lock_leader_election():
+    class Connection:
+        def __init__(self, locked: bool):
+            self.locked = locked
+            self.closed = False
+            self.on_terminated = None
+
+        def is_closed(self):
+            return self.closed
+
+        def add_termination_listener(self, listener):
+            self.on_terminated = listener
+
+        async def fetchval(self, query, *args, timeout=None):
+            return self.locked if "pg_try_advisory_lock" in query else 1
+
+        async def close(self, timeout=None):
+            self.closed = True
+
+    class SessionFactory:
+        def __init__(self):
+            self.connections = []
+
+        async def connect_raw(self):
+            self.connections.append(Connection(locked=len(self.connections) > 0))
+            return self.connections[-1]
+
+    changes = []
+    election = AdvisoryLockLeaderElection(SessionFactory(), lock_key=1)
+    election.listeners.append(changes.append)
+
+    # 다른 프로세스가 lock 을 가지고 있음
+    await election._elect()
+    assert not election.is_leader
+
+    # 커넥션이 끊기면 새 커넥션으로 다시 시도
+    connection = election._connection
+    connection.closed = True
+    connection.on_terminated(connection)
+    await election._elect()
+    assert election.is_leader
+
+    await election.stop()
+    assert not election.is_leader
+    assert changes == [True, False]
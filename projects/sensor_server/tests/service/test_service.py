@@ -126,6 +126,9 @@ async def test_record_tank_sensor_multiple_times(
     assert record.content.temperature == 20 + 9
     assert record.content.ph == 7 + 9
     assert record.content.dissolved_oxygen == 10 + 9
+    # 파생 항목은 저장 시 계산됨
+    assert record.content.oxygen_saturation == content.oxygen_saturation
+    assert record.content.oxygen_saturation is not None
 
     histories = await given_history_repository.find_all()
     histories.sort(key=lambda x: x.content.recorded_at)
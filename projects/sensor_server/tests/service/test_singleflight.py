@@ -0,0 +1,73 @@
+import asyncio
+
+import pytest
+from prometheus_client import REGISTRY
+
+from src.singleflight import SingleFlight
+
+
+def get_coalesced(name: str) -> float:
+    return REGISTRY.get_sample_value(
+        "singleflight_coalesced_calls_total", {"name": name}
+    ) or 0
+
+
+async def test_concurrent_calls_share_one_execution():
+    single_flight = SingleFlight("test_share")
+    calls = []
+
+    async def lookup():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "tank"
+
+    results = await asyncio.gather(
+        *(single_flight.do("tank_0001", lookup) for _ in range(64))
+    )
+
+    assert results == ["tank"] * 64
+    assert len(calls) == 1
+    assert get_coalesced("test_share") == 63
+    assert len(single_flight) == 0
+
+    # 끝난 호출은 캐시하지 않음
+    await single_flight.do("tank_0001", lookup)
+    assert len(calls) == 2
+
+
+async def test_cancelling_one_caller_does_not_cancel_others():
+    single_flight = SingleFlight("test_cancel")
+    release = asyncio.Event()
+
+    async def lookup():
+        await release.wait()
+        return 42
+
+    first = asyncio.create_task(single_flight.do("key", lookup))
+    second = asyncio.create_task(single_flight.do("key", lookup))
+    await asyncio.sleep(0)
+
+    first.cancel()
+    release.set()
+
+    assert await second == 42
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+
+async def test_errors_are_shared_and_not_cached():
+    single_flight = SingleFlight("test_error")
+    calls = []
+
+    async def lookup():
+        calls.append(1)
+        await asyncio.sleep(0)
+        raise KeyError("tank_0001")
+
+    results = await asyncio.gather(
+        *(single_flight.do("key", lookup) for _ in range(3)), return_exceptions=True
+    )
+
+    assert all(isinstance(result, KeyError) for result in results)
+    assert len(calls) == 1
+    assert len(single_flight) == 0
@@ -0,0 +1,161 @@
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import numpy as np
+
+from src.sensor.columnar import ColumnarSensorRecordHistoryRepository
+from src.sensor.domains import (
+    METRICS,
+    WaterTankSensorRecord,
+    WaterTankSensorRecordColumns,
+    WaterTankSensorRecordContent,
+)
+from src.sensor.service import SensorRecordService
+from src.sketch.aggregator import SketchAggregator
+from src.sketch.ddsketch import DDSketchMapping
+from src.sketch.repository import merge_sketch
+from src.sketch.service import merge_counts
+
+QUANTILES = [0.0, 0.1, 0.5, 0.9, 0.95, 0.99, 1.0]
+
+
+def columns(tank_id, recorded_at, values) -> WaterTankSensorRecordColumns:
+    n = len(tank_id)
+    return WaterTankSensorRecordColumns(
+        tank_id=np.asarray(tank_id, dtype=np.int64),
+        recorded_at=np.asarray(recorded_at, dtype=np.int64),
+        temperature=np.asarray(values, dtype=np.float64),
+        ph=np.full(n, 7.0),
+        dissolved_oxygen=np.full(n, np.nan),
+        salinity=np.full(n, 30.0),
+    )
+
+
+def sketch_counts(mapping: DDSketchMapping, values: np.ndarray) -> np.ndarray:
+    return np.bincount(mapping.to_bins(values), minlength=mapping.bins)
+
+
+def test_quantiles_within_relative_accuracy():
+    mapping = DDSketchMapping(relative_accuracy=0.01)
+    rng = np.random.default_rng(0)
+    values = np.concatenate(
+        [rng.lognormal(2.0, 1.0, 10_000), -rng.lognormal(0.0, 0.5, 1_000)]
+    )
+
+    estimates = mapping.quantiles(sketch_counts(mapping, values), QUANTILES)
+
+    # 추정 값은 실제 분위수(lower)의 relative_accuracy 이내
+    expected = np.quantile(values, QUANTILES, method="lower")
+    assert np.all(np.abs(estimates - expected) <= 0.01 * np.abs(expected) + 1e-12)
+
+
+def test_merged_sketches_equal_sketch_of_all_values():
+    mapping = DDSketchMapping()
+    rng = np.random.default_rng(1)
+    values = rng.normal(25.0, 3.0, 5_000)
+    parts = np.array_split(values, 3)
+
+    merged = np.zeros(mapping.bins, dtype=np.int64)
+    for part in parts:
+        merged += sketch_counts(mapping, part)
+    assert np.array_equal(merged, sketch_counts(mapping, values))
+
+    # sparse 저장 형식으로 합쳐도 같음
+    class Sparse:
+        def __init__(self, counts):
+            self.bins = np.flatnonzero(counts).tolist()
+            self.counts = counts[self.bins].tolist()
+
+    first, second = (Sparse(sketch_counts(mapping, p)) for p in (parts[0], parts[1]))
+    bins, counts = merge_sketch(first.bins, first.counts, second)
+    dense = np.zeros(mapping.bins, dtype=np.int64)
+    dense[bins] = counts
+    assert np.array_equal(dense, sketch_counts(mapping, np.concatenate(parts[:2])))
+
+
+async def test_aggregator_flushes_per_bucket_and_retries():
+    mapping = DDSketchMapping()
+
+    class Repository:
+        def __init__(self):
+            self.fail = True
+            self.merged = {}
+
+        async def merge_many(self, bucket_at, sketches):
+            if self.fail:
+                raise ConnectionError("database is down")
+            self.merged.setdefault(bucket_at, []).extend(sketches)
+
+    repository = Repository()
+    aggregator = SketchAggregator(repository, mapping, bucket=3600)
+    aggregator.on_records(columns([1, 2, 1], [10, 20, 3700], [20.0, 21.0, 22.0]))
+    aggregator.on_records(columns([1], [30], [20.0]))
+
+    # 실패하면 다음 flush 때 다시 시도
+    await aggregator.flush()
+    assert sorted(aggregator.pending) == [0, 3600]
+    repository.fail = False
+    await aggregator.flush()
+    assert not aggregator.pending
+
+    assert sorted(int(b.timestamp()) for b in repository.merged) == [0, 3600]
+    first = {(s.tank_id, s.metric): s for s in repository.merged[min(repository.merged)]}
+    # dissolved_oxygen 은 NaN 이므로 sketch 가 없음
+    assert sorted(first) == [
+        (1, "ph"),
+        (1, "salinity"),
+        (1, "temperature"),
+        (2, "ph"),
+        (2, "salinity"),
+        (2, "temperature"),
+    ]
+    temperature = first[(1, "temperature")]
+    assert temperature.bins == mapping.to_bins(np.array([20.0])).tolist()
+    assert temperature.counts == [2]
+
+    counts = merge_counts(mapping, list(first.values()))
+    assert counts.sum() == 9  # 측정 값 3개 x 항목 3개
+    # 수조 1, 2 의 temperature 만 합친 분위수
+    temperatures = merge_counts(
+        mapping, [first[(1, "temperature")], first[(2, "temperature")]]
+    )
+    low, high = mapping.quantiles(temperatures, [0.0, 1.0])
+    assert abs(low - 20.0) <= 0.01 * 20.0
+    assert abs(high - 21.0) <= 0.01 * 21.0
+
+
+async def test_aggregator_counts_each_stored_record_once(tmp_path: Path):
+    """재시도 / spool 재처리로 다시 저장되는 측정 값은 sketch 에 다시 세지 않음"""
+
+    class LatestRepository:
+        async def upsert_many(self, records):
+            pass
+
+    aggregator = SketchAggregator(None, DDSketchMapping(), bucket=3600)
+    service = SensorRecordService(
+        repository=LatestRepository(),
+        history_repository=ColumnarSensorRecordHistoryRepository(str(tmp_path)),
+        facility_service=None,
+        history_listeners=[aggregator],
+    )
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    records = [
+        WaterTankSensorRecord(
+            tank_id=1,
+            content=WaterTankSensorRecordContent(
+                temperature=20.0 + i,
+                ph=7.0,
+                dissolved_oxygen=10.0,
+                salinity=30.0,
+                recorded_at=start + timedelta(seconds=i),
+            ),
+        )
+        for i in range(3)
+    ]
+
+    await service.write_records(records[:2])
+    await service.write_records(records)  # 앞의 두 값은 이미 저장됨
+
+    (parts,) = aggregator.pending.values()
+    counted = sum(len(indexes) for indexes, _ in parts)
+    assert counted == 3 * len(METRICS)
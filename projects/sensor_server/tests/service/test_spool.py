@@ -0,0 +1,172 @@
+import asyncio
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List
+
+from src.exceptions import DBIntegrityException
+from src.sensor.domains import WaterTankSensorRecord, WaterTankSensorRecordContent
+from src.sensor.service import SensorRecordService
+from src.sensor.spool import (
+    FRAME_SIZE,
+    claim_spool_directory,
+    decode_frames,
+    SensorRecordSpool,
+    SensorRecordSpoolReplayer,
+)
+
+
+def create_records(count: int, tank_id: int = 1) -> List[WaterTankSensorRecord]:
+    return [
+        WaterTankSensorRecord(
+            tank_id=tank_id,
+            content=WaterTankSensorRecordContent(
+                temperature=20 + i,
+                ph=7,
+                dissolved_oxygen=10,
+                salinity=30,
+                recorded_at=datetime(2025, 1, 1, 12, 0, i, tzinfo=timezone.utc),
+            ),
+        )
+        for i in range(count)
+    ]
+
+
+async def test_spool_recovers_records_after_restart(tmp_path: Path):
+    """fsync 된 측정 값은 새 spool 인스턴스에서 다시 읽을 수 있음"""
+    spool = SensorRecordSpool(str(tmp_path), fsync_interval=0)
+    await spool.append(create_records(10))
+
+    recovered = SensorRecordSpool(str(tmp_path))
+    assert recovered.depth == 10
+    [segment] = recovered.sealed_segments()
+    assert await recovered.read_segment(segment) == create_records(10)
+
+
+async def test_spool_ignores_torn_tail(tmp_path: Path):
+    """쓰는 도중 잘린 마지막 frame 은 버림"""
+    spool = SensorRecordSpool(str(tmp_path), fsync_interval=0)
+    await spool.append(create_records(3))
+    spool.seal()
+    [segment] = spool.sealed_segments()
+    with open(segment, "r+b") as file:
+        file.truncate(FRAME_SIZE * 3 - 5)
+
+    assert await spool.read_segment(segment) == create_records(2)
+
+
+async def test_spool_rotates_segments(tmp_path: Path):
+    spool = SensorRecordSpool(
+        str(tmp_path), segment_bytes=FRAME_SIZE * 4, fsync_interval=0
+    )
+    for record in create_records(10):
+        await spool.append([record])
+    spool.seal()
+
+    assert len(spool.sealed_segments()) == 3
+    assert spool.depth == 10
+
+
+async def test_claim_adopts_segments_of_unused_slots(tmp_path: Path):
+    """살아있는 worker 가 없는 slot 의 segment 는 새로 시작한 worker 가 가져감"""
+    slot_0, lock_0 = claim_spool_directory(str(tmp_path))
+    slot_1, lock_1 = claim_spool_directory(str(tmp_path))
+    await SensorRecordSpool(slot_1, fsync_interval=0).append(create_records(2))
+    # worker 수가 줄어 다시 사용되지 않는 slot
+    orphan = SensorRecordSpool(str(tmp_path / "worker-5"), fsync_interval=0)
+    await orphan.append(create_records(3))
+    orphan.seal()
+    await orphan.append(create_records(4))
+
+    directory, lock = claim_spool_directory(str(tmp_path))
+
+    assert directory == str(tmp_path / "worker-2")
+    spool = SensorRecordSpool(directory)
+    assert spool.depth == 7
+    assert [
+        await spool.read_segment(segment) for segment in spool.sealed_segments()
+    ] == [create_records(3), create_records(4)]
+    # lock 이 잡혀있는 slot 은 그대로 유지
+    assert SensorRecordSpool(slot_1).depth == 2
+    assert list((tmp_path / "worker-5").glob("*.spool")) == []
+    for file in (lock_0, lock_1, lock):
+        file.close()
+
+
+async def test_replayer_drains_spool(tmp_path: Path):
+    spool = SensorRecordSpool(str(tmp_path), fsync_interval=0)
+    await spool.append(create_records(10))
+    written = []
+
+    async def writer(records: List[WaterTankSensorRecord]):
+        written.extend(records)
+
+    replayer = SensorRecordSpoolReplayer(spool, writer, batch_size=3)
+
+    assert await replayer.replay() == 10
+    assert written == create_records(10)
+    assert spool.depth == 0
+    assert spool.sealed_segments() == []
+
+
+async def test_replayer_keeps_segment_when_database_is_down(tmp_path: Path):
+    spool = SensorRecordSpool(str(tmp_path), fsync_interval=0)
+    await spool.append(create_records(5))
+
+    async def failing_writer(records: List[WaterTankSensorRecord]):
+        raise ConnectionRefusedError()
+
+    replayer = SensorRecordSpoolReplayer(spool, failing_writer)
+
+    try:
+        await replayer.replay()
+    except ConnectionRefusedError:
+        pass
+    assert spool.depth == 5
+
+
+async def test_replayer_rejects_only_unrecoverable_records(tmp_path: Path):
+    """저장할 수 없는 측정 값만 .rejected 로 옮기고 나머지는 반영"""
+    spool = SensorRecordSpool(str(tmp_path), fsync_interval=0)
+    records = create_records(10)
+    await spool.append(records)
+    saved = []
+
+    async def rejecting_writer(batch: List[WaterTankSensorRecord]):
+        if records[3] in batch:
+            raise DBIntegrityException("unknown tank")
+        saved.extend(batch)
+
+    replayer = SensorRecordSpoolReplayer(spool, rejecting_writer, batch_size=8)
+
+    assert await replayer.replay() == 9
+    assert spool.depth == 0
+    assert saved == records[:3] + records[4:]
+    (rejected,) = tmp_path.glob("*.rejected")
+    assert decode_frames(rejected.read_bytes()) == [records[3]]
+
+
+class SlowRepository:
+    """latency budget 보다 느린 저장소"""
+
+    async def upsert_many(self, records):
+        await asyncio.sleep(1)
+
+    async def insert_many(self, records):
+        await asyncio.sleep(1)
+        return records
+
+
+async def test_service_spools_when_database_is_slow(tmp_path: Path):
+    """DB 저장이 latency budget 을 넘으면 spool 에 기록"""
+    spool = SensorRecordSpool(str(tmp_path), fsync_interval=0)
+    service = SensorRecordService(
+        repository=SlowRepository(),
+        history_repository=SlowRepository(),
+        facility_service=None,
+        spool=spool,
+        spool_latency_budget=0.01,
+    )
+
+    await service.save_records(create_records(3))
+
+    assert spool.depth == 3
@@ -0,0 +1,138 @@
+import asyncio
+
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from webapp.admission import AdaptiveConcurrencyLimiter
+from webapp.middleware import AdmissionControlMiddleware
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_limiter_decreases_once_per_interval_on_congestion():
+    clock = FakeClock()
+    limiter = AdaptiveConcurrencyLimiter(
+        initial_limit=10, target_latency=0.5, backoff_ratio=0.5, clock=clock
+    )
+    for _ in range(3):
+        assert limiter.try_acquire()
+    # 같은 시점에 끝난 느린 요청들은 한 번만 줄임
+    for _ in range(3):
+        limiter.release(latency=1.0, pool_wait=0.0, failed=False)
+
+    assert limiter.limit == 5
+    assert limiter.congested
+
+    clock.now = 1.0
+    assert limiter.try_acquire()
+    limiter.release(latency=0.0, pool_wait=0.3, failed=False)  # 커넥션 대기
+    assert limiter.limit == 2.5
+
+
+def test_limiter_increases_only_when_limit_is_used():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=5)
+
+    assert limiter.try_acquire()
+    limiter.release(latency=0.01, pool_wait=0.0, failed=False)
+    assert limiter.limit == 4  # 한가할 때는 그대로
+
+    for _ in range(4):
+        assert limiter.try_acquire()
+    assert not limiter.try_acquire()
+    for _ in range(4):
+        limiter.release(latency=0.01, pool_wait=0.0, failed=False)
+
+    assert 4 < limiter.limit <= 5
+    assert not limiter.congested
+
+
+def test_limiter_stays_congested_for_decrease_interval():
+    """혼잡 중에 빨리 끝난 요청 하나로 혼잡이 풀리지 않음"""
+    clock = FakeClock()
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=10, target_latency=0.5, clock=clock)
+    for latency in (1.0, 0.01):
+        assert limiter.try_acquire()
+        limiter.release(latency=latency, pool_wait=0.0, failed=False)
+    assert limiter.congested
+
+    clock.now = 0.5
+    assert not limiter.congested
+
+
+def create_test_app(limiter: AdaptiveConcurrencyLimiter, release: asyncio.Event):
+    async def record(request):
+        await release.wait()
+        return JSONResponse({"ok": True}, status_code=201)
+
+    async def fail(request):
+        return JSONResponse({"ok": False}, status_code=500)
+
+    async def health(request):
+        return JSONResponse({"status": "ok"})
+
+    app = Starlette(
+        routes=[
+            Route("/api/records/water-tank-sensor", record, methods=["POST"]),
+            Route("/api/reports/daily", record),
+            Route("/api/records/fail", fail, methods=["POST"]),
+            Route("/health", health),
+        ]
+    )
+    return AdmissionControlMiddleware(
+        app,
+        limiter=limiter,
+        path_prefixes=["/api/records/", "/api/reports/"],
+        retry_after=2,
+    )
+
+
+async def test_middleware_rejects_requests_over_limit():
+    clock = FakeClock()
+    limiter = AdaptiveConcurrencyLimiter(
+        initial_limit=2, min_limit=1, max_limit=2, clock=clock
+    )
+    release = asyncio.Event()
+    app = create_test_app(limiter, release)
+
+    async with AsyncClient(
+        transport=ASGITransport(app), base_url="http://test"
+    ) as client:
+        admitted = [
+            asyncio.create_task(client.post("/api/records/water-tank-sensor")),
+            asyncio.create_task(client.get("/api/reports/daily")),
+        ]
+        while limiter.inflight < 2:
+            await asyncio.sleep(0)
+
+        rejected = await client.post("/api/records/water-tank-sensor")
+        assert rejected.status_code == 429
+        assert rejected.headers["retry-after"] == "2"
+
+        # 한도와 관계없이 health 는 응답
+        assert (await client.get("/health")).status_code == 200
+
+        release.set()
+        assert [r.status_code for r in await asyncio.gather(*admitted)] == [201, 201]
+        assert limiter.inflight == 0
+
+        # 서버 오류로 한도를 줄인 뒤 decrease_interval 동안은 503
+        assert (await client.post("/api/records/fail")).status_code == 500
+        release.clear()
+        admitted = asyncio.create_task(client.post("/api/records/water-tank-sensor"))
+        while limiter.inflight < 1:
+            await asyncio.sleep(0)
+        assert (await client.post("/api/records/water-tank-sensor")).status_code == 503
+
+        clock.now = 1.0
+        assert (await client.post("/api/records/water-tank-sensor")).status_code == 429
+
+        release.set()
+        assert (await admitted).status_code == 201
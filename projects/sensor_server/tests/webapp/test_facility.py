@@ -0,0 +1,80 @@
+from httpx import AsyncClient
+
+
+async def test_provision_center(
+    given_test_client: AsyncClient,
+):
+    response = await given_test_client.post(
+        "/api/facilities/centers",
+        json={
+            "center_name": "provision_center",
+            "buildings": [
+                {"building_name": "제1동", "tank_names": ["제1탱크", "제2탱크"]},
+                {"building_name": "제2동", "tank_names": ["제1탱크"]},
+            ],
+        },
+    )
+
+    assert response.status_code == 201
+    body = response.json()
+    assert [building["building_name"] for building in body["buildings"]] == [
+        "제1동",
+        "제2동",
+    ]
+    assert [len(building["tanks"]) for building in body["buildings"]] == [2, 1]
+
+
+async def test_provision_center_with_duplicated_building(
+    given_test_client: AsyncClient,
+):
+    response = await given_test_client.post(
+        "/api/facilities/centers",
+        json={
+            "center_name": "provision_center",
+            "buildings": [
+                {"building_name": "제1동", "tank_names": ["제1탱크"]},
+                {"building_name": "제1동", "tank_names": ["제2탱크"]},
+            ],
+        },
+    )
+
+    assert response.status_code == 400
+
+
+async def test_provision_center_with_empty_tank_name(
+    given_test_client: AsyncClient,
+):
+    response = await given_test_client.post(
+        "/api/facilities/centers",
+        json={
+            "center_name": "provision_center",
+            "buildings": [{"building_name": "제1동", "tank_names": ["제1탱크", ""]}],
+        },
+    )
+
+    assert response.status_code == 422
+
+
+async def test_provision_center_with_empty_center_name(
+    given_test_client: AsyncClient,
+):
+    response = await given_test_client.post(
+        "/api/facilities/centers",
+        json={"center_name": "", "buildings": []},
+    )
+
+    assert response.status_code == 422
+
+
+async def test_provision_center_with_empty_building_name(
+    given_test_client: AsyncClient,
+):
+    response = await given_test_client.post(
+        "/api/facilities/centers",
+        json={
+            "center_name": "provision_center",
+            "buildings": [{"building_name": "", "tank_names": ["제1탱크"]}],
+        },
+    )
+
+    assert response.status_code == 422
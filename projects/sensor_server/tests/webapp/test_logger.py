@@ -0,0 +1,93 @@
+import json
+import logging
+import queue
+import sys
+from logging.handlers import QueueListener
+
+from webapp.logger import JSONFormatter, LightweightQueueHandler, TracebackSampler
+
+
+def create_error_record(route: str, error: Exception = ValueError("boom")):
+    try:
+        raise error
+    except Exception:
+        record = logging.LogRecord(
+            "test", logging.ERROR, __file__, 1, "error %s", ("args",), sys.exc_info()
+        )
+    record.route = route
+    return record
+
+
+def test_sampler_limits_tracebacks_per_exception_and_route():
+    now = [0.0]
+    sampler = TracebackSampler(limit=2, interval=60, clock=lambda: now[0])
+
+    records = [create_error_record("/a") for _ in range(5)]
+    passed = [sampler.filter(record) for record in records]
+    other_route = create_error_record("/b")
+    plain = logging.LogRecord("test", logging.INFO, __file__, 1, "ok", None, None)
+
+    # limit 을 넘은 로그도 남기되 traceback 만 생략
+    assert passed == [True] * 5
+    assert [record.exc_info is not None for record in records] == [True, True, False, False, False]
+    assert records[-1].getMessage() == "error args"
+    assert sampler.filter(other_route) is True and other_route.exc_info is not None
+    assert sampler.filter(plain) is True
+
+    message = json.loads(JSONFormatter().format(records[-1]))
+    assert message["exception"] == {"type": "ValueError", "message": "boom"}
+
+    # 다음 주기의 첫 로그에 생략된 수 기록
+    now[0] = 61
+    record = create_error_record("/a")
+    assert sampler.filter(record) is True
+    assert record.suppressed == 3
+
+
+def test_sampler_flushes_suppressed_counts(caplog):
+    now = [0.0]
+    sampler = TracebackSampler(limit=1, interval=60, clock=lambda: now[0])
+    for _ in range(3):
+        sampler.filter(create_error_record("/a"))
+    now[0] = 30
+    for _ in range(2):
+        sampler.filter(create_error_record("/b"))
+
+    # 주기가 끝난 것만 요약, 종료 시에는 모두 요약
+    with caplog.at_level(logging.WARNING, logger="webapp.logger"):
+        now[0] = 61
+        sampler.flush()
+        assert [record.suppressed for record in caplog.records] == [2]
+        sampler.stop()
+        assert [record.suppressed for record in caplog.records] == [2, 1]
+
+
+def test_queue_handler_formats_on_listener_thread():
+    log_queue = queue.SimpleQueue()
+    records = []
+
+    class CollectingHandler(logging.Handler):
+        def emit(self, record):
+            records.append(self.format(record))
+
+    handler = CollectingHandler()
+    handler.setFormatter(JSONFormatter())
+    listener = QueueListener(log_queue, handler)
+    listener.start()
+    LightweightQueueHandler(log_queue).handle(create_error_record("/a"))
+    listener.stop()
+
+    [message] = [json.loads(record) for record in records]
+    assert message["message"] == "error args"
+    assert message["exception"]["type"] == "ValueError"
+    assert "raise error" in message["exception"]["traceback"]
+
+
+def test_formatter_uses_record_time_in_kst():
+    record = logging.LogRecord("test", logging.INFO, __file__, 1, "한글", None, None)
+    record.created = 1735689600.25  # 2025-01-01 00:00:00.250 UTC
+
+    message = json.loads(JSONFormatter().format(record))
+
+    assert message["timestamp"] == "2025-01-01 09:00:00,250"
+    assert message["message"] == "한글"
@@ -0,0 +1,18 @@
+import json
+from pathlib import Path
+
+from fastapi import FastAPI
+
+RESOURCE_DIR = Path(__file__).parent.parent / "resources"
+
+
+def test_existing_endpoints_keep_openapi_schema(given_fastapi_app: FastAPI):
+    """기존 endpoint 의 공개 스키마는 바뀌지 않음 (수집 경로를 msgspec 으로 바꾼 뒤에도 DTO 기준 그대로)"""
+    baseline = json.loads((RESOURCE_DIR / "openapi_baseline.json").read_text())
+
+    schema = given_fastapi_app.openapi()
+
+    for path, operations in baseline["paths"].items():
+        assert schema["paths"][path] == operations, path
+    for name, component in baseline["components"]["schemas"].items():
+        assert schema["components"]["schemas"][name] == component, name
@@ -1,7 +1,13 @@
+import gzip
+
+import numpy as np
 from httpx import AsyncClient
 
 from src.facility.domains import WaterTank
-from datetime import datetime
+from src.sensor.domains import WaterTankSensorRecordBatch
+from src.sensor.frame import MEDIA_TYPE, encode_frame
+from src.sensor.repository import WaterTankSensorRecordHistoryRepository
+from datetime import datetime, timedelta, timezone
 
 
 async def test_record_tank_sensor(
@@ -22,3 +28,78 @@ async def test_record_tank_sensor(
         )
 
         assert response.status_code == 201
+        assert response.json() == {"ok": True}
+
+
+async def test_record_tank_sensors_with_float_timestamp(
+    given_test_client: AsyncClient,
+    given_tank: WaterTank,
+    given_history_repository: WaterTankSensorRecordHistoryRepository,
+):
+    """소수점 이하가 있는 측정 시간도 기록"""
+    start = datetime(2025, 2, 1, tzinfo=timezone.utc)
+    recorded_at = start.timestamp() + 0.5
+    response = await given_test_client.post(
+        "/api/records/water-tank-sensors",
+        json=[
+            {
+                "tank_code": given_tank.tank_code,
+                "temperature": 20,
+                "ph": 7,
+                "salinity": 10,
+                "dissolved_oxygen": 100,
+                "recorded_at": recorded_at,
+            }
+        ],
+    )
+
+    assert response.status_code == 201
+    [record] = await given_history_repository.find_range(
+        given_tank.tank_id, start, start + timedelta(seconds=1)
+    )
+    assert record.content.recorded_at.timestamp() == recorded_at
+
+
+async def test_record_tank_sensor_rejects_invalid_body(
+    given_test_client: AsyncClient,
+    given_tank: WaterTank,
+):
+    """decode 단계의 검증 오류는 기존과 같이 422"""
+    response = await given_test_client.post(
+        "/api/records/water-tank-sensor",
+        json={
+            "tank_code": given_tank.tank_code,
+            "temperature": "hot",
+            "ph": 7,
+            "salinity": 10,
+            "dissolved_oxygen": 100,
+            "recorded_at": int(datetime(2025, 1, 1).timestamp()),
+        },
+    )
+
+    assert response.status_code == 422
+    assert response.json()["message"][0]["loc"] == ["body", "temperature"]
+
+
+async def test_record_tank_sensors_with_compressed_frame(
+    given_test_client: AsyncClient,
+    given_tank: WaterTank,
+):
+    """gzip 으로 압축된 binary frame 일괄 기록"""
+    batch = WaterTankSensorRecordBatch(
+        tank_codes=[given_tank.tank_code],
+        code_index=np.zeros(10, dtype=np.int64),
+        recorded_at=np.arange(10) + int(datetime(2025, 1, 2).timestamp()),
+        temperature=np.full(10, 20.0),
+        ph=np.full(10, 7.0),
+        dissolved_oxygen=np.full(10, 100.0),
+        salinity=np.full(10, 10.0),
+    )
+
+    response = await given_test_client.post(
+        "/api/records/water-tank-sensors",
+        content=gzip.compress(encode_frame(batch)),
+        headers={"content-type": MEDIA_TYPE, "content-encoding": "gzip"},
+    )
+
+    assert response.status_code == 201
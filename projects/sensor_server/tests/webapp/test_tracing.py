@@ -0,0 +1,53 @@
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+from opentelemetry.trace import SpanKind, Status, StatusCode
+
+from webapp.settings import TracingSettings
+from webapp.tracing import create_tracer_provider
+
+
+def export_spans(settings: TracingSettings, errors: int, ok: int):
+    exporter = InMemorySpanExporter()
+    provider = create_tracer_provider(settings, exporter=exporter)
+    tracer = provider.get_tracer(__name__)
+
+    for _ in range(ok):
+        with tracer.start_as_current_span("request", kind=SpanKind.SERVER):
+            with tracer.start_as_current_span("query"):
+                pass
+    for _ in range(errors):
+        with tracer.start_as_current_span("request", kind=SpanKind.SERVER) as span:
+            with tracer.start_as_current_span("query") as child:
+                # sampling 되지 않은 요청은 root span 만 기록하고 자식 span 은 기록하지 않음
+                if not span.get_span_context().trace_flags.sampled:
+                    assert not child.is_recording()
+            span.set_status(Status(StatusCode.ERROR))
+
+    provider.force_flush()
+    spans = exporter.get_finished_spans()
+    provider.shutdown()
+    return spans
+
+
+def test_unsampled_error_spans_are_exported():
+    settings = TracingSettings(TRACE_SAMPLE_RATIO=0.0, TRACE_SAMPLE_ERRORS=True)
+
+    spans = export_spans(settings, errors=3, ok=10)
+
+    assert len(spans) == 3
+    assert all(span.context.trace_flags.sampled for span in spans)
+    assert all(span.status.status_code is StatusCode.ERROR for span in spans)
+
+
+def test_ratio_sampler_keeps_whole_traces():
+    settings = TracingSettings(TRACE_SAMPLE_RATIO=1.0, TRACE_SAMPLE_ERRORS=False)
+
+    spans = export_spans(settings, errors=0, ok=5)
+
+    # 자식 span 은 부모의 sampling 결정을 따름
+    assert len(spans) == 10
+
+    settings = TracingSettings(TRACE_SAMPLE_RATIO=0.0, TRACE_SAMPLE_ERRORS=False)
+    assert export_spans(settings, errors=3, ok=5) == ()
+
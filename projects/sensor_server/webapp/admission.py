@@ -0,0 +1,93 @@
+"""수집 API 요청 수용 제어 (admission control)
+
+DB 가 느려지면 요청이 커넥션 풀 앞에 쌓여 지연 시간이 계속 늘어나고, 결국 liveness probe 까지 밀려 pod 가 재시작됩니다.
+동시에 처리하는 요청 수를 AIMD(additive increase / multiplicative decrease) 방식으로 조절해
+한도를 넘는 요청은 DB 를 기다리지 않고 바로 거절합니다.
+
+- 요청이 끝날 때마다 처리 시간과 커넥션 대기 시간을 보고 혼잡 여부를 판단합니다.
+- 혼잡하면 한도를 backoff_ratio 배로 줄이고 (decrease_interval 에 한 번), 아니면 1/한도 씩 늘립니다.
+- 한도가 다 찼을 때 DB 가 혼잡한 상태(최근 decrease_interval 안에 한도를 줄임)면 503, 단순히 요청이 많은 경우면
+  429 를 Retry-After 와 함께 반환합니다.
+"""
+
+import time
+from typing import Callable, Optional
+
+from src import metrics
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD 동시 처리 한도
+
+    이벤트 루프 안에서만 호출되므로 lock 없이 상태를 갱신합니다.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 32,
+        min_limit: int = 2,
+        max_limit: int = 256,
+        target_latency: float = 0.5,
+        max_pool_wait: float = 0.1,
+        backoff_ratio: float = 0.8,
+        decrease_interval: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.target_latency = target_latency
+        self.max_pool_wait = max_pool_wait
+        self.backoff_ratio = backoff_ratio
+        # 한 번 줄인 뒤, 줄이기 전에 들어온 요청들의 혼잡 신호로 연달아 줄이지 않도록 대기
+        self.decrease_interval = (
+            target_latency if decrease_interval is None else decrease_interval
+        )
+        self.clock = clock
+
+        self.limit = float(min(max(initial_limit, min_limit), max_limit))
+        self.inflight = 0
+        self._decreased_at = float("-inf")
+        metrics.admission_concurrency_limit.set(self.limit)
+
+    @property
+    def congested(self) -> bool:
+        """최근 decrease_interval 안에 혼잡으로 한도를 줄였는지 여부
+
+        마지막 요청 하나의 결과가 아니라 한도를 줄인 시점으로 판단하므로, 혼잡 중에 빨리 끝난 요청 하나로
+        혼잡이 풀린 것으로 보지 않습니다.
+        """
+        return self.clock() - self._decreased_at < self.decrease_interval
+
+    def try_acquire(self) -> bool:
+        """한도 안이면 처리 중인 요청 수를 늘리고 True"""
+        if self.inflight >= int(self.limit):
+            return False
+        self.inflight += 1
+        metrics.admission_inflight_requests.inc()
+        return True
+
+    def release(self, latency: float, pool_wait: float, failed: bool) -> None:
+        """요청 처리 결과로 한도를 조절
+
+        Args:
+            latency: 요청 처리 시간 (초)
+            pool_wait: 요청이 커넥션 풀에서 기다린 시간 (초)
+            failed: 서버 오류(5xx) 여부
+        """
+        inflight = self.inflight
+        self.inflight -= 1
+        metrics.admission_inflight_requests.dec()
+
+        congested = (
+            failed or latency > self.target_latency or pool_wait > self.max_pool_wait
+        )
+        if congested:
+            now = self.clock()
+            if now - self._decreased_at >= self.decrease_interval:
+                self._decreased_at = now
+                self.limit = max(self.min_limit, self.limit * self.backoff_ratio)
+                metrics.admission_concurrency_limit.set(self.limit)
+        elif inflight * 2 >= self.limit:
+            # 한도를 절반 이상 사용 중일 때만 늘림 (한가할 때 한도가 끝없이 커지지 않도록)
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+            metrics.admission_concurrency_limit.set(self.limit)
@@ -1,4 +1,5 @@
 from contextlib import asynccontextmanager
+import gc
 import logging
 
 from fastapi import FastAPI, Request
@@ -8,6 +9,7 @@ from fastapi.middleware.gzip import GZipMiddleware
 from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
 from opentelemetry.instrumentation.asyncpg import AsyncPGInstrumentor
 from prometheus_fastapi_instrumentator import Instrumentator
+from src import metrics
 from src.exceptions import (
     ClientException,
     SensorAppException,
@@ -17,31 +19,84 @@ from starlette.middleware.cors import CORSMiddleware
 from opentelemetry import trace
 
 from webapp.routers import (
+    facility,
     health,
+    report,
     sensor,
+    tank,
+)
+from webapp.container import ApplicationContainer, create_container, warmup_database
+from webapp.middleware import (
+    AdmissionControlMiddleware,
+    DBRoundTripMiddleware,
+    RequestDecompressionMiddleware,
 )
-from webapp.container import ApplicationContainer, create_container
 
 logger = logging.getLogger(__name__)
 
 
 def create_app(container: ApplicationContainer = None) -> FastAPI:
+    container = container or create_container()
+
     @asynccontextmanager
     async def lifespan(app: FastAPI):
-        # set up
+        # set up (완료되기 전까지 /ready 는 503)
         logger.info("Setting up application")
+        with metrics.startup_phase("total"):
+            with metrics.startup_phase("database"):
+                await warmup_database(app.container)
+            with metrics.startup_phase("facility_index"):
+                facility_index = app.container.facility.index()
+                await facility_index.start()
+            with metrics.startup_phase("alert_rules"):
+                alert_engine = app.container.alert.engine()
+                await alert_engine.start()
+            with metrics.startup_phase("background"):
+                analytics_executor = app.container.analytics.executor()
+                await analytics_executor.start()
+                spool_replayer = app.container.sensor.spool_replayer()
+                await spool_replayer.start()
+                line_protocol_listener = app.container.sensor.line_protocol_listener()
+                await line_protocol_listener.start()
+                liveness_tracker = app.container.monitoring.liveness_tracker()
+                await liveness_tracker.start()
+                sketch_aggregator = app.container.sketch.aggregator()
+                await sketch_aggregator.start()
+                scheduler = app.container.scheduler.scheduler()
+                await scheduler.start()
+        # 시작하면서 만든 객체(모듈, container, 시설 인덱스 등)는 full GC 가 매번 훑지 않도록 제외
+        # (대량 조회의 행 객체가 full GC 를 일으킬 때 event loop 가 힙 크기만큼 멈추지 않음)
+        gc.collect()
+        gc.freeze()
+        app.state.ready = True
         yield
         # tear down
         logger.info("Tearing down application")
+        app.state.ready = False
+        await scheduler.stop()
+        await sketch_aggregator.stop()
+        await analytics_executor.stop()
+        await liveness_tracker.stop()
+        await line_protocol_listener.stop()
+        await spool_replayer.stop()
+        await alert_engine.stop()
+        await facility_index.stop()
+        metrics.mark_process_dead()
+        # 로그 queue 비우기
+        app.container.shutdown_resources()
 
     app = FastAPI(
         title="Sensor Server",
         lifespan=lifespan,
         generate_unique_id_function=lambda route: route.name,
     )
+    app.state.ready = False
 
     app.include_router(health.router, tags=["health"], include_in_schema=False)
     app.include_router(sensor.router, tags=["sensor"])
+    app.include_router(facility.router, tags=["facility"])
+    app.include_router(tank.router, tags=["tank"])
+    app.include_router(report.router, tags=["report"])
 
     app.add_middleware(
         CORSMiddleware,
@@ -56,6 +111,22 @@ def create_app(container: ApplicationContainer = None) -> FastAPI:
         minimum_size=4096,
     )
 
+    # 게이트웨이가 압축해서 올린 요청 body 해제
+    app.add_middleware(RequestDecompressionMiddleware)
+
+    # 수집 API 동시 처리 한도 (DB 가 느려지면 풀 앞에 쌓이기 전에, 압축 해제 전에 거절)
+    admission_settings = container.admission_settings()
+    if admission_settings.ADMISSION_ENABLED:
+        app.add_middleware(
+            AdmissionControlMiddleware,
+            limiter=container.admission_limiter(),
+            path_prefixes=admission_settings.ADMISSION_PATH_PREFIXES,
+            retry_after=admission_settings.ADMISSION_RETRY_AFTER,
+        )
+
+    # 요청당 DB 왕복 횟수
+    app.add_middleware(DBRoundTripMiddleware)
+
     # 프로메테우스 Metric 설정
     (
         Instrumentator(
@@ -65,6 +136,7 @@ def create_app(container: ApplicationContainer = None) -> FastAPI:
                 "/openapi.json",
                 "/metrics",
                 "/health",
+                "/ready",
                 "/favicon.ico",
             ],
         )
@@ -87,9 +159,18 @@ def create_app(container: ApplicationContainer = None) -> FastAPI:
         except Exception as e:
             return ""
 
+    def get_route(request: Request) -> str:
+        """로그 sampling 기준이 되는 route (경로 파라미터가 치환되기 전의 path)"""
+        route = request.scope.get("route")
+        return getattr(route, "path", request.url.path)
+
     @app.exception_handler(ClientException)
     async def client_exception_handler(request: Request, exc: ClientException):
-        logger.error(f"Client exception: {exc}", exc_info=True)
+        logger.error(
+            f"Client exception: {exc}",
+            exc_info=True,
+            extra={"route": get_route(request)},
+        )
         return JSONResponse(
             status_code=400,
             content={
@@ -101,7 +182,11 @@ def create_app(container: ApplicationContainer = None) -> FastAPI:
 
     @app.exception_handler(ServerException)
     async def server_exception_handler(request: Request, exc: ServerException):
-        logger.error(f"Server exception: {exc}", exc_info=True)
+        logger.error(
+            f"Server exception: {exc}",
+            exc_info=True,
+            extra={"route": get_route(request)},
+        )
         return JSONResponse(
             status_code=500,
             content={
@@ -113,7 +198,11 @@ def create_app(container: ApplicationContainer = None) -> FastAPI:
 
     @app.exception_handler(SensorAppException)
     async def sensor_exception_handler(request: Request, exc: SensorAppException):
-        logger.error(f"Sensor App exception: {exc}", exc_info=True)
+        logger.error(
+            f"Sensor App exception: {exc}",
+            exc_info=True,
+            extra={"route": get_route(request)},
+        )
         return JSONResponse(
             status_code=500,
             content={
@@ -125,7 +214,11 @@ def create_app(container: ApplicationContainer = None) -> FastAPI:
 
     @app.exception_handler(Exception)
     async def exception_handler(request: Request, exc: Exception):
-        logger.error(f"Exception: {exc}", exc_info=True)
+        logger.error(
+            f"Exception: {exc}",
+            exc_info=True,
+            extra={"route": get_route(request)},
+        )
         return JSONResponse(
             status_code=503,
             content={"message": str(exc), "code": exc.__class__.__name__},
@@ -135,7 +228,11 @@ def create_app(container: ApplicationContainer = None) -> FastAPI:
     async def validation_exception_handler(
         request: Request, exc: RequestValidationError
     ):
-        logger.error(f"Validation error: {exc.errors()}", exc_info=True)
+        logger.error(
+            f"Validation error: {exc.errors()}",
+            exc_info=True,
+            extra={"route": get_route(request)},
+        )
         return JSONResponse(
             status_code=422,
             content={
@@ -145,5 +242,5 @@ def create_app(container: ApplicationContainer = None) -> FastAPI:
             },
         )
 
-    app.container = container or create_container()
+    app.container = container
     return app
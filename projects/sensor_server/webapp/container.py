@@ -1,8 +1,17 @@
 from dependency_injector import containers, providers
+from src.alert.container import AlertContainer
+from src.analytics.container import AnalyticsContainer
+from src.anomaly.container import AnomalyContainer
 from src.database.container import DatabaseContainer
 from src.facility.container import FacilityContainer
+from src.monitoring.container import MonitoringContainer
+from src.report.container import ReportContainer
+from src.scheduler.container import SchedulerContainer
 from src.sensor.container import SensorContainer
+from src.sketch.container import SketchContainer
+from webapp.admission import AdaptiveConcurrencyLimiter
 from webapp.logger import initialize_logger
+from webapp.settings import AdmissionSettings, TracingSettings
 import logging
 
 logger = logging.getLogger(__name__)
@@ -11,19 +20,85 @@ logger = logging.getLogger(__name__)
 class ApplicationContainer(containers.DeclarativeContainer):
     wiring_config = containers.WiringConfiguration(packages=["webapp"])
 
-    logger = providers.Resource(initialize_logger)
+    tracing_settings = providers.Singleton(TracingSettings)
+
+    logger = providers.Resource(initialize_logger, tracing=tracing_settings)
 
     database: DatabaseContainer = providers.Container(DatabaseContainer)
 
+    analytics: AnalyticsContainer = providers.Container(AnalyticsContainer)
+
     facility: FacilityContainer = providers.Container(
         FacilityContainer,
         database=database,
     )
 
+    alert: AlertContainer = providers.Container(
+        AlertContainer,
+        database=database,
+        facility=facility,
+    )
+
+    monitoring: MonitoringContainer = providers.Container(
+        MonitoringContainer,
+        facility=facility,
+    )
+
+    sketch: SketchContainer = providers.Container(
+        SketchContainer,
+        database=database,
+        facility=facility,
+        analytics=analytics,
+    )
+
     sensor: SensorContainer = providers.Container(
         SensorContainer,
         database=database,
         facility=facility,
+        analytics=analytics,
+        listeners=providers.List(
+            alert.engine,
+            monitoring.rolling_statistics,
+            monitoring.liveness_tracker,
+        ),
+        history_listeners=providers.List(sketch.aggregator),
+    )
+
+    anomaly: AnomalyContainer = providers.Container(
+        AnomalyContainer,
+        database=database,
+        sensor=sensor,
+        analytics=analytics,
+    )
+
+    report: ReportContainer = providers.Container(
+        ReportContainer,
+        database=database,
+        facility=facility,
+        sensor=sensor,
+        alert=alert,
+        analytics=analytics,
+    )
+
+    scheduler: SchedulerContainer = providers.Container(
+        SchedulerContainer,
+        database=database,
+        jobs=providers.List(
+            anomaly.job,
+            report.job,
+        ),
+    )
+
+    admission_settings = providers.Singleton(AdmissionSettings)
+
+    admission_limiter = providers.Singleton(
+        AdaptiveConcurrencyLimiter,
+        initial_limit=admission_settings.provided.ADMISSION_INITIAL_LIMIT,
+        min_limit=admission_settings.provided.ADMISSION_MIN_LIMIT,
+        max_limit=admission_settings.provided.ADMISSION_MAX_LIMIT,
+        target_latency=admission_settings.provided.ADMISSION_TARGET_LATENCY,
+        max_pool_wait=admission_settings.provided.ADMISSION_MAX_POOL_WAIT,
+        backoff_ratio=admission_settings.provided.ADMISSION_BACKOFF_RATIO,
     )
 
 
@@ -52,3 +127,16 @@ def create_container() -> ApplicationContainer:
     # 의존성 초기화
     preload_dependency(container)
     return container
+
+
+async def warmup_database(container: ApplicationContainer):
+    """DB 커넥션 풀을 미리 채우고 수집 경로의 statement 를 준비"""
+    settings = container.database.settings()
+    await container.database.session_factory().warmup(
+        connections=settings.DB_WARMUP_CONNECTIONS,
+        statements=[
+            *container.facility.water_tank_repository().warmup_statements(),
+            *container.sensor.repository().warmup_statements(),
+            *container.sensor.history_repository().warmup_statements(),
+        ],
+    )
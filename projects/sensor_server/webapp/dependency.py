@@ -1,5 +1,11 @@
 from typing import Annotated, Optional
+from src.anomaly.detector import AnomalyDetector
+from src.facility.service import FacilityService
+from src.monitoring.liveness import LivenessTracker
+from src.monitoring.rolling import RollingStatistics
+from src.report.service import DailyReportService
 from src.sensor.service import SensorRecordService
+from src.sketch.service import SketchService
 from webapp.container import ApplicationContainer
 from fastapi import Depends
 from dependency_injector.wiring import inject, Provide
@@ -15,3 +21,57 @@ def sensor_service_dependency(
     ),
 ) -> SensorRecordService:
     return sensor_service
+
+
+@inject
+def facility_service_dependency(
+    facility_service: FacilityService = Depends(
+        Provide[ApplicationContainer.facility.service]
+    ),
+) -> FacilityService:
+    return facility_service
+
+
+@inject
+def rolling_statistics_dependency(
+    rolling_statistics: RollingStatistics = Depends(
+        Provide[ApplicationContainer.monitoring.rolling_statistics]
+    ),
+) -> RollingStatistics:
+    return rolling_statistics
+
+
+@inject
+def anomaly_detector_dependency(
+    anomaly_detector: AnomalyDetector = Depends(
+        Provide[ApplicationContainer.anomaly.detector]
+    ),
+) -> AnomalyDetector:
+    return anomaly_detector
+
+
+@inject
+def liveness_tracker_dependency(
+    liveness_tracker: LivenessTracker = Depends(
+        Provide[ApplicationContainer.monitoring.liveness_tracker]
+    ),
+) -> LivenessTracker:
+    return liveness_tracker
+
+
+@inject
+def sketch_service_dependency(
+    sketch_service: SketchService = Depends(
+        Provide[ApplicationContainer.sketch.service]
+    ),
+) -> SketchService:
+    return sketch_service
+
+
+@inject
+def report_service_dependency(
+    report_service: DailyReportService = Depends(
+        Provide[ApplicationContainer.report.service]
+    ),
+) -> DailyReportService:
+    return report_service
@@ -1,8 +1,30 @@
+from typing import Annotated, Dict, List, Optional, Tuple, Union
+import msgspec
+import numpy as np
 from pydantic import BaseModel
-from datetime import datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 from pydantic import Field
 
-from src.sensor.domains import WaterTankSensorRecordContent
+from src.anomaly.domains import AnomalyDetectionRun, WaterTankAnomaly
+from src.facility.domains import (
+    WaterTank,
+    WaterTankBuilding,
+    WaterTankCenterProvision,
+)
+from src.monitoring.domains import (
+    MetricStatistics,
+    StaleWaterTank,
+    WaterTankRollingStatistics,
+)
+from src.sensor.domains import (
+    EPOCH,
+    METRICS,
+    WaterTankSensorRecordGrid,
+    WaterTankSensorRecordBatch,
+    WaterTankSensorRecordContent,
+)
+from src.report.domains import DailySummary
+from src.sketch.domains import PercentileResult
 
 
 class WaterTankSensorRecordDTO(BaseModel):
@@ -23,5 +45,323 @@ class WaterTankSensorRecordDTO(BaseModel):
         )
 
 
+class WaterTankSensorRecordStruct(msgspec.Struct):
+    """WaterTankSensorRecordDTO 의 msgspec 버전 (수집 경로의 빠른 decode 용)
+
+    필드 구성은 WaterTankSensorRecordDTO 와 동일해야 합니다. (OpenAPI 스키마는 DTO 기준)
+    recorded_at 은 공개 스키마(정수 epoch 초)를 바꾸지 않고 소수점 이하 초가 있는 값도 받습니다.
+    """
+
+    tank_code: str
+    temperature: float
+    ph: float
+    dissolved_oxygen: float
+    salinity: float
+    recorded_at: Union[int, float]
+
+    def to_content(self) -> WaterTankSensorRecordContent:
+        return WaterTankSensorRecordContent(
+            temperature=self.temperature,
+            ph=self.ph,
+            dissolved_oxygen=self.dissolved_oxygen,
+            salinity=self.salinity,
+            recorded_at=EPOCH + timedelta(seconds=self.recorded_at),
+        )
+
+
+def to_record_batch(
+    sensor_records: List[WaterTankSensorRecordStruct],
+) -> WaterTankSensorRecordBatch:
+    """JSON 으로 받은 측정 값 리스트를 측정 값 묶음으로 변환"""
+    code_index_by_code: Dict[str, int] = {}
+    code_index = [
+        code_index_by_code.setdefault(record.tank_code, len(code_index_by_code))
+        for record in sensor_records
+    ]
+    return WaterTankSensorRecordBatch(
+        tank_codes=list(code_index_by_code),
+        code_index=np.array(code_index, dtype=np.int64),
+        recorded_at=np.array([r.recorded_at for r in sensor_records], dtype=np.float64),
+        temperature=np.array([r.temperature for r in sensor_records], dtype=np.float64),
+        ph=np.array([r.ph for r in sensor_records], dtype=np.float64),
+        dissolved_oxygen=np.array(
+            [r.dissolved_oxygen for r in sensor_records], dtype=np.float64
+        ),
+        salinity=np.array([r.salinity for r in sensor_records], dtype=np.float64),
+    )
+
+
 class OkDTO(BaseModel):
     ok: bool = True
+
+
+class WaterTankBuildingProvisionDTO(BaseModel):
+    building_name: str = Field(..., min_length=1, max_length=20, description="동 이름")
+    tank_names: List[Annotated[str, Field(min_length=1, max_length=20)]] = Field(
+        default_factory=list, description="수조 이름 목록"
+    )
+
+
+class WaterTankCenterProvisionDTO(BaseModel):
+    center_name: str = Field(..., min_length=1, max_length=20, description="센터 이름")
+    buildings: List[WaterTankBuildingProvisionDTO] = Field(
+        default_factory=list, description="동 목록"
+    )
+
+    def to_buildings(self) -> List[Tuple[str, List[str]]]:
+        return [(building.building_name, building.tank_names) for building in self.buildings]
+
+
+class WaterTankDTO(BaseModel):
+    tank_id: int = Field(..., description="수조 id")
+    tank_name: str = Field(..., description="수조 이름")
+    tank_code: str = Field(..., description="수조 코드")
+
+    @staticmethod
+    def from_domain(tank: WaterTank) -> "WaterTankDTO":
+        return WaterTankDTO(
+            tank_id=tank.tank_id,
+            tank_name=tank.tank_name,
+            tank_code=tank.tank_code,
+        )
+
+
+class WaterTankBuildingDTO(BaseModel):
+    building_id: int = Field(..., description="동 id")
+    building_name: str = Field(..., description="동 이름")
+    building_code: str = Field(..., description="동 코드")
+    tanks: List[WaterTankDTO] = Field(..., description="수조 목록")
+
+    @staticmethod
+    def from_domain(
+        building: WaterTankBuilding, tanks: List[WaterTank]
+    ) -> "WaterTankBuildingDTO":
+        return WaterTankBuildingDTO(
+            building_id=building.building_id,
+            building_name=building.building_name,
+            building_code=building.building_code,
+            tanks=[WaterTankDTO.from_domain(tank) for tank in tanks],
+        )
+
+
+class WaterTankCenterDTO(BaseModel):
+    center_id: int = Field(..., description="센터 id")
+    center_name: str = Field(..., description="센터 이름")
+    buildings: List[WaterTankBuildingDTO] = Field(..., description="동 목록")
+
+    @staticmethod
+    def from_provision(provision: WaterTankCenterProvision) -> "WaterTankCenterDTO":
+        return WaterTankCenterDTO(
+            center_id=provision.center.center_id,
+            center_name=provision.center.center_name,
+            buildings=[
+                WaterTankBuildingDTO.from_domain(
+                    building,
+                    [
+                        tank
+                        for tank in provision.tanks
+                        if tank.building_id == building.building_id
+                    ],
+                )
+                for building in provision.buildings
+            ],
+        )
+
+
+class MetricStatisticsDTO(BaseModel):
+    mean: float = Field(..., description="평균")
+    stddev: float = Field(..., description="표본 표준편차")
+    minimum: float = Field(..., description="최소")
+    maximum: float = Field(..., description="최대")
+    ewma: float = Field(..., description="지수 이동 평균")
+
+    @staticmethod
+    def from_domain(statistics: MetricStatistics) -> "MetricStatisticsDTO":
+        return MetricStatisticsDTO(
+            mean=statistics.mean,
+            stddev=statistics.stddev,
+            minimum=statistics.minimum,
+            maximum=statistics.maximum,
+            ewma=statistics.ewma,
+        )
+
+
+class WaterTankRollingStatisticsDTO(BaseModel):
+    tank_id: int = Field(..., description="수조 id")
+    window: int = Field(..., description="구간 길이 (초)")
+    count: int = Field(..., description="구간 내 측정 횟수")
+    recorded_at: int = Field(..., description="마지막 측정 시간")
+    temperature: MetricStatisticsDTO = Field(..., description="온도")
+    ph: MetricStatisticsDTO = Field(..., description="pH")
+    dissolved_oxygen: MetricStatisticsDTO = Field(..., description="용존산소")
+    salinity: MetricStatisticsDTO = Field(..., description="염분")
+
+    @staticmethod
+    def from_domain(
+        statistics: WaterTankRollingStatistics,
+    ) -> "WaterTankRollingStatisticsDTO":
+        return WaterTankRollingStatisticsDTO(
+            tank_id=statistics.tank_id,
+            window=statistics.window,
+            count=statistics.count,
+            recorded_at=int(statistics.recorded_at.timestamp()),
+            temperature=MetricStatisticsDTO.from_domain(statistics.temperature),
+            ph=MetricStatisticsDTO.from_domain(statistics.ph),
+            dissolved_oxygen=MetricStatisticsDTO.from_domain(statistics.dissolved_oxygen),
+            salinity=MetricStatisticsDTO.from_domain(statistics.salinity),
+        )
+
+
+class WaterTankAnomalyDTO(BaseModel):
+    tank_id: int = Field(..., description="수조 id")
+    metric: str = Field(..., description="측정 항목")
+    evaluated_at: int = Field(..., description="탐지 시간")
+    value: float = Field(..., description="최근 bucket 평균")
+    median: float = Field(..., description="구간 중앙값")
+    mad: float = Field(..., description="구간 중앙값 절대 편차")
+    zscore: float = Field(..., description="robust z-score")
+    flatline: bool = Field(..., description="값 고착 의심")
+    anomalous: bool = Field(..., description="이상 여부")
+
+    @staticmethod
+    def from_domain(anomaly: WaterTankAnomaly) -> "WaterTankAnomalyDTO":
+        return WaterTankAnomalyDTO(
+            tank_id=anomaly.tank_id,
+            metric=anomaly.metric,
+            evaluated_at=int(anomaly.evaluated_at.timestamp()),
+            value=anomaly.value,
+            median=anomaly.median,
+            mad=anomaly.mad,
+            zscore=anomaly.zscore,
+            flatline=anomaly.flatline,
+            anomalous=anomaly.anomalous,
+        )
+
+
+class AnomalyDetectionRunDTO(BaseModel):
+    started_at: int = Field(..., description="실행 시간")
+    tanks: int = Field(..., description="탐지한 수조 수")
+    buckets: int = Field(..., description="수조별 bucket 수")
+    anomalies: int = Field(..., description="이상으로 판정된 (수조, 항목) 수")
+    load_seconds: float = Field(..., description="history 조회 / 정렬 시간")
+    detect_seconds: float = Field(..., description="행렬 연산 시간")
+    store_seconds: float = Field(..., description="결과 저장 시간")
+
+    @staticmethod
+    def from_domain(run: AnomalyDetectionRun) -> "AnomalyDetectionRunDTO":
+        return AnomalyDetectionRunDTO(
+            started_at=int(run.started_at.timestamp()),
+            tanks=run.tanks,
+            buckets=run.buckets,
+            anomalies=run.anomalies,
+            load_seconds=run.load_seconds,
+            detect_seconds=run.detect_seconds,
+            store_seconds=run.store_seconds,
+        )
+
+
+class StaleWaterTankDTO(BaseModel):
+    tank_id: int = Field(..., description="수조 id")
+    last_seen_at: int = Field(..., description="마지막 수신 시간")
+    last_recorded_at: Optional[int] = Field(None, description="마지막 측정 시간")
+
+    @staticmethod
+    def from_domain(tank: StaleWaterTank) -> "StaleWaterTankDTO":
+        return StaleWaterTankDTO(
+            tank_id=tank.tank_id,
+            last_seen_at=int(tank.last_seen_at.timestamp()),
+            last_recorded_at=(
+                int(tank.last_recorded_at.timestamp())
+                if tank.last_recorded_at is not None
+                else None
+            ),
+        )
+
+
+class WaterTankSensorRecordGridDTO(BaseModel):
+    tank_codes: List[str] = Field(..., description="수조 코드 (values 의 첫 번째 축)")
+    metrics: List[str] = Field(..., description="측정 항목 (values 의 세 번째 축)")
+    timestamps: List[int] = Field(..., description="bucket 시작 시간 (values 의 두 번째 축)")
+    values: List[List[List[Optional[float]]]] = Field(
+        ..., description="[수조, bucket, 항목] 평균 (값이 없으면 null)"
+    )
+    filled: List[List[List[bool]]] = Field(
+        ..., description="[수조, bucket, 항목] 측정 값이 아니라 채운 칸인지"
+    )
+
+    @staticmethod
+    def encode(grid: WaterTankSensorRecordGrid) -> bytes:
+        """격자가 크므로 pydantic 검증 없이 바로 JSON 으로 (NaN 은 null)"""
+        return msgspec.json.encode(
+            {
+                "tank_codes": grid.tank_codes,
+                "metrics": list(METRICS),
+                "timestamps": grid.timestamps.tolist(),
+                "values": grid.values.tolist(),
+                "filled": grid.filled.tolist(),
+            }
+        )
+
+
+class PercentileDTO(BaseModel):
+    quantile: float = Field(..., description="분위수 (0~1)")
+    value: Optional[float] = Field(None, description="추정 값 (측정 값이 없으면 null)")
+
+
+class PercentileResultDTO(BaseModel):
+    scope: str = Field(..., description="범위 (tank / building / center)")
+    scope_id: int = Field(..., description="범위의 수조 / 동 / 센터 id")
+    metric: str = Field(..., description="측정 항목")
+    start: int = Field(..., description="조회에 사용한 첫 bucket 시작 시간")
+    end: int = Field(..., description="조회에 사용한 마지막 bucket 끝 시간")
+    count: int = Field(..., description="측정 값 수")
+    relative_accuracy: float = Field(..., description="추정 값의 상대 오차 한계")
+    percentiles: List[PercentileDTO] = Field(..., description="분위수별 추정 값")
+
+    @staticmethod
+    def from_domain(result: PercentileResult) -> "PercentileResultDTO":
+        return PercentileResultDTO(
+            scope=result.scope,
+            scope_id=result.scope_id,
+            metric=result.metric,
+            start=int(result.start.timestamp()),
+            end=int(result.end.timestamp()),
+            count=result.count,
+            relative_accuracy=result.relative_accuracy,
+            percentiles=[
+                PercentileDTO(
+                    quantile=quantile, value=None if np.isnan(value) else value
+                )
+                for quantile, value in result.percentiles.items()
+            ],
+        )
+
+
+class DailySummaryDTO(BaseModel):
+    report_date: date = Field(..., description="보고 날짜")
+    scope: str = Field(..., description="범위 (tank / building)")
+    scope_id: int = Field(..., description="범위의 수조 / 동 id")
+    metric: str = Field(..., description="측정 항목")
+    count: int = Field(..., description="측정 값 수")
+    completeness: float = Field(..., description="측정 값으로 덮인 시간 비율 (0~1)")
+    minimum: Optional[float] = Field(None, description="최소 (측정 값이 없으면 null)")
+    maximum: Optional[float] = Field(None, description="최대 (측정 값이 없으면 null)")
+    mean: Optional[float] = Field(None, description="평균 (측정 값이 없으면 null)")
+    out_of_range_seconds: Optional[float] = Field(
+        None, description="경보 규칙 범위를 벗어난 시간 (초, 규칙이 없으면 null)"
+    )
+
+    @staticmethod
+    def from_domain(summary: DailySummary) -> "DailySummaryDTO":
+        return DailySummaryDTO(
+            report_date=summary.report_date,
+            scope=summary.scope,
+            scope_id=summary.scope_id,
+            metric=summary.metric,
+            count=summary.count,
+            completeness=summary.completeness,
+            minimum=summary.minimum,
+            maximum=summary.maximum,
+            mean=summary.mean,
+            out_of_range_seconds=summary.out_of_range_seconds,
+        )
@@ -0,0 +1,110 @@
+import dataclasses
+import re
+from contextlib import AsyncExitStack
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import msgspec
+from fastapi import Request, Response
+from fastapi.dependencies.utils import solve_dependencies
+from fastapi.exceptions import RequestValidationError
+from fastapi.routing import APIRoute
+
+from src import metrics
+
+# OkDTO(ok=True) 를 미리 직렬화한 응답 body
+OK_BODY = b'{"ok":true}'
+
+FAST_INGEST_ATTRIBUTE = "__fast_ingest__"
+
+_ERROR_PATH = re.compile(r" - at `\$(.*)`$")
+
+
+def fast_ingest(
+    body_type: Any,
+    decoders: Optional[Dict[str, Callable[[bytes], Any]]] = None,
+):
+    """endpoint 의 요청 body 를 pydantic 대신 msgspec 으로 decode 합니다.
+
+    FastIngestRoute 가 body 를 `body_type` 으로 한 번에 decode + 검증한 뒤, 나머지 parameter(Depends)는
+    FastAPI 와 같은 방식으로 풀어서 endpoint 를 호출합니다. endpoint 의 body parameter 선언(pydantic DTO)은
+    OpenAPI 스키마에만 사용되고, 실제로는 같은 필드를 가진 `body_type` 값이 전달됩니다.
+    endpoint 가 정상 종료하면 반환 값 대신 미리 직렬화된 OK 응답을 반환합니다.
+
+    Args:
+        body_type: JSON 요청 body 의 msgspec 타입 (endpoint 의 DTO 와 필드 구성이 같아야 함)
+        decoders: JSON 외 Content-Type 별 decode 함수 (ValueError 는 422 로 변환)
+    """
+
+    def decorator(endpoint):
+        setattr(endpoint, FAST_INGEST_ATTRIBUTE, (body_type, decoders or {}))
+        return endpoint
+
+    return decorator
+
+
+class FastIngestRoute(APIRoute):
+    """`fast_ingest` 가 지정된 endpoint 의 요청을 pydantic 모델 생성 없이 처리하는 route
+
+    지정되지 않은 endpoint 는 기본 APIRoute 와 동일하게 동작합니다.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Awaitable[Response]]:
+        fast = getattr(self.endpoint, FAST_INGEST_ATTRIBUTE, None)
+        if fast is None:
+            return super().get_route_handler()
+
+        body_type, decoders = fast
+        decoder = msgspec.json.Decoder(body_type)
+        status_code = self.status_code or 200
+        # body 를 제외한 parameter 만 FastAPI 가 풀도록
+        (body_field,) = self.dependant.body_params
+        dependant = dataclasses.replace(self.dependant, body_params=[])
+
+        async def route_handler(request: Request) -> Response:
+            body = await request.body()
+            media_type = request.headers.get("content-type", "").split(";")[0].strip()
+            try:
+                with metrics.ingest_stage("decode"):
+                    if media_type in decoders:
+                        value = decoders[media_type](body)
+                    else:
+                        value = decoder.decode(body)
+            except msgspec.DecodeError as e:
+                raise RequestValidationError(to_validation_errors(e), body=body)
+            except ValueError as e:
+                raise RequestValidationError(
+                    [{"type": "value_error", "loc": ("body",), "msg": str(e)}]
+                )
+
+            async with AsyncExitStack() as stack:
+                solved = await solve_dependencies(
+                    request=request,
+                    dependant=dependant,
+                    dependency_overrides_provider=self.dependency_overrides_provider,
+                    async_exit_stack=stack,
+                    embed_body_fields=False,
+                )
+                if solved.errors:
+                    raise RequestValidationError(solved.errors, body=body)
+                await self.endpoint(**solved.values, **{body_field.name: value})
+            return Response(
+                content=OK_BODY, status_code=status_code, media_type="application/json"
+            )
+
+        return route_handler
+
+
+def to_validation_errors(error: msgspec.DecodeError) -> list:
+    """msgspec 오류를 FastAPI 의 RequestValidationError 형식으로 변환"""
+    message = str(error)
+    location = ["body"]
+    if (match := _ERROR_PATH.search(message)) is not None:
+        message = message[: match.start()]
+        location += [
+            int(part[1:-1]) if part.startswith("[") else part
+            for part in re.findall(r"\[\d+\]|[^.\[\]]+", match.group(1))
+        ]
+    error_type = (
+        "value_error" if isinstance(error, msgspec.ValidationError) else "json_invalid"
+    )
+    return [{"type": error_type, "loc": tuple(location), "msg": message}]
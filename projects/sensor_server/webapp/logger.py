@@ -1,28 +1,53 @@
+import copy
 import logging
-import json
+import queue
+import threading
+import time
 from datetime import datetime
 import traceback
+from logging.handlers import QueueHandler, QueueListener
+from typing import Callable, Dict, List, Optional, Tuple
+
+import msgspec
 from pytz import timezone
 
+from webapp.settings import TracingSettings
+
 
 KST = timezone("Asia/Seoul")
 
+# (예외 타입, route) 별 traceback 허용 횟수 / 주기 (초)
+TRACEBACK_SAMPLE_LIMIT = 5
+TRACEBACK_SAMPLE_INTERVAL = 60.0
+
 
 class JSONFormatter(logging.Formatter):
-    """JSONFormatter"""
+    """JSONFormatter
 
-    def format(self, record):
-        # KST 시간대 설정
-        def timetz(*args, **kwargs):
-            return datetime.now(KST).timetuple()
+    QueueListener 스레드에서 호출됩니다.
+    시간은 record 생성 시각(record.created)을 KST 로 변환하며, 초 단위 문자열을 캐시합니다.
+    """
+
+    _encoder = msgspec.json.Encoder(enc_hook=str)
+
+    def __init__(self):
+        super().__init__()
+        self._second = None
+        self._second_text = ""
 
-        # asctime을 수동으로 설정
-        logging.Formatter.converter = timetz
-        record.asctime = self.formatTime(record, self.datefmt)
+    def format_time(self, created: float) -> str:
+        second = int(created)
+        if second != self._second:
+            self._second_text = datetime.fromtimestamp(second, KST).strftime(
+                "%Y-%m-%d %H:%M:%S"
+            )
+            self._second = second
+        return f"{self._second_text},{int((created - second) * 1000):03d}"
 
+    def format(self, record):
         # JSON 형태로 로그 메시지 구성
         log_message = {
-            "timestamp": record.asctime,
+            "timestamp": self.format_time(record.created),
             "level": record.levelname,
             "trace_id": getattr(record, "otelTraceID", "N/A"),
             "span_id": getattr(record, "otelSpanID", "N/A"),
@@ -41,25 +66,145 @@ class JSONFormatter(logging.Formatter):
                 "traceback": formatted_tb,
             }
 
-        return json.dumps(log_message, ensure_ascii=False)
-
+        elif exception_type := getattr(record, "exception_type", None):
+            # TracebackSampler 가 traceback 을 생략한 경우
+            log_message["exception"] = {
+                "type": exception_type,
+                "message": record.exception_message,
+            }
 
-def initialize_tracer():
-    """tracer 초기화"""
+        if suppressed := getattr(record, "suppressed", 0):
+            # 직전 주기 동안 생략된 같은 종류의 로그 수
+            log_message["suppressed"] = suppressed
+
+        return self._encoder.encode(log_message).decode("utf-8")
+
+
+class TracebackSampler(logging.Filter):
+    """(예외 타입, route) 별로 traceback 을 주기당 limit 개까지만 남기는 filter
+
+    잘못된 수조 코드를 계속 보내는 게이트웨이처럼 같은 예외가 폭주할 때 traceback 포맷팅과 출력이 병목이 되지 않도록 합니다.
+    limit 을 넘은 로그는 버리지 않고 traceback(exc_info) 만 떼어내 메시지와 예외 타입 / 메시지는 남깁니다.
+    traceback 을 생략한 수는 다음 주기의 첫 로그에 `suppressed` 로 기록되며,
+    그 전에 같은 예외가 더 오지 않으면 `start()` 로 띄운 스레드가 주기가 끝날 때 또는 `stop()` 시에 요약 로그로 남깁니다.
+    """
+
+    def __init__(
+        self,
+        limit: int = TRACEBACK_SAMPLE_LIMIT,
+        interval: float = TRACEBACK_SAMPLE_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        super().__init__()
+        self.limit = limit
+        self.interval = interval
+        self.clock = clock
+        self._lock = threading.Lock()
+        # key -> [주기 시작 시간, 통과 수, 생략 수]
+        self._windows: Dict[Tuple[str, str], List] = {}
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not record.exc_info or record.exc_info[0] is None:
+            return True
+
+        key = (record.exc_info[0].__name__, getattr(record, "route", record.name))
+        now = self.clock()
+        with self._lock:
+            window = self._windows.get(key)
+            if window is None or now - window[0] >= self.interval:
+                if window is not None and window[2] > 0:
+                    record.suppressed = window[2]
+                window = [now, 0, 0]
+                self._windows[key] = window
+            if window[1] < self.limit:
+                window[1] += 1
+                return True
+            window[2] += 1
+
+        # traceback 만 생략 (예외 타입 / 메시지는 남김)
+        record.exception_type = record.exc_info[0].__name__
+        record.exception_message = str(record.exc_info[1])
+        record.exc_info = None
+        record.exc_text = None
+        record.stack_info = None
+        return True
+
+    def start(self) -> None:
+        """주기가 끝난 (예외 타입, route) 의 생략 수를 요약 로그로 남기는 스레드 시작"""
+        self._thread = threading.Thread(
+            target=self._run, name="traceback-sampler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """스레드를 멈추고 남은 생략 수를 모두 요약 로그로 남김"""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.flush(expired_only=False)
+
+    def flush(self, expired_only: bool = True) -> None:
+        """생략 수가 있는 주기를 요약 로그로 남기고 닫음 (expired_only 이면 끝난 주기만)"""
+        now = self.clock()
+        with self._lock:
+            keys = [
+                key
+                for key, window in self._windows.items()
+                if not expired_only or now - window[0] >= self.interval
+            ]
+            windows = [(key, self._windows.pop(key)) for key in keys]
+        for (exception_type, route), window in windows:
+            if window[2] > 0:
+                logging.getLogger(__name__).warning(
+                    f"{exception_type} traceback suppressed {window[2]} times ({route})",
+                    extra={"suppressed": window[2]},
+                )
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            self.flush()
+
+
+class LightweightQueueHandler(QueueHandler):
+    """포맷팅 없이 record 만 queue 에 넣는 handler
+
+    기본 QueueHandler.prepare 는 호출한 스레드(이벤트 루프)에서 포맷팅까지 수행하므로,
+    메시지 문자열만 만들고 traceback 포맷팅과 출력은 QueueListener 스레드에 맡깁니다.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
+
+
+def initialize_tracer(settings: TracingSettings):
+    """tracer 초기화 (sampling / span 내보내기 설정은 webapp/tracing.py)"""
     from opentelemetry import trace
-    from opentelemetry.sdk.trace import TracerProvider
     from opentelemetry.instrumentation.logging import LoggingInstrumentor
+    from webapp.tracing import create_tracer_provider
 
     # 트레이서 프로바이더 설정
-    trace.set_tracer_provider(TracerProvider())
+    provider = create_tracer_provider(settings)
+    trace.set_tracer_provider(provider)
 
     # 로깅 인스트루멘테이션 활성화
     LoggingInstrumentor().instrument()
+    return provider
+
 
+def initialize_logger(tracing: TracingSettings):
+    """로거 초기화
 
-def initialize_logger():
-    """로거 초기화"""
-    initialize_tracer()
+    이벤트 루프에서는 record 를 queue 에 넣기만 하고, 포맷팅과 출력은 QueueListener 스레드에서 수행합니다.
+    리소스 종료 시 남은 span 을 내보내고 queue 를 비운 뒤 출력 handler 를 루트 로거에 직접 연결합니다.
+    """
+    tracer_provider = initialize_tracer(tracing)
 
     # 루트 로거 설정
     logger = logging.getLogger()
@@ -73,5 +218,22 @@ def initialize_logger():
     # 새로운 핸들러 추가
     handler = logging.StreamHandler()
     handler.setFormatter(JSONFormatter())
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = LightweightQueueHandler(log_queue)
+    sampler = TracebackSampler()
+    queue_handler.addFilter(sampler)
+    listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    listener.start()
+    sampler.start()
+    logger.addHandler(queue_handler)
+
+    yield logger
+
+    tracer_provider.shutdown()
+    # 남은 생략 수는 queue 를 비우기 전에 기록
+    sampler.stop()
+    logger.removeHandler(queue_handler)
+    listener.stop()
+    handler.addFilter(TracebackSampler())
     logger.addHandler(handler)
-    return logger
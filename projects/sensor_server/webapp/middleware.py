@@ -0,0 +1,196 @@
+import time
+import zlib
+from typing import Sequence
+
+import zstandard
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src import metrics
+from webapp.admission import AdaptiveConcurrencyLimiter
+
+SUPPORTED_ENCODINGS = ("gzip", "zstd")
+
+
+class RequestTooLarge(Exception):
+    pass
+
+
+class RequestDecompressionMiddleware:
+    """압축된 요청 body (Content-Encoding: gzip / zstd) 를 풀어서 전달하는 middleware
+
+    GZipMiddleware 는 응답만 압축하므로, 게이트웨이가 압축해서 올린 요청은 여기서 해제합니다.
+    압축 해제 후 크기가 max_body_size 를 넘으면 413 을 반환합니다. (압축 폭탄 방지)
+    """
+
+    def __init__(self, app: ASGIApp, max_body_size: int = 16 * 1024 * 1024):
+        self.app = app
+        self.max_body_size = max_body_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = Headers(scope=scope).get("content-encoding", "identity").lower()
+        if encoding == "identity":
+            await self.app(scope, receive, send)
+            return
+        if encoding not in SUPPORTED_ENCODINGS:
+            response = self._error(415, f"unsupported content-encoding: {encoding}")
+            await response(scope, receive, send)
+            return
+
+        try:
+            body = await self._read_body(receive)
+            body = decompress(encoding, body, self.max_body_size)
+        except RequestTooLarge:
+            response = self._error(413, "request body is too large")
+            await response(scope, receive, send)
+            return
+        except (zlib.error, zstandard.ZstdError) as e:
+            response = self._error(400, f"invalid {encoding} body ({e})")
+            await response(scope, receive, send)
+            return
+
+        headers = [
+            (name, value)
+            for name, value in scope["headers"]
+            if name not in (b"content-encoding", b"content-length")
+        ]
+        headers.append((b"content-length", str(len(body)).encode("latin-1")))
+        # 바깥 middleware 가 라우팅 결과(scope["route"])를 볼 수 있도록 scope 는 그대로 사용
+        scope["headers"] = headers
+
+        sent = False
+
+        async def receive_decompressed() -> Message:
+            nonlocal sent
+            if sent:
+                return await receive()
+            sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        await self.app(scope, receive_decompressed, send)
+
+    async def _read_body(self, receive: Receive) -> bytes:
+        chunks = []
+        size = 0
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                break
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if size > self.max_body_size:
+                raise RequestTooLarge()
+            chunks.append(chunk)
+            if not message.get("more_body", False):
+                break
+        return b"".join(chunks)
+
+    @staticmethod
+    def _error(status_code: int, message: str) -> JSONResponse:
+        return JSONResponse(
+            status_code=status_code,
+            content={"message": message, "code": RequestDecompressionMiddleware.__name__},
+        )
+
+
+class DBRoundTripMiddleware:
+    """API 요청마다 DB 로 보낸 statement 수를 route 별로 집계하는 middleware"""
+
+    def __init__(self, app: ASGIApp, path_prefix: str = "/api/"):
+        self.app = app
+        self.path_prefix = path_prefix
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not scope["path"].startswith(self.path_prefix):
+            await self.app(scope, receive, send)
+            return
+
+        counter = metrics.start_db_round_trip_count()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            # route 는 라우팅 이후 scope 에 설정됨 (경로 파라미터 치환 전 path 로 label 수 제한)
+            route = getattr(scope.get("route"), "path", "unmatched")
+            metrics.db_round_trips.labels(route).inc(counter[0])
+            metrics.db_round_trips_per_request.labels(route).observe(counter[0])
+
+
+class AdmissionControlMiddleware:
+    """수집 API 와 DB 를 오래 쓰는 조회 API 앞에서 동시 처리 요청 수를 제한하는 middleware
+
+    한도를 넘는 요청은 DB 를 기다리지 않고 바로 503 (DB 혼잡) / 429 (요청 과다) 로 거절합니다.
+    path_prefixes 밖의 경로(/health, /ready, /metrics 등)는 제한하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        limiter: AdaptiveConcurrencyLimiter,
+        path_prefixes: Sequence[str] = ("/api/records/",),
+        retry_after: int = 1,
+    ):
+        self.app = app
+        self.limiter = limiter
+        self.path_prefixes = tuple(path_prefixes)
+        self.retry_after = retry_after
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not scope["path"].startswith(self.path_prefixes):
+            await self.app(scope, receive, send)
+            return
+
+        if not self.limiter.try_acquire():
+            status_code = 503 if self.limiter.congested else 429
+            metrics.admission_rejected_requests.labels(str(status_code)).inc()
+            response = JSONResponse(
+                status_code=status_code,
+                content={
+                    "message": "server is busy, retry later",
+                    "code": AdmissionControlMiddleware.__name__,
+                },
+                headers={"Retry-After": str(self.retry_after)},
+            )
+            await response(scope, receive, send)
+            return
+
+        status_code = 500
+        pool_wait = metrics.start_pool_wait_measure()
+        started_at = time.perf_counter()
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            self.limiter.release(
+                latency=time.perf_counter() - started_at,
+                pool_wait=pool_wait[0],
+                failed=status_code >= 500,
+            )
+
+
+def decompress(encoding: str, body: bytes, max_size: int) -> bytes:
+    """압축 해제 (결과가 max_size 를 넘으면 RequestTooLarge)"""
+    if encoding == "gzip":
+        decompressor = zlib.decompressobj(wbits=zlib.MAX_WBITS | 16)
+        data = decompressor.decompress(body, max_size + 1)
+        if not decompressor.eof and len(data) <= max_size:
+            raise zlib.error("incomplete gzip stream")
+    else:
+        with zstandard.ZstdDecompressor().stream_reader(
+            body, read_across_frames=True
+        ) as reader:
+            data = reader.read(max_size + 1)
+
+    if len(data) > max_size:
+        raise RequestTooLarge()
+    return data
@@ -0,0 +1,20 @@
+from fastapi import APIRouter, Depends
+
+from src.facility.service import FacilityService
+from webapp.dependency import facility_service_dependency
+from webapp.dtos import WaterTankCenterDTO, WaterTankCenterProvisionDTO
+
+router = APIRouter()
+
+
+@router.post("/api/facilities/centers", status_code=201)
+async def provision_center(
+    provision: WaterTankCenterProvisionDTO,
+    facility_service: FacilityService = Depends(facility_service_dependency),
+) -> WaterTankCenterDTO:
+    """센터 → 동 → 수조 트리 일괄 생성"""
+    result = await facility_service.provision_center(
+        center_name=provision.center_name,
+        buildings=provision.to_buildings(),
+    )
+    return WaterTankCenterDTO.from_provision(result)
@@ -1,4 +1,5 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
+from fastapi.responses import JSONResponse
 
 router = APIRouter()
 
@@ -6,3 +7,11 @@ router = APIRouter()
 @router.get("/health")
 async def health_check():
     return {"status": "ok"}
+
+
+@router.get("/ready")
+async def readiness_check(request: Request):
+    """시작 준비(warmup)가 끝나고 종료 중이 아닐 때만 200"""
+    if not request.app.state.ready:
+        return JSONResponse(status_code=503, content={"status": "starting"})
+    return {"status": "ok"}
@@ -0,0 +1,38 @@
+from datetime import date
+from typing import List
+
+from fastapi import APIRouter, Depends
+
+from src.report.service import DailyReportService
+from webapp.dependency import report_service_dependency
+from webapp.dtos import DailySummaryDTO
+
+router = APIRouter()
+
+
+@router.get("/api/reports/daily/{report_date}/tanks/{tank_code}")
+async def get_tank_daily_report(
+    report_date: date,
+    tank_code: str,
+    report_service: DailyReportService = Depends(report_service_dependency),
+) -> List[DailySummaryDTO]:
+    """수조의 항목별 하루 요약 (미리 만들어둔 요약을 기본 키로 조회, 만들어지기 전이면 빈 리스트)"""
+    return [
+        DailySummaryDTO.from_domain(summary)
+        for summary in await report_service.find_tank_report(report_date, tank_code)
+    ]
+
+
+@router.get("/api/reports/daily/{report_date}/buildings/{building_code}")
+async def get_building_daily_report(
+    report_date: date,
+    building_code: str,
+    report_service: DailyReportService = Depends(report_service_dependency),
+) -> List[DailySummaryDTO]:
+    """동의 항목별 하루 요약 (미리 만들어둔 요약을 기본 키로 조회, 만들어지기 전이면 빈 리스트)"""
+    return [
+        DailySummaryDTO.from_domain(summary)
+        for summary in await report_service.find_building_report(
+            report_date, building_code
+        )
+    ]
@@ -1,21 +1,67 @@
+from typing import List
+
 from fastapi import APIRouter, Depends
 
+from src import metrics
 from src.sensor.service import SensorRecordService
 from webapp.dependency import sensor_service_dependency
-from webapp.dtos import OkDTO, WaterTankSensorRecordDTO
-from webapp import metrics
+from src.sensor import frame
+from src.sensor.domains import WaterTankSensorRecordBatch
+from webapp.dtos import (
+    OkDTO,
+    WaterTankSensorRecordDTO,
+    WaterTankSensorRecordStruct,
+    to_record_batch,
+)
+from webapp.ingest import FastIngestRoute, fast_ingest
 
-router = APIRouter()
+router = APIRouter(route_class=FastIngestRoute)
 
 
 @router.post("/api/records/water-tank-sensor", status_code=201)
+@fast_ingest(WaterTankSensorRecordStruct)
 async def record_tank_sensor(
     sensor_record: WaterTankSensorRecordDTO,
     sensor_service: SensorRecordService = Depends(sensor_service_dependency),
 ) -> OkDTO:
-    metrics.tank_sensor_records.labels(sensor_record.tank_code).inc()
+    # sensor_record 는 FastIngestRoute 가 decode 한 WaterTankSensorRecordStruct (필드는 DTO 와 같음)
     await sensor_service.record_tank_sensor(
         tank_code=sensor_record.tank_code,
         content=sensor_record.to_content(),
     )
+    metrics.sensor_ingested_records.labels("http").inc()
+    return OkDTO(ok=True)
+
+
+@router.post(
+    "/api/records/water-tank-sensors",
+    status_code=201,
+    openapi_extra={
+        "requestBody": {
+            "content": {
+                frame.MEDIA_TYPE: {"schema": {"type": "string", "format": "binary"}}
+            }
+        }
+    },
+)
+@fast_ingest(
+    List[WaterTankSensorRecordStruct],
+    decoders={frame.MEDIA_TYPE: frame.decode_frame},
+)
+async def record_tank_sensors(
+    sensor_records: List[WaterTankSensorRecordDTO],
+    sensor_service: SensorRecordService = Depends(sensor_service_dependency),
+) -> OkDTO:
+    """여러 수조의 측정 값 일괄 기록
+
+    JSON 배열 또는 binary frame(application/x-sensor-frame, 형식은 src.sensor.frame 참고)을 받으며,
+    Content-Encoding: gzip / zstd 로 압축해서 보낼 수 있습니다.
+    """
+    # sensor_records 는 FastIngestRoute 가 decode 한 WaterTankSensorRecordStruct 리스트 또는 frame 의 측정 값 묶음
+    if isinstance(sensor_records, WaterTankSensorRecordBatch):
+        batch = sensor_records
+    else:
+        batch = to_record_batch(sensor_records)
+    await sensor_service.record_tank_sensor_batch(batch)
+    metrics.sensor_ingested_records.labels("http").inc(len(batch))
     return OkDTO(ok=True)
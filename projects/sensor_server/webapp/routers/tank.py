@@ -0,0 +1,154 @@
+from datetime import datetime, timedelta, timezone
+from typing import List, Literal, Optional
+
+from fastapi import APIRouter, Depends, Query, Response
+
+from src.anomaly.detector import AnomalyDetector
+from src.exceptions import InvalidRequestException
+from src.facility.service import FacilityService
+from src.monitoring.liveness import LivenessTracker
+from src.monitoring.rolling import RollingStatistics
+from src.sensor.service import SensorRecordService
+from src.sketch.service import SketchService
+from webapp.dependency import (
+    anomaly_detector_dependency,
+    facility_service_dependency,
+    liveness_tracker_dependency,
+    rolling_statistics_dependency,
+    sensor_service_dependency,
+    sketch_service_dependency,
+)
+from webapp.dtos import (
+    AnomalyDetectionRunDTO,
+    PercentileResultDTO,
+    StaleWaterTankDTO,
+    WaterTankAnomalyDTO,
+    WaterTankRollingStatisticsDTO,
+    WaterTankSensorRecordGridDTO,
+)
+
+router = APIRouter()
+
+
+@router.get("/api/tanks/stats")
+async def get_rolling_statistics(
+    window: int = Query(..., description="구간 길이 (초)"),
+    rolling_statistics: RollingStatistics = Depends(rolling_statistics_dependency),
+) -> List[WaterTankRollingStatisticsDTO]:
+    """측정 값이 있는 모든 수조의 최근 구간 통계 (메모리에서 응답, DB 조회 없음)"""
+    if window not in rolling_statistics.windows:
+        raise InvalidRequestException(
+            f"window 는 {rolling_statistics.windows.tolist()} 중 하나여야 합니다."
+        )
+    return [
+        WaterTankRollingStatisticsDTO.from_domain(statistics)
+        for statistics in rolling_statistics.snapshot(window)
+    ]
+
+
+@router.get("/api/tanks/history/grid", response_model=WaterTankSensorRecordGridDTO)
+async def get_history_grid(
+    tank_codes: List[str] = Query(..., description="수조 코드 (여러 개)"),
+    start: int = Query(..., description="조회 시작 시간 (epoch 초)"),
+    end: int = Query(..., description="조회 종료 시간 (epoch 초, 미포함)"),
+    interval: int = Query(60, gt=0, description="bucket 간격 (초)"),
+    fill: Literal["none", "locf", "linear"] = Query(
+        "none", description="빈 칸 채우기 (locf: 직전 값, linear: 선형 보간)"
+    ),
+    max_gap: int = Query(5, ge=0, description="채울 수 있는 최대 연속 빈 bucket 수"),
+    sensor_service: SensorRecordService = Depends(sensor_service_dependency),
+) -> Response:
+    """여러 수조의 측정 history 를 고정 간격 격자([수조, bucket, 항목] 행렬)로 조회"""
+    grid = await sensor_service.resample_tank_history(
+        tank_codes=tank_codes,
+        start=datetime.fromtimestamp(start, tz=timezone.utc),
+        end=datetime.fromtimestamp(end, tz=timezone.utc),
+        interval=timedelta(seconds=interval),
+        fill=fill,
+        max_gap=max_gap,
+    )
+    return Response(
+        content=WaterTankSensorRecordGridDTO.encode(grid), media_type="application/json"
+    )
+
+
+@router.get("/api/tanks/percentiles")
+async def get_percentiles(
+    metric: str = Query(..., description="측정 항목"),
+    start: int = Query(..., description="조회 시작 시간 (epoch 초, bucket 경계로 내림)"),
+    end: int = Query(..., description="조회 종료 시간 (epoch 초, bucket 경계로 올림)"),
+    q: List[float] = Query([0.5, 0.95, 0.99], description="분위수 (0~1, 여러 개)"),
+    tank_code: Optional[str] = Query(None, description="수조 코드"),
+    building_code: Optional[str] = Query(None, description="동 코드"),
+    center_id: Optional[int] = Query(None, description="센터 id"),
+    sketch_service: SketchService = Depends(sketch_service_dependency),
+) -> PercentileResultDTO:
+    """수조 / 동 / 센터 범위의 측정 항목 분위수 (저장된 sketch 를 합쳐 계산, raw history 조회 없음)"""
+    result = await sketch_service.percentiles(
+        metric=metric,
+        start=datetime.fromtimestamp(start, tz=timezone.utc),
+        end=datetime.fromtimestamp(end, tz=timezone.utc),
+        quantiles=q,
+        tank_code=tank_code,
+        building_code=building_code,
+        center_id=center_id,
+    )
+    return PercentileResultDTO.from_domain(result)
+
+
+@router.get("/api/tanks/stale")
+async def get_stale_tanks(
+    liveness_tracker: LivenessTracker = Depends(liveness_tracker_dependency),
+) -> List[StaleWaterTankDTO]:
+    """측정 값이 timeout 이상 들어오지 않은 수조 목록 (메모리에서 응답, DB 조회 없음)"""
+    return [StaleWaterTankDTO.from_domain(tank) for tank in liveness_tracker.find_stale()]
+
+
+@router.get("/api/tanks/{tank_code}/stats")
+async def get_tank_rolling_statistics(
+    tank_code: str,
+    facility_service: FacilityService = Depends(facility_service_dependency),
+    rolling_statistics: RollingStatistics = Depends(rolling_statistics_dependency),
+) -> List[WaterTankRollingStatisticsDTO]:
+    """수조의 구간별 최근 통계"""
+    tank = await facility_service.get_water_tank_by_code(tank_code)
+    return [
+        WaterTankRollingStatisticsDTO.from_domain(statistics)
+        for window in rolling_statistics.windows.tolist()
+        for statistics in rolling_statistics.snapshot(window, [tank.tank_id])
+    ]
+
+
+@router.get("/api/tanks/anomalies")
+async def get_anomalies(
+    anomaly_detector: AnomalyDetector = Depends(anomaly_detector_dependency),
+) -> List[WaterTankAnomalyDTO]:
+    """마지막 이상 탐지에서 이상으로 판정된 (수조, 항목) 목록"""
+    return [
+        WaterTankAnomalyDTO.from_domain(anomaly)
+        for anomaly in await anomaly_detector.find_anomalous()
+    ]
+
+
+@router.get("/api/tanks/anomalies/last-run")
+async def get_last_anomaly_detection_run(
+    anomaly_detector: AnomalyDetector = Depends(anomaly_detector_dependency),
+) -> Optional[AnomalyDetectionRunDTO]:
+    """이 worker 에서 마지막으로 실행한 이상 탐지의 요약과 단계별 소요 시간 (실행 전이면 null)"""
+    if anomaly_detector.last_run is None:
+        return None
+    return AnomalyDetectionRunDTO.from_domain(anomaly_detector.last_run)
+
+
+@router.get("/api/tanks/{tank_code}/anomalies")
+async def get_tank_anomalies(
+    tank_code: str,
+    facility_service: FacilityService = Depends(facility_service_dependency),
+    anomaly_detector: AnomalyDetector = Depends(anomaly_detector_dependency),
+) -> List[WaterTankAnomalyDTO]:
+    """수조의 항목별 마지막 이상 탐지 결과"""
+    tank = await facility_service.get_water_tank_by_code(tank_code)
+    return [
+        WaterTankAnomalyDTO.from_domain(anomaly)
+        for anomaly in await anomaly_detector.find_tank_anomalies(tank.tank_id)
+    ]
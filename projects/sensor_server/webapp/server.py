@@ -0,0 +1,54 @@
+"""애플리케이션 실행 (python -m webapp.server)
+
+WEB_CONCURRENCY 가 2 이상이면 uvicorn worker 프로세스를 여러 개 띄우고,
+prometheus_client multiprocess 모드로 모든 worker 의 metric 을 /metrics 에서 합산합니다.
+"""
+
+import os
+import shutil
+import tempfile
+from typing import Optional
+
+import uvicorn
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class ServerSettings(BaseSettings):
+    WEB_HOST: str = Field(default="0.0.0.0")
+    WEB_PORT: int = Field(default=80)
+    WEB_CONCURRENCY: int = Field(default=1)  # worker 프로세스 수
+    # multiprocess metric 파일 디렉토리 (없으면 임시 디렉토리 사용)
+    PROMETHEUS_MULTIPROC_DIR: Optional[str] = Field(default=None)
+
+
+def prepare_multiprocess_metrics(directory: Optional[str]) -> str:
+    """multiprocess metric 디렉토리 초기화
+
+    worker 가 prometheus_client 를 import 하기 전에 환경 변수가 설정되어 있어야 하므로,
+    worker 를 띄우기 전에 호출해야 합니다. 이전 실행의 파일이 남아 있으면 counter 가 이어서 합산되므로 비웁니다.
+    """
+    directory = directory or os.path.join(tempfile.gettempdir(), "prometheus_multiproc")
+    shutil.rmtree(directory, ignore_errors=True)
+    os.makedirs(directory)
+    os.environ["PROMETHEUS_MULTIPROC_DIR"] = directory
+    return directory
+
+
+def main():
+    settings = ServerSettings()
+    if settings.WEB_CONCURRENCY > 1:
+        prepare_multiprocess_metrics(settings.PROMETHEUS_MULTIPROC_DIR)
+
+    uvicorn.run(
+        "webapp.app:create_app",
+        factory=True,
+        host=settings.WEB_HOST,
+        port=settings.WEB_PORT,
+        workers=settings.WEB_CONCURRENCY,
+        access_log=False,
+    )
+
+
+if __name__ == "__main__":
+    main()
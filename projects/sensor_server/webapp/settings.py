@@ -0,0 +1,40 @@
+from typing import List, Literal, Optional
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class AdmissionSettings(BaseSettings):
+    """수집 API / 무거운 조회 API 요청 수용 제어 (worker 프로세스 하나 기준)"""
+
+    ADMISSION_ENABLED: bool = Field(default=True)
+    # 수용 제어 대상 경로 (수집 API 와 DB 를 오래 쓰는 조회 API)
+    ADMISSION_PATH_PREFIXES: List[str] = Field(
+        default=[
+            "/api/records/",
+            "/api/tanks/history/grid",
+            "/api/tanks/percentiles",
+            "/api/reports/",
+        ]
+    )
+    ADMISSION_INITIAL_LIMIT: int = Field(default=32)  # 시작 동시 처리 한도
+    ADMISSION_MIN_LIMIT: int = Field(default=2)
+    ADMISSION_MAX_LIMIT: int = Field(default=256)
+    # 요청 처리 시간이 이 값을 넘으면 혼잡으로 판단 (초)
+    ADMISSION_TARGET_LATENCY: float = Field(default=0.5)
+    # 요청이 커넥션 풀에서 기다린 시간이 이 값을 넘으면 혼잡으로 판단 (초)
+    ADMISSION_MAX_POOL_WAIT: float = Field(default=0.1)
+    ADMISSION_BACKOFF_RATIO: float = Field(default=0.8)  # 혼잡 시 한도 감소 비율
+    ADMISSION_RETRY_AFTER: int = Field(default=1)  # 거절 응답의 Retry-After (초)
+
+
+class TracingSettings(BaseSettings):
+    """trace sampling / span 내보내기 (webapp/tracing.py)"""
+
+    TRACE_EXPORTER: Literal["none", "console", "otlp"] = Field(default="none")
+    TRACE_OTLP_ENDPOINT: Optional[str] = Field(default=None)  # 없으면 OTEL_EXPORTER_OTLP_* 환경 변수
+    TRACE_SAMPLE_RATIO: float = Field(default=0.1, ge=0.0, le=1.0)  # 새 trace 의 sampling 비율
+    TRACE_SAMPLE_ERRORS: bool = Field(default=False)  # 오류로 끝난 요청의 root span 은 항상 내보냄
+    TRACE_EXPORT_QUEUE_SIZE: int = Field(default=2048)  # 가득 차면 span 을 버림
+    TRACE_EXPORT_BATCH_SIZE: int = Field(default=512)
+    TRACE_EXPORT_DELAY_MILLIS: int = Field(default=5000)
@@ -0,0 +1,159 @@
+"""trace sampling / span 내보내기 설정
+
+- sampler: 부모 span 의 sampling 결정을 따르고, 새 trace 는 TRACE_SAMPLE_RATIO 비율로 sampling 합니다.
+- TRACE_SAMPLE_ERRORS: sampling 되지 않은 요청의 root SERVER span 만 기록해두었다가 (RECORD_ONLY),
+  오류(status ERROR)로 끝나면 sampled 로 다시 표시해서 내보냅니다. 요청마다 기록 비용이 들므로 기본은 꺼져 있으며,
+  자식 span(DB 조회 등)은 기록하지 않으므로 오류 trace 는 root span 하나만 남습니다.
+- 내보내기는 BatchSpanProcessor 스레드에서 모아서 처리하고, queue 가 가득 차면 span 을 버립니다.
+
+TRACE_EXPORTER 가 none 이면 span 을 기록하지 않습니다. (trace_id 는 그대로 생성되어 로그와 오류 응답에 남습니다)
+"""
+
+from typing import Optional, Sequence
+
+from opentelemetry.context import Context
+from opentelemetry.sdk.trace import ReadableSpan, TracerProvider
+from opentelemetry.sdk.trace.export import (
+    BatchSpanProcessor,
+    ConsoleSpanExporter,
+    SpanExporter,
+)
+from opentelemetry.sdk.trace.sampling import (
+    ALWAYS_OFF,
+    Decision,
+    ParentBased,
+    Sampler,
+    SamplingResult,
+    TraceIdRatioBased,
+)
+from opentelemetry.trace import (
+    Link,
+    SpanContext,
+    SpanKind,
+    StatusCode,
+    TraceFlags,
+    get_current_span,
+)
+from opentelemetry.util.types import Attributes
+
+from webapp.settings import TracingSettings
+
+
+class RecordUnsampledSampler(Sampler):
+    """sampling 되지 않은 root SERVER span 도 기록(RECORD_ONLY)하도록 감싸는 sampler
+
+    ErrorAwareBatchSpanProcessor 가 오류로 끝난 요청의 span 을 골라 내보낼 수 있도록 합니다.
+    같은 process 안에 부모가 있는 span 은 그대로 버려서 기록 비용을 요청당 span 하나로 제한합니다.
+    """
+
+    def __init__(self, sampler: Sampler):
+        self.sampler = sampler
+
+    def should_sample(
+        self,
+        parent_context: Optional[Context],
+        trace_id: int,
+        name: str,
+        kind: Optional[SpanKind] = None,
+        attributes: Attributes = None,
+        links: Optional[Sequence[Link]] = None,
+        trace_state=None,
+    ) -> SamplingResult:
+        result = self.sampler.should_sample(
+            parent_context, trace_id, name, kind, attributes, links, trace_state
+        )
+        if result.decision == Decision.DROP and is_local_root(parent_context, kind):
+            return SamplingResult(
+                Decision.RECORD_ONLY, result.attributes, result.trace_state
+            )
+        return result
+
+    def get_description(self) -> str:
+        return f"RecordUnsampled{{{self.sampler.get_description()}}}"
+
+
+def is_local_root(parent_context: Optional[Context], kind: Optional[SpanKind]) -> bool:
+    """이 process 에서 요청을 받아 시작한 SERVER span 인지 (부모가 없거나 원격)"""
+    if kind is not SpanKind.SERVER:
+        return False
+    parent = get_current_span(parent_context).get_span_context()
+    return not parent.is_valid or parent.is_remote
+
+
+class ErrorAwareBatchSpanProcessor(BatchSpanProcessor):
+    """sampling 되지 않았더라도 오류로 끝난 span 은 내보내는 BatchSpanProcessor"""
+
+    def on_end(self, span: ReadableSpan) -> None:
+        if not span.context.trace_flags.sampled:
+            if span.status.status_code is not StatusCode.ERROR:
+                return
+            span = resample(span)
+        super().on_end(span)
+
+
+def resample(span: ReadableSpan) -> ReadableSpan:
+    """sampled flag 를 켠 span 복사본"""
+    context = span.context
+    return ReadableSpan(
+        name=span.name,
+        context=SpanContext(
+            context.trace_id,
+            context.span_id,
+            context.is_remote,
+            TraceFlags(context.trace_flags | TraceFlags.SAMPLED),
+            context.trace_state,
+        ),
+        parent=span.parent,
+        resource=span.resource,
+        attributes=span.attributes,
+        events=span.events,
+        links=span.links,
+        kind=span.kind,
+        status=span.status,
+        start_time=span.start_time,
+        end_time=span.end_time,
+        instrumentation_scope=span.instrumentation_scope,
+    )
+
+
+def create_exporter(settings: TracingSettings) -> Optional[SpanExporter]:
+    if settings.TRACE_EXPORTER == "console":
+        return ConsoleSpanExporter()
+    if settings.TRACE_EXPORTER == "otlp":
+        # protobuf 등 import 비용이 크므로 사용할 때만 import
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+            OTLPSpanExporter,
+        )
+
+        return OTLPSpanExporter(endpoint=settings.TRACE_OTLP_ENDPOINT)
+    return None
+
+
+def create_tracer_provider(
+    settings: TracingSettings, exporter: Optional[SpanExporter] = None
+) -> TracerProvider:
+    """설정에 맞는 TracerProvider 생성
+
+    Args:
+        exporter: 설정 대신 사용할 exporter (benchmark / 테스트용)
+    """
+    exporter = exporter or create_exporter(settings)
+    if exporter is None:
+        return TracerProvider(sampler=ParentBased(root=ALWAYS_OFF))
+
+    sampler = ParentBased(root=TraceIdRatioBased(settings.TRACE_SAMPLE_RATIO))
+    processor_class = BatchSpanProcessor
+    if settings.TRACE_SAMPLE_ERRORS:
+        sampler = RecordUnsampledSampler(sampler)
+        processor_class = ErrorAwareBatchSpanProcessor
+
+    provider = TracerProvider(sampler=sampler)
+    provider.add_span_processor(
+        processor_class(
+            exporter,
+            max_queue_size=settings.TRACE_EXPORT_QUEUE_SIZE,
+            max_export_batch_size=settings.TRACE_EXPORT_BATCH_SIZE,
+            schedule_delay_millis=settings.TRACE_EXPORT_DELAY_MILLIS,
+        )
+    )
+    return provider